@@ -0,0 +1,115 @@
+import asyncio
+from typing import Iterator, List
+
+import pytest
+from _pytest.terminal import TerminalReporter
+
+from benchmarks.harness import Benchmark, BenchmarkResult, find_regressions, write_json
+from momento.aio.simple_cache_client import SimpleCacheClient as SimpleCacheClientAsync
+from momento.incubating.aio.simple_cache_client import SimpleCacheClientIncubating
+from momento.simple_cache_client import SimpleCacheClient
+from momento.testing.fake_server import FakeMomentoServer
+
+BENCH_CACHE_NAME = "bench-cache"
+DEFAULT_TTL_SECONDS = 60
+
+_RESULTS: List[BenchmarkResult] = []
+_REGRESSIONS: List[str] = []
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("benchmarks")
+    group.addoption("--benchmark-json", default=None, help="Write the results to this JSON file.")
+    group.addoption("--benchmark-compare", default=None, help="Compare against the results in this JSON file.")
+    group.addoption(
+        "--benchmark-max-regression",
+        type=float,
+        default=0.25,
+        help="Fail if a median per-op time grew by more than this fraction over the compared results.",
+    )
+    group.addoption("--benchmark-min-time", type=float, default=0.2, help="Minimum seconds to run each benchmark.")
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest) -> Benchmark:
+    return Benchmark(
+        request.node.name,
+        request.node.module.__name__.rsplit(".", 1)[-1],
+        request.config.getoption("--benchmark-min-time"),
+        _RESULTS,
+    )
+
+
+@pytest.fixture(scope="session")
+def fake_server() -> Iterator[FakeMomentoServer]:
+    with FakeMomentoServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def bench_loop() -> Iterator[asyncio.AbstractEventLoop]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def client_async(
+    fake_server: FakeMomentoServer, bench_loop: asyncio.AbstractEventLoop
+) -> Iterator[SimpleCacheClientAsync]:
+    async def create() -> SimpleCacheClientAsync:
+        client = SimpleCacheClientAsync(fake_server.auth_token, DEFAULT_TTL_SECONDS, local_credentials=True)
+        await client.create_cache(BENCH_CACHE_NAME)
+        return client
+
+    client = bench_loop.run_until_complete(create())
+    yield client
+    bench_loop.run_until_complete(client.__aexit__(None, None, None))
+
+
+@pytest.fixture(scope="session")
+def client(fake_server: FakeMomentoServer, client_async: SimpleCacheClientAsync) -> Iterator[SimpleCacheClient]:
+    with SimpleCacheClient(fake_server.auth_token, DEFAULT_TTL_SECONDS, local_credentials=True) as _client:
+        yield _client
+
+
+@pytest.fixture(scope="session")
+def incubating_client_async(
+    fake_server: FakeMomentoServer, bench_loop: asyncio.AbstractEventLoop, client_async: SimpleCacheClientAsync
+) -> Iterator[SimpleCacheClientIncubating]:
+    async def create() -> SimpleCacheClientIncubating:
+        return SimpleCacheClientIncubating(fake_server.auth_token, DEFAULT_TTL_SECONDS, local_credentials=True)
+
+    client = bench_loop.run_until_complete(create())
+    yield client
+    bench_loop.run_until_complete(client.__aexit__(None, None, None))
+
+
+def pytest_terminal_summary(terminalreporter: TerminalReporter, config: pytest.Config) -> None:
+    if not _RESULTS:
+        return
+    terminalreporter.section("benchmarks (per operation)")
+    terminalreporter.write_line(f"{'name':<56} {'median':>12} {'mean':>12} {'cpu':>12} {'ops/s':>12}")
+    for result in _RESULTS:
+        stats = result.to_json()["stats"]
+        terminalreporter.write_line(
+            f"{result.name:<56} {stats['median'] * 1e6:>10.2f}us {stats['mean'] * 1e6:>10.2f}us "
+            f"{stats['cpu_mean'] * 1e6:>10.2f}us {stats['ops']:>12.0f}"
+        )
+
+    json_path = config.getoption("--benchmark-json")
+    if json_path:
+        write_json(json_path, _RESULTS)
+        terminalreporter.write_line(f"Wrote benchmark results to {json_path}")
+
+    for regression in _REGRESSIONS:
+        terminalreporter.write_line(f"REGRESSION {regression}", red=True)
+
+
+def pytest_sessionfinish(session: pytest.Session) -> None:
+    baseline_path = session.config.getoption("--benchmark-compare")
+    if baseline_path and _RESULTS:
+        max_regression = session.config.getoption("--benchmark-max-regression")
+        _REGRESSIONS.extend(find_regressions(baseline_path, _RESULTS, max_regression))
+        if _REGRESSIONS:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
@@ -0,0 +1,145 @@
+import asyncio
+import json
+import platform
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
+
+_TReturn = TypeVar("_TReturn")
+
+# A round is timed as a whole and must be long enough for the clock resolution not to matter.
+_MIN_ROUND_SECONDS = 0.01
+_MIN_ROUNDS = 5
+
+
+class BenchmarkResult:
+    def __init__(self, name: str, group: str, iterations: int, round_seconds: List[float], cpu_seconds: float):
+        """Per-operation timings of a benchmark.
+
+        Args:
+            name (str): Name of the benchmark, usually the test name.
+            group (str): Group the benchmark is reported in, usually the test module.
+            iterations (int): Number of operations in each round.
+            round_seconds (List[float]): Wall-clock duration of each round.
+            cpu_seconds (float): CPU time of the benchmarking thread across all rounds.
+        """
+        self.name = name
+        self.group = group
+        self.iterations = iterations
+        self.per_op = [seconds / iterations for seconds in round_seconds]
+        self.cpu_per_op = cpu_seconds / (iterations * len(round_seconds))
+
+    def median(self) -> float:
+        return statistics.median(self.per_op)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "group": self.group,
+            "stats": {
+                "min": min(self.per_op),
+                "max": max(self.per_op),
+                "mean": statistics.mean(self.per_op),
+                "median": self.median(),
+                "stddev": statistics.stdev(self.per_op) if len(self.per_op) > 1 else 0.0,
+                "rounds": len(self.per_op),
+                "iterations": self.iterations,
+                "ops": 1.0 / self.median() if self.median() > 0 else 0.0,
+                "cpu_mean": self.cpu_per_op,
+            },
+        }
+
+
+class Benchmark:
+    """Times a callable in calibrated rounds, similar to the `pytest-benchmark` fixture.
+
+    Wall-clock time is reported per operation; CPU time is measured on the calling thread only, so work
+    done by an in-process fake server on its own thread is not attributed to the client.
+    """
+
+    def __init__(self, name: str, group: str, min_time: float, results: List[BenchmarkResult]):
+        self._name = name
+        self._group = group
+        self._min_time = min_time
+        self._results = results
+
+    def __call__(self, fn: Callable[..., _TReturn], *args: Any, **kwargs: Any) -> _TReturn:
+        def run(iterations: int) -> _TReturn:
+            result = fn(*args, **kwargs)
+            for _ in range(iterations - 1):
+                fn(*args, **kwargs)
+            return result
+
+        return self._measure(run)
+
+    def run_async(
+        self, loop: asyncio.AbstractEventLoop, fn: Callable[..., Awaitable[_TReturn]], *args: Any, **kwargs: Any
+    ) -> _TReturn:
+        """Benchmark a coroutine function; each round runs its iterations back to back on `loop`."""
+
+        async def run_round(iterations: int) -> _TReturn:
+            result = await fn(*args, **kwargs)
+            for _ in range(iterations - 1):
+                await fn(*args, **kwargs)
+            return result
+
+        return self._measure(lambda iterations: loop.run_until_complete(run_round(iterations)))
+
+    def _measure(self, run: Callable[[int], _TReturn]) -> _TReturn:
+        result = run(1)  # warm up
+        iterations = 1
+        while True:
+            start = time.perf_counter()
+            run(iterations)
+            if time.perf_counter() - start >= _MIN_ROUND_SECONDS:
+                break
+            iterations *= 2
+
+        round_seconds: List[float] = []
+        cpu_start = time.thread_time()
+        while len(round_seconds) < _MIN_ROUNDS or sum(round_seconds) < self._min_time:
+            start = time.perf_counter()
+            run(iterations)
+            round_seconds.append(time.perf_counter() - start)
+        cpu_seconds = time.thread_time() - cpu_start
+
+        self._results.append(BenchmarkResult(self._name, self._group, iterations, round_seconds, cpu_seconds))
+        return result
+
+
+def write_json(path: str, results: List[BenchmarkResult]) -> None:
+    document = {
+        "machine_info": {
+            "python_implementation": platform.python_implementation(),
+            "python_version": platform.python_version(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "datetime": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "benchmarks": [result.to_json() for result in results],
+    }
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+
+
+def find_regressions(baseline_path: str, results: List[BenchmarkResult], max_regression: float) -> List[str]:
+    """Compares median per-op times against a previous JSON report.
+
+    Returns:
+        List[str]: A description of each benchmark whose median got slower by more than `max_regression`.
+    """
+    with open(baseline_path) as f:
+        baseline: Dict[str, float] = {
+            benchmark["name"]: benchmark["stats"]["median"] for benchmark in json.load(f)["benchmarks"]
+        }
+    regressions = []
+    for result in results:
+        previous: Optional[float] = baseline.get(result.name)
+        if previous is None or previous <= 0:
+            continue
+        change = result.median() / previous - 1.0
+        if change > max_regression:
+            regressions.append(
+                f"{result.name}: median {result.median() * 1e6:.2f}us vs {previous * 1e6:.2f}us (+{change:.0%})"
+            )
+    return regressions
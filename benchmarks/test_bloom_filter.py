@@ -0,0 +1,56 @@
+"""Incubating Bloom filters: client-side hashing and membership tests against the fake server."""
+import asyncio
+
+from benchmarks.conftest import BENCH_CACHE_NAME
+from benchmarks.harness import Benchmark
+from momento.incubating._utilities._bloom_filter import _BloomFilter
+from momento.incubating.aio.simple_cache_client import SimpleCacheClientIncubating
+
+ADDED = [f"added-{i}".encode() for i in range(10_000)]
+ABSENT = [f"absent-{i}".encode() for i in range(10_000)]
+FALSE_POSITIVE_RATE = 0.01
+
+
+def _filled_filter() -> _BloomFilter:
+    bloom_filter = _BloomFilter.sized_for(len(ADDED), FALSE_POSITIVE_RATE)
+    bloom_filter.add_many(ADDED)
+    return bloom_filter
+
+
+def test_bloom_add_many_10k(benchmark: Benchmark):
+    def add_many() -> None:
+        _BloomFilter.sized_for(len(ADDED), FALSE_POSITIVE_RATE).add_many(ADDED)
+
+    benchmark(add_many)
+
+
+def test_bloom_might_contain_many_10k(benchmark: Benchmark):
+    assert all(benchmark(_filled_filter().might_contain_many, ADDED))
+
+
+def test_bloom_false_positive_rate_10k(benchmark: Benchmark):
+    """Testing absent keys, with the filter at its expected number of items."""
+    false_positives = sum(benchmark(_filled_filter().might_contain_many, ABSENT))
+    assert false_positives / len(ABSENT) < 1.5 * FALSE_POSITIVE_RATE
+
+
+def test_async_bloom_might_contain_many_1000(
+    benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop, incubating_client_async: SimpleCacheClientIncubating
+):
+    """Compare with `test_async_exists_1000`: one GET of the filter instead of one per key."""
+    keys = [key.decode() for key in ADDED[:1000]]
+    bench_loop.run_until_complete(
+        incubating_client_async.bloom_add_many(BENCH_CACHE_NAME, "bloom", *keys, expected_items=len(keys))
+    )
+    response = benchmark.run_async(
+        bench_loop, incubating_client_async.bloom_might_contain_many, BENCH_CACHE_NAME, "bloom", *keys
+    )
+    assert response.all()
+
+
+def test_async_exists_1000(
+    benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop, incubating_client_async: SimpleCacheClientIncubating
+):
+    keys = [key.decode() for key in ADDED[:1000]]
+    bench_loop.run_until_complete(incubating_client_async.set_multi(BENCH_CACHE_NAME, {key: "v" for key in keys}))
+    assert benchmark.run_async(bench_loop, incubating_client_async.exists, BENCH_CACHE_NAME, *keys).all()
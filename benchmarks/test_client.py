@@ -0,0 +1,211 @@
+"""End-to-end client operations against the in-process fake server."""
+import asyncio
+
+import pytest
+
+from benchmarks.conftest import BENCH_CACHE_NAME, DEFAULT_TTL_SECONDS
+from benchmarks.harness import Benchmark
+from momento._utilities._client_metrics import _ClientMetrics
+from momento._utilities._hot_keys import _HotKeyTracker
+from momento.aio.simple_cache_client import SimpleCacheClient as SimpleCacheClientAsync
+from momento.cache_operation_types import CacheGetStatus
+from momento.hooks import RequestHook, RequestInfo
+from momento.hot_keys import HotKeyTracking
+from momento.near_cache import NearCaching
+from momento.simple_cache_client import SimpleCacheClient
+from momento.slow_requests import SlowRequestLogging
+from momento.testing.fake_server import FakeMomentoServer
+
+VALUE = "v" * 1024
+
+
+def test_async_set(benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop, client_async: SimpleCacheClientAsync):
+    benchmark.run_async(bench_loop, client_async.set, BENCH_CACHE_NAME, "set-key", VALUE)
+
+
+def test_async_get_hit(
+    benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop, client_async: SimpleCacheClientAsync
+):
+    bench_loop.run_until_complete(client_async.set(BENCH_CACHE_NAME, "get-key", VALUE))
+    response = benchmark.run_async(bench_loop, client_async.get, BENCH_CACHE_NAME, "get-key")
+    assert response.status() == CacheGetStatus.HIT
+
+
+class _CountingHook(RequestHook):
+    def __init__(self) -> None:
+        self.requests = 0
+
+    def on_success(self, request: RequestInfo, duration_seconds: float, response_bytes: int) -> None:
+        self.requests += 1
+
+
+def test_async_get_hit_with_hook(
+    benchmark: Benchmark,
+    bench_loop: asyncio.AbstractEventLoop,
+    fake_server: FakeMomentoServer,
+    client_async: SimpleCacheClientAsync,
+):
+    """Compare with `test_async_get_hit` for the cost of a hook; clients without hooks skip them entirely."""
+    hook = _CountingHook()
+
+    async def create() -> SimpleCacheClientAsync:
+        return SimpleCacheClientAsync(fake_server.auth_token, DEFAULT_TTL_SECONDS, local_credentials=True, hooks=[hook])
+
+    client = bench_loop.run_until_complete(create())
+    bench_loop.run_until_complete(client.set(BENCH_CACHE_NAME, "get-key", VALUE))
+    response = benchmark.run_async(bench_loop, client.get, BENCH_CACHE_NAME, "get-key")
+    bench_loop.run_until_complete(client.__aexit__(None, None, None))
+    assert response.status() == CacheGetStatus.HIT
+    assert hook.requests > 1
+
+
+def test_async_get_hit_with_metrics(
+    benchmark: Benchmark,
+    bench_loop: asyncio.AbstractEventLoop,
+    fake_server: FakeMomentoServer,
+    client_async: SimpleCacheClientAsync,
+):
+    """Compare with `test_async_get_hit` for the cost of recording metrics."""
+
+    async def create() -> SimpleCacheClientAsync:
+        return SimpleCacheClientAsync(fake_server.auth_token, DEFAULT_TTL_SECONDS, local_credentials=True, metrics=True)
+
+    client = bench_loop.run_until_complete(create())
+    bench_loop.run_until_complete(client.set(BENCH_CACHE_NAME, "get-key", VALUE))
+    response = benchmark.run_async(bench_loop, client.get, BENCH_CACHE_NAME, "get-key")
+    snapshot = client.metrics_snapshot()
+    bench_loop.run_until_complete(client.__aexit__(None, None, None))
+    assert response.status() == CacheGetStatus.HIT
+    assert snapshot is not None
+    gets = snapshot.operation("get", BENCH_CACHE_NAME)
+    assert gets is not None and gets.hits > 1
+
+
+def test_async_get_hit_with_slow_request_log(
+    benchmark: Benchmark,
+    bench_loop: asyncio.AbstractEventLoop,
+    fake_server: FakeMomentoServer,
+    client_async: SimpleCacheClientAsync,
+):
+    """Compare with `test_async_get_hit` for the cost of recording the timeline of every request."""
+
+    async def create() -> SimpleCacheClientAsync:
+        logging = SlowRequestLogging(threshold_seconds=60)
+        return SimpleCacheClientAsync(
+            fake_server.auth_token, DEFAULT_TTL_SECONDS, local_credentials=True, slow_requests=logging
+        )
+
+    client = bench_loop.run_until_complete(create())
+    bench_loop.run_until_complete(client.set(BENCH_CACHE_NAME, "get-key", VALUE))
+    response = benchmark.run_async(bench_loop, client.get, BENCH_CACHE_NAME, "get-key")
+    bench_loop.run_until_complete(client.__aexit__(None, None, None))
+    assert response.status() == CacheGetStatus.HIT
+
+
+def test_async_get_hit_traced_unsampled(
+    benchmark: Benchmark,
+    bench_loop: asyncio.AbstractEventLoop,
+    fake_server: FakeMomentoServer,
+    client_async: SimpleCacheClientAsync,
+):
+    """Compare with `test_async_get_hit`: unsampled requests skip tracing after one sampling decision."""
+    tracing = pytest.importorskip("momento.tracing")
+
+    async def create() -> SimpleCacheClientAsync:
+        interceptor = tracing.TracingInterceptor(sample_ratio=0.0)
+        return SimpleCacheClientAsync(
+            fake_server.auth_token, DEFAULT_TTL_SECONDS, local_credentials=True, tracing=interceptor
+        )
+
+    client = bench_loop.run_until_complete(create())
+    bench_loop.run_until_complete(client.set(BENCH_CACHE_NAME, "get-key", VALUE))
+    response = benchmark.run_async(bench_loop, client.get, BENCH_CACHE_NAME, "get-key")
+    bench_loop.run_until_complete(client.__aexit__(None, None, None))
+    assert response.status() == CacheGetStatus.HIT
+
+
+def test_async_get_hit_near_cached(
+    benchmark: Benchmark,
+    bench_loop: asyncio.AbstractEventLoop,
+    fake_server: FakeMomentoServer,
+    client_async: SimpleCacheClientAsync,
+):
+    """Compare with `test_async_get_hit`: gets of a promoted key are served without a round trip."""
+
+    async def create() -> SimpleCacheClientAsync:
+        near_cache = NearCaching(min_reads_per_second=1, ttl_seconds=3600)
+        return SimpleCacheClientAsync(
+            fake_server.auth_token, DEFAULT_TTL_SECONDS, local_credentials=True, near_cache=near_cache
+        )
+
+    client = bench_loop.run_until_complete(create())
+    bench_loop.run_until_complete(client.set(BENCH_CACHE_NAME, "get-key", VALUE))
+    response = benchmark.run_async(bench_loop, client.get, BENCH_CACHE_NAME, "get-key")
+    stats = client.near_cache_stats()
+    bench_loop.run_until_complete(client.__aexit__(None, None, None))
+    assert response.status() == CacheGetStatus.HIT
+    assert stats is not None and stats.hits > 1
+
+
+def test_record_request_metrics(benchmark: Benchmark):
+    """Recording one request costs a few microseconds, far below the budget of a client doing 50k requests/s."""
+    metrics = _ClientMetrics(1, lambda: None)
+    request = RequestInfo("get", BENCH_CACHE_NAME, b"get-key", 0, 0.0)
+    request.hit = True
+
+    def record() -> None:
+        metrics.on_start(request)
+        metrics.on_success(request, 0.0012, len(VALUE))
+
+    benchmark(record)
+    snapshot = metrics.snapshot()
+    assert snapshot.in_flight == [0]
+
+
+def test_async_get_miss(
+    benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop, client_async: SimpleCacheClientAsync
+):
+    response = benchmark.run_async(bench_loop, client_async.get, BENCH_CACHE_NAME, "missing-key")
+    assert response.status() == CacheGetStatus.MISS
+
+
+def test_async_get_multi_10(
+    benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop, client_async: SimpleCacheClientAsync
+):
+    keys = [f"multi-key-{i}" for i in range(10)]
+    bench_loop.run_until_complete(client_async.set_multi(BENCH_CACHE_NAME, {key: VALUE for key in keys}))
+    response = benchmark.run_async(bench_loop, client_async.get_multi, BENCH_CACHE_NAME, *keys)
+    assert all(status == CacheGetStatus.HIT for status in response.status())
+
+
+def test_async_get_multi_100(
+    benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop, client_async: SimpleCacheClientAsync
+):
+    keys = [f"multi-key-{i}" for i in range(100)]
+    bench_loop.run_until_complete(client_async.set_multi(BENCH_CACHE_NAME, {key: VALUE for key in keys}))
+    benchmark.run_async(bench_loop, client_async.get_multi, BENCH_CACHE_NAME, *keys)
+
+
+def test_sync_get_hit(benchmark: Benchmark, client: SimpleCacheClient):
+    """Compare with `test_async_get_hit` for the overhead of the synchronous wrapper."""
+    client.set(BENCH_CACHE_NAME, "sync-get-key", VALUE)
+    assert benchmark(client.get, BENCH_CACHE_NAME, "sync-get-key").status() == CacheGetStatus.HIT
+
+
+def test_sync_set(benchmark: Benchmark, client: SimpleCacheClient):
+    benchmark(client.set, BENCH_CACHE_NAME, "sync-set-key", VALUE)
+
+
+def test_record_hot_keys(benchmark: Benchmark):
+    """Counting a request whose key is new to the sketch, which is the worst case as it leads to evictions."""
+    tracker = _HotKeyTracker(HotKeyTracking())
+    requests = [RequestInfo("get", BENCH_CACHE_NAME, f"key-{i}".encode(), 0, 0.0) for i in range(100_000)]
+    position = 0
+
+    def record() -> None:
+        nonlocal position
+        tracker.on_start(requests[position % len(requests)])
+        position += 1
+
+    benchmark(record)
+    assert tracker.hot_keys(now=1.0)
@@ -0,0 +1,71 @@
+"""Value compression of typical JSON payloads."""
+import asyncio
+import json
+
+from benchmarks.conftest import BENCH_CACHE_NAME, DEFAULT_TTL_SECONDS
+from benchmarks.harness import Benchmark
+from momento._utilities._value_compression import _ValueCompressor
+from momento.aio.simple_cache_client import SimpleCacheClient as SimpleCacheClientAsync
+from momento.compression import Compression, GzipCodec, ZlibCodec
+from momento.testing.fake_server import FakeMomentoServer
+
+# About 50 KB.
+JSON_VALUE = json.dumps(
+    [{"id": i, "name": f"user-{i}", "email": f"user-{i}@example.com", "active": i % 3 == 0} for i in range(700)]
+).encode()
+
+
+def test_zlib_compress_50kb(benchmark: Benchmark):
+    compressor = _ValueCompressor(Compression(ZlibCodec()))
+    benchmark(compressor.compress, JSON_VALUE)
+
+
+def test_zlib_fast_compress_50kb(benchmark: Benchmark):
+    compressor = _ValueCompressor(Compression(ZlibCodec(level=1)))
+    benchmark(compressor.compress, JSON_VALUE)
+
+
+def test_gzip_compress_50kb(benchmark: Benchmark):
+    compressor = _ValueCompressor(Compression(GzipCodec()))
+    benchmark(compressor.compress, JSON_VALUE)
+
+
+def test_zlib_decompress_50kb(benchmark: Benchmark):
+    compressor = _ValueCompressor(Compression(ZlibCodec()))
+    compressed = compressor.compress(JSON_VALUE)
+    assert benchmark(compressor.decompress, compressed) == JSON_VALUE
+    stats = compressor.stats()
+    assert stats.compression_ratio() > 4
+
+
+def test_async_set_get_50kb_compressed(
+    benchmark: Benchmark,
+    bench_loop: asyncio.AbstractEventLoop,
+    fake_server: FakeMomentoServer,
+    client_async: SimpleCacheClientAsync,
+):
+    """Compare with `test_async_set_get_50kb` for the cost of compression against a local server."""
+
+    async def create() -> SimpleCacheClientAsync:
+        return SimpleCacheClientAsync(
+            fake_server.auth_token, DEFAULT_TTL_SECONDS, local_credentials=True, compression=Compression()
+        )
+
+    client = bench_loop.run_until_complete(create())
+
+    async def set_get() -> None:
+        await client.set(BENCH_CACHE_NAME, "compressed-key", JSON_VALUE)
+        await client.get(BENCH_CACHE_NAME, "compressed-key")
+
+    benchmark.run_async(bench_loop, set_get)
+    bench_loop.run_until_complete(client.__aexit__(None, None, None))
+
+
+def test_async_set_get_50kb(
+    benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop, client_async: SimpleCacheClientAsync
+):
+    async def set_get() -> None:
+        await client_async.set(BENCH_CACHE_NAME, "uncompressed-key", JSON_VALUE)
+        await client_async.get(BENCH_CACHE_NAME, "uncompressed-key")
+
+    benchmark.run_async(bench_loop, set_get)
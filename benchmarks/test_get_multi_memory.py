@@ -0,0 +1,64 @@
+"""Memory held by the result of a 10,000 key multi-get, kept in columns or as an object per key.
+
+Run with `-s` to see the numbers.
+"""
+import gc
+import tracemalloc
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+from momento.cache_operation_types import CacheGetMultiResponse, CacheGetStatus
+
+_KEY_COUNT = 10_000
+_T = TypeVar("_T")
+
+
+class _PerKeyGetResponse:
+    """The layout results had before: an object with an instance dict for every key."""
+
+    def __init__(self, value: bytes, status: CacheGetStatus):
+        self._value = value
+        self._status = status
+        self._decoded_value: Optional[str] = None
+
+
+def _retained(build: Callable[[], _T]) -> Tuple[_T, int, int]:
+    """What `build` returns, with the bytes and the number of blocks still allocated for it."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        result = build()
+        gc.collect()
+        stats = tracemalloc.take_snapshot().compare_to(before, "filename")
+    finally:
+        tracemalloc.stop()
+    return result, sum(stat.size_diff for stat in stats), sum(stat.count_diff for stat in stats)
+
+
+def test_get_multi_10k_keys_retained_memory():
+    keys = [f"multi-key-{i}".encode("utf-8") for i in range(_KEY_COUNT)]
+    # Every other key is a miss.
+    values = [None if i % 2 else b"v" * 16 for i in range(_KEY_COUNT)]
+
+    def per_key() -> List[_PerKeyGetResponse]:
+        return [
+            _PerKeyGetResponse(b"", CacheGetStatus.MISS)
+            if value is None
+            else _PerKeyGetResponse(value, CacheGetStatus.HIT)
+            for value in values
+        ]
+
+    def columns() -> CacheGetMultiResponse:
+        return CacheGetMultiResponse._from_columns(list(keys), list(values))
+
+    _, per_key_bytes, per_key_blocks = _retained(per_key)
+    response, column_bytes, column_blocks = _retained(columns)
+    print(
+        f"\nResult of a {_KEY_COUNT} key multi-get, besides keys and values: "
+        f"one object per key {per_key_bytes / _KEY_COUNT:.1f} bytes and {per_key_blocks / _KEY_COUNT:.2f} blocks "
+        f"per key, columns {column_bytes / _KEY_COUNT:.1f} bytes and {column_blocks / _KEY_COUNT:.4f} blocks per key"
+    )
+    assert response.by_key(keys[0]).status() == CacheGetStatus.HIT
+    assert response.by_key(keys[1]).status() == CacheGetStatus.MISS
+    assert column_blocks * 100 < per_key_blocks
+    assert column_bytes * 4 < per_key_bytes
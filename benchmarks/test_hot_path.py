@@ -0,0 +1,198 @@
+"""Client-side CPU cost of the request/response hot path, without any network I/O."""
+import asyncio
+
+import grpc
+from grpc.aio import ClientCallDetails, Metadata
+from momento_wire_types.cacheclient_pb2 import (
+    Hit,
+    _GetRequest,
+    _GetResponse,
+    _SetRequest,
+)
+
+from benchmarks.harness import Benchmark
+from momento._utilities._data_validation import (
+    _as_buffer,
+    _as_bytes,
+    _validate_cache_name,
+    _validate_ttl,
+)
+from momento._utilities._wire_encoding import encode_set_request
+from momento.aio._add_header_client_interceptor import (
+    AddHeaderClientInterceptor,
+    Header,
+    StaticHeaders,
+)
+from momento.aio._retry_interceptor import RetryInterceptor
+from momento.cache_operation_types import CacheGetResponse
+
+KEY = "benchmark-key"
+VALUE = "v" * 1024
+VALUE_BYTES = VALUE.encode("utf-8")
+
+
+def test_as_bytes_str(benchmark: Benchmark):
+    assert benchmark(_as_bytes, VALUE) == VALUE_BYTES
+
+
+def test_as_bytes_bytes(benchmark: Benchmark):
+    assert benchmark(_as_bytes, VALUE_BYTES) is VALUE_BYTES
+
+
+def test_validation(benchmark: Benchmark):
+    def validate() -> None:
+        _validate_cache_name("bench-cache")
+        _validate_ttl(60)
+
+    benchmark(validate)
+
+
+def test_make_metadata(benchmark: Benchmark):
+    benchmark(Metadata, ("cache", "bench-cache"))
+
+
+def test_make_metadata_with_static_headers(benchmark: Benchmark):
+    """Data requests are made with the authorization header already in their metadata."""
+    headers = StaticHeaders([Header("authorization", "token")])
+    benchmark(headers.metadata, "bench-cache")
+
+
+def test_set_request_construction(benchmark: Benchmark):
+    def build() -> _SetRequest:
+        request = _SetRequest()
+        request.cache_key = _as_bytes(KEY)
+        request.cache_body = _as_bytes(VALUE)
+        request.ttl_milliseconds = 60 * 1000
+        return request
+
+    assert benchmark(build).cache_body == VALUE_BYTES
+
+
+def test_set_request_construction_and_serialization(benchmark: Benchmark):
+    """What sending a set request took before requests were encoded by hand."""
+
+    def build() -> bytes:
+        request = _SetRequest()
+        request.cache_key = _as_bytes(KEY)
+        request.cache_body = _as_bytes(VALUE)
+        request.ttl_milliseconds = 60 * 1000
+        return request.SerializeToString()
+
+    benchmark(build)
+
+
+def test_set_request_encoding(benchmark: Benchmark):
+    def build() -> bytes:
+        return encode_set_request(_as_bytes(KEY), _as_buffer(VALUE), 60 * 1000)
+
+    benchmark(build)
+
+
+def test_get_request_construction(benchmark: Benchmark):
+    def build() -> _GetRequest:
+        request = _GetRequest()
+        request.cache_key = _as_bytes(KEY)
+        return request
+
+    benchmark(build)
+
+
+def test_get_response_from_grpc_response(benchmark: Benchmark):
+    grpc_response = _GetResponse(result=Hit, cache_body=VALUE_BYTES)
+    assert benchmark(CacheGetResponse.from_grpc_response, grpc_response).value() == VALUE
+
+
+def test_get_response_value_decode(benchmark: Benchmark):
+    response = CacheGetResponse.from_grpc_response(_GetResponse(result=Hit, cache_body=VALUE_BYTES))
+    assert benchmark(response.value) == VALUE
+
+
+class _OkCall:
+    async def code(self) -> grpc.StatusCode:
+        return grpc.StatusCode.OK
+
+
+async def _continuation(client_call_details: ClientCallDetails, request: _GetRequest) -> _OkCall:
+    return _OkCall()
+
+
+def _call_details() -> ClientCallDetails:
+    return ClientCallDetails(
+        method=b"/cache_client.Scs/Get",
+        timeout=5.0,
+        metadata=Metadata(("cache", "bench-cache")),
+        credentials=None,
+        wait_for_ready=None,
+    )
+
+
+def test_interceptor_baseline(benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop):
+    """The cost of building call details and invoking the continuation, for comparison with the interceptors."""
+    request = _GetRequest(cache_key=b"key")
+
+    async def call() -> _OkCall:
+        return await _continuation(_call_details(), request)
+
+    benchmark.run_async(bench_loop, call)
+
+
+def test_add_header_interceptor(benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop):
+    """What adding the authorization and agent headers cost data requests before `StaticHeaders`."""
+    interceptor = AddHeaderClientInterceptor([Header("authorization", "token"), Header("agent", "python:bench")])
+    request = _GetRequest(cache_key=b"key")
+
+    async def call() -> _OkCall:
+        return await interceptor.intercept_unary_unary(_continuation, _call_details(), request)
+
+    benchmark.run_async(bench_loop, call)
+
+
+def test_static_headers(benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop):
+    """Compare with `test_add_header_interceptor`: the headers go into the metadata the call is made with."""
+    headers = StaticHeaders([Header("authorization", "token"), Header("agent", "python:bench")])
+    request = _GetRequest(cache_key=b"key")
+
+    async def call() -> _OkCall:
+        details = ClientCallDetails(
+            method=b"/cache_client.Scs/Get",
+            timeout=5.0,
+            metadata=headers.metadata("bench-cache"),
+            credentials=None,
+            wait_for_ready=None,
+        )
+        return await _continuation(details, request)
+
+    benchmark.run_async(bench_loop, call)
+
+
+def test_add_header_interceptor_with_list_metadata(benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop):
+    """Metadata arrives as a list when another interceptor (e.g. ddtrace) ran first."""
+    interceptor = AddHeaderClientInterceptor([Header("authorization", "token")])
+    request = _GetRequest(cache_key=b"key")
+
+    async def call() -> _OkCall:
+        details = ClientCallDetails(
+            method=b"/cache_client.Scs/Get",
+            timeout=5.0,
+            metadata=[("cache", "bench-cache"), ("x-datadog-trace-id", "1")],
+            credentials=None,
+            wait_for_ready=None,
+        )
+        return await interceptor.intercept_unary_unary(_continuation, details, request)
+
+    benchmark.run_async(bench_loop, call)
+
+
+def test_retry_interceptor(benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop):
+    interceptor = RetryInterceptor()
+    request = _GetRequest(cache_key=b"key")
+
+    async def call() -> _OkCall:
+        return await interceptor.intercept_unary_unary(_continuation, _call_details(), request)
+
+    benchmark.run_async(bench_loop, call)
+
+
+def test_metadata_copy(benchmark: Benchmark):
+    metadata = Metadata(("cache", "bench-cache"))
+    benchmark(lambda: Metadata(*metadata))
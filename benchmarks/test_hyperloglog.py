@@ -0,0 +1,26 @@
+"""Incubating HyperLogLogs: batched hashing into registers, and counting."""
+from benchmarks.harness import Benchmark
+from momento.incubating._utilities._hyperloglog import _HyperLogLog
+
+IDS = [f"visitor-{i}".encode() for i in range(100_000)]
+
+
+def test_hll_add_many_100k(benchmark: Benchmark):
+    """The client-side cost of the single read-modify-write that adds 100k IDs."""
+
+    def add_many() -> None:
+        _HyperLogLog.empty(14).add_many(IDS)
+
+    benchmark(add_many)
+
+
+def test_hll_count(benchmark: Benchmark):
+    sketch = _HyperLogLog.empty(14)
+    sketch.add_many(IDS)
+    assert abs(benchmark(sketch.count) - len(IDS)) <= 0.02 * len(IDS)
+
+
+def test_hll_decode_and_merge(benchmark: Benchmark):
+    blob = _HyperLogLog.empty(14).encode()
+    sketch = _HyperLogLog.empty(14)
+    benchmark(lambda: sketch.merge(_HyperLogLog.decode(blob)))
@@ -0,0 +1,64 @@
+"""Incubating dictionary (de)serialization."""
+import asyncio
+import pickle
+
+from benchmarks.harness import Benchmark
+from momento.incubating._utilities._decoded_dictionary_cache import (
+    _DecodedDictionaryCache,
+)
+from momento.incubating.aio.utils import (
+    convert_dict_items_to_bytes,
+    deserialize_dictionary,
+    deserialize_dictionary_fields,
+    serialize_dictionary,
+)
+from momento.incubating.cache_operation_types import BytesDictionary
+
+SMALL = {f"field-{i}".encode(): b"v" * 32 for i in range(10)}
+LARGE = {f"field-{i}".encode(): b"v" * 100 for i in range(10_000)}
+
+
+def test_serialize_dictionary_small(benchmark: Benchmark):
+    benchmark(serialize_dictionary, SMALL)
+
+
+def test_deserialize_dictionary_small(benchmark: Benchmark):
+    blob = serialize_dictionary(SMALL)
+    assert benchmark(deserialize_dictionary, blob) == SMALL
+
+
+def test_serialize_dictionary_large(benchmark: Benchmark):
+    benchmark(serialize_dictionary, LARGE)
+
+
+def test_deserialize_dictionary_large(benchmark: Benchmark):
+    blob = serialize_dictionary(LARGE)
+    assert benchmark(deserialize_dictionary, blob) == LARGE
+
+
+def test_convert_dict_items_to_bytes(benchmark: Benchmark):
+    dictionary = {f"field-{i}": "v" * 32 for i in range(100)}
+    benchmark(convert_dict_items_to_bytes, dictionary)
+
+
+def test_lookup_dictionary_field_large(benchmark: Benchmark):
+    """`dictionary_get` only decodes the requested field."""
+    blob = serialize_dictionary(LARGE)
+    assert benchmark(deserialize_dictionary_fields, blob, [b"field-5000"]) == [LARGE[b"field-5000"]]
+
+
+def test_deserialize_legacy_pickled_dictionary_large(benchmark: Benchmark):
+    blob = pickle.dumps(LARGE)
+    assert benchmark(deserialize_dictionary, blob) == LARGE
+
+
+def test_decoded_dictionary_cache_hit_large(benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop):
+    """An unchanged dictionary is compared against the cached blob and copied instead of decoded."""
+    blob = serialize_dictionary(LARGE)
+    cache = _DecodedDictionaryCache(100_000_000)
+
+    async def decode(blob: bytes) -> BytesDictionary:
+        return deserialize_dictionary(blob)
+
+    bench_loop.run_until_complete(cache.get_or_decode("cache", "dictionary", blob, decode))
+    assert benchmark.run_async(bench_loop, cache.get_or_decode, "cache", "dictionary", blob, decode) == LARGE
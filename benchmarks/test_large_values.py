@@ -0,0 +1,38 @@
+"""Chunked transfer of values larger than a single item."""
+import asyncio
+import os
+
+from benchmarks.conftest import BENCH_CACHE_NAME
+from benchmarks.harness import Benchmark
+from momento.aio.simple_cache_client import SimpleCacheClient as SimpleCacheClientAsync
+
+# Eight 1 MiB chunks.
+LARGE_VALUE = os.urandom(8 * 1024 * 1024)
+# The largest value a single set can carry.
+SINGLE_ITEM_VALUE = LARGE_VALUE[: 3 * 1024 * 1024]
+
+
+def test_async_set_large_8mib(
+    benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop, client_async: SimpleCacheClientAsync
+):
+    benchmark.run_async(bench_loop, client_async.set_large, BENCH_CACHE_NAME, "large-key", LARGE_VALUE)
+
+
+def test_async_get_large_8mib(
+    benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop, client_async: SimpleCacheClientAsync
+):
+    bench_loop.run_until_complete(client_async.set_large(BENCH_CACHE_NAME, "large-key", LARGE_VALUE))
+    benchmark.run_async(bench_loop, client_async.get_large, BENCH_CACHE_NAME, "large-key")
+
+
+def test_async_set_3mib(
+    benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop, client_async: SimpleCacheClientAsync
+):
+    """Compare with `test_async_set_large_3mib` for the cost of chunking a value that fits an item."""
+    benchmark.run_async(bench_loop, client_async.set, BENCH_CACHE_NAME, "single-key", SINGLE_ITEM_VALUE)
+
+
+def test_async_set_large_3mib(
+    benchmark: Benchmark, bench_loop: asyncio.AbstractEventLoop, client_async: SimpleCacheClientAsync
+):
+    benchmark.run_async(bench_loop, client_async.set_large, BENCH_CACHE_NAME, "chunked-key", SINGLE_ITEM_VALUE)
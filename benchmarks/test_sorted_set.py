@@ -0,0 +1,45 @@
+"""Incubating sorted sets: binary search over the encoded index versus decoding the whole set."""
+import random
+
+from benchmarks.harness import Benchmark
+from momento.incubating._utilities._sorted_set_encoding import (
+    _SortedSetView,
+    decode_sorted_set,
+    encode_sorted_set,
+)
+
+_random = random.Random(0)
+LEADERBOARD = {f"player-{i}".encode(): float(_random.randint(0, 1_000_000)) for i in range(100_000)}
+BLOB = encode_sorted_set(LEADERBOARD)
+
+
+def test_encode_sorted_set_100k(benchmark: Benchmark):
+    benchmark(encode_sorted_set, LEADERBOARD)
+
+
+def test_decode_sorted_set_100k(benchmark: Benchmark):
+    """What every query would cost if the set were decoded in full, before even sorting it."""
+    assert len(benchmark(decode_sorted_set, BLOB)) == len(LEADERBOARD)
+
+
+def test_zrank_100k(benchmark: Benchmark):
+    def zrank() -> object:
+        return _SortedSetView(BLOB).rank(b"player-50000")
+
+    assert benchmark(zrank) is not None
+
+
+def test_top_10_of_100k(benchmark: Benchmark):
+    def top_10() -> object:
+        view = _SortedSetView(BLOB)
+        return view.items(len(view) - 10, len(view))[::-1]
+
+    assert len(benchmark(top_10)) == 10
+
+
+def test_range_by_score_100k(benchmark: Benchmark):
+    def range_by_score() -> object:
+        view = _SortedSetView(BLOB)
+        return view.items(*view.ranks_by_score(500_000, 501_000))
+
+    benchmark(range_by_score)
@@ -9,6 +9,7 @@ _MOMENTO_CONTROL_ENDPOINT_PREFIX = "control."
 _MOMENTO_CACHE_ENDPOINT_PREFIX = "cache."
 _CONTROL_ENDPOINT_CLAIM_ID = "cp"
 _CACHE_ENDPOINT_CLAIM_ID = "c"
+_LOOPBACK_HOSTS = ("localhost", "127.0.0.1", "[::1]")
 
 
 class _Endpoints:
@@ -19,6 +20,9 @@ class _Endpoints:
 
 def resolve(auth_token: str, endpoint_override: Optional[str] = None) -> _Endpoints:
     if endpoint_override is not None:
+        # A local server (such as `momento.testing.fake_server`) hosts both services on one port.
+        if is_loopback(endpoint_override):
+            return _Endpoints(endpoint_override, endpoint_override)
         return _Endpoints(
             _MOMENTO_CONTROL_ENDPOINT_PREFIX + endpoint_override,
             _MOMENTO_CACHE_ENDPOINT_PREFIX + endpoint_override,
@@ -26,6 +30,11 @@ def resolve(auth_token: str, endpoint_override: Optional[str] = None) -> _Endpoi
     return _getEndpointFromToken(auth_token)
 
 
+def is_loopback(endpoint: str) -> bool:
+    host = endpoint if endpoint.endswith("]") else endpoint.rsplit(":", 1)[0]
+    return host in _LOOPBACK_HOSTS
+
+
 def _getEndpointFromToken(auth_token: str) -> _Endpoints:
     try:
         claims = jwt.decode(auth_token, options={"verify_signature": False})  # type: ignore[misc]
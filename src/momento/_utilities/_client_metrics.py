@@ -0,0 +1,166 @@
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..compression import CompressionStats
+from ..hooks import RequestHook, RequestInfo
+from ..hot_keys import HotKey
+from ..metrics import HistogramSnapshot, MetricsSnapshot, OperationMetrics
+from ..near_cache import NearCacheStats
+
+# Durations are recorded in microseconds, in buckets of HdrHistogram's log-linear layout: exact up to
+# 32 µs, and then 16 buckets per power of two, so every bucket is within 1/16 of the values in it.
+_SUB_BUCKETS = 16
+_LINEAR_BUCKETS = 2 * _SUB_BUCKETS
+# Enough for durations of up to 2**30 µs, about 18 minutes; longer ones go into the last bucket.
+_BUCKET_COUNT = (30 - 5) * _SUB_BUCKETS + _LINEAR_BUCKETS
+
+
+def _bucket_index(micros: int) -> int:
+    if micros < _LINEAR_BUCKETS:
+        return micros
+    shift = micros.bit_length() - 5
+    return min(shift * _SUB_BUCKETS + (micros >> shift), _BUCKET_COUNT - 1)
+
+
+def _bucket_upper_bound(index: int) -> int:
+    """The largest duration, in microseconds, that goes into bucket `index`."""
+    if index < _LINEAR_BUCKETS:
+        return index
+    shift = index // _SUB_BUCKETS - 1
+    sub_bucket = index % _SUB_BUCKETS + _SUB_BUCKETS
+    return ((sub_bucket + 1) << shift) - 1
+
+
+class _LatencyHistogram:
+    __slots__ = ("_counts", "_count", "_total_micros", "_min_micros", "_max_micros")
+
+    def __init__(self) -> None:
+        self._counts = [0] * _BUCKET_COUNT
+        self._count = 0
+        self._total_micros = 0
+        self._min_micros = 0
+        self._max_micros = 0
+
+    def record(self, seconds: float) -> None:
+        micros = int(seconds * 1_000_000)
+        self._counts[_bucket_index(micros)] += 1
+        if not self._count or micros < self._min_micros:
+            self._min_micros = micros
+        if micros > self._max_micros:
+            self._max_micros = micros
+        self._count += 1
+        self._total_micros += micros
+
+    def snapshot(self) -> HistogramSnapshot:
+        buckets = [
+            (min(_bucket_upper_bound(index), self._max_micros) / 1_000_000, count)
+            for index, count in enumerate(self._counts)
+            if count
+        ]
+        return HistogramSnapshot(
+            self._count,
+            self._total_micros / 1_000_000,
+            self._min_micros / 1_000_000,
+            self._max_micros / 1_000_000,
+            buckets,
+        )
+
+
+class _OperationStats:
+    __slots__ = ("latency", "successes", "hits", "misses", "errors", "request_bytes", "response_bytes")
+
+    def __init__(self) -> None:
+        self.latency = _LatencyHistogram()
+        self.successes = 0
+        self.hits = 0
+        self.misses = 0
+        self.errors: Dict[str, int] = {}
+        self.request_bytes = 0
+        self.response_bytes = 0
+
+
+class _ClientMetrics(RequestHook):
+    """Records the requests of a client.
+
+    Everything is recorded on the client's event loop, one request at a time, so plain counters
+    suffice and no locks are taken.
+    """
+
+    def __init__(
+        self,
+        channel_count: int,
+        compression_stats: Callable[[], Optional[CompressionStats]],
+        hot_keys: Callable[[], Optional[List[HotKey]]] = lambda: None,
+        near_cache_stats: Callable[[], Optional[NearCacheStats]] = lambda: None,
+    ):
+        self._operations: Dict[Tuple[str, str], _OperationStats] = {}
+        self._in_flight = [0] * channel_count
+        self._retries: Dict[str, int] = {}
+        self._compression_stats = compression_stats
+        self._hot_keys = hot_keys
+        self._near_cache_stats = near_cache_stats
+
+    def on_start(self, request: RequestInfo) -> None:
+        self._in_flight[request.channel] += 1
+
+    def on_success(self, request: RequestInfo, duration_seconds: float, response_bytes: int) -> None:
+        self._in_flight[request.channel] -= 1
+        stats = self._operation_stats(request.operation, request.cache_name)
+        stats.latency.record(duration_seconds)
+        if request.hit is None:
+            stats.successes += 1
+        elif request.hit:
+            stats.hits += 1
+        else:
+            stats.misses += 1
+        stats.request_bytes += request.request_bytes
+        stats.response_bytes += response_bytes
+
+    def on_error(self, request: RequestInfo, duration_seconds: float, error: Exception) -> None:
+        self._in_flight[request.channel] -= 1
+        stats = self._operation_stats(request.operation, request.cache_name)
+        stats.latency.record(duration_seconds)
+        error_name = type(error).__name__
+        stats.errors[error_name] = stats.errors.get(error_name, 0) + 1
+        stats.request_bytes += request.request_bytes
+
+    def record_near_cache_hit(self, cache_name: str, duration_seconds: float) -> None:
+        """Counts a get served from the near cache, which sends no request and skips the hooks."""
+        stats = self._operation_stats("get", cache_name)
+        stats.latency.record(duration_seconds)
+        stats.hits += 1
+
+    def record_retry(self, method: str) -> None:
+        """Counts a retry of a gRPC method, given by its path, e.g. "/cache_client.Scs/Get"."""
+        operation = method.rsplit("/", 1)[-1].lower()
+        self._retries[operation] = self._retries.get(operation, 0) + 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        operations: List[OperationMetrics] = [
+            OperationMetrics(
+                operation,
+                cache_name,
+                stats.latency.snapshot(),
+                stats.successes,
+                stats.hits,
+                stats.misses,
+                dict(stats.errors),
+                stats.request_bytes,
+                stats.response_bytes,
+            )
+            for (operation, cache_name), stats in sorted(self._operations.items())
+        ]
+        return MetricsSnapshot(
+            operations,
+            dict(self._retries),
+            list(self._in_flight),
+            self._compression_stats(),
+            self._hot_keys(),
+            self._near_cache_stats(),
+        )
+
+    def _operation_stats(self, operation: str, cache_name: str) -> _OperationStats:
+        key = (operation, cache_name)
+        stats = self._operations.get(key)
+        if stats is None:
+            stats = self._operations[key] = _OperationStats()
+        return stats
@@ -1,14 +1,11 @@
 from typing import Optional, Union
 
-from grpc.aio import Metadata
-
 from .. import errors
 
 DEFAULT_STRING_CONVERSION_ERROR = "Could not decode bytes to UTF-8"
 
-
-def _make_metadata(cache_name: str) -> Metadata:
-    return Metadata(("cache", cache_name))  # type: ignore[misc]
+# gRPC rejects larger messages by default, but only after they were sent in full.
+MAX_MESSAGE_SIZE_BYTES = 4 * 1024 * 1024
 
 
 def _validate_cache_name(cache_name: str) -> None:
@@ -17,14 +14,42 @@ def _validate_cache_name(cache_name: str) -> None:
 
 
 def _as_bytes(
-    data: Union[str, bytes],
+    data: Union[str, bytes, bytearray, memoryview],
     error_message: Optional[str] = DEFAULT_STRING_CONVERSION_ERROR,
 ) -> bytes:
     if isinstance(data, str):
         return data.encode("utf-8")
-    if isinstance(data, bytes):
+    # Not `isinstance`, which mypy also takes to match bytearrays and memoryviews.
+    if type(data) is bytes:
+        return data
+    return bytes(_as_buffer(data, error_message))
+
+
+def _as_buffer(
+    data: Union[str, bytes, bytearray, memoryview],
+    error_message: Optional[str] = DEFAULT_STRING_CONVERSION_ERROR,
+) -> Union[bytes, memoryview]:
+    """Like `_as_bytes`, but returns other objects supporting the buffer protocol as a view rather than a copy."""
+    if type(data) is bytes:
         return data
-    raise errors.InvalidArgumentError(error_message + str(type(data)))
+    if isinstance(data, str):
+        return data.encode("utf-8")
+    try:
+        view = memoryview(data)
+    except TypeError:
+        message = error_message or DEFAULT_STRING_CONVERSION_ERROR
+        raise errors.InvalidArgumentError(message + str(type(data))) from None
+    if not view.c_contiguous:
+        raise errors.InvalidArgumentError("Buffers must be contiguous")
+    return view if view.format == "B" and view.ndim == 1 else view.cast("B")
+
+
+def _validate_request_size(request_size: int) -> None:
+    if request_size > MAX_MESSAGE_SIZE_BYTES:
+        raise errors.InvalidArgumentError(
+            f"Request of {request_size} bytes exceeds the limit of {MAX_MESSAGE_SIZE_BYTES} bytes; "
+            "use set_large to store larger values"
+        )
 
 
 def _validate_ttl(ttl_seconds: int) -> None:
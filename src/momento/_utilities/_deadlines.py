@@ -0,0 +1,37 @@
+import time
+from contextvars import ContextVar
+from typing import Optional, overload
+
+from .. import errors
+
+# When the budget of the code being run is used up, as a `time.monotonic()` timestamp.
+DEADLINE: ContextVar[Optional[float]] = ContextVar("momento_deadline", default=None)
+
+
+def remaining_seconds() -> Optional[float]:
+    deadline = DEADLINE.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+@overload
+def bounded_timeout(timeout: float) -> float:
+    ...
+
+
+@overload
+def bounded_timeout(timeout: None) -> Optional[float]:
+    ...
+
+
+def bounded_timeout(timeout: Optional[float]) -> Optional[float]:
+    """`timeout`, or the remaining budget if there is one and it is shorter.
+
+    Raises:
+        TimeoutError: If the budget is used up.
+    """
+    remaining = remaining_seconds()
+    if remaining is None:
+        return timeout
+    if remaining <= 0:
+        raise errors.TimeoutError("The deadline budget of the request is used up")
+    return remaining if timeout is None else min(timeout, remaining)
@@ -0,0 +1,114 @@
+import heapq
+import random
+from typing import Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
+
+from .. import logs
+from ..hooks import RequestHook, RequestInfo
+from ..hot_keys import HotKey, HotKeyTracking
+
+_TKey = TypeVar("_TKey", bound=Hashable)
+
+# Operations whose keys are counted.
+_TRACKED_OPERATIONS = frozenset(("get", "set"))
+
+
+class _SpaceSaving(Generic[_TKey]):
+    """Counts the most frequent keys of a stream in bounded memory, after Metwally et al.
+
+    Keys that are not counted yet start at the count of the busiest key evicted so far, which
+    bounds how often they may have been seen before. Evicting the least counted key on every new
+    key takes a scan of all counts, so instead up to twice `capacity` keys are kept, and the half
+    with the lowest counts is evicted at once.
+    """
+
+    def __init__(self, capacity: int):
+        self._capacity = capacity
+        self._counts: Dict[_TKey, int] = {}
+        self._errors: Dict[_TKey, int] = {}
+        self._floor = 0
+
+    def add(self, key: _TKey) -> int:
+        """Counts `key`, and returns how often it has been seen at least."""
+        count = self._counts.get(key)
+        if count is not None:
+            self._counts[key] = count + 1
+            return count + 1 - self._errors[key]
+        if len(self._counts) >= 2 * self._capacity:
+            self._evict()
+        self._counts[key] = self._floor + 1
+        self._errors[key] = self._floor
+        return 1
+
+    def count(self, key: _TKey) -> int:
+        """How often `key` has been seen at most."""
+        return self._counts.get(key, self._floor)
+
+    def top(self, k: int) -> List[Tuple[_TKey, int, int]]:
+        """The `k` keys with the highest counts, with their counts and how much those may be too high."""
+        counts = self._counts
+        return [(key, counts[key], self._errors[key]) for key in heapq.nlargest(k, counts, key=counts.__getitem__)]
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def _evict(self) -> None:
+        capacity = self._capacity
+        counts = self._counts
+        ranked = sorted(counts, key=counts.__getitem__, reverse=True)
+        self._floor = max(self._floor, counts[ranked[capacity]])
+        for key in ranked[capacity:]:
+            del counts[key]
+            del self._errors[key]
+
+
+class _HotKeyTracker(RequestHook):
+    """Counts the gets and sets of a client by key, in intervals.
+
+    Like `_ClientMetrics`, this runs on the client's event loop and takes no locks.
+    """
+
+    def __init__(self, tracking: HotKeyTracking):
+        self._tracking = tracking
+        self._sketch: _SpaceSaving[Tuple[str, bytes]] = _SpaceSaving(tracking.capacity)
+        self._interval_start: Optional[float] = None
+
+    def on_start(self, request: RequestInfo) -> None:
+        if request.operation in _TRACKED_OPERATIONS:
+            self.record(request.cache_name, request.key, request.start_time)
+
+    def record(self, cache_name: str, key: bytes, now: float) -> None:
+        """Counts a get or set of `key`, including gets served from the near cache, which skip the hooks."""
+        tracking = self._tracking
+        if tracking.sample_ratio < 1.0 and random.random() >= tracking.sample_ratio:
+            return
+        interval_start = self._interval_start
+        if interval_start is None:
+            self._interval_start = now
+        elif now - interval_start >= tracking.report_interval_seconds:
+            self._report(now, now - interval_start)
+        self._sketch.add((cache_name, key))
+
+    def hot_keys(self, now: float) -> List[HotKey]:
+        """The busiest keys of the current interval so far."""
+        if self._interval_start is None:
+            return []
+        return self._top(max(now - self._interval_start, 1e-9))
+
+    def _report(self, now: float, seconds: float) -> None:
+        hot_keys = self._top(seconds)
+        self._sketch = _SpaceSaving(self._tracking.capacity)
+        self._interval_start = now
+        if self._tracking.on_report is not None:
+            self._tracking.on_report(hot_keys)
+        else:
+            logs.logger.info(
+                "Hot keys: %s",
+                ", ".join(f"{key.cache_name}/{key.key!r} {key.requests_per_second:.1f}/s" for key in hot_keys),
+            )
+
+    def _top(self, seconds: float) -> List[HotKey]:
+        scale = 1 / self._tracking.sample_ratio
+        return [
+            HotKey(cache_name, key, round(count * scale), round(error * scale), count * scale / seconds)
+            for (cache_name, key), count, error in self._sketch.top(self._tracking.top_k)
+        ]
@@ -0,0 +1,88 @@
+"""Layout of values stored with `set_large`.
+
+A large value is split into chunks of `chunk size` bytes, the last one possibly shorter, and each
+chunk is stored as a cache item of its own. A manifest stored under the value's own key describes
+them:
+
+    manifest: magic (4 bytes, starting with 0xFF) | version (uint8) | generation (8 bytes)
+              | chunk size (uint32) | value size (uint64) | CRC-32 of each chunk (uint32 each)
+
+Chunk keys contain the generation, which is random and new for every `set_large`. The manifest is
+written only after all of its chunks, so readers find either the previous value or the new one,
+never a mix of both; the previous chunks are deleted once the new manifest is in place. Every
+chunk is checked against its length and CRC-32 when it is read.
+"""
+import os
+import struct
+import sys
+import zlib
+from array import array
+from typing import List, Optional, Tuple, Union, cast
+
+from .. import errors
+
+MAGIC = b"\xffMLV"
+_VERSION = 1
+_HEADER = struct.Struct("<4sB8sIQ")
+# Checksums are read and written as an array of native uint32s, byte-swapped on big-endian hosts.
+_UINT32 = "I" if array("I").itemsize == 4 else "L"
+
+
+class _LargeValueManifest:
+    def __init__(self, generation: bytes, chunk_size: int, value_size: int, checksums: "array[int]"):
+        self.generation = generation
+        self.chunk_size = chunk_size
+        self.value_size = value_size
+        self.checksums = checksums
+
+    @staticmethod
+    def for_value(value: Union[bytes, memoryview], chunk_size: int) -> "_LargeValueManifest":
+        checksums = array(_UINT32, (zlib.crc32(chunk) for chunk in _chunks(value, chunk_size)))
+        return _LargeValueManifest(os.urandom(8), chunk_size, len(value), checksums)
+
+    @staticmethod
+    def decode(blob: bytes) -> Optional["_LargeValueManifest"]:
+        """Returns the manifest stored in `blob`, or None if `blob` is a value of its own."""
+        if len(blob) < _HEADER.size or not blob.startswith(MAGIC):
+            return None
+        _, version, generation, chunk_size, value_size = cast(
+            Tuple[bytes, int, bytes, int, int], _HEADER.unpack_from(blob)
+        )
+        if version != _VERSION or chunk_size == 0:
+            raise errors.ClientSdkError("Could not read large value: unsupported manifest")
+        checksums = array(_UINT32)
+        checksums.frombytes(blob[_HEADER.size :])  # noqa: E203
+        if sys.byteorder == "big":
+            checksums.byteswap()
+        if len(checksums) != -(-value_size // chunk_size):
+            raise errors.ClientSdkError("Could not read large value: manifest is corrupt")
+        return _LargeValueManifest(generation, chunk_size, value_size, checksums)
+
+    def encode(self) -> bytes:
+        checksums = array(_UINT32, self.checksums)
+        if sys.byteorder == "big":
+            checksums.byteswap()
+        header = _HEADER.pack(MAGIC, _VERSION, self.generation, self.chunk_size, self.value_size)
+        return header + checksums.tobytes()
+
+    @property
+    def chunk_count(self) -> int:
+        return len(self.checksums)
+
+    def chunk_key(self, key: bytes, index: int) -> bytes:
+        # NUL cannot be typed by accident, so chunk keys do not collide with the keys of other items.
+        return b"%s\x00%s\x00%d" % (key, self.generation.hex().encode("ascii"), index)
+
+    def chunk_bounds(self, index: int) -> Tuple[int, int]:
+        start = index * self.chunk_size
+        return start, min(start + self.chunk_size, self.value_size)
+
+    def verify_chunk(self, index: int, chunk: bytes) -> None:
+        start, end = self.chunk_bounds(index)
+        if len(chunk) != end - start or zlib.crc32(chunk) != self.checksums[index]:
+            raise errors.ClientSdkError(f"Could not read large value: chunk {index} is corrupt")
+
+
+def _chunks(value: Union[bytes, memoryview], chunk_size: int) -> List[memoryview]:
+    view = memoryview(value)
+    return [view[start : start + chunk_size] for start in range(0, len(value), chunk_size)]  # noqa: E203
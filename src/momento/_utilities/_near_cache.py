@@ -0,0 +1,110 @@
+import math
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from ..cache_operation_types import CacheGetResponse, CacheGetStatus
+from ..hooks import RequestHook, RequestInfo
+from ..near_cache import NearCacheStats, NearCaching
+from ._hot_keys import _SpaceSaving
+
+_Key = Tuple[str, bytes]
+
+# Requests that change the item of their key.
+_WRITE_OPERATIONS = frozenset(("set", "delete"))
+
+
+class _NearCache(RequestHook):
+    """Keeps the responses of gets of frequently read keys in memory.
+
+    Reads are counted in a Space-Saving sketch per interval. Promoted keys map to their kept
+    response and its expiry time, or to None until a response is kept. As a hook, the cache sees
+    every set and delete of the client's data clients, including those of `set_multi` and of the
+    incubating operations, and invalidates their keys when they start and again when they end. A get
+    that was in flight while its key was written must not keep what it read, so every invalidation
+    bumps a version, and responses read under an older version are not kept. Invalidating at the end
+    too covers gets that start during a write and still read the item from before it.
+
+    Everything runs on the client's event loop, so no locks are taken.
+    """
+
+    def __init__(self, settings: NearCaching, clock: Callable[[], float] = time.perf_counter):
+        self._settings = settings
+        self._clock = clock
+        self._promotion_reads = math.ceil(settings.min_reads_per_second * settings.window_seconds)
+        self._reads: _SpaceSaving[_Key] = _SpaceSaving(settings.tracked_keys)
+        self._window_start = clock()
+        self._entries: Dict[_Key, Optional[Tuple[CacheGetResponse, float]]] = {}
+        self._version = 0
+        self._hits = 0
+        self._misses = 0
+        self._promotions = 0
+        self._demotions = 0
+        self._invalidations = 0
+
+    def get(self, cache_name: str, key: bytes) -> Tuple[Optional[CacheGetResponse], int]:
+        """Counts a read of `key`, and returns the response kept for it, if any, and the version to keep the
+        response read from Momento under otherwise."""
+        now = self._clock()
+        if now - self._window_start >= self._settings.window_seconds:
+            self._end_window(now)
+        entry_key = (cache_name, key)
+        reads = self._reads.add(entry_key)
+        if entry_key in self._entries:
+            entry = self._entries[entry_key]
+            if entry is not None and entry[1] > now:
+                self._hits += 1
+                return entry[0], self._version
+            self._misses += 1
+        elif reads >= self._promotion_reads and len(self._entries) < self._settings.max_entries:
+            self._entries[entry_key] = None
+            self._promotions += 1
+        return None, self._version
+
+    def put(self, cache_name: str, key: bytes, response: CacheGetResponse, version: int) -> None:
+        """Keeps `response` if its key is promoted and has not been written since `version`."""
+        entry_key = (cache_name, key)
+        if version == self._version and entry_key in self._entries and response.status() == CacheGetStatus.HIT:
+            self._entries[entry_key] = (response, self._clock() + self._settings.ttl_seconds)
+
+    def on_start(self, request: RequestInfo) -> None:
+        if request.operation in _WRITE_OPERATIONS:
+            self.invalidate(request.cache_name, request.key)
+
+    def on_success(self, request: RequestInfo, duration_seconds: float, response_bytes: int) -> None:
+        if request.operation in _WRITE_OPERATIONS:
+            self.invalidate(request.cache_name, request.key)
+
+    def on_error(self, request: RequestInfo, duration_seconds: float, error: Exception) -> None:
+        # The write may have been applied even though it failed, e.g. if it timed out.
+        if request.operation in _WRITE_OPERATIONS:
+            self.invalidate(request.cache_name, request.key)
+
+    def invalidate(self, cache_name: str, key: bytes) -> None:
+        entry_key = (cache_name, key)
+        if entry_key in self._entries:
+            self._version += 1
+            if self._entries[entry_key] is not None:
+                self._entries[entry_key] = None
+                self._invalidations += 1
+
+    def invalidate_cache(self, cache_name: str) -> None:
+        self._version += 1
+        for entry_key, entry in self._entries.items():
+            if entry_key[0] == cache_name and entry is not None:
+                self._entries[entry_key] = None
+                self._invalidations += 1
+
+    def stats(self) -> NearCacheStats:
+        return NearCacheStats(
+            self._hits, self._misses, self._promotions, self._demotions, self._invalidations, len(self._entries)
+        )
+
+    def _end_window(self, now: float) -> None:
+        # Keys are demoted at half the promotion rate, so that keys around it do not flap. Windows
+        # only end on a read, so they may have lasted longer than `window_seconds`.
+        demotion_reads = self._promotion_reads / 2 * (now - self._window_start) / self._settings.window_seconds
+        for entry_key in [entry_key for entry_key in self._entries if self._reads.count(entry_key) < demotion_reads]:
+            del self._entries[entry_key]
+            self._demotions += 1
+        self._reads = _SpaceSaving(self._settings.tracked_keys)
+        self._window_start = now
@@ -0,0 +1,56 @@
+import time
+from typing import List, Optional, Sequence
+
+from .. import logs
+from ..hooks import RequestHook, RequestInfo, TraceLoggingHook
+
+
+class _RequestHooks:
+    """Calls the hooks of a client, and the one that logs requests while TRACE logging is enabled."""
+
+    def __init__(self, hooks: Sequence[RequestHook], channel: int = 0):
+        self._hooks = list(hooks)
+        self._hooks_with_trace_logging = [*self._hooks, TraceLoggingHook()]
+        self._channel = channel
+
+    def start(
+        self, operation: str, cache_name: str, key: bytes, request_bytes: int = 0
+    ) -> Optional["_ObservedRequest"]:
+        """Calls the hooks for a request that starts, or returns None without taking a timestamp if there are none."""
+        # The level is checked for every request, so that enabling TRACE logging also logs the requests
+        # of clients that already exist. `isEnabledFor` caches its answer until levels change.
+        hooks = self._hooks_with_trace_logging if logs.logger.isEnabledFor(logs.TRACE) else self._hooks
+        if not hooks:
+            return None
+        request = RequestInfo(operation, cache_name, key, request_bytes, time.perf_counter(), self._channel)
+        for hook in hooks:
+            try:
+                hook.on_start(request)
+            except Exception as e:
+                logs.logger.warning("Request hook %r failed: %s", hook, e)
+        return _ObservedRequest(hooks, request)
+
+
+class _ObservedRequest:
+    __slots__ = ("_hooks", "_request")
+
+    def __init__(self, hooks: List[RequestHook], request: RequestInfo):
+        self._hooks = hooks
+        self._request = request
+
+    def succeeded(self, response_bytes: int = 0, hit: Optional[bool] = None) -> None:
+        self._request.hit = hit
+        duration_seconds = time.perf_counter() - self._request.start_time
+        for hook in self._hooks:
+            try:
+                hook.on_success(self._request, duration_seconds, response_bytes)
+            except Exception as e:
+                logs.logger.warning("Request hook %r failed: %s", hook, e)
+
+    def failed(self, error: Exception) -> None:
+        duration_seconds = time.perf_counter() - self._request.start_time
+        for hook in self._hooks:
+            try:
+                hook.on_error(self._request, duration_seconds, error)
+            except Exception as e:
+                logs.logger.warning("Request hook %r failed: %s", hook, e)
@@ -0,0 +1,92 @@
+import random
+import time
+from contextvars import ContextVar
+from typing import List, Optional, Tuple
+
+from .. import logs
+from ..hooks import RequestHook, RequestInfo
+from ..slow_requests import SlowRequest, SlowRequestLogging
+
+
+class _Timeline:
+    """When a request reached each of its phases, as `time.perf_counter()` timestamps."""
+
+    __slots__ = ("request", "phases")
+
+    def __init__(self, request: RequestInfo):
+        self.request = request
+        self.phases: List[Tuple[str, float]] = []
+
+    def record(self, phase: str) -> None:
+        self.phases.append((phase, time.perf_counter()))
+
+
+# The timeline of the request being made, if it is sampled. gRPC runs interceptors in a task of its
+# own, which starts with a copy of the context of the request, so they see the same timeline.
+REQUEST_TIMELINE: ContextVar[Optional[_Timeline]] = ContextVar("momento_request_timeline", default=None)
+
+
+class _SlowRequestLog(RequestHook):
+    """Reports the requests of a client that take longer than a threshold.
+
+    Like `_ClientMetrics`, this runs on the client's event loop and takes no locks.
+    """
+
+    def __init__(self, logging: SlowRequestLogging):
+        self._logging = logging
+
+    def on_start(self, request: RequestInfo) -> None:
+        sample_ratio = self._logging.sample_ratio
+        if sample_ratio >= 1.0 or random.random() < sample_ratio:
+            REQUEST_TIMELINE.set(_Timeline(request))
+
+    def on_success(self, request: RequestInfo, duration_seconds: float, response_bytes: int) -> None:
+        phases = self._finish(request)
+        if duration_seconds >= self._logging.threshold_seconds:
+            self._report(request, duration_seconds, phases, "decoded", None)
+
+    def on_error(self, request: RequestInfo, duration_seconds: float, error: Exception) -> None:
+        phases = self._finish(request)
+        if duration_seconds >= self._logging.threshold_seconds:
+            self._report(request, duration_seconds, phases, "failed", error)
+
+    def _finish(self, request: RequestInfo) -> Optional[List[Tuple[str, float]]]:
+        timeline = REQUEST_TIMELINE.get()
+        if timeline is None or timeline.request is not request:
+            return None
+        REQUEST_TIMELINE.set(None)
+        return timeline.phases
+
+    def _report(
+        self,
+        request: RequestInfo,
+        duration_seconds: float,
+        phases: Optional[List[Tuple[str, float]]],
+        last_phase: str,
+        error: Optional[Exception],
+    ) -> None:
+        offsets = (
+            []
+            if phases is None
+            else [
+                *((phase, timestamp - request.start_time) for phase, timestamp in phases),
+                (last_phase, duration_seconds),
+            ]
+        )
+        slow_request = SlowRequest(request, duration_seconds, offsets, error)
+        if self._logging.on_slow_request is not None:
+            self._logging.on_slow_request(slow_request)
+            return
+        logs.logger.warning(
+            "Slow %s of %s/%r %s %.1f ms%s%s",
+            request.operation,
+            request.cache_name,
+            request.key,
+            "took" if error is None else "failed after",
+            duration_seconds * 1000,
+            "" if error is None else f" with {type(error).__name__}",
+            "".join(
+                f"{',' if index else ':'} {phase} +{offset * 1000:.1f} ms"
+                for index, (phase, offset) in enumerate(offsets)
+            ),
+        )
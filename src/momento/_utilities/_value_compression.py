@@ -0,0 +1,72 @@
+import time
+
+from .. import errors
+from ..compression import Compression, CompressionStats
+
+_MAGIC = b"\xffMZ"
+_HEADER_SIZE = len(_MAGIC) + 1
+# Marks a value that is stored uncompressed but would otherwise look like it has a header.
+_UNCOMPRESSED_CODEC_ID = 0
+
+
+class _ValueCompressor:
+    """Compresses values on their way into the cache and decompresses them on their way out."""
+
+    def __init__(self, compression: Compression):
+        self._codec = compression.codec
+        self._header = _MAGIC + bytes([compression.codec.codec_id])
+        self._threshold_bytes = compression.threshold_bytes
+        self._codecs = compression.codecs
+        self._values_compressed = 0
+        self._values_not_compressed = 0
+        self._bytes_before_compression = 0
+        self._bytes_after_compression = 0
+        self._compress_cpu_seconds = 0.0
+        self._values_decompressed = 0
+        self._decompress_cpu_seconds = 0.0
+
+    def compress(self, value: bytes) -> bytes:
+        if len(value) >= self._threshold_bytes:
+            # CPU time of this thread, so that other threads' work, e.g. gRPC's, is not counted.
+            start = time.thread_time()
+            compressed = self._codec.compress(value)
+            self._compress_cpu_seconds += time.thread_time() - start
+            if len(compressed) + _HEADER_SIZE < len(value):
+                self._values_compressed += 1
+                self._bytes_before_compression += len(value)
+                self._bytes_after_compression += len(compressed) + _HEADER_SIZE
+                return self._header + compressed
+        self._values_not_compressed += 1
+        if value.startswith(_MAGIC):
+            return _MAGIC + bytes([_UNCOMPRESSED_CODEC_ID]) + value
+        return value
+
+    def decompress(self, body: bytes) -> bytes:
+        if not body.startswith(_MAGIC) or len(body) < _HEADER_SIZE:
+            return body
+        codec_id = body[len(_MAGIC)]
+        payload = body[_HEADER_SIZE:]
+        if codec_id == _UNCOMPRESSED_CODEC_ID:
+            return payload
+        codec = self._codecs.get(codec_id)
+        if codec is None:
+            raise errors.ClientSdkError(f"Could not decompress value: no codec with id {codec_id} is configured")
+        start = time.thread_time()
+        try:
+            value = codec.decompress(payload)
+        except Exception as e:
+            raise errors.ClientSdkError(f"Could not decompress value: {e}") from e
+        self._decompress_cpu_seconds += time.thread_time() - start
+        self._values_decompressed += 1
+        return value
+
+    def stats(self) -> CompressionStats:
+        return CompressionStats(
+            values_compressed=self._values_compressed,
+            values_not_compressed=self._values_not_compressed,
+            bytes_before_compression=self._bytes_before_compression,
+            bytes_after_compression=self._bytes_after_compression,
+            compress_cpu_seconds=self._compress_cpu_seconds,
+            values_decompressed=self._values_decompressed,
+            decompress_cpu_seconds=self._decompress_cpu_seconds,
+        )
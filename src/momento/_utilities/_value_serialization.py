@@ -0,0 +1,20 @@
+from typing import TypeVar
+
+from .. import errors
+from ..serialization import Serializer
+
+_T = TypeVar("_T")
+
+
+def _serialize(serializer: Serializer[_T], value: _T) -> bytes:
+    try:
+        return serializer.serialize(value)
+    except Exception as e:
+        raise errors.InvalidArgumentError(f"Could not serialize value: {e}") from e
+
+
+def _deserialize(serializer: Serializer[_T], data: bytes) -> _T:
+    try:
+        return serializer.deserialize(data)
+    except Exception as e:
+        raise errors.ClientSdkError(f"Could not deserialize value: {e}") from e
@@ -1,4 +1,4 @@
-from typing import Callable, List, Union
+from typing import Callable, List, Tuple, Union
 
 import grpc
 from grpc.aio import ClientCallDetails, Metadata
@@ -48,6 +48,30 @@ class AddHeaderClientInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
         return await continuation(new_client_call_details, request)
 
 
+class StaticHeaders:
+    """Headers to send with every request, put into the metadata the requests are made with.
+
+    This saves running `AddHeaderClientInterceptor` for every call, which may have to copy the
+    metadata to add the same headers each time. Once-only headers are sent with the first request
+    of the process, whether it goes through the interceptor or not.
+    """
+
+    def __init__(self, headers: List[Header]):
+        self._every_time: Tuple[Tuple[str, str], ...] = tuple(
+            (header.name, header.value) for header in headers if header.name not in header.once_only_headers
+        )
+        self._once: Tuple[Tuple[str, str], ...] = tuple(
+            (header.name, header.value) for header in headers if header.name in header.once_only_headers
+        )
+
+    def metadata(self, cache_name: str) -> Metadata:
+        """The metadata of a request for `cache_name`."""
+        if AddHeaderClientInterceptor.are_only_once_headers_sent or not self._once:
+            return Metadata(("cache", cache_name), *self._every_time)
+        AddHeaderClientInterceptor.are_only_once_headers_sent = True
+        return Metadata(("cache", cache_name), *self._every_time, *self._once)
+
+
 def sanitize_client_call_details(client_call_details: grpc.aio.ClientCallDetails) -> grpc.aio.ClientCallDetails:
     """
     Defensive function meant to handle inbound grpc client request objects and make sure we can handle properly
@@ -1,5 +1,6 @@
 import logging
-from typing import Callable, List, Union
+from contextvars import ContextVar
+from typing import Callable, List, Optional, Union
 
 import grpc
 
@@ -10,6 +11,8 @@ import grpc
 # For now, for convenience during development, you can toggle this hard-coded
 # variable to enable/disable it.
 import momento.errors
+from momento._utilities._deadlines import DEADLINE, bounded_timeout
+from momento._utilities._slow_requests import REQUEST_TIMELINE
 
 RETRIES_ENABLED = True
 MAX_ATTEMPTS = 3
@@ -39,20 +42,29 @@ RETRYABLE_STATUS_CODES: List[grpc.StatusCode] = [
 
 LOGGER = logging.getLogger("retry-interceptor")
 
+# The attempt a request is on, starting at 1, as seen by the interceptors that come after this one.
+ATTEMPT: ContextVar[int] = ContextVar("momento_request_attempt", default=1)
+
 
 # TODO: We need to send retry count information to the server so that we
 # will have some visibility into how often this is happening to customers:
 # https://github.com/momentohq/client-sdk-javascript/issues/80
 # TODO: we need to add backoff/jitter for the retries:
 # https://github.com/momentohq/client-sdk-javascript/issues/81
-def get_retry_interceptor_if_enabled() -> List[grpc.aio.UnaryUnaryClientInterceptor]:
+def get_retry_interceptor_if_enabled(
+    on_retry: Optional[Callable[[str], None]] = None
+) -> List[grpc.aio.UnaryUnaryClientInterceptor]:
     if not RETRIES_ENABLED:
         return []
 
-    return [RetryInterceptor()]
+    return [RetryInterceptor(on_retry)]
 
 
 class RetryInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    def __init__(self, on_retry: Optional[Callable[[str], None]] = None):
+        # Called with the method path of every request that is retried.
+        self._on_retry = on_retry
+
     async def intercept_unary_unary(
         self,
         continuation: Callable[
@@ -62,9 +74,37 @@ class RetryInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
         client_call_details: grpc.aio._interceptor.ClientCallDetails,
         request: grpc.aio._typing.RequestType,
     ) -> Union[grpc.aio._call.UnaryUnaryCall, grpc.aio._typing.ResponseType]:
+        timeline = REQUEST_TIMELINE.get()
+        if timeline is not None:
+            timeline.record("interceptor")
+        call: Optional[grpc.aio._call.UnaryUnaryCall] = None
         for try_i in range(MAX_ATTEMPTS):
-            call = await continuation(client_call_details, request)
+            attempt_call_details = client_call_details
+            if DEADLINE.get() is not None:
+                try:
+                    timeout = bounded_timeout(client_call_details.timeout)
+                except momento.errors.TimeoutError:
+                    # Once the deadline budget is used up, the last failed attempt stands.
+                    if call is None:
+                        raise
+                    return call
+                attempt_call_details = grpc.aio.ClientCallDetails(
+                    method=client_call_details.method,
+                    timeout=timeout,
+                    metadata=client_call_details.metadata,
+                    credentials=client_call_details.credentials,
+                    wait_for_ready=client_call_details.wait_for_ready,
+                )
+            if timeline is not None:
+                timeline.record(f"attempt {try_i + 1}")
+            attempt = ATTEMPT.set(try_i + 1)
+            try:
+                call = await continuation(attempt_call_details, request)
+            finally:
+                ATTEMPT.reset(attempt)
             response_code = await call.code()
+            if timeline is not None:
+                timeline.record(f"attempt {try_i + 1} {response_code.name}")
 
             if response_code == grpc.StatusCode.OK:
                 return call
@@ -93,5 +133,7 @@ class RetryInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
                 try_i,
                 MAX_ATTEMPTS,
             )
+            if self._on_retry is not None:
+                self._on_retry(client_call_details.method.decode("utf-8"))
 
         raise momento.errors.ClientSdkError("Failed to return from RetryInterceptor!  This is a bug.")
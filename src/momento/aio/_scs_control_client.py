@@ -27,10 +27,10 @@ _DEADLINE_SECONDS = 60.0  # 1 minute
 class _ScsControlClient:
     """Momento Internal."""
 
-    def __init__(self, auth_token: str, endpoint: str):
+    def __init__(self, auth_token: str, endpoint: str, insecure: bool = False, local_credentials: bool = False):
         self._logger = logs.logger
         self._logger.debug("Simple cache control client instantiated with endpoint: %s", endpoint)
-        self._grpc_manager = _scs_grpc_manager._ControlGrpcManager(auth_token, endpoint)
+        self._grpc_manager = _scs_grpc_manager._ControlGrpcManager(auth_token, endpoint, insecure, local_credentials)
 
     async def create_cache(self, cache_name: str) -> CreateCacheResponse:
         _validate_cache_name(cache_name)
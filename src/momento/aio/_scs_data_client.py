@@ -1,19 +1,43 @@
 import asyncio
-from typing import Mapping, Optional, Union
+from contextlib import nullcontext
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    ContextManager,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+    cast,
+)
 
-from momento_wire_types.cacheclient_pb2 import _DeleteRequest, _GetRequest, _SetRequest
+from momento_wire_types.cacheclient_pb2 import _DeleteRequest, _GetRequest
 
 from .. import _cache_service_errors_converter
 from .. import cache_operation_types as cache_sdk_ops
 from .. import logs
 from .._utilities._data_validation import (
+    _as_buffer,
     _as_bytes,
-    _make_metadata,
     _validate_cache_name,
+    _validate_request_size,
     _validate_ttl,
 )
+from .._utilities._deadlines import bounded_timeout
+from .._utilities._request_hooks import _RequestHooks
+from .._utilities._value_compression import _ValueCompressor
+from .._utilities._wire_encoding import (
+    encode_set_request,
+    encoded_set_request_size,
+    encoded_set_request_value,
+)
+from ..hooks import RequestHook
 from . import _scs_grpc_manager
 
+if TYPE_CHECKING:
+    # Only for type checking, as it needs OpenTelemetry.
+    from ..tracing import TracingInterceptor
+
 _DEFAULT_DEADLINE_SECONDS = 5.0  # 5 seconds
 
 
@@ -26,16 +50,33 @@ class _ScsDataClient:
         endpoint: str,
         default_ttl_seconds: int,
         operation_timeout_ms: Optional[int],
+        insecure: bool = False,
+        local_credentials: bool = False,
+        compressor: Optional[_ValueCompressor] = None,
+        hooks: Sequence[RequestHook] = (),
+        channel: int = 0,
+        on_retry: Optional[Callable[[str], None]] = None,
+        tracing: Optional["TracingInterceptor"] = None,
     ):
         self._logger = logs.logger
         self._logger.debug("Simple cache data client instantiated with endpoint: %s", endpoint)
         self._default_deadline_seconds = (
             _DEFAULT_DEADLINE_SECONDS if not operation_timeout_ms else operation_timeout_ms / 1000.0
         )
-        self._grpc_manager = _scs_grpc_manager._DataGrpcManager(auth_token, endpoint)
+        self._grpc_manager = _scs_grpc_manager._DataGrpcManager(
+            auth_token, endpoint, insecure, local_credentials, on_retry, tracing
+        )
         _validate_ttl(default_ttl_seconds)
         self._default_ttlSeconds = default_ttl_seconds
         self._endpoint = endpoint
+        self._compressor = compressor
+        self._hooks = _RequestHooks(hooks, channel)
+        self._tracing = tracing
+
+    def _traced(self, operation: str, cache_name: str, key_count: int) -> ContextManager[None]:
+        if self._tracing is None:
+            return nullcontext()
+        return self._tracing.operation(operation, cache_name, key_count)
 
     def get_endpoint(self) -> str:
         return self._endpoint
@@ -44,75 +85,98 @@ class _ScsDataClient:
         self,
         cache_name: str,
         key: Union[str, bytes],
-        value: Union[str, bytes],
+        value: Union[str, bytes, bytearray, memoryview],
         ttl_seconds: Optional[int],
     ) -> cache_sdk_ops.CacheSetResponse:
         _validate_cache_name(cache_name)
+        request = None
         try:
-            self._logger.log(logs.TRACE, "Issuing a set request with key %s", str(key))
             item_ttl_seconds = self._default_ttlSeconds if ttl_seconds is None else ttl_seconds
             _validate_ttl(item_ttl_seconds)
-            set_request = _SetRequest()
-            set_request.cache_key = _as_bytes(key, "Unsupported type for key: ")
-            set_request.cache_body = _as_bytes(value, "Unsupported type for value: ")
-            set_request.ttl_milliseconds = item_ttl_seconds * 1000
-            await self._grpc_manager.async_stub().Set(
-                set_request,
-                metadata=_make_metadata(cache_name),
-                timeout=self._default_deadline_seconds,
+            cache_key = _as_bytes(key, "Unsupported type for key: ")
+            value_buffer = _as_buffer(value, "Unsupported type for value: ")
+            if self._compressor is None:
+                cache_body = value_buffer
+            else:
+                # Codecs take `bytes`, and compressing copies the value anyway.
+                value_buffer = bytes(value_buffer)
+                cache_body = self._compressor.compress(value_buffer)
+            ttl_milliseconds = item_ttl_seconds * 1000
+            _validate_request_size(encoded_set_request_size(cache_key, cache_body, ttl_milliseconds))
+            request = self._hooks.start("set", cache_name, cache_key, len(cache_body))
+            encoded_request = encode_set_request(cache_key, cache_body, ttl_milliseconds)
+            await self._grpc_manager.encoded_set()(
+                encoded_request,
+                metadata=self._grpc_manager.metadata(cache_name),
+                timeout=bounded_timeout(self._default_deadline_seconds),
             )
-            self._logger.log(logs.TRACE, "Set succeeded for key: %s", str(key))
-            return cache_sdk_ops.CacheSetResponse(set_request.cache_key, set_request.cache_body)
+            if request is not None:
+                request.succeeded()
+            # The response must not keep the caller's buffer, which may be changed or resized afterwards, so a
+            # value that is not `bytes` is viewed in the request that was sent instead.
+            if type(value_buffer) is not bytes:
+                value_buffer = encoded_set_request_value(encoded_request)
+            return cache_sdk_ops.CacheSetResponse(cache_key, value_buffer)
         except Exception as e:
-            self._logger.log(logs.TRACE, "Set failed for %s with response: %s", str(key), e)
-            raise _cache_service_errors_converter.convert(e)
+            error = _cache_service_errors_converter.convert(e)
+            if request is not None:
+                request.failed(error)
+            raise error
 
     async def set_multi(
         self,
         cache_name: str,
-        items: Union[Mapping[str, str], Mapping[bytes, bytes]],
+        items: Union[Mapping[str, str], Mapping[bytes, Union[bytes, bytearray, memoryview]]],
         ttl_seconds: Optional[int] = None,
     ) -> cache_sdk_ops.CacheSetMultiResponse:
         _validate_cache_name(cache_name)
-
-        try:
-            request_promises = [self.set(cache_name, key, value, ttl_seconds) for key, value in items.items()]
-
-            # A note on `return_exceptions=True`: because we're gathering the results,
-            # if an individual promise raises an exception, we want the others to finish gracefully.
-            responses = await asyncio.gather(
-                *request_promises,
-                return_exceptions=True,
-            )
-
-            for response in responses:
-                if isinstance(response, Exception):
-                    raise response
-
-            items_as_bytes = {response.key_as_bytes(): response.value_as_bytes() for response in responses}
-            return cache_sdk_ops.CacheSetMultiResponse(items=items_as_bytes)
-        except Exception as e:
-            self._logger.debug("multi-set failed with error: %s", e)
-            # re-raise any error caught here is fatal error with overall handling of request objects
-            raise _cache_service_errors_converter.convert(e)
+        with self._traced("set_multi", cache_name, len(items)):
+            try:
+                request_promises = [self.set(cache_name, key, value, ttl_seconds) for key, value in items.items()]
+
+                # A note on `return_exceptions=True`: because we're gathering the results,
+                # if an individual promise raises an exception, we want the others to finish gracefully.
+                responses = await asyncio.gather(
+                    *request_promises,
+                    return_exceptions=True,
+                )
+
+                for response in responses:
+                    if isinstance(response, Exception):
+                        raise response
+
+                return cache_sdk_ops.CacheSetMultiResponse._from_set_responses(responses)
+            except Exception as e:
+                self._logger.debug("multi-set failed with error: %s", e)
+                # re-raise any error caught here is fatal error with overall handling of request objects
+                raise _cache_service_errors_converter.convert(e)
 
     async def get(self, cache_name: str, key: Union[str, bytes]) -> cache_sdk_ops.CacheGetResponse:
 
         _validate_cache_name(cache_name)
+        request = None
         try:
-            self._logger.log(logs.TRACE, "Issuing a get request with key %s", str(key))
             get_request = _GetRequest()
             get_request.cache_key = _as_bytes(key, "Unsupported type for key: ")
+            request = self._hooks.start("get", cache_name, get_request.cache_key)
             response = await self._grpc_manager.async_stub().Get(
                 get_request,
-                metadata=_make_metadata(cache_name),
-                timeout=self._default_deadline_seconds,
+                metadata=self._grpc_manager.metadata(cache_name),
+                timeout=bounded_timeout(self._default_deadline_seconds),
             )
-            self._logger.log(logs.TRACE, "Received a get response for %s", str(key))
-            return cache_sdk_ops.CacheGetResponse.from_grpc_response(response)
+            get_response = cache_sdk_ops.CacheGetResponse.from_grpc_response(response)
+            if request is not None:
+                hit = get_response.status() == cache_sdk_ops.CacheGetStatus.HIT
+                request.succeeded(len(response.cache_body), hit)
+            if self._compressor is not None and get_response.status() == cache_sdk_ops.CacheGetStatus.HIT:
+                value = self._compressor.decompress(cast(bytes, get_response.value_as_bytes()))
+                return cache_sdk_ops.CacheGetResponse(value, cache_sdk_ops.CacheGetStatus.HIT)
+            return get_response
         except Exception as e:
-            self._logger.log(logs.TRACE, "Get failed for %s with response: %s", str(key), e)
-            raise _cache_service_errors_converter.convert(e)
+            error = _cache_service_errors_converter.convert(e)
+            if request is not None:
+                request.failed(error)
+            raise error
 
     async def get_multi(
         self,
@@ -120,40 +184,47 @@ class _ScsDataClient:
         *keys: Union[str, bytes],
     ) -> cache_sdk_ops.CacheGetMultiResponse:
         _validate_cache_name(cache_name)
-        try:
-            request_promises = [self.get(cache_name, key) for key in keys]
-
-            # A note on `return_exceptions=True`: because we're gathering the results,
-            # if an individual promise raises an exception, we want the others to finish gracefully.
-            responses = await asyncio.gather(
-                *request_promises,
-                return_exceptions=True,
-            )
-            for response in responses:
-                if isinstance(response, Exception):
-                    raise response
-        except Exception as e:
-            self._logger.debug("get_multi failed with response: %s", e)
-            raise _cache_service_errors_converter.convert(e)
-
-        return cache_sdk_ops.CacheGetMultiResponse(responses=responses)
+        with self._traced("get_multi", cache_name, len(keys)):
+            try:
+                keys_as_bytes = [_as_bytes(key, "Unsupported type for key: ") for key in keys]
+                request_promises = [self.get(cache_name, key) for key in keys_as_bytes]
+
+                # A note on `return_exceptions=True`: because we're gathering the results,
+                # if an individual promise raises an exception, we want the others to finish gracefully.
+                responses = await asyncio.gather(
+                    *request_promises,
+                    return_exceptions=True,
+                )
+                for response in responses:
+                    if isinstance(response, Exception):
+                        raise response
+            except Exception as e:
+                self._logger.debug("get_multi failed with response: %s", e)
+                raise _cache_service_errors_converter.convert(e)
+
+            values = [response.value_as_bytes() for response in responses]
+            return cache_sdk_ops.CacheGetMultiResponse._from_columns(keys_as_bytes, values)
 
     async def delete(self, cache_name: str, key: Union[str, bytes]) -> cache_sdk_ops.CacheDeleteResponse:
         _validate_cache_name(cache_name)
+        request = None
         try:
-            self._logger.log(logs.TRACE, "Issuing a delete request with key %s", str(key))
             delete_request = _DeleteRequest()
             delete_request.cache_key = _as_bytes(key, "Unsupported type for key: ")
+            request = self._hooks.start("delete", cache_name, delete_request.cache_key)
             await self._grpc_manager.async_stub().Delete(
                 delete_request,
-                metadata=_make_metadata(cache_name),
-                timeout=self._default_deadline_seconds,
+                metadata=self._grpc_manager.metadata(cache_name),
+                timeout=bounded_timeout(self._default_deadline_seconds),
             )
-            self._logger.log(logs.TRACE, "Received a delete response for %s", str(key))
+            if request is not None:
+                request.succeeded()
             return cache_sdk_ops.CacheDeleteResponse()
         except Exception as e:
-            self._logger.debug("Delete failed for %s with response: %s", str(key), e)
-            raise _cache_service_errors_converter.convert(e)
+            error = _cache_service_errors_converter.convert(e)
+            if request is not None:
+                request.failed(error)
+            raise error
 
     async def close(self) -> None:
         await self._grpc_manager.close()
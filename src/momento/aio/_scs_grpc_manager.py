@@ -1,11 +1,16 @@
-from typing import List
+from typing import Callable, List, Optional, Tuple, Union
 
 import grpc
 import momento_wire_types.cacheclient_pb2_grpc as cache_client
 import momento_wire_types.controlclient_pb2_grpc as control_client
 import pkg_resources
+from momento_wire_types.cacheclient_pb2 import _SetResponse
 
-from ._add_header_client_interceptor import AddHeaderClientInterceptor, Header
+from ._add_header_client_interceptor import (
+    AddHeaderClientInterceptor,
+    Header,
+    StaticHeaders,
+)
 from ._retry_interceptor import get_retry_interceptor_if_enabled
 
 
@@ -14,11 +19,12 @@ class _ControlGrpcManager:
 
     version = pkg_resources.get_distribution("momento").version
 
-    def __init__(self, auth_token: str, endpoint: str):
-        self._secure_channel = grpc.aio.secure_channel(
-            target=endpoint,
-            credentials=grpc.ssl_channel_credentials(),
-            interceptors=_interceptors(auth_token),
+    def __init__(self, auth_token: str, endpoint: str, insecure: bool = False, local_credentials: bool = False):
+        self._secure_channel = _channel(
+            endpoint,
+            insecure,
+            local_credentials,
+            interceptors=[AddHeaderClientInterceptor(_headers(auth_token)), *get_retry_interceptor_if_enabled()],
         )
 
     async def close(self) -> None:
@@ -33,11 +39,26 @@ class _DataGrpcManager:
 
     version = pkg_resources.get_distribution("momento").version
 
-    def __init__(self, auth_token: str, endpoint: str):
-        self._secure_channel = grpc.aio.secure_channel(
-            target=endpoint,
-            credentials=grpc.ssl_channel_credentials(),
-            interceptors=_interceptors(auth_token),
+    def __init__(
+        self,
+        auth_token: str,
+        endpoint: str,
+        insecure: bool = False,
+        local_credentials: bool = False,
+        on_retry: Optional[Callable[[str], None]] = None,
+        tracing: Optional[grpc.aio.UnaryUnaryClientInterceptor] = None,
+    ):
+        # Data requests are made with the headers already in their metadata, see `metadata()`.
+        self._headers = StaticHeaders(_headers(auth_token))
+        self._secure_channel = _channel(
+            endpoint,
+            insecure,
+            local_credentials,
+            interceptors=[
+                *get_retry_interceptor_if_enabled(on_retry),
+                # After the retry interceptor, so that every attempt is traced.
+                *([] if tracing is None else [tracing]),
+            ],
             # Here is where you would pass override configuration to the underlying C gRPC layer.
             # However, I have tried several different tuning options here and did not see any
             # performance improvements, so sticking with the defaults for now.
@@ -54,19 +75,46 @@ class _DataGrpcManager:
             ],
         )
 
+        # Takes requests that are already encoded, see `_utilities._wire_encoding`.
+        self._encoded_set: grpc.aio.UnaryUnaryMultiCallable = self._secure_channel.unary_unary(
+            "/cache_client.Scs/Set", response_deserializer=_SetResponse.FromString
+        )
+
     async def close(self) -> None:
         await self._secure_channel.close()
 
     def async_stub(self) -> cache_client.ScsStub:
         return cache_client.ScsStub(self._secure_channel)
 
-
-def _interceptors(auth_token: str) -> List[grpc.aio.ClientInterceptor]:
-    headers = [
+    def encoded_set(self) -> grpc.aio.UnaryUnaryMultiCallable:
+        return self._encoded_set
+
+    def metadata(self, cache_name: str) -> grpc.aio.Metadata:
+        """The metadata to make a request for `cache_name` with, including the authorization and agent headers."""
+        return self._headers.metadata(cache_name)
+
+
+def _channel(
+    endpoint: str,
+    insecure: bool,
+    local_credentials: bool,
+    interceptors: List[grpc.aio.ClientInterceptor],
+    options: Optional[List[Tuple[str, Union[int, str]]]] = None,
+) -> grpc.aio.Channel:
+    if insecure:
+        return grpc.aio.insecure_channel(target=endpoint, interceptors=interceptors, options=options)
+    # Local credentials are only used when asked for: a loopback endpoint may as well be a port
+    # forwarded to the service, which must still be reached over TLS.
+    credentials = (
+        grpc.local_channel_credentials(grpc.LocalConnectionType.LOCAL_TCP)
+        if local_credentials
+        else grpc.ssl_channel_credentials()
+    )
+    return grpc.aio.secure_channel(target=endpoint, credentials=credentials, interceptors=interceptors, options=options)
+
+
+def _headers(auth_token: str) -> List[Header]:
+    return [
         Header("authorization", auth_token),
         Header("agent", f"python:{_ControlGrpcManager.version}"),
     ]
-    return [
-        AddHeaderClientInterceptor(headers),
-        *get_retry_interceptor_if_enabled(),
-    ]
@@ -1,10 +1,38 @@
+import asyncio
+import time
 from types import TracebackType
-from typing import Mapping, Optional, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
-from .. import logs
+from .. import errors, logs
 
 try:
-    from .._utilities._data_validation import _validate_request_timeout
+    from .._utilities._client_metrics import _ClientMetrics
+    from .._utilities._data_validation import (
+        MAX_MESSAGE_SIZE_BYTES,
+        _as_buffer,
+        _as_bytes,
+        _validate_cache_name,
+        _validate_request_timeout,
+    )
+    from .._utilities._hot_keys import _HotKeyTracker
+    from .._utilities._large_values import MAGIC as _LARGE_VALUE_MAGIC
+    from .._utilities._large_values import _chunks, _LargeValueManifest
+    from .._utilities._near_cache import _NearCache
+    from .._utilities._slow_requests import _SlowRequestLog
+    from .._utilities._value_compression import _ValueCompressor
+    from .._utilities._value_serialization import _deserialize, _serialize
     from ._scs_control_client import _ScsControlClient
     from ._scs_data_client import _ScsDataClient
 except ImportError as e:
@@ -33,6 +61,7 @@ from ..cache_operation_types import (
     CacheDeleteResponse,
     CacheGetMultiResponse,
     CacheGetResponse,
+    CacheGetStatus,
     CacheSetMultiResponse,
     CacheSetResponse,
     CreateCacheResponse,
@@ -42,6 +71,24 @@ from ..cache_operation_types import (
     ListSigningKeysResponse,
     RevokeSigningKeyResponse,
 )
+from ..compression import Compression, CompressionStats
+from ..hooks import RequestHook
+from ..hot_keys import HotKey, HotKeyTracking
+from ..metrics import MetricsSnapshot
+from ..near_cache import NearCacheStats, NearCaching
+from ..serialization import JsonSerializer, Serializer
+from ..slow_requests import SlowRequestLogging
+
+if TYPE_CHECKING:
+    # Only for type checking, as it needs OpenTelemetry.
+    from ..tracing import TracingInterceptor
+
+_T = TypeVar("_T")
+
+DEFAULT_LARGE_VALUE_CHUNK_SIZE_BYTES = 1024 * 1024
+# Leaves room for the key and the framing of the request.
+MAX_LARGE_VALUE_CHUNK_SIZE_BYTES = MAX_MESSAGE_SIZE_BYTES - 64 * 1024
+DEFAULT_LARGE_VALUE_MAX_CONCURRENCY = 16
 
 
 class SimpleCacheClient:
@@ -64,6 +111,17 @@ class SimpleCacheClient:
         auth_token: str,
         default_ttl_seconds: int,
         request_timeout_ms: Optional[int] = None,
+        endpoint_override: Optional[str] = None,
+        insecure: bool = False,
+        local_credentials: bool = False,
+        compression: Optional[Compression] = None,
+        serializer: Optional[Serializer[object]] = None,
+        hooks: Sequence[RequestHook] = (),
+        metrics: bool = False,
+        tracing: Optional["TracingInterceptor"] = None,
+        hot_keys: Optional[HotKeyTracking] = None,
+        near_cache: Optional[NearCaching] = None,
+        slow_requests: Optional[SlowRequestLogging] = None,
     ):
         """Creates an async SimpleCacheClient
 
@@ -74,22 +132,74 @@ class SimpleCacheClient:
             request_timeout_ms (Optional[int], optional): An optional timeout in milliseconds to allow for Get and Set
                 operations to complete. The request will be terminated if it takes longer than this value and will
                 result in TimeoutError. Defaults to None, in which case a 5 second timeout is used.
+            endpoint_override (Optional[str], optional): Connect to this endpoint instead of the one in the auth
+                token. A loopback `host:port`, such as a `momento.testing.fake_server`, is used for both the control
+                and the data plane.
+            insecure (bool, optional): Connect over a plaintext channel. Only meant for local test servers.
+            local_credentials (bool, optional): Connect with gRPC local credentials instead of TLS, as a
+                `momento.testing.fake_server` listens with by default. Only meant for local test servers.
+            compression (Optional[Compression], optional): Compress values of at least the configured size before
+                storing them, and decompress compressed values when reading them. Defaults to None, in which case
+                values are stored as they are; compressed values written by other clients are still returned
+                compressed.
+            serializer (Optional[Serializer[object]], optional): Converts values to bytes in `set_object` and back
+                in `get_object`, unless another serializer is passed to them. Defaults to None, in which case
+                values are stored as JSON.
+            hooks (Sequence[RequestHook], optional): Called when data requests, such as gets and sets, start and
+                end. See `momento.hooks`. Defaults to none.
+            metrics (bool, optional): Record latencies, outcomes and sizes of data requests, for
+                `metrics_snapshot()`. Defaults to False.
+            tracing (Optional[TracingInterceptor], optional): Creates OpenTelemetry spans for data requests and
+                sends their trace context to the server. See `momento.tracing`. Defaults to None.
+            hot_keys (Optional[HotKeyTracking], optional): Count gets and sets by key, to report the busiest
+                keys. See `momento.hot_keys`. Defaults to None.
+            near_cache (Optional[NearCaching], optional): Serve gets of frequently read keys from memory for a
+                short while. See `momento.near_cache`. Defaults to None.
+            slow_requests (Optional[SlowRequestLogging], optional): Report data requests that take longer than a
+                threshold, with a timeline of their phases. See `momento.slow_requests`. Defaults to None.
         Raises:
             IllegalArgumentError: If method arguments fail validations.
         """
         _validate_request_timeout(request_timeout_ms)
+        if insecure and local_credentials:
+            raise errors.InvalidArgumentError("A client cannot use local credentials over an insecure channel")
         self._logger = logs.logger
+        self._compressor = None if compression is None else _ValueCompressor(compression)
+        self._serializer: Serializer[object] = JsonSerializer() if serializer is None else serializer
         self._next_client_index = 0
-        endpoints = _momento_endpoint_resolver.resolve(auth_token)
-        self._control_client = _ScsControlClient(auth_token, endpoints.control_endpoint)
+        self._hot_key_tracker = None if hot_keys is None else _HotKeyTracker(hot_keys)
+        self._near_cache = None if near_cache is None else _NearCache(near_cache)
+        self._metrics = (
+            _ClientMetrics(SimpleCacheClient._NUM_CLIENTS, self.compression_stats, self.hot_keys, self.near_cache_stats)
+            if metrics
+            else None
+        )
+        slow_request_log = None if slow_requests is None else _SlowRequestLog(slow_requests)
+        data_hooks = [
+            *hooks,
+            *(
+                hook
+                for hook in (self._metrics, self._hot_key_tracker, self._near_cache, slow_request_log)
+                if hook is not None
+            ),
+        ]
+        endpoints = _momento_endpoint_resolver.resolve(auth_token, endpoint_override)
+        self._control_client = _ScsControlClient(auth_token, endpoints.control_endpoint, insecure, local_credentials)
         self._data_clients = [
             _ScsDataClient(
                 auth_token,
                 endpoints.cache_endpoint,
                 default_ttl_seconds,
                 request_timeout_ms,
+                insecure,
+                local_credentials,
+                self._compressor,
+                data_hooks,
+                channel,
+                None if self._metrics is None else self._metrics.record_retry,
+                tracing,
             )
-            for _ in range(SimpleCacheClient._NUM_CLIENTS)
+            for channel in range(SimpleCacheClient._NUM_CLIENTS)
         ]
 
     async def __aenter__(self) -> "SimpleCacheClient":
@@ -105,6 +215,52 @@ class SimpleCacheClient:
         for data_client in self._data_clients:
             await data_client.close()
 
+    def compression_stats(self) -> Optional[CompressionStats]:
+        """Counts, sizes and CPU time of value compression.
+
+        Returns:
+            Optional[CompressionStats]: The counters, or None if compression is disabled.
+        """
+        if self._compressor is None:
+            return None
+        return self._compressor.stats()
+
+    def metrics_snapshot(self) -> Optional[MetricsSnapshot]:
+        """Latency histograms, outcome counts and sizes of data requests, and the compression counters.
+
+        See `momento.metrics` for exporters.
+
+        Returns:
+            Optional[MetricsSnapshot]: A copy of the metrics, or None if the client does not record them.
+        """
+        if self._metrics is None:
+            return None
+        return self._metrics.snapshot()
+
+    def hot_keys(self) -> Optional[List[HotKey]]:
+        """The most requested keys of the current interval so far, busiest first.
+
+        See `momento.hot_keys`.
+
+        Returns:
+            Optional[List[HotKey]]: The keys, or None if the client does not track them.
+        """
+        if self._hot_key_tracker is None:
+            return None
+        return self._hot_key_tracker.hot_keys(time.perf_counter())
+
+    def near_cache_stats(self) -> Optional[NearCacheStats]:
+        """Hits, promotions and demotions of the near cache.
+
+        See `momento.near_cache`.
+
+        Returns:
+            Optional[NearCacheStats]: The counters, or None if the client has no near cache.
+        """
+        if self._near_cache is None:
+            return None
+        return self._near_cache.stats()
+
     async def create_cache(self, cache_name: str) -> CreateCacheResponse:
         """Creates a new cache in your Momento account.
 
@@ -139,6 +295,8 @@ class SimpleCacheClient:
             AuthenticationError: If the provided Momento Auth Token is invalid.
             ClientSdkError: For any SDK checks that fail.
         """
+        if self._near_cache is not None:
+            self._near_cache.invalidate_cache(cache_name)
         return await self._control_client.delete_cache(cache_name)
 
     async def list_caches(self, next_token: Optional[str] = None) -> ListCachesResponse:
@@ -205,14 +363,15 @@ class SimpleCacheClient:
     async def set_multi(
         self,
         cache_name: str,
-        items: Union[Mapping[str, str], Mapping[bytes, bytes]],
+        items: Union[Mapping[str, str], Mapping[bytes, Union[bytes, bytearray, memoryview]]],
         ttl_seconds: Optional[int] = None,
     ) -> CacheSetMultiResponse:
         """Store items in the cache.
 
         Args:
             cache_name: Name of the cache to store the item in.
-            items: (Union[Mapping[str, str], Mapping[bytes, bytes]]): The items to store.
+            items: (Union[Mapping[str, str], Mapping[bytes, bytes]]): The items to store. Values may also be
+                bytearrays, memoryviews or other objects supporting the buffer protocol, which are not copied.
             ttl_seconds: (Optional[int]): The TTL to apply to each item. Defaults to None.
 
         Returns:
@@ -231,7 +390,7 @@ class SimpleCacheClient:
         self,
         cache_name: str,
         key: str,
-        value: Union[str, bytes],
+        value: Union[str, bytes, bytearray, memoryview],
         ttl_seconds: Optional[int] = None,
     ) -> CacheSetResponse:
         """Stores an item in cache
@@ -239,7 +398,8 @@ class SimpleCacheClient:
         Args:
             cache_name: Name of the cache to store the item in.
             key (string or bytes): The key to be used to store item.
-            value (string or bytes): The value to be stored.
+            value (string or bytes): The value to be stored. May also be a bytearray, memoryview or other object
+                supporting the buffer protocol, such as an mmap, which is not copied before it is sent.
             ttl_seconds (Optional): Time to live in cache in seconds. If not provided, then default TTL for the cache
                 client instance is used.
 
@@ -291,7 +451,191 @@ class SimpleCacheClient:
             AuthenticationError: If the provided Momento Auth Token is invalid.
             InternalServerError: If server encountered an unknown error while trying to retrieve the item.
         """
-        return await self._get_next_client().get(cache_name, key)
+        return await self._get(cache_name, key)
+
+    async def set_object(
+        self,
+        cache_name: str,
+        key: Union[str, bytes],
+        value: _T,
+        ttl_seconds: Optional[int] = None,
+        serializer: Optional[Serializer[_T]] = None,
+    ) -> CacheSetResponse:
+        """Serializes an object and stores it in the cache.
+
+        Args:
+            cache_name: Name of the cache to store the item in.
+            key (string or bytes): The key to be used to store item.
+            value: The object to be stored.
+            ttl_seconds (Optional): Time to live in cache in seconds. If not provided, then default TTL for the cache
+                client instance is used.
+            serializer (Optional[Serializer]): Converts the object to bytes. If not provided, then the serializer of
+                the cache client instance is used.
+
+        Returns:
+            CacheSetResponse, with the serialized value.
+
+        Raises:
+            InvalidArgumentError: If validation fails for provided method arguments, or the object cannot be
+                serialized.
+            BadRequestError: If the provided inputs are rejected by server because they are invalid
+            NotFoundError: If the cache with the given name doesn't exist.
+            AuthenticationError: If the provided Momento Auth Token is invalid.
+            InternalServerError: If server encountered an unknown error while trying to store the item.
+        """
+        value_bytes = _serialize(self._serializer, value) if serializer is None else _serialize(serializer, value)
+        return await self._get_next_client().set(cache_name, key, value_bytes, ttl_seconds)
+
+    @overload
+    async def get_object(self, cache_name: str, key: Union[str, bytes]) -> Optional[object]:
+        ...
+
+    @overload
+    async def get_object(self, cache_name: str, key: Union[str, bytes], serializer: Serializer[_T]) -> Optional[_T]:
+        ...
+
+    async def get_object(
+        self, cache_name: str, key: Union[str, bytes], serializer: Optional[Serializer[_T]] = None
+    ) -> Optional[object]:
+        """Retrieve an item from the cache and deserialize it.
+
+        The object is read straight from the bytes of the item, without decoding them to a string first.
+
+        Args:
+            cache_name: Name of the cache to get the item from
+            key (string or bytes): The key to be used to retrieve the item.
+            serializer (Optional[Serializer]): Converts the bytes back to an object. If not provided, then the
+                serializer of the cache client instance is used.
+
+        Returns:
+            The object if the get was a hit, else None.
+
+        Raises:
+            InvalidArgumentError: If validation fails for provided method arguments.
+            BadRequestError: If the provided inputs are rejected by server because they are invalid
+            NotFoundError: If the cache with the given name doesn't exist.
+            AuthenticationError: If the provided Momento Auth Token is invalid.
+            InternalServerError: If server encountered an unknown error while trying to retrieve the item.
+            ClientSdkError: If the item cannot be deserialized.
+        """
+        value_bytes = (await self._get(cache_name, key)).value_as_bytes()
+        if value_bytes is None:
+            return None
+        if serializer is None:
+            return _deserialize(self._serializer, value_bytes)
+        return _deserialize(serializer, value_bytes)
+
+    async def set_large(
+        self,
+        cache_name: str,
+        key: Union[str, bytes],
+        value: Union[str, bytes, bytearray, memoryview],
+        ttl_seconds: Optional[int] = None,
+        chunk_size_bytes: int = DEFAULT_LARGE_VALUE_CHUNK_SIZE_BYTES,
+        max_concurrency: int = DEFAULT_LARGE_VALUE_MAX_CONCURRENCY,
+    ) -> CacheSetResponse:
+        """Stores a value of any size, split across several cache items if needed.
+
+        Values larger than `chunk_size_bytes` are split into chunks that are stored concurrently as
+        items of their own, plus a small manifest under `key` that lists them with their checksums.
+        The manifest is written last, so `get_large` never returns a mix of the previous and the new
+        value; the chunks of the previous value are deleted afterwards. Smaller values are stored
+        like `set` does. Large values can only be read with `get_large`.
+
+        Args:
+            cache_name: Name of the cache to store the item in.
+            key (string or bytes): The key to be used to store item.
+            value (string or bytes): The value to be stored. May also be a bytearray, memoryview or other object
+                supporting the buffer protocol, such as an mmap, which is not copied before it is sent.
+            ttl_seconds (Optional): Time to live in cache in seconds. If not provided, then default TTL for the cache
+                client instance is used.
+            chunk_size_bytes (int): Size of the chunks. Defaults to 1 MiB; at most 4 MiB minus 64 KiB.
+            max_concurrency (int): Maximum number of chunks written at a time. Defaults to 16.
+
+        Returns:
+            CacheSetResponse
+
+        Raises:
+            InvalidArgumentError: If validation fails for provided method arguments.
+            BadRequestError: If the provided inputs are rejected by server because they are invalid
+            NotFoundError: If the cache with the given name doesn't exist.
+            AuthenticationError: If the provided Momento Auth Token is invalid.
+            InternalServerError: If server encountered an unknown error while trying to store the item.
+        """
+        _validate_cache_name(cache_name)
+        _validate_chunk_size(chunk_size_bytes)
+        _validate_max_concurrency(max_concurrency)
+        key_bytes = _as_bytes(key, "Unsupported type for key: ")
+        value_buffer = _as_buffer(value, "Unsupported type for value: ")
+        previous = await self._get_large_value_manifest(cache_name, key_bytes)
+
+        # Small values that could be mistaken for a manifest are chunked too.
+        magic_length = len(_LARGE_VALUE_MAGIC)
+        if len(value_buffer) <= chunk_size_bytes and value_buffer[:magic_length] != _LARGE_VALUE_MAGIC:
+            set_response = await self._get_next_client().set(cache_name, key_bytes, value_buffer, ttl_seconds)
+        else:
+            manifest = _LargeValueManifest.for_value(value_buffer, chunk_size_bytes)
+            # Views of the value, which are copied straight into the requests.
+            chunks = _chunks(value_buffer, chunk_size_bytes)
+
+            async def set_chunk(index: int) -> bool:
+                chunk_key = manifest.chunk_key(key_bytes, index)
+                await self._get_next_client().set(cache_name, chunk_key, chunks[index], ttl_seconds)
+                return True
+
+            await _for_each_chunk(set_chunk, manifest.chunk_count, max_concurrency)
+            await self._get_next_client().set(cache_name, key_bytes, manifest.encode(), ttl_seconds)
+            # No request holds the whole value, and the response must not keep the caller's buffer.
+            set_response = CacheSetResponse(
+                key_bytes, value_buffer if type(value_buffer) is bytes else bytes(value_buffer)
+            )
+
+        if previous is not None:
+            await self._delete_chunks(cache_name, key_bytes, previous, max_concurrency)
+        return set_response
+
+    async def get_large(
+        self, cache_name: str, key: Union[str, bytes], max_concurrency: int = DEFAULT_LARGE_VALUE_MAX_CONCURRENCY
+    ) -> CacheGetResponse:
+        """Retrieve a value stored with `set_large`, or with `set`.
+
+        The chunks of a large value are fetched concurrently and copied into a single buffer of the
+        size listed in the manifest as they arrive, after checking their checksums.
+
+        Args:
+            cache_name: Name of the cache to get the item from
+            key (string or bytes): The key to be used to retrieve the item.
+            max_concurrency (int): Maximum number of chunks fetched at a time. Defaults to 16.
+
+        Returns:
+            CacheGetResponse: A miss if the value does not exist or chunks of it expired.
+
+        Raises:
+            InvalidArgumentError: If validation fails for provided method arguments.
+            BadRequestError: If the provided inputs are rejected by server because they are invalid
+            NotFoundError: If the cache with the given name doesn't exist.
+            AuthenticationError: If the provided Momento Auth Token is invalid.
+            InternalServerError: If server encountered an unknown error while trying to retrieve the item.
+            ClientSdkError: If a chunk does not match its checksum.
+        """
+        _validate_cache_name(cache_name)
+        _validate_max_concurrency(max_concurrency)
+        key_bytes = _as_bytes(key, "Unsupported type for key: ")
+        blob = (await self._get_next_client().get(cache_name, key_bytes)).value_as_bytes()
+        while blob is not None:
+            manifest = _LargeValueManifest.decode(blob)
+            if manifest is None:
+                return CacheGetResponse(blob, CacheGetStatus.HIT)
+            value = await self._get_chunks(cache_name, key_bytes, manifest, max_concurrency)
+            if value is not None:
+                return CacheGetResponse(value, CacheGetStatus.HIT)
+            # Chunks are missing because they expired, or because the value was replaced and its
+            # previous chunks deleted while reading them; only in the latter case is there more to read.
+            current = (await self._get_next_client().get(cache_name, key_bytes)).value_as_bytes()
+            if current == blob:
+                break
+            blob = current
+        return CacheGetResponse(b"", CacheGetStatus.MISS)
 
     async def delete(self, cache_name: str, key: str) -> CacheDeleteResponse:
         """Delete an item from the cache.
@@ -314,7 +658,101 @@ class SimpleCacheClient:
         """
         return await self._get_next_client().delete(cache_name, key)
 
+    async def _get_large_value_manifest(self, cache_name: str, key: bytes) -> Optional[_LargeValueManifest]:
+        blob = (await self._get_next_client().get(cache_name, key)).value_as_bytes()
+        return None if blob is None else _LargeValueManifest.decode(blob)
+
+    async def _get_chunks(
+        self, cache_name: str, key: bytes, manifest: _LargeValueManifest, max_concurrency: int
+    ) -> Optional[bytes]:
+        """Reassembles the value of `manifest`, or returns None if any of its chunks is missing."""
+        buffer = bytearray(manifest.value_size)
+        view = memoryview(buffer)
+
+        async def get_chunk(index: int) -> bool:
+            chunk = (await self._get_next_client().get(cache_name, manifest.chunk_key(key, index))).value_as_bytes()
+            if chunk is None:
+                return False
+            manifest.verify_chunk(index, chunk)
+            start, end = manifest.chunk_bounds(index)
+            view[start:end] = chunk
+            return True
+
+        if not await _for_each_chunk(get_chunk, manifest.chunk_count, max_concurrency):
+            return None
+        return bytes(buffer)
+
+    async def _delete_chunks(
+        self, cache_name: str, key: bytes, manifest: _LargeValueManifest, max_concurrency: int
+    ) -> None:
+        async def delete_chunk(index: int) -> bool:
+            await self._get_next_client().delete(cache_name, manifest.chunk_key(key, index))
+            return True
+
+        try:
+            await _for_each_chunk(delete_chunk, manifest.chunk_count, max_concurrency)
+        except Exception as e:
+            # Chunks that are left behind expire with their TTL.
+            self._logger.debug("Could not delete the previous chunks of a large value: %s", e)
+
+    async def _get(self, cache_name: str, key: Union[str, bytes]) -> CacheGetResponse:
+        if self._near_cache is None:
+            return await self._get_next_client().get(cache_name, key)
+        _validate_cache_name(cache_name)
+        key_bytes = _as_bytes(key, "Unsupported type for key: ")
+        start_time = time.perf_counter()
+        cached, version = self._near_cache.get(cache_name, key_bytes)
+        if cached is not None:
+            # The hooks only see requests, so hits are counted here, or keys would look colder once promoted.
+            if self._hot_key_tracker is not None:
+                self._hot_key_tracker.record(cache_name, key_bytes, start_time)
+            if self._metrics is not None:
+                self._metrics.record_near_cache_hit(cache_name, time.perf_counter() - start_time)
+            return cached
+        response = await self._get_next_client().get(cache_name, key_bytes)
+        self._near_cache.put(cache_name, key_bytes, response, version)
+        return response
+
     def _get_next_client(self) -> _ScsDataClient:
         client = self._data_clients[self._next_client_index]
         self._next_client_index = (self._next_client_index + 1) % len(self._data_clients)
         return client
+
+
+async def _for_each_chunk(function: Callable[[int], Awaitable[bool]], chunk_count: int, max_concurrency: int) -> bool:
+    """Call `function` on every chunk index, at most `max_concurrency` at a time.
+
+    Returns False as soon as a call returns False, cancelling the calls that are still in flight.
+    """
+    remaining = iter(range(chunk_count))
+
+    # Workers share the iterator, so a worker picks up the next chunk as soon as it is done with one.
+    async def work() -> bool:
+        for index in remaining:
+            if not await function(index):
+                return False
+        return True
+
+    workers = [asyncio.ensure_future(work()) for _ in range(min(max_concurrency, chunk_count))]
+    try:
+        for worker in asyncio.as_completed(workers):
+            if not await worker:
+                return False
+        return True
+    finally:
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.wait(workers)
+
+
+def _validate_chunk_size(chunk_size_bytes: int) -> None:
+    if not isinstance(chunk_size_bytes, int) or not 1 <= chunk_size_bytes <= MAX_LARGE_VALUE_CHUNK_SIZE_BYTES:
+        raise errors.InvalidArgumentError(
+            f"Chunk size must be an integer between 1 and {MAX_LARGE_VALUE_CHUNK_SIZE_BYTES} bytes"
+        )
+
+
+def _validate_max_concurrency(max_concurrency: int) -> None:
+    if not isinstance(max_concurrency, int) or max_concurrency < 1:
+        raise errors.InvalidArgumentError("Max concurrency must be a positive integer")
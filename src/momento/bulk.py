@@ -0,0 +1,558 @@
+"""Bulk import and export of cache items, for warming caches and moving items between them.
+
+Run `python -m momento.bulk --help` for the command line. Items are read from, and written to,
+files in one of three formats:
+
+    jsonl:  one object per line: {"key": ..., "value": ..., "ttl_seconds": ...}, where "ttl_seconds"
+            is optional. Keys and values that are not UTF-8 are given as "key_base64" and
+            "value_base64" instead.
+    csv:    rows of key, value and optionally a TTL in seconds, without a header. Keys and values
+            are UTF-8.
+    binary: records of key length (uint32) | value length (uint32) | TTL in seconds (uint32, 0 for
+            the default) | key | value, little-endian.
+
+Exports read keys from a text file with one UTF-8 key per line, and write the items that are found
+in the cache, without TTLs.
+
+Input files are memory-mapped and parsed as batches are sent, so they are never read into memory
+as a whole. Batches are stored with `set_multi` and read with `get_multi`, with a bounded number
+of batches in flight. Items of batches in flight at the same time may be stored in any order, so
+a key that occurs more than once may end up with any of its values.
+
+With a checkpoint file, the position in the input is saved as batches complete, and a run started
+again with the same checkpoint file resumes after the last batch that completed, and every batch
+before it. A checkpoint of a completed run is kept, so running it again does nothing.
+"""
+import argparse
+import asyncio
+import base64
+import csv
+import io
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+from itertools import islice
+from typing import (
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
+
+from . import errors
+from .aio.simple_cache_client import SimpleCacheClient
+
+FORMATS = ("jsonl", "csv", "binary")
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_TTL_SECONDS = 3600
+
+_EXTENSIONS = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv", ".bin": "binary"}
+_BINARY_HEADER = struct.Struct("<III")
+_CHECKPOINT_INTERVAL_SECONDS = 1.0
+_REPORT_INTERVAL_SECONDS = 1.0
+
+_Input = Union[mmap.mmap, io.BytesIO]
+# Key, value, TTL in seconds or None for the client's default, and where the item ends in the input.
+_Record = Tuple[bytes, bytes, Optional[int], int]
+_Batch = TypeVar("_Batch")
+_Result = TypeVar("_Result")
+
+
+class BulkStats:
+    def __init__(self, items: int, value_bytes: int, missing_keys: int, seconds: float):
+        """Totals of a bulk import or export, including the runs it resumed.
+
+        Args:
+            items (int): Number of items stored or exported.
+            value_bytes (int): Total size of their values.
+            missing_keys (int): Number of keys to export that were not found in the cache.
+            seconds (float): Duration of the last run.
+        """
+        self.items = items
+        self.value_bytes = value_bytes
+        self.missing_keys = missing_keys
+        self.seconds = seconds
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkStats(items={self.items!r}, value_bytes={self.value_bytes!r}, "
+            f"missing_keys={self.missing_keys!r}, seconds={self.seconds!r})"
+        )
+
+
+async def import_items(
+    client: SimpleCacheClient,
+    cache_name: str,
+    path: str,
+    file_format: Optional[str] = None,
+    checkpoint_path: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    report: Optional[TextIO] = None,
+) -> BulkStats:
+    """Stores the items of a file in a cache.
+
+    Args:
+        client (SimpleCacheClient): The client to store the items with. Items without a TTL of their
+            own get the client's default TTL.
+        cache_name (str): Name of the cache to store the items in.
+        path (str): The file to read the items from.
+        file_format (Optional[str]): One of `FORMATS`. Defaults to None, in which case it is inferred
+            from the extension of `path`.
+        checkpoint_path (Optional[str]): A file to save progress to, and to resume from if it exists.
+            Defaults to None, in which case all items are stored.
+        batch_size (int): Number of items per `set_multi`.
+        max_concurrency (int): Maximum number of batches in flight.
+        report (Optional[TextIO]): A stream to write throughput to while items are stored.
+
+    Returns:
+        BulkStats: The number of items stored.
+
+    Raises:
+        InvalidArgumentError: If an argument or a record of the file is invalid, or the checkpoint is
+            of another file.
+    """
+    file_format = _file_format(file_format, path)
+    _validate_batching(batch_size, max_concurrency)
+    progress = _Progress(checkpoint_path, path, report, "Imported")
+
+    async def send(batch: List[_Record]) -> None:
+        by_ttl: Dict[Optional[int], Dict[bytes, bytes]] = {}
+        for key, value, ttl_seconds, _ in batch:
+            by_ttl.setdefault(ttl_seconds, {})[key] = value
+        await asyncio.gather(*(client.set_multi(cache_name, items, ttl) for ttl, items in by_ttl.items()))
+
+    def done(batch: List[_Record], _: None) -> None:
+        progress.advance(batch[-1][3], items=len(batch), value_bytes=sum(len(value) for _, value, _, _ in batch))
+
+    with _mapped(path) as data:
+        records = _read_records(data, file_format, progress.offset)
+        try:
+            await _run_in_order(_batches(records, batch_size), send, done, max_concurrency)
+        finally:
+            progress.save()
+    return progress.finish()
+
+
+async def export_items(
+    client: SimpleCacheClient,
+    cache_name: str,
+    keys_path: str,
+    output_path: str,
+    file_format: Optional[str] = None,
+    checkpoint_path: Optional[str] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    report: Optional[TextIO] = None,
+) -> BulkStats:
+    """Writes the items of a cache with the keys listed in a file to another file.
+
+    Args:
+        client (SimpleCacheClient): The client to read the items with.
+        cache_name (str): Name of the cache to read the items from.
+        keys_path (str): A text file with one UTF-8 key per line.
+        output_path (str): The file to write the items to. Replaced, unless a run is resumed.
+        file_format (Optional[str]): One of `FORMATS`. Defaults to None, in which case it is inferred
+            from the extension of `output_path`.
+        checkpoint_path (Optional[str]): A file to save progress to, and to resume from if it exists.
+            Defaults to None, in which case all keys are exported.
+        batch_size (int): Number of keys per `get_multi`.
+        max_concurrency (int): Maximum number of batches in flight.
+        report (Optional[TextIO]): A stream to write throughput to while items are exported.
+
+    Returns:
+        BulkStats: The number of items exported, and of keys that were not found.
+
+    Raises:
+        InvalidArgumentError: If an argument is invalid, the checkpoint is of another file, or the
+            output of the resumed run is shorter than the checkpoint says.
+    """
+    file_format = _file_format(file_format, output_path)
+    _validate_batching(batch_size, max_concurrency)
+    progress = _Progress(checkpoint_path, keys_path, report, "Exported")
+    encode = _ENCODERS[file_format]
+
+    async def send(batch: List[Tuple[bytes, int]]) -> List[Optional[bytes]]:
+        response = await client.get_multi(cache_name, *(key for key, _ in batch))
+        return response.values_as_bytes()
+
+    with _mapped(keys_path) as data, _output(output_path, progress.output_size) as output:
+
+        def done(batch: List[Tuple[bytes, int]], values: List[Optional[bytes]]) -> None:
+            items = [(key, value) for (key, _), value in zip(batch, values) if value is not None]
+            output.write(encode(items))
+            progress.advance(
+                batch[-1][1],
+                items=len(items),
+                value_bytes=sum(len(value) for _, value in items),
+                missing_keys=len(batch) - len(items),
+                output_size=output.tell(),
+            )
+
+        # Whatever the checkpoint says was exported must be on disk first.
+        progress.before_save = output.flush
+        try:
+            await _run_in_order(_batches(_read_keys(data, progress.offset), batch_size), send, done, max_concurrency)
+        finally:
+            progress.save()
+    return progress.finish()
+
+
+class _Progress:
+    """Counts what has been done, reports throughput and saves checkpoints."""
+
+    def __init__(self, checkpoint_path: Optional[str], input_path: str, report: Optional[TextIO], verb: str):
+        self._checkpoint_path = checkpoint_path
+        self._input_path = os.path.abspath(input_path)
+        self._report = report
+        self._verb = verb
+        self.before_save: Optional[Callable[[], object]] = None
+        self.offset = 0
+        self.output_size = 0
+        self._items = 0
+        self._value_bytes = 0
+        self._missing_keys = 0
+        if checkpoint_path is not None and os.path.exists(checkpoint_path):
+            self._load(checkpoint_path)
+        self._start = self._saved_at = self._reported_at = time.monotonic()
+        self._start_items = self._items
+        self._start_value_bytes = self._value_bytes
+
+    def advance(self, offset: int, items: int, value_bytes: int, missing_keys: int = 0, output_size: int = 0) -> None:
+        self.offset = offset
+        self.output_size = output_size
+        self._items += items
+        self._value_bytes += value_bytes
+        self._missing_keys += missing_keys
+        now = time.monotonic()
+        if now - self._saved_at >= _CHECKPOINT_INTERVAL_SECONDS:
+            self.save()
+        if self._report is not None and now - self._reported_at >= _REPORT_INTERVAL_SECONDS:
+            self._reported_at = now
+            end = "\r" if self._report.isatty() else "\n"
+            self._report.write(f"{self._summary(now)}{end}")
+            self._report.flush()
+
+    def save(self) -> None:
+        self._saved_at = time.monotonic()
+        if self._checkpoint_path is None:
+            return
+        if self.before_save is not None:
+            self.before_save()
+        checkpoint = {
+            "input": self._input_path,
+            "offset": self.offset,
+            "output_size": self.output_size,
+            "items": self._items,
+            "value_bytes": self._value_bytes,
+            "missing_keys": self._missing_keys,
+        }
+        # Written aside and renamed, so that an interruption never leaves a torn checkpoint.
+        temporary_path = f"{self._checkpoint_path}.tmp"
+        with open(temporary_path, "w") as file:
+            json.dump(checkpoint, file)
+        os.replace(temporary_path, self._checkpoint_path)
+
+    def finish(self) -> BulkStats:
+        if self._report is not None:
+            self._report.write(f"{self._summary(time.monotonic())}\n")
+            self._report.flush()
+        return BulkStats(self._items, self._value_bytes, self._missing_keys, time.monotonic() - self._start)
+
+    def _summary(self, now: float) -> str:
+        seconds = max(now - self._start, 1e-9)
+        items_per_second = (self._items - self._start_items) / seconds
+        mib_per_second = (self._value_bytes - self._start_value_bytes) / seconds / (1024 * 1024)
+        summary = f"{self._verb} {self._items} items ({items_per_second:.0f} items/s, {mib_per_second:.1f} MiB/s)"
+        if self._missing_keys:
+            summary += f", {self._missing_keys} keys not found"
+        return summary
+
+    def _load(self, checkpoint_path: str) -> None:
+        with open(checkpoint_path) as file:
+            checkpoint = cast(Dict[str, object], json.load(file))
+        if checkpoint.get("input") != self._input_path:
+            raise errors.InvalidArgumentError(
+                f"Checkpoint {checkpoint_path} is of {checkpoint.get('input')}, not {self._input_path}"
+            )
+        counters = [checkpoint.get(name) for name in ("offset", "output_size", "items", "value_bytes", "missing_keys")]
+        if not all(isinstance(counter, int) for counter in counters):
+            raise errors.InvalidArgumentError(f"Checkpoint {checkpoint_path} is corrupt")
+        self.offset, self.output_size, self._items, self._value_bytes, self._missing_keys = cast(List[int], counters)
+
+
+async def _run_in_order(
+    batches: Iterator[_Batch],
+    send: Callable[[_Batch], Awaitable[_Result]],
+    done: Callable[[_Batch, _Result], None],
+    max_concurrency: int,
+) -> None:
+    """Sends up to `max_concurrency` batches at a time, and passes their results to `done` in order."""
+    in_flight: Deque[Tuple[_Batch, "asyncio.Future[_Result]"]] = deque()
+    try:
+        for batch in batches:
+            if len(in_flight) == max_concurrency:
+                first, task = in_flight.popleft()
+                done(first, await task)
+            in_flight.append((batch, asyncio.ensure_future(send(batch))))
+        while in_flight:
+            first, task = in_flight.popleft()
+            done(first, await task)
+    finally:
+        for _, task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.wait([task for _, task in in_flight])
+
+
+def _batches(items: Iterator[_Batch], batch_size: int) -> Iterator[List[_Batch]]:
+    while True:
+        batch = list(islice(items, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+@contextmanager
+def _mapped(path: str) -> Iterator[_Input]:
+    with open(path, "rb") as file:
+        # Empty files cannot be mapped.
+        if os.fstat(file.fileno()).st_size == 0:
+            yield io.BytesIO()
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield data
+
+
+@contextmanager
+def _output(path: str, resumed_size: int) -> Iterator[io.BufferedIOBase]:
+    if not resumed_size:
+        with open(path, "wb") as file:
+            yield file
+        return
+    with open(path, "r+b") as file:
+        if os.fstat(file.fileno()).st_size < resumed_size:
+            raise errors.InvalidArgumentError(f"Output {path} is shorter than the checkpoint says it is")
+        # Drops what was written after the last checkpoint.
+        file.truncate(resumed_size)
+        file.seek(resumed_size)
+        yield file
+
+
+def _read_records(data: _Input, file_format: str, offset: int) -> Iterator[_Record]:
+    data.seek(offset)
+    reader = _READERS[file_format](data)
+    while True:
+        start = data.tell()
+        try:
+            record = next(reader)
+        except StopIteration:
+            return
+        except (ValueError, struct.error) as e:
+            raise errors.InvalidArgumentError(f"Could not read {file_format} record at byte {start}: {e}") from e
+        yield record
+
+
+def _read_jsonl(data: _Input) -> Iterator[_Record]:
+    for line in iter(data.readline, b""):
+        if line.strip():
+            item = json.loads(line)
+            if not isinstance(item, dict):
+                raise ValueError("expected an object")
+            fields = cast(Dict[str, object], item)
+            ttl_seconds = fields.get("ttl_seconds")
+            yield _jsonl_field(fields, "key"), _jsonl_field(fields, "value"), _ttl(ttl_seconds), data.tell()
+
+
+def _jsonl_field(item: Dict[str, object], name: str) -> bytes:
+    text = item.get(name)
+    if isinstance(text, str):
+        return text.encode("utf-8")
+    encoded = item.get(f"{name}_base64")
+    if isinstance(encoded, str):
+        return base64.b64decode(encoded, validate=True)
+    raise ValueError(f'expected a string "{name}" or "{name}_base64"')
+
+
+def _read_csv(data: _Input) -> Iterator[_Record]:
+    # Rows with quoted line breaks span several lines, which the reader asks for as it needs them.
+    lines = (line.decode("utf-8") for line in iter(data.readline, b""))
+    for row in csv.reader(lines):
+        if not row:
+            continue
+        if len(row) not in (2, 3):
+            raise ValueError("expected a key, a value and optionally a TTL")
+        ttl_seconds = int(row[2]) if len(row) == 3 and row[2] else None
+        yield row[0].encode("utf-8"), row[1].encode("utf-8"), _ttl(ttl_seconds), data.tell()
+
+
+def _read_binary(data: _Input) -> Iterator[_Record]:
+    while True:
+        header = data.read(_BINARY_HEADER.size)
+        if not header:
+            return
+        key_length, value_length, ttl_seconds = cast(Tuple[int, int, int], _BINARY_HEADER.unpack(header))
+        key = data.read(key_length)
+        value = data.read(value_length)
+        if len(key) != key_length or len(value) != value_length:
+            raise ValueError("record is truncated")
+        yield key, value, ttl_seconds or None, data.tell()
+
+
+def _ttl(ttl_seconds: object) -> Optional[int]:
+    if ttl_seconds is None:
+        return None
+    if type(ttl_seconds) is not int or ttl_seconds <= 0:
+        raise ValueError(f"TTL must be a positive integer, not {ttl_seconds!r}")
+    return ttl_seconds
+
+
+def _read_keys(data: _Input, offset: int) -> Iterator[Tuple[bytes, int]]:
+    data.seek(offset)
+    for line in iter(data.readline, b""):
+        key = line.rstrip(b"\r\n")
+        if key:
+            yield key, data.tell()
+
+
+def _encode_jsonl(items: List[Tuple[bytes, bytes]]) -> bytes:
+    lines = []
+    for key, value in items:
+        item: Dict[str, str] = {}
+        for name, field in (("key", key), ("value", value)):
+            try:
+                item[name] = field.decode("utf-8")
+            except UnicodeDecodeError:
+                item[f"{name}_base64"] = base64.b64encode(field).decode("ascii")
+        lines.append(json.dumps(item, separators=(",", ":")))
+    return "".join(f"{line}\n" for line in lines).encode("utf-8")
+
+
+def _encode_csv(items: List[Tuple[bytes, bytes]]) -> bytes:
+    rows = io.StringIO()
+    writer = csv.writer(rows, lineterminator="\n")
+    for key, value in items:
+        try:
+            writer.writerow([key.decode("utf-8"), value.decode("utf-8")])
+        except UnicodeDecodeError as e:
+            raise errors.InvalidArgumentError(f"Item {key!r} is not UTF-8; export it as jsonl or binary") from e
+    return rows.getvalue().encode("utf-8")
+
+
+def _encode_binary(items: List[Tuple[bytes, bytes]]) -> bytes:
+    parts = []
+    for key, value in items:
+        parts += [_BINARY_HEADER.pack(len(key), len(value), 0), key, value]
+    return b"".join(parts)
+
+
+_READERS: Dict[str, Callable[[_Input], Iterator[_Record]]] = {
+    "jsonl": _read_jsonl,
+    "csv": _read_csv,
+    "binary": _read_binary,
+}
+_ENCODERS: Dict[str, Callable[[List[Tuple[bytes, bytes]]], bytes]] = {
+    "jsonl": _encode_jsonl,
+    "csv": _encode_csv,
+    "binary": _encode_binary,
+}
+
+
+def _file_format(file_format: Optional[str], path: str) -> str:
+    if file_format is None:
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in _EXTENSIONS:
+            raise errors.InvalidArgumentError(f"Cannot tell the format of {path}; pass one of {', '.join(FORMATS)}")
+        return _EXTENSIONS[extension]
+    if file_format not in FORMATS:
+        raise errors.InvalidArgumentError(f"Format must be one of {', '.join(FORMATS)}, not {file_format!r}")
+    return file_format
+
+
+def _validate_batching(batch_size: int, max_concurrency: int) -> None:
+    if not isinstance(batch_size, int) or batch_size < 1:
+        raise errors.InvalidArgumentError("Batch size must be a positive integer")
+    if not isinstance(max_concurrency, int) or max_concurrency < 1:
+        raise errors.InvalidArgumentError("Max concurrency must be a positive integer")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Imports items into a cache, or exports them from it."""
+    parser = argparse.ArgumentParser(prog="python -m momento.bulk", description=main.__doc__)
+    parser.add_argument("--auth-token", default=os.getenv("MOMENTO_AUTH_TOKEN"), help="defaults to $MOMENTO_AUTH_TOKEN")
+    parser.add_argument("--format", choices=FORMATS, help="defaults to the one of the file's extension")
+    parser.add_argument("--checkpoint", help="file to save progress to, and to resume from if it exists")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="items per request batch")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_MAX_CONCURRENCY, help="batches in flight")
+    parser.add_argument(
+        "--ttl-seconds", type=int, default=DEFAULT_TTL_SECONDS, help="TTL of imported items without one of their own"
+    )
+    parser.add_argument(
+        "--local-credentials", action="store_true", help="connect with gRPC local credentials, e.g. to a fake server"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_command = commands.add_parser("import", help="store the items of a file in a cache")
+    import_command.add_argument("cache_name")
+    import_command.add_argument("path")
+    export_command = commands.add_parser("export", help="write the items with the listed keys to a file")
+    export_command.add_argument("cache_name")
+    export_command.add_argument("keys_path", help="text file with one key per line")
+    export_command.add_argument("output_path")
+    args = parser.parse_args(argv)
+    if not args.auth_token:
+        parser.error("an auth token is required, with --auth-token or $MOMENTO_AUTH_TOKEN")
+
+    async def run() -> BulkStats:
+        async with SimpleCacheClient(
+            args.auth_token, args.ttl_seconds, local_credentials=args.local_credentials
+        ) as client:
+            if args.command == "import":
+                return await import_items(
+                    client,
+                    args.cache_name,
+                    args.path,
+                    args.format,
+                    args.checkpoint,
+                    args.batch_size,
+                    args.concurrency,
+                    sys.stderr,
+                )
+            return await export_items(
+                client,
+                args.cache_name,
+                args.keys_path,
+                args.output_path,
+                args.format,
+                args.checkpoint,
+                args.batch_size,
+                args.concurrency,
+                sys.stderr,
+            )
+
+    try:
+        asyncio.run(run())
+    except errors.SdkError as e:
+        sys.exit(f"{parser.prog}: error: {e}")
+    except KeyboardInterrupt:
+        sys.exit(
+            f"{parser.prog}: interrupted" + (f"; resume with --checkpoint {args.checkpoint}" if args.checkpoint else "")
+        )
+
+
+if __name__ == "__main__":
+    main()
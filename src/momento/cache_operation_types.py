@@ -1,7 +1,7 @@
 import json
 from datetime import datetime
 from enum import Enum
-from typing import Any, List, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional, Union, cast
 
 from momento_wire_types import cacheclient_pb2 as cache_client_types
 
@@ -15,22 +15,28 @@ class CacheGetStatus(Enum):
 
 
 class CacheSetResponse:
-    def __init__(self, key: bytes, value: bytes):
+    __slots__ = ("_value", "_key")
+
+    def __init__(self, key: bytes, value: Union[bytes, memoryview]):
         """Initializes CacheSetResponse to handle gRPC set response.
 
         Args:
             key (bytes): The value of the key of item that was stored in cache..
-            value (bytes): The value of item that was stored in the cache.
+            value (Union[bytes, memoryview]): The value of item that was stored in the cache. A view, which must
+                not be of a buffer the caller may change, such as of the request that was sent, is only copied into
+                `bytes` when the value is first asked for.
         """
         self._value = value
         self._key = key
 
     def value(self) -> str:
         """Decodes string value set in cache to a utf-8 string."""
-        return self._value.decode("utf-8")
+        return self.value_as_bytes().decode("utf-8")
 
     def value_as_bytes(self) -> bytes:
         """Returns byte value set in cache."""
+        if type(self._value) is not bytes:
+            self._value = bytes(self._value)
         return self._value
 
     def key(self) -> str:
@@ -49,26 +55,42 @@ class CacheSetResponse:
 
 
 class CacheSetMultiResponse:
+    __slots__ = ("_items", "_responses")
+
     def __init__(self, items: Mapping[bytes, bytes]):
         self._items = items
+        self._responses: Optional[List[CacheSetResponse]] = None
+
+    @staticmethod
+    def _from_set_responses(responses: List[CacheSetResponse]) -> "CacheSetMultiResponse":
+        """Keeps the responses, so that values given as views are only copied if they are asked for."""
+        multi_response = CacheSetMultiResponse({})
+        multi_response._responses = responses
+        return multi_response
 
     def items(self) -> Mapping[str, str]:
-        return {key.decode("utf-8"): value.decode("utf-8") for key, value in self._items.items()}
+        return {key.decode("utf-8"): value.decode("utf-8") for key, value in self.items_as_bytes().items()}
 
     def items_as_bytes(self) -> Mapping[bytes, bytes]:
+        if self._responses is not None:
+            self._items = {response.key_as_bytes(): response.value_as_bytes() for response in self._responses}
+            self._responses = None
         return self._items
 
     def __str__(self) -> str:
         return self.__repr__()
 
     def __repr__(self) -> str:
-        return f"CacheSetMultiResponse(items={self._items!r})"
+        return f"CacheSetMultiResponse(items={self.items_as_bytes()!r})"
 
 
 class CacheGetResponse:
+    __slots__ = ("_value", "_status", "_decoded_value")
+
     def __init__(self, value: bytes, status: CacheGetStatus):
         self._value = value
         self._status = status
+        self._decoded_value: Optional[str] = None
 
     @staticmethod
     def from_grpc_response(grpc_get_response: Any) -> "CacheGetResponse":  # type: ignore[misc]
@@ -96,7 +118,9 @@ class CacheGetResponse:
     def value(self) -> Optional[str]:
         """Returns value stored in cache as utf-8 string if there was Hit. Returns None otherwise."""
         if self._status == CacheGetStatus.HIT:
-            return self._value.decode("utf-8")
+            if self._decoded_value is None:
+                self._decoded_value = self._value.decode("utf-8")
+            return self._decoded_value
         return None
 
     def value_as_bytes(self) -> Optional[bytes]:
@@ -109,6 +133,10 @@ class CacheGetResponse:
         """Returns get operation result such as HIT or MISS."""
         return self._status
 
+    def _set_decoded_value(self, decoded_value: str) -> None:
+        """Remember the value decoded elsewhere, e.g. off the event loop, for `value()` to return."""
+        self._decoded_value = decoded_value
+
     def __str__(self) -> str:
         return self.__repr__()
 
@@ -117,31 +145,79 @@ class CacheGetResponse:
 
 
 class CacheGetMultiResponse:
-    def __init__(self, responses: List[CacheGetResponse]):
-        self._responses = responses
+    """Results of a multi-get, kept as a column of keys and a column of values.
+
+    Values are decoded to strings only once `values()` is called, and a `CacheGetResponse` for a
+    single key is only created when one is asked for.
+    """
+
+    __slots__ = ("_keys", "_values", "_decoded_values", "_positions")
+
+    def __init__(self, responses: List[CacheGetResponse], keys: Optional[List[bytes]] = None):
+        """Initializes the results of a multi-get.
+
+        Args:
+            responses: The result for each key, in the order the keys were requested.
+            keys: The requested keys, needed to look results up with `by_key`.
+        """
+        self._keys: List[bytes] = [] if keys is None else keys
+        self._values: List[Optional[bytes]] = [response.value_as_bytes() for response in responses]
+        self._decoded_values: Optional[List[Optional[str]]] = None
+        self._positions: Optional[Dict[bytes, int]] = None
+
+    @staticmethod
+    def _from_columns(keys: List[bytes], values: List[Optional[bytes]]) -> "CacheGetMultiResponse":
+        """The results for `keys`, given the value of each key, or None for a miss."""
+        response = CacheGetMultiResponse([], keys)
+        response._values = values
+        return response
 
     def status(self) -> List[CacheGetStatus]:
-        return [response.status() for response in self._responses]
+        return [CacheGetStatus.MISS if value is None else CacheGetStatus.HIT for value in self._values]
 
     def values(self) -> List[Optional[str]]:
         """Returns list of values as utf-8 string for each Hit. Each item in list is None if was a Miss."""
-        return [response.value() for response in self._responses]
+        if self._decoded_values is None:
+            self._decoded_values = [None if value is None else value.decode("utf-8") for value in self._values]
+        return list(self._decoded_values)
 
     def values_as_bytes(self) -> List[Optional[bytes]]:
         """Returns list of values as bytes for each Hit. Each item in list is None if was a Miss."""
-        return [response.value_as_bytes() for response in self._responses]
+        return list(self._values)
+
+    def by_key(self, key: Union[str, bytes]) -> CacheGetResponse:
+        """Returns the result for `key`.
+
+        Raises:
+            KeyError: If `key` was not one of the requested keys.
+        """
+        if self._positions is None:
+            self._positions = {requested_key: i for i, requested_key in enumerate(self._keys)}
+        position = self._positions[key.encode("utf-8") if isinstance(key, str) else key]
+        return self._response(position)
 
     def to_list(self) -> List[CacheGetResponse]:
-        return self._responses
+        return [self._response(i) for i in range(len(self._values))]
+
+    def _response(self, position: int) -> CacheGetResponse:
+        value = self._values[position]
+        if value is None:
+            return CacheGetResponse(b"", CacheGetStatus.MISS)
+        response = CacheGetResponse(value, CacheGetStatus.HIT)
+        if self._decoded_values is not None:
+            response._set_decoded_value(cast(str, self._decoded_values[position]))
+        return response
 
     def __str__(self) -> str:
         return self.__repr__()
 
     def __repr__(self) -> str:
-        return f"CacheGetMultiResponse(responses={self._responses!r})"
+        return f"CacheGetMultiResponse(keys={self._keys!r}, values={self._values!r})"
 
 
 class CacheDeleteResponse:
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -153,6 +229,8 @@ class CacheDeleteResponse:
 
 
 class CreateCacheResponse:
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -164,6 +242,8 @@ class CreateCacheResponse:
 
 
 class DeleteCacheResponse:
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -175,6 +255,8 @@ class DeleteCacheResponse:
 
 
 class CacheInfo:
+    __slots__ = ("_name",)
+
     def __init__(self, name: str):
         """Initializes CacheInfo to handle caches returned from list cache operation.
 
@@ -204,6 +286,8 @@ class CacheInfo:
 
 
 class ListCachesResponse:
+    __slots__ = ("_next_token", "_caches")
+
     def __init__(self, next_token: Optional[str], caches: List[CacheInfo]):
         """Initializes ListCacheResponse to handle list cache response.
 
@@ -245,6 +329,8 @@ class ListCachesResponse:
 
 
 class CreateSigningKeyResponse:
+    __slots__ = ("_key_id", "_endpoint", "_key", "_expires_at")
+
     def __init__(self, key_id: str, endpoint: str, key: str, expires_at: datetime):
         """Initializes CreateSigningKeyResponse to handle create signing key response.
 
@@ -292,6 +378,8 @@ class CreateSigningKeyResponse:
 
 
 class RevokeSigningKeyResponse:
+    __slots__ = ()
+
     def __init__(self) -> None:
         pass
 
@@ -303,6 +391,8 @@ class RevokeSigningKeyResponse:
 
 
 class SigningKey:
+    __slots__ = ("_key_id", "_expires_at", "_endpoint")
+
     def __init__(self, key_id: str, expires_at: datetime, endpoint: str):
         """Initializes SigningKey to handle signing keys returned from list signing keys operation.
 
@@ -339,6 +429,8 @@ class SigningKey:
 
 
 class ListSigningKeysResponse:
+    __slots__ = ("_next_token", "_signing_keys")
+
     def __init__(self, next_token: Optional[str], signing_keys: List[SigningKey]):
         """Initializes ListSigningKeysResponse to handle list signing keys response.
 
@@ -0,0 +1,168 @@
+"""Opt-in compression of cache values.
+
+A client created with a `Compression` compresses values of at least `threshold_bytes` before
+storing them, and prefixes them with a 4 byte header that names the codec:
+
+    header: magic (3 bytes, starting with 0xFF) | codec id (uint8)
+
+Reads decompress any value with a header, whichever codec was used to write it, as long as the
+codec is known to the reading client. Values without a header are returned as they are, so a
+client with compression can read values written without it. The magic starts with a byte that
+never occurs in UTF-8, so text values are never mistaken for compressed ones.
+"""
+import gzip
+import zlib
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from . import errors
+
+DEFAULT_COMPRESSION_THRESHOLD_BYTES = 1024
+
+# Codec ids up to this one are reserved for codecs of the SDK.
+MAX_BUILT_IN_CODEC_ID = 127
+
+
+class Codec(ABC):
+    """A compression algorithm for cache values.
+
+    Custom codecs subclass this and set `codec_id` to a value between 128 and 255, which is
+    written into every value the codec compresses. Every client that reads those values must be
+    configured with a codec of the same id.
+    """
+
+    codec_id: int
+
+    @abstractmethod
+    def compress(self, data: bytes) -> bytes:
+        ...
+
+    @abstractmethod
+    def decompress(self, data: bytes) -> bytes:
+        ...
+
+
+class ZlibCodec(Codec):
+    codec_id = 1
+
+    def __init__(self, level: int = 6):
+        self._level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data, self._level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data)
+
+
+class GzipCodec(Codec):
+    codec_id = 2
+
+    def __init__(self, level: int = 6):
+        self._level = level
+
+    def compress(self, data: bytes) -> bytes:
+        return gzip.compress(data, self._level)
+
+    def decompress(self, data: bytes) -> bytes:
+        return gzip.decompress(data)
+
+
+class Compression:
+    def __init__(
+        self,
+        codec: Codec = ZlibCodec(),
+        threshold_bytes: int = DEFAULT_COMPRESSION_THRESHOLD_BYTES,
+        extra_codecs: Sequence[Codec] = (),
+    ):
+        """Compression settings of a client.
+
+        Args:
+            codec (Codec): The codec to compress values with. Defaults to zlib.
+            threshold_bytes (int): Only compress values of at least this many bytes; compressing
+                small values costs more CPU time than it saves in transfer. Values that do not get
+                smaller are stored uncompressed either way. Defaults to 1 KiB.
+            extra_codecs (Sequence[Codec]): Custom codecs other than `codec` that values to read
+                may have been compressed with. The built-in codecs are always known.
+
+        Raises:
+            InvalidArgumentError: If the threshold is negative, or codec ids are invalid, reserved or clash.
+        """
+        if not isinstance(threshold_bytes, int) or threshold_bytes < 0:
+            raise errors.InvalidArgumentError("Compression threshold must be a non-negative integer")
+        codecs = {ZlibCodec.codec_id: ZlibCodec(), GzipCodec.codec_id: GzipCodec()}
+        for extra_codec in [codec, *extra_codecs]:
+            codec_id = extra_codec.codec_id
+            if not isinstance(codec_id, int) or not 1 <= codec_id <= 255:
+                raise errors.InvalidArgumentError(f"Codec id must be an integer between 1 and 255, not {codec_id!r}")
+            known = codecs.get(codec_id)
+            if known is not None and type(known) is not type(extra_codec):
+                raise errors.InvalidArgumentError(f"Codec id {codec_id} is used by {type(known).__name__}")
+            if known is None and codec_id <= MAX_BUILT_IN_CODEC_ID:
+                raise errors.InvalidArgumentError(
+                    f"Codec ids up to {MAX_BUILT_IN_CODEC_ID} are reserved for built-in codecs, not {codec_id}"
+                )
+            codecs[codec_id] = extra_codec
+        self.codec = codec
+        self.threshold_bytes = threshold_bytes
+        self.codecs = codecs
+
+
+class CompressionStats:
+    def __init__(
+        self,
+        values_compressed: int,
+        values_not_compressed: int,
+        bytes_before_compression: int,
+        bytes_after_compression: int,
+        compress_cpu_seconds: float,
+        values_decompressed: int,
+        decompress_cpu_seconds: float,
+    ):
+        """Counters of a client's value compression.
+
+        Args:
+            values_compressed (int): Number of values stored compressed.
+            values_not_compressed (int): Number of values stored uncompressed, because they were below
+                the threshold or did not get smaller.
+            bytes_before_compression (int): Total size of the values stored compressed, before compression.
+            bytes_after_compression (int): Total size of the values stored compressed, including headers.
+            compress_cpu_seconds (float): CPU time spent compressing, including values that did not get smaller.
+            values_decompressed (int): Number of compressed values read.
+            decompress_cpu_seconds (float): CPU time spent decompressing.
+        """
+        self.values_compressed = values_compressed
+        self.values_not_compressed = values_not_compressed
+        self.bytes_before_compression = bytes_before_compression
+        self.bytes_after_compression = bytes_after_compression
+        self.compress_cpu_seconds = compress_cpu_seconds
+        self.values_decompressed = values_decompressed
+        self.decompress_cpu_seconds = decompress_cpu_seconds
+
+    def compression_ratio(self) -> float:
+        """Size before compression over size after, of the values stored compressed; 1.0 if there are none."""
+        if not self.bytes_after_compression:
+            return 1.0
+        return self.bytes_before_compression / self.bytes_after_compression
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, CompressionStats)
+            and self.values_compressed == other.values_compressed
+            and self.values_not_compressed == other.values_not_compressed
+            and self.bytes_before_compression == other.bytes_before_compression
+            and self.bytes_after_compression == other.bytes_after_compression
+            and self.compress_cpu_seconds == other.compress_cpu_seconds
+            and self.values_decompressed == other.values_decompressed
+            and self.decompress_cpu_seconds == other.decompress_cpu_seconds
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"CompressionStats(values_compressed={self.values_compressed!r}, "
+            f"values_not_compressed={self.values_not_compressed!r}, "
+            f"bytes_before_compression={self.bytes_before_compression!r}, "
+            f"bytes_after_compression={self.bytes_after_compression!r}, "
+            f"compress_cpu_seconds={self.compress_cpu_seconds!r}, values_decompressed={self.values_decompressed!r}, "
+            f"decompress_cpu_seconds={self.decompress_cpu_seconds!r})"
+        )
@@ -0,0 +1,48 @@
+"""Deadline budgets for the data requests made while serving a request.
+
+A handler that has to answer within 50 ms should not wait for the cache for the 5 seconds of the
+client's timeout. A budget set once, where the request enters, bounds every data request made in
+it, however deep in the call stack:
+
+    with deadline(0.05):
+        response = await client.get(cache_name, key)
+
+Every request, and every retry of it, gets the timeout of the client or the remaining budget,
+whichever is shorter. Requests made once the budget is used up fail with `TimeoutError` without
+being sent, and failed requests are not retried. A budget set inside another one cannot outlast it.
+
+The budget is kept in a context variable, so it follows the code across awaits and into the tasks
+created in the block, and the synchronous client uses the budget of the thread calling it.
+"""
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from . import errors
+from ._utilities import _deadlines
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Limits the data requests made in the block to finish within `seconds` from now.
+
+    Args:
+        seconds (float): The budget.
+
+    Raises:
+        InvalidArgumentError: If `seconds` is negative.
+    """
+    if seconds < 0:
+        raise errors.InvalidArgumentError("The deadline budget must not be negative")
+    new_deadline = time.monotonic() + seconds
+    current_deadline = _deadlines.DEADLINE.get()
+    token = _deadlines.DEADLINE.set(new_deadline if current_deadline is None else min(current_deadline, new_deadline))
+    try:
+        yield
+    finally:
+        _deadlines.DEADLINE.reset(token)
+
+
+def remaining_seconds() -> Optional[float]:
+    """The time left of the current budget, which is negative once it is used up, or None if there is none."""
+    return _deadlines.remaining_seconds()
@@ -0,0 +1,98 @@
+"""Hooks that observe the data requests of a client, such as its gets, sets and deletes.
+
+A hook is called when a request starts, and when it succeeds or fails:
+
+    class SlowRequestHook(RequestHook):
+        def on_success(self, request: RequestInfo, duration_seconds: float, response_bytes: int) -> None:
+            if duration_seconds > 0.1:
+                print(f"{request.operation} of {request.key!r} took {duration_seconds:.3f}s")
+
+    client = SimpleCacheClient(auth_token, default_ttl_seconds, hooks=[SlowRequestHook()])
+
+Multi-key operations call the hooks for every key. A client without hooks does no work for them
+unless TRACE logging is enabled: no timestamps are taken and nothing is allocated or formatted.
+Hooks run on the event loop of the client, so they should return quickly; exceptions they raise
+are logged and otherwise ignored.
+"""
+from typing import Optional
+
+from . import logs
+
+
+class RequestInfo:
+    """A data request, as seen by hooks."""
+
+    __slots__ = ("operation", "cache_name", "key", "request_bytes", "start_time", "channel", "hit")
+
+    def __init__(
+        self, operation: str, cache_name: str, key: bytes, request_bytes: int, start_time: float, channel: int = 0
+    ):
+        """A request that has started.
+
+        Args:
+            operation (str): The name of the operation, e.g. "get", "set" or "delete".
+            cache_name (str): Name of the cache the request is for.
+            key (bytes): The key of the item.
+            request_bytes (int): Size of the value sent, after compression; 0 if there is none.
+            start_time (float): When the request started, as a `time.perf_counter()` timestamp.
+            channel (int): Index of the client's gRPC channel the request is sent on.
+
+        Gets set `hit` to whether the item was found before `on_success` is called; for other
+        requests it stays None.
+        """
+        self.operation = operation
+        self.cache_name = cache_name
+        self.key = key
+        self.request_bytes = request_bytes
+        self.start_time = start_time
+        self.channel = channel
+        self.hit: Optional[bool] = None
+
+    def __repr__(self) -> str:
+        return (
+            f"RequestInfo(operation={self.operation!r}, cache_name={self.cache_name!r}, key={self.key!r}, "
+            f"request_bytes={self.request_bytes!r}, start_time={self.start_time!r}, channel={self.channel!r}, "
+            f"hit={self.hit!r})"
+        )
+
+
+class RequestHook:
+    """Observes requests. Subclasses override the methods of the events they are interested in."""
+
+    def on_start(self, request: RequestInfo) -> None:
+        """Called before a request is sent."""
+
+    def on_success(self, request: RequestInfo, duration_seconds: float, response_bytes: int) -> None:
+        """Called when a request has succeeded.
+
+        Args:
+            request (RequestInfo): The request.
+            duration_seconds (float): Time since the request started.
+            response_bytes (int): Size of the value received, before decompression; 0 if there is none.
+        """
+
+    def on_error(self, request: RequestInfo, duration_seconds: float, error: Exception) -> None:
+        """Called when a request has failed, with the error the caller is about to receive."""
+
+
+class TraceLoggingHook(RequestHook):
+    """Logs every request at the TRACE level.
+
+    Clients call this hook themselves for the requests they make while TRACE logging is enabled for
+    the `momentosdk` logger.
+    """
+
+    def on_start(self, request: RequestInfo) -> None:
+        logs.logger.log(logs.TRACE, "Issuing a %s request with key %r", request.operation, request.key)
+
+    def on_success(self, request: RequestInfo, duration_seconds: float, response_bytes: int) -> None:
+        logs.logger.log(
+            logs.TRACE,
+            "%s succeeded for key %r in %.3f ms",
+            request.operation,
+            request.key,
+            duration_seconds * 1000,
+        )
+
+    def on_error(self, request: RequestInfo, duration_seconds: float, error: Exception) -> None:
+        logs.logger.log(logs.TRACE, "%s failed for %r with response: %s", request.operation, request.key, error)
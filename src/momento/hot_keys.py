@@ -0,0 +1,88 @@
+"""Tracking of the keys a client reads and writes most often.
+
+A client created with `hot_keys=HotKeyTracking()` counts its gets and sets by key in a Space-Saving
+sketch, which keeps the most requested keys in a bounded amount of memory. At the end of every
+interval the busiest keys are reported, to a callback or to the `momentosdk` log:
+
+    def report(hot_keys: List[HotKey]) -> None:
+        for hot_key in hot_keys:
+            print(f"{hot_key.cache_name}/{hot_key.key!r}: {hot_key.requests_per_second:.0f}/s")
+
+    client = SimpleCacheClient(auth_token, default_ttl_seconds, hot_keys=HotKeyTracking(on_report=report))
+
+`hot_keys()` returns the busiest keys of the current interval so far, and metrics snapshots include
+them too. Counts are estimates: a key may be counted up to `max_error` more often than it was
+requested, and, if requests are sampled, counts are scaled up from the sample.
+"""
+from typing import Callable, List, Optional
+
+from . import errors
+
+DEFAULT_CAPACITY = 1000
+DEFAULT_TOP_K = 10
+DEFAULT_REPORT_INTERVAL_SECONDS = 60.0
+
+
+class HotKey:
+    __slots__ = ("cache_name", "key", "requests", "max_error", "requests_per_second")
+
+    def __init__(self, cache_name: str, key: bytes, requests: int, max_error: int, requests_per_second: float):
+        """A key that was requested often.
+
+        Args:
+            cache_name (str): Name of the cache the key is in.
+            key (bytes): The key.
+            requests (int): Estimated number of gets and sets of the key in the interval.
+            max_error (int): How much `requests` may exceed the actual number.
+            requests_per_second (float): `requests` divided by the length of the interval.
+        """
+        self.cache_name = cache_name
+        self.key = key
+        self.requests = requests
+        self.max_error = max_error
+        self.requests_per_second = requests_per_second
+
+    def __repr__(self) -> str:
+        return (
+            f"HotKey(cache_name={self.cache_name!r}, key={self.key!r}, requests={self.requests!r}, "
+            f"max_error={self.max_error!r}, requests_per_second={self.requests_per_second!r})"
+        )
+
+
+class HotKeyTracking:
+    def __init__(
+        self,
+        top_k: int = DEFAULT_TOP_K,
+        capacity: int = DEFAULT_CAPACITY,
+        sample_ratio: float = 1.0,
+        report_interval_seconds: float = DEFAULT_REPORT_INTERVAL_SECONDS,
+        on_report: Optional[Callable[[List[HotKey]], None]] = None,
+    ):
+        """How a client tracks its hot keys.
+
+        Args:
+            top_k (int, optional): Number of keys to report. Defaults to 10.
+            capacity (int, optional): Number of keys to keep counts of; up to twice as many are kept
+                between evictions. The more there are, the more accurate the counts. Defaults to 1000.
+            sample_ratio (float, optional): The fraction of requests to count, to save CPU time at
+                high request rates. Defaults to 1.0.
+            report_interval_seconds (float, optional): Length of the intervals keys are counted over.
+                Defaults to 60 seconds.
+            on_report (Optional[Callable[[List[HotKey]], None]], optional): Called on the event loop
+                of the client with the busiest keys at the end of every interval in which there were
+                requests. Defaults to None, in which case they are logged at the INFO level.
+
+        Raises:
+            InvalidArgumentError: If an argument is out of range.
+        """
+        if top_k < 1 or capacity < top_k:
+            raise errors.InvalidArgumentError("top_k must be positive and at most capacity")
+        if not 0.0 < sample_ratio <= 1.0:
+            raise errors.InvalidArgumentError("sample_ratio must be greater than 0 and at most 1")
+        if report_interval_seconds <= 0:
+            raise errors.InvalidArgumentError("report_interval_seconds must be positive")
+        self.top_k = top_k
+        self.capacity = capacity
+        self.sample_ratio = sample_ratio
+        self.report_interval_seconds = report_interval_seconds
+        self.on_report = on_report
@@ -0,0 +1,100 @@
+"""Bloom filters stored in a single cache item.
+
+An encoded filter is a small header followed by the bitset:
+
+    header: magic (4 bytes) | version (uint8) | hash count (uint8) | bit count (uint32)
+
+The positions of a key are derived from a single BLAKE2b digest of it, `4 * hash count` bytes
+long, unpacked into as many uint32s in one call and reduced modulo the bit count. BLAKE2b is
+keyless here; it is only used because it is fast, well distributed and stable across processes.
+"""
+import math
+import struct
+from hashlib import blake2b
+from typing import Callable, Iterable, List, Optional, Tuple, cast
+
+from ... import errors
+
+_MAGIC = b"MBLM"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBBI")
+
+# Bounded by the largest BLAKE2b digest, which provides 16 uint32s.
+MAX_HASH_COUNT = 16
+MAX_BIT_COUNT = 2**32 - 1
+
+
+class _BloomFilter:
+    def __init__(self, bit_count: int, hash_count: int, bits: Optional[bytearray] = None):
+        self.bit_count = bit_count
+        self.hash_count = hash_count
+        self.bits = bytearray((bit_count + 7) // 8) if bits is None else bits
+        self._digest_size = 4 * hash_count
+        self._unpack_hashes = cast(Callable[[bytes], Tuple[int, ...]], struct.Struct(f"<{hash_count}I").unpack)
+
+    @staticmethod
+    def sized_for(expected_items: int, false_positive_rate: float) -> "_BloomFilter":
+        """Creates an empty filter with the false positive rate once `expected_items` keys were added."""
+        _validate_sizing(expected_items, false_positive_rate)
+        bit_count = _bit_count(expected_items, false_positive_rate)
+        hash_count = round(bit_count / expected_items * math.log(2))
+        return _BloomFilter(bit_count, min(max(hash_count, 1), MAX_HASH_COUNT))
+
+    @staticmethod
+    def decode(blob: bytes) -> "_BloomFilter":
+        if len(blob) < _HEADER.size:
+            raise errors.ClientSdkError("Could not decode Bloom filter: blob is too short")
+        magic, version, hash_count, bit_count = cast(Tuple[bytes, int, int, int], _HEADER.unpack_from(blob))
+        if magic != _MAGIC or version != _VERSION:
+            raise errors.ClientSdkError("Could not decode Bloom filter: unrecognized encoding")
+        bits = bytearray(memoryview(blob)[_HEADER.size :])  # noqa: E203
+        if not 1 <= hash_count <= MAX_HASH_COUNT or bit_count == 0 or len(bits) != (bit_count + 7) // 8:
+            raise errors.ClientSdkError("Could not decode Bloom filter: header is corrupt")
+        return _BloomFilter(bit_count, hash_count, bits)
+
+    def encode(self) -> bytes:
+        return _HEADER.pack(_MAGIC, _VERSION, self.hash_count, self.bit_count) + self.bits
+
+    def add_many(self, keys: Iterable[bytes]) -> List[bool]:
+        """Adds `keys` and returns, for each key, whether it was possibly present before."""
+        bits, bit_count, digest_size = self.bits, self.bit_count, self._digest_size
+        unpack = self._unpack_hashes
+        were_present = []
+        for key in keys:
+            was_present = True
+            for h in unpack(blake2b(key, digest_size=digest_size).digest()):
+                position = h % bit_count
+                mask = 1 << (position & 7)
+                if not bits[position >> 3] & mask:
+                    was_present = False
+                    bits[position >> 3] |= mask
+            were_present.append(was_present)
+        return were_present
+
+    def might_contain_many(self, keys: Iterable[bytes]) -> List[bool]:
+        # Inlined rather than built on a generator of positions, which doubles the cost per key.
+        bits, bit_count, digest_size = self.bits, self.bit_count, self._digest_size
+        unpack = self._unpack_hashes
+        results = []
+        for key in keys:
+            for h in unpack(blake2b(key, digest_size=digest_size).digest()):
+                position = h % bit_count
+                if not bits[position >> 3] >> (position & 7) & 1:
+                    results.append(False)
+                    break
+            else:
+                results.append(True)
+        return results
+
+
+def _bit_count(expected_items: int, false_positive_rate: float) -> int:
+    return math.ceil(-expected_items * math.log(false_positive_rate) / math.log(2) ** 2)
+
+
+def _validate_sizing(expected_items: int, false_positive_rate: float) -> None:
+    if not isinstance(expected_items, int) or expected_items <= 0:
+        raise errors.InvalidArgumentError("Expected items must be a positive integer")
+    if not isinstance(false_positive_rate, (int, float)) or not 0 < false_positive_rate < 1:
+        raise errors.InvalidArgumentError("False positive rate must be between 0 and 1")
+    if _bit_count(expected_items, false_positive_rate) > MAX_BIT_COUNT:
+        raise errors.InvalidArgumentError("Bloom filter would be too large; expect fewer items")
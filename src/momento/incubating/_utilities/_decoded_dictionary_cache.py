@@ -0,0 +1,133 @@
+import sys
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Tuple
+
+from ... import errors
+from ..cache_operation_types import BytesDictionary
+
+# Rough per-field cost of a decoded dictionary on top of the field bytes: two bytes objects and a dict slot.
+_FIELD_OVERHEAD_BYTES = 2 * sys.getsizeof(b"") + 3 * 8
+
+_EntryKey = Tuple[str, str]
+_Entry = Tuple[bytes, BytesDictionary, int]
+
+
+class DecodedDictionaryCacheStats:
+    def __init__(
+        self,
+        hits: int,
+        misses: int,
+        evictions: int,
+        entries: int,
+        size_bytes: int,
+        decode_seconds: float,
+    ):
+        """Counters of a client's decoded-dictionary cache.
+
+        Args:
+            hits (int): Number of dictionaries that did not have to be decoded.
+            misses (int): Number of dictionaries that were decoded.
+            evictions (int): Number of decoded dictionaries dropped to stay within the size limit.
+            entries (int): Number of decoded dictionaries currently held.
+            size_bytes (int): Estimated memory held by the cache.
+            decode_seconds (float): Total time spent decoding dictionaries on a miss.
+        """
+        self.hits = hits
+        self.misses = misses
+        self.evictions = evictions
+        self.entries = entries
+        self.size_bytes = size_bytes
+        self.decode_seconds = decode_seconds
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, DecodedDictionaryCacheStats)
+            and self.hits == other.hits
+            and self.misses == other.misses
+            and self.evictions == other.evictions
+            and self.entries == other.entries
+            and self.size_bytes == other.size_bytes
+            and self.decode_seconds == other.decode_seconds
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"DecodedDictionaryCacheStats(hits={self.hits!r}, misses={self.misses!r}, "
+            f"evictions={self.evictions!r}, entries={self.entries!r}, size_bytes={self.size_bytes!r}, "
+            f"decode_seconds={self.decode_seconds!r})"
+        )
+
+
+class _DecodedDictionaryCache:
+    """A size-bounded LRU cache of decoded dictionaries.
+
+    Entries are keyed by cache and dictionary name and remember the blob they were decoded from.
+    A dictionary is only served from the cache if the blob just read from Momento is byte-for-byte
+    the same; comparing the bytes is exact and cheaper than hashing them. Only the latest version
+    of each dictionary is kept.
+
+    Callers receive copies of the cached dictionaries, so they are free to modify them.
+    """
+
+    def __init__(self, max_bytes: int, clock: Callable[[], float] = time.perf_counter):
+        if not isinstance(max_bytes, int) or max_bytes < 0:
+            raise errors.InvalidArgumentError("Decoded dictionary cache size must be a non-negative integer")
+        self._max_bytes = max_bytes
+        self._clock = clock
+        self._entries: "OrderedDict[_EntryKey, _Entry]" = OrderedDict()
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._decode_seconds = 0.0
+
+    async def get_or_decode(
+        self,
+        cache_name: str,
+        dictionary_name: str,
+        blob: bytes,
+        decode: Callable[[bytes], Awaitable[BytesDictionary]],
+    ) -> BytesDictionary:
+        key = (cache_name, dictionary_name)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == blob:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return dict(entry[1])
+
+        self._misses += 1
+        start = self._clock()
+        dictionary = await decode(blob)
+        self._decode_seconds += self._clock() - start
+        self.put(cache_name, dictionary_name, blob, dict(dictionary))
+        return dictionary
+
+    def put(self, cache_name: str, dictionary_name: str, blob: bytes, dictionary: BytesDictionary) -> None:
+        """Remember that `blob` decodes to `dictionary`, which must not be modified afterwards."""
+        key = (cache_name, dictionary_name)
+        self._remove(key)
+        size_bytes = 2 * len(blob) + len(dictionary) * _FIELD_OVERHEAD_BYTES
+        if size_bytes > self._max_bytes:
+            return
+        self._entries[key] = (blob, dictionary, size_bytes)
+        self._size_bytes += size_bytes
+        while self._size_bytes > self._max_bytes:
+            _, (_, _, evicted_size_bytes) = self._entries.popitem(last=False)
+            self._size_bytes -= evicted_size_bytes
+            self._evictions += 1
+
+    def stats(self) -> DecodedDictionaryCacheStats:
+        return DecodedDictionaryCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+            entries=len(self._entries),
+            size_bytes=self._size_bytes,
+            decode_seconds=self._decode_seconds,
+        )
+
+    def _remove(self, key: _EntryKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry[2]
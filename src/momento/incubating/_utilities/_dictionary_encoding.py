@@ -0,0 +1,212 @@
+"""Binary encoding for incubating dictionaries.
+
+An encoded dictionary is a 6 byte header followed by a payload, which is zlib-compressed
+when the header's compression flag is set:
+
+    header:  magic (4 bytes) | version (uint8) | flags (uint8)
+    payload: count (uint32) | index (count * 12 bytes) | data
+
+Index entries are `(offset, key length, value length)` as little-endian uint32s, sorted by key,
+so a field can be found by binary search without decoding the other fields. `offset` is relative
+to the start of `data` and points at the key, which is immediately followed by its value.
+
+Dictionaries written by earlier versions of the SDK are pickled; these are still read.
+"""
+import pickle
+import struct
+import sys
+import zlib
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+from typing import Dict, List, Optional, Sequence, Tuple, cast
+
+from ... import errors
+
+_MAGIC = b"MDCT"
+_VERSION = 1
+_FLAG_ZLIB = 0x01
+
+_HEADER = struct.Struct("<4sBB")
+_COUNT = struct.Struct("<I")
+_INDEX_ENTRY = struct.Struct("<III")
+
+# The index is read and written as an array of native uint32s, byte-swapped on big-endian hosts.
+_UINT32 = "I" if array("I").itemsize == 4 else "L"
+
+# Pickle protocols 2 and newer start with the PROTO opcode.
+_PICKLE_PROTO_OPCODE = 0x80
+
+
+def encode_dictionary(
+    dictionary: Dict[bytes, bytes],
+    compression_threshold_bytes: Optional[int] = None,
+) -> bytes:
+    """Encode a dictionary in the binary format.
+
+    Args:
+        dictionary (Dict[bytes, bytes]): The dictionary to encode.
+        compression_threshold_bytes (Optional[int]): Compress the payload when it is at least this
+            large. Compressed dictionaries must be decompressed as a whole to look up a field.
+            Defaults to None, which disables compression.
+
+    Returns:
+        bytes: The encoded dictionary.
+    """
+    keys = sorted(dictionary)
+    count = len(keys)
+    # Keys interleaved with their values, which is also the layout of `data`.
+    fields: List[bytes] = [b""] * (2 * count)
+    fields[0::2] = keys
+    fields[1::2] = map(dictionary.__getitem__, keys)
+    lengths = array(_UINT32, map(len, fields))
+    ends = array(_UINT32, accumulate(lengths))
+
+    # The index is filled in column by column rather than packing each entry separately.
+    index = array(_UINT32, bytes(_COUNT.size + _INDEX_ENTRY.size * count))
+    index[0] = count
+    index[2::3] = lengths[0::2]
+    index[3::3] = lengths[1::2]
+    # Each field starts where the previous value ends; the first one starts at 0.
+    index[4::3] = ends[1:-1:2]
+    if sys.byteorder == "big":
+        index.byteswap()
+
+    payload = index.tobytes() + b"".join(fields)
+    flags = 0
+    if compression_threshold_bytes is not None and len(payload) >= compression_threshold_bytes:
+        compressed = zlib.compress(payload)
+        if len(compressed) < len(payload):
+            payload = compressed
+            flags |= _FLAG_ZLIB
+    return _HEADER.pack(_MAGIC, _VERSION, flags) + payload
+
+
+def decode_dictionary(blob: bytes) -> Dict[bytes, bytes]:
+    """Decode an entire dictionary.
+
+    Args:
+        blob (bytes): A dictionary in the binary format, or pickled by an earlier SDK version.
+
+    Returns:
+        Dict[bytes, bytes]: The decoded dictionary.
+
+    Raises:
+        ClientSdkError: If the blob is not an encoded dictionary.
+    """
+    if _is_legacy_pickle(blob):
+        return _decode_legacy_pickle(blob)
+    payload, payload_start = _payload(blob)
+    count, data_start = _count_and_data_start(payload, payload_start)
+    index_start = payload_start + _COUNT.size
+    index = array(_UINT32)
+    index.frombytes(payload[index_start:data_start])
+    if sys.byteorder == "big":
+        index.byteswap()
+    entries = iter(index)
+    dictionary: Dict[bytes, bytes] = {}
+    end = data_start
+    for offset, key_length, value_length in zip(entries, entries, entries):
+        start = data_start + offset
+        split = start + key_length
+        end = split + value_length
+        dictionary[payload[start:split]] = payload[split:end]
+    if len(dictionary) != count or end > len(payload):
+        raise errors.ClientSdkError("Could not decode dictionary: index is corrupt")
+    return dictionary
+
+
+def lookup_dictionary_fields(blob: bytes, keys: Sequence[bytes]) -> List[Optional[bytes]]:
+    """Look up individual fields of an encoded dictionary without decoding the rest of it.
+
+    Args:
+        blob (bytes): A dictionary in the binary format, or pickled by an earlier SDK version.
+        keys (Sequence[bytes]): The fields to look up.
+
+    Returns:
+        List[Optional[bytes]]: The value of each field, or None if the field is not in the dictionary.
+
+    Raises:
+        ClientSdkError: If the blob is not an encoded dictionary.
+    """
+    if _is_legacy_pickle(blob):
+        dictionary = _decode_legacy_pickle(blob)
+        return [dictionary.get(key) for key in keys]
+    payload, payload_start = _payload(blob)
+    index = _SortedIndex(payload, payload_start)
+    return [index.get(key) for key in keys]
+
+
+class _SortedIndex:
+    """Binary search over the fixed-width index of an encoded dictionary payload."""
+
+    def __init__(self, payload: bytes, payload_start: int):
+        self._payload = payload
+        self._index_start = payload_start + _COUNT.size
+        self._count, self._data_start = _count_and_data_start(payload, payload_start)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> bytes:
+        # Lets `bisect` compare keys; only the probed keys are copied out of the payload.
+        offset, key_length, _ = self._entry(i)
+        start = self._data_start + offset
+        end = start + key_length
+        return self._payload[start:end]
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        i = bisect_left(self, key)  # type: ignore[arg-type]
+        if i == self._count:
+            return None
+        offset, key_length, value_length = self._entry(i)
+        start = self._data_start + offset
+        split = start + key_length
+        end = split + value_length
+        if self._payload[start:split] != key:
+            return None
+        return self._payload[split:end]
+
+    def _entry(self, i: int) -> Tuple[int, int, int]:
+        position = self._index_start + i * _INDEX_ENTRY.size
+        return cast(Tuple[int, int, int], _INDEX_ENTRY.unpack_from(self._payload, position))
+
+
+def _is_legacy_pickle(blob: bytes) -> bool:
+    return len(blob) > 0 and blob[0] == _PICKLE_PROTO_OPCODE
+
+
+def _decode_legacy_pickle(blob: bytes) -> Dict[bytes, bytes]:
+    return cast(Dict[bytes, bytes], pickle.loads(blob))
+
+
+def _payload(blob: bytes) -> Tuple[bytes, int]:
+    """Returns the buffer holding the payload and the position the payload starts at.
+
+    An uncompressed payload is read in place from the blob, so offsets are absolute rather than
+    relative to a copy of the payload.
+    """
+    if len(blob) < _HEADER.size:
+        raise errors.ClientSdkError("Could not decode dictionary: blob is too short")
+    magic, version, flags = cast(Tuple[bytes, int, int], _HEADER.unpack_from(blob))
+    if magic != _MAGIC:
+        raise errors.ClientSdkError("Could not decode dictionary: unrecognized encoding")
+    if version != _VERSION:
+        raise errors.ClientSdkError(f"Could not decode dictionary: unsupported version {version}")
+    if flags & _FLAG_ZLIB:
+        try:
+            payload_start = _HEADER.size
+            return zlib.decompress(memoryview(blob)[payload_start:]), 0
+        except zlib.error as e:
+            raise errors.ClientSdkError(f"Could not decode dictionary: {e}") from e
+    return blob, _HEADER.size
+
+
+def _count_and_data_start(payload: bytes, payload_start: int) -> Tuple[int, int]:
+    if len(payload) < payload_start + _COUNT.size:
+        raise errors.ClientSdkError("Could not decode dictionary: index is truncated")
+    (count,) = cast(Tuple[int], _COUNT.unpack_from(payload, payload_start))
+    data_start = payload_start + _COUNT.size + count * _INDEX_ENTRY.size
+    if data_start > len(payload):
+        raise errors.ClientSdkError("Could not decode dictionary: index is truncated")
+    return count, data_start
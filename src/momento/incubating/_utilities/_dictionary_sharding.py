@@ -0,0 +1,73 @@
+"""Layout of sharded incubating dictionaries.
+
+A sharded dictionary spreads its fields over `shard_count` cache items, each an encoded dictionary,
+and keeps a small manifest under the dictionary's own name in place of the dictionary itself:
+
+    manifest: magic (4 bytes) | version (uint8) | shard count (uint32) | generation (uint32)
+
+Fields are assigned to shards by the CRC-32 of the field, which unlike `hash` is the same in every
+process. Resharding writes a new set of shards under the next generation before switching the
+manifest over, so readers of the previous manifest keep finding the previous shards until they
+are deleted.
+"""
+import struct
+import zlib
+from typing import Dict, List, Optional, Sequence, Tuple, cast
+
+from ... import errors
+
+_MAGIC = b"MDSM"
+_VERSION = 1
+_MANIFEST = struct.Struct("<4sBII")
+
+MAX_SHARD_COUNT = 1024
+_GENERATION_MODULUS = 2**32
+
+
+class _ShardManifest:
+    def __init__(self, shard_count: int, generation: int = 0):
+        self.shard_count = shard_count
+        self.generation = generation
+
+    @staticmethod
+    def decode(blob: bytes) -> Optional["_ShardManifest"]:
+        """Returns the manifest stored in `blob`, or None if `blob` is an unsharded dictionary."""
+        if len(blob) != _MANIFEST.size or not blob.startswith(_MAGIC):
+            return None
+        _, version, shard_count, generation = cast(Tuple[bytes, int, int, int], _MANIFEST.unpack(blob))
+        if version != _VERSION or shard_count == 0:
+            raise errors.ClientSdkError("Could not decode dictionary: unsupported shard manifest")
+        return _ShardManifest(shard_count, generation)
+
+    def encode(self) -> bytes:
+        return _MANIFEST.pack(_MAGIC, _VERSION, self.shard_count, self.generation)
+
+    def next(self, shard_count: int) -> "_ShardManifest":
+        """The manifest of this dictionary after resharding it to `shard_count` shards."""
+        return _ShardManifest(shard_count, (self.generation + 1) % _GENERATION_MODULUS)
+
+    def shard_of(self, field: bytes) -> int:
+        return zlib.crc32(field) % self.shard_count
+
+    def shard_key(self, dictionary_name: str, shard: int) -> str:
+        # NUL cannot be typed by accident, so shard keys do not collide with the names of other items.
+        return f"{dictionary_name}\x00{self.generation}\x00{shard}"
+
+    def group_fields(self, fields: Sequence[bytes]) -> Dict[int, List[int]]:
+        """Returns the positions of `fields`, grouped by the shard each field belongs to."""
+        groups: Dict[int, List[int]] = {}
+        for position, field in enumerate(fields):
+            groups.setdefault(self.shard_of(field), []).append(position)
+        return groups
+
+    def split(self, dictionary: Dict[bytes, bytes]) -> List[Dict[bytes, bytes]]:
+        """Splits `dictionary` into the fields of each shard."""
+        shards: List[Dict[bytes, bytes]] = [{} for _ in range(self.shard_count)]
+        for field, value in dictionary.items():
+            shards[self.shard_of(field)][field] = value
+        return shards
+
+
+def _validate_shard_count(shard_count: int) -> None:
+    if not isinstance(shard_count, int) or not 1 <= shard_count <= MAX_SHARD_COUNT:
+        raise errors.InvalidArgumentError(f"Shard count must be an integer between 1 and {MAX_SHARD_COUNT}")
@@ -0,0 +1,103 @@
+"""HyperLogLog cardinality sketches stored in a single cache item.
+
+An encoded sketch is a small header followed by one byte per register:
+
+    header: magic (4 bytes) | version (uint8) | precision (uint8)
+
+A key is hashed to 64 bits with BLAKE2b. The top `precision` bits select a register, which keeps
+the highest rank seen, the rank being one more than the number of leading zeros in the remaining
+bits. The hashes of a batch of keys are produced together and converted to integers in one call.
+"""
+import math
+import struct
+import sys
+from array import array
+from hashlib import blake2b
+from typing import Iterable, List, Tuple, cast
+
+from ... import errors
+
+_MAGIC = b"MHLL"
+_VERSION = 1
+_HEADER = struct.Struct("<4sBB")
+
+_HASH_BITS = 64
+MIN_PRECISION = 4
+MAX_PRECISION = 16
+
+# 2 ** -rank for every possible rank, so that estimating does not compute powers.
+_INVERSE_POWERS = [2.0**-rank for rank in range(_HASH_BITS + 1)]
+
+
+class _HyperLogLog:
+    def __init__(self, precision: int, registers: bytearray):
+        self.precision = precision
+        self.registers = registers
+
+    @staticmethod
+    def empty(precision: int) -> "_HyperLogLog":
+        _validate_precision(precision)
+        return _HyperLogLog(precision, bytearray(1 << precision))
+
+    @staticmethod
+    def decode(blob: bytes) -> "_HyperLogLog":
+        if len(blob) < _HEADER.size:
+            raise errors.ClientSdkError("Could not decode HyperLogLog: blob is too short")
+        magic, version, precision = cast(Tuple[bytes, int, int], _HEADER.unpack_from(blob))
+        if magic != _MAGIC or version != _VERSION:
+            raise errors.ClientSdkError("Could not decode HyperLogLog: unrecognized encoding")
+        registers = bytearray(memoryview(blob)[_HEADER.size :])  # noqa: E203
+        if not MIN_PRECISION <= precision <= MAX_PRECISION or len(registers) != 1 << precision:
+            raise errors.ClientSdkError("Could not decode HyperLogLog: header is corrupt")
+        return _HyperLogLog(precision, registers)
+
+    def encode(self) -> bytes:
+        return _HEADER.pack(_MAGIC, _VERSION, self.precision) + self.registers
+
+    def add_many(self, keys: Iterable[bytes]) -> int:
+        """Adds `keys` and returns the number of registers that changed."""
+        hashes = array("Q", b"".join(blake2b(key, digest_size=8).digest() for key in keys))
+        if sys.byteorder != "little":
+            hashes.byteswap()
+        registers = self.registers
+        rank_bits = _HASH_BITS - self.precision
+        rank_mask = (1 << rank_bits) - 1
+        changed = 0
+        for h in hashes:
+            index = h >> rank_bits
+            rank = rank_bits - (h & rank_mask).bit_length() + 1
+            if rank > registers[index]:
+                registers[index] = rank
+                changed += 1
+        return changed
+
+    def merge(self, other: "_HyperLogLog") -> None:
+        if other.precision != self.precision:
+            raise errors.InvalidArgumentError(
+                f"Cannot merge HyperLogLogs of precision {other.precision} and {self.precision}"
+            )
+        self.registers = bytearray(a if a > b else b for a, b in zip(self.registers, other.registers))
+
+    def count(self) -> int:
+        register_count = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / register_count)
+        estimate = alpha * register_count**2 / sum(map(_INVERSE_POWERS.__getitem__, self.registers))
+        zeros = self.registers.count(0)
+        # With 64-bit hashes only the small-range correction is needed, which counts empty registers instead.
+        if estimate <= 2.5 * register_count and zeros:
+            estimate = register_count * math.log(register_count / zeros)
+        return round(estimate)
+
+
+def _merge_all(sketches: List[_HyperLogLog]) -> _HyperLogLog:
+    merged = _HyperLogLog(sketches[0].precision, bytearray(sketches[0].registers))
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+    return merged
+
+
+def _validate_precision(precision: int) -> None:
+    if not isinstance(precision, int) or not MIN_PRECISION <= precision <= MAX_PRECISION:
+        raise errors.InvalidArgumentError(
+            f"HyperLogLog precision must be an integer between {MIN_PRECISION} and {MAX_PRECISION}"
+        )
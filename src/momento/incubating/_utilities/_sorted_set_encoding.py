@@ -0,0 +1,172 @@
+"""Binary encoding for incubating sorted sets.
+
+An encoded sorted set is a header followed by three fixed-width columns and the members:
+
+    header:    magic (4 bytes) | version (uint8) | count (uint32)
+    scores:    count * float64
+    ends:      count * uint32
+    by member: count * uint32
+    data:      members
+
+Members are stored in rank order, i.e. by score and then by member, so `scores` is sorted and a
+score range is found by binary search. Member `i` ends at `ends[i]`, relative to the start of
+`data`, and starts where member `i - 1` ends. `by member` lists the ranks ordered by member, so
+the rank of a member is found by binary search as well. Columns are little-endian.
+"""
+import math
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Dict, List, Optional, Tuple, cast
+
+from ... import errors
+from ._dictionary_encoding import _UINT32
+
+_MAGIC = b"MZST"
+_VERSION = 1
+
+_HEADER = struct.Struct("<4sBI")
+_SCORE = struct.Struct("<d")
+_UINT32_ENTRY = struct.Struct("<I")
+
+ScoredMember = Tuple[bytes, float]
+
+
+def encode_sorted_set(scores: Dict[bytes, float]) -> bytes:
+    """Encode a sorted set, given as the score of each member."""
+    # Sorting tuples compares them in C, which is much faster than a key function.
+    ranked = sorted(zip(scores.values(), scores))
+    members = [member for _, member in ranked]
+    rank_of = {member: rank for rank, member in enumerate(members)}
+    score_column = array("d", [score for score, _ in ranked])
+    end_column = array(_UINT32, accumulate(map(len, members)))
+    by_member_column = array(_UINT32, map(rank_of.__getitem__, sorted(members)))
+    if sys.byteorder == "big":
+        score_column.byteswap()
+        end_column.byteswap()
+        by_member_column.byteswap()
+    return b"".join(
+        [
+            _HEADER.pack(_MAGIC, _VERSION, len(members)),
+            score_column.tobytes(),
+            end_column.tobytes(),
+            by_member_column.tobytes(),
+            *members,
+        ]
+    )
+
+
+def decode_sorted_set(blob: bytes) -> Dict[bytes, float]:
+    """Decode an entire sorted set into the score of each member."""
+    view = _SortedSetView(blob)
+    return dict(view.items(0, len(view)))
+
+
+class _SortedSetView:
+    """Binary search and slicing over an encoded sorted set, decoding only what is read."""
+
+    def __init__(self, blob: bytes):
+        if len(blob) < _HEADER.size:
+            raise errors.ClientSdkError("Could not decode sorted set: blob is too short")
+        magic, version, count = cast(Tuple[bytes, int, int], _HEADER.unpack_from(blob))
+        if magic != _MAGIC or version != _VERSION:
+            raise errors.ClientSdkError("Could not decode sorted set: unrecognized encoding")
+        self._blob = blob
+        self._count = count
+        self._scores_start = _HEADER.size
+        self._ends_start = self._scores_start + _SCORE.size * count
+        self._by_member_start = self._ends_start + _UINT32_ENTRY.size * count
+        self._data_start = self._by_member_start + _UINT32_ENTRY.size * count
+        if self._data_start > len(blob) or count and self._data_start + self._end(count - 1) != len(blob):
+            raise errors.ClientSdkError("Could not decode sorted set: index is corrupt")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def score(self, rank: int) -> float:
+        (score,) = cast(Tuple[float], _SCORE.unpack_from(self._blob, self._scores_start + _SCORE.size * rank))
+        return score
+
+    def member(self, rank: int) -> bytes:
+        start = self._data_start + (self._end(rank - 1) if rank else 0)
+        end = self._data_start + self._end(rank)
+        return self._blob[start:end]
+
+    def rank(self, member: bytes) -> Optional[int]:
+        """The rank of `member`, or None if it is not in the set."""
+        i = bisect_left(_MembersByName(self), member)  # type: ignore[arg-type]
+        if i == self._count:
+            return None
+        rank = self._rank_by_member(i)
+        return rank if self.member(rank) == member else None
+
+    def ranks_by_score(self, min_score: float, max_score: float) -> Tuple[int, int]:
+        """The range of ranks whose scores are between `min_score` and `max_score`, inclusive."""
+        scores = _Scores(self)
+        start = bisect_left(scores, min_score)  # type: ignore[arg-type]
+        return start, max(start, bisect_right(scores, max_score, start))  # type: ignore[arg-type]
+
+    def items(self, start: int, stop: int) -> List[ScoredMember]:
+        """The members of ranks `start` to `stop`, exclusive, with their scores."""
+        if start >= stop:
+            return []
+        scores = array("d")
+        scores_start = self._scores_start + _SCORE.size * start
+        scores_end = self._scores_start + _SCORE.size * stop
+        scores.frombytes(self._blob[scores_start:scores_end])
+        # The end of the previous member is where the first one starts.
+        ends = array(_UINT32)
+        ends_start = self._ends_start + _UINT32_ENTRY.size * (start - 1 if start else 0)
+        ends_end = self._ends_start + _UINT32_ENTRY.size * stop
+        ends.frombytes(self._blob[ends_start:ends_end])
+        if sys.byteorder == "big":
+            scores.byteswap()
+            ends.byteswap()
+        if not start:
+            ends.insert(0, 0)
+        blob, data_start = self._blob, self._data_start
+        members = [blob[data_start + begin : data_start + end] for begin, end in zip(ends, ends[1:])]  # noqa: E203
+        return list(zip(members, scores))
+
+    def _end(self, rank: int) -> int:
+        (end,) = cast(Tuple[int], _UINT32_ENTRY.unpack_from(self._blob, self._ends_start + _UINT32_ENTRY.size * rank))
+        return end
+
+    def _rank_by_member(self, i: int) -> int:
+        position = self._by_member_start + _UINT32_ENTRY.size * i
+        (rank,) = cast(Tuple[int], _UINT32_ENTRY.unpack_from(self._blob, position))
+        return rank
+
+
+class _Scores:
+    """Lets `bisect` probe the scores column."""
+
+    def __init__(self, view: _SortedSetView):
+        self._view = view
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __getitem__(self, rank: int) -> float:
+        return self._view.score(rank)
+
+
+class _MembersByName:
+    """Lets `bisect` probe the members in member order."""
+
+    def __init__(self, view: _SortedSetView):
+        self._view = view
+
+    def __len__(self) -> int:
+        return len(self._view)
+
+    def __getitem__(self, i: int) -> bytes:
+        return self._view.member(self._view._rank_by_member(i))
+
+
+def _validate_scores(scores: Dict[bytes, float]) -> None:
+    for score in scores.values():
+        if not isinstance(score, (int, float)) or math.isnan(score):
+            raise errors.InvalidArgumentError("Scores must be numbers other than NaN")
@@ -0,0 +1,81 @@
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Optional, Tuple, TypeVar
+
+from ... import errors
+from ._item_locks import _ItemLocks
+
+_DictionaryKey = Tuple[str, str]
+_TValue = TypeVar("_TValue")
+
+
+class _PendingUpdates(Generic[_TValue]):
+    def __init__(self) -> None:
+        self.updates: Dict[bytes, _TValue] = {}
+        self.done: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+
+
+class _DictionaryWriteCombiner(Generic[_TValue]):
+    """Merges concurrent updates of the same dictionary into a single read-modify-write cycle.
+
+    Any item that is updated field by field can be combined, e.g. a sorted set updated with the
+    score of each member, with `_TValue` the type of the field values.
+
+    Updates of a dictionary that arrive within `window_seconds` of the first one, or while a
+    read-modify-write of that dictionary is in flight, are applied together by the next cycle.
+    Updates are applied in arrival order, so a later value for a field wins. Every caller waits
+    for the cycle that applies its update and sees the error if that cycle fails.
+
+    Each cycle holds the dictionary's lock in `locks`, so cycles of the same dictionary never
+    overlap with each other or with other multi-step writes that take the lock, like resharding.
+    """
+
+    def __init__(
+        self,
+        read_modify_write: Callable[[str, str, Dict[bytes, _TValue]], Awaitable[None]],
+        window_seconds: float = 0.0,
+        locks: Optional[_ItemLocks] = None,
+    ):
+        if window_seconds < 0:
+            raise errors.InvalidArgumentError("Dictionary write window must be non-negative")
+        self._read_modify_write = read_modify_write
+        self._window_seconds = window_seconds
+        self._locks = locks or _ItemLocks()
+        self._pending: Dict[_DictionaryKey, _PendingUpdates[_TValue]] = {}
+        self._writers: Dict[_DictionaryKey, "asyncio.Task[None]"] = {}
+
+    async def update(self, cache_name: str, dictionary_name: str, updates: Dict[bytes, _TValue]) -> None:
+        key = (cache_name, dictionary_name)
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _PendingUpdates()
+        pending.updates.update(updates)
+        if key not in self._writers:
+            self._writers[key] = asyncio.ensure_future(self._write(key))
+        # A caller giving up must not cancel the cycle other callers are waiting for.
+        await asyncio.shield(pending.done)
+
+    async def _write(self, key: _DictionaryKey) -> None:
+        try:
+            # Even without a window, yield once so updates issued together (e.g. by `asyncio.gather`) are combined.
+            await asyncio.sleep(self._window_seconds)
+            while True:
+                async with self._locks.lock(*key):
+                    # Taken only once the lock is held, so updates made meanwhile are combined as well.
+                    pending: Optional[_PendingUpdates[_TValue]] = self._pending.pop(key, None)
+                    if pending is None:
+                        return
+                    try:
+                        await self._read_modify_write(key[0], key[1], pending.updates)
+                    except asyncio.CancelledError:
+                        pending.done.cancel()
+                        raise
+                    except Exception as e:
+                        pending.done.set_exception(e)
+                    else:
+                        pending.done.set_result(None)
+        finally:
+            del self._writers[key]
+            # Updates that were waiting for a cancelled writer would otherwise never complete.
+            pending = self._pending.pop(key, None)
+            if pending is not None:
+                pending.done.cancel()
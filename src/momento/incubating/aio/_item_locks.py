@@ -0,0 +1,25 @@
+import asyncio
+import weakref
+from typing import Tuple
+
+_ItemKey = Tuple[str, str]
+
+
+class _ItemLocks:
+    """Per-item locks for read-modify-write cycles made by one client.
+
+    Holding the lock of an item keeps the other read-modify-write cycles of this client from
+    interleaving with one's own, so their updates are not lost to each other. Updates made
+    concurrently through other clients still can be. Locks are dropped once nobody holds or
+    waits for them.
+    """
+
+    def __init__(self) -> None:
+        self._locks: "weakref.WeakValueDictionary[_ItemKey, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    def lock(self, cache_name: str, key: str) -> asyncio.Lock:
+        item_key = (cache_name, key)
+        lock = self._locks.get(item_key)
+        if lock is None:
+            lock = self._locks[item_key] = asyncio.Lock()
+        return lock
@@ -1,28 +1,93 @@
+import asyncio
+import functools
+import math
 import warnings
-from typing import List, Optional, Union, cast
+from concurrent.futures import Executor
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+    cast,
+)
 
+from ... import errors
 from ..._utilities._data_validation import _as_bytes
 from ...aio.simple_cache_client import SimpleCacheClient
+from ...cache_operation_types import CacheGetResponse
+from ...compression import Compression
+from ...hooks import RequestHook
+from ...hot_keys import HotKeyTracking
+from ...near_cache import NearCaching
+from ...serialization import Serializer
+from ...slow_requests import SlowRequestLogging
 from .. import INCUBATING_WARNING_MSG
+from .._utilities._bloom_filter import _BloomFilter, _validate_sizing
+from .._utilities._decoded_dictionary_cache import (
+    DecodedDictionaryCacheStats,
+    _DecodedDictionaryCache,
+)
+from .._utilities._dictionary_sharding import _ShardManifest, _validate_shard_count
+from .._utilities._hyperloglog import _HyperLogLog, _merge_all, _validate_precision
+from .._utilities._serialization import _bytes_to_string
+from .._utilities._sorted_set_encoding import (
+    _SortedSetView,
+    _validate_scores,
+    decode_sorted_set,
+    encode_sorted_set,
+)
 from ..cache_operation_types import (
     BytesDictionary,
+    CacheBloomAddManyResponse,
+    CacheBloomMightContainManyResponse,
+    CacheDictionaryGetAllManyResponse,
     CacheDictionaryGetAllResponse,
     CacheDictionaryGetMultiResponse,
     CacheDictionaryGetUnaryResponse,
+    CacheDictionaryReshardResponse,
     CacheDictionarySetMultiResponse,
     CacheDictionarySetUnaryResponse,
     CacheExistsResponse,
     CacheGetStatus,
+    CacheHllAddManyResponse,
+    CacheHllCountResponse,
+    CacheHllMergeResponse,
+    CacheSortedSetAddManyResponse,
+    CacheSortedSetRangeResponse,
+    CacheSortedSetRankResponse,
     Dictionary,
     DictionaryKey,
     DictionaryValue,
 )
+from ._dictionary_write_combiner import _DictionaryWriteCombiner
+from ._item_locks import _ItemLocks
 from .utils import (
     convert_dict_items_to_bytes,
     deserialize_dictionary,
+    deserialize_dictionary_fields,
+    gather_all,
     serialize_dictionary,
 )
 
+if TYPE_CHECKING:
+    # Only for type checking, as it needs OpenTelemetry.
+    from ...tracing import TracingInterceptor
+
+_TArg = TypeVar("_TArg")
+_TResult = TypeVar("_TResult")
+
+DEFAULT_SERIALIZATION_OFFLOAD_THRESHOLD_BYTES = 256 * 1024
+DEFAULT_BLOOM_EXPECTED_ITEMS = 100_000
+DEFAULT_BLOOM_FALSE_POSITIVE_RATE = 0.01
+DEFAULT_HLL_PRECISION = 14
+DEFAULT_EXISTS_MAX_CONCURRENCY = 100
+
 
 class SimpleCacheClientIncubating(SimpleCacheClient):
     def __init__(
@@ -30,6 +95,22 @@ class SimpleCacheClientIncubating(SimpleCacheClient):
         auth_token: str,
         default_ttl_seconds: int,
         request_timeout_ms: Optional[int] = None,
+        endpoint_override: Optional[str] = None,
+        insecure: bool = False,
+        local_credentials: bool = False,
+        decoded_dictionary_cache_max_bytes: Optional[int] = None,
+        dictionary_write_window_ms: int = 0,
+        dictionary_compression_threshold_bytes: Optional[int] = None,
+        serialization_executor: Optional[Executor] = None,
+        serialization_offload_threshold_bytes: int = DEFAULT_SERIALIZATION_OFFLOAD_THRESHOLD_BYTES,
+        compression: Optional[Compression] = None,
+        serializer: Optional[Serializer[object]] = None,
+        hooks: Sequence[RequestHook] = (),
+        metrics: bool = False,
+        tracing: Optional["TracingInterceptor"] = None,
+        hot_keys: Optional[HotKeyTracking] = None,
+        near_cache: Optional[NearCaching] = None,
+        slow_requests: Optional[SlowRequestLogging] = None,
     ):
         """Creates a SimpleCacheClientIncubating.
         !! Includes non-final, experimental features and APIs subject to change  !!
@@ -41,18 +122,96 @@ class SimpleCacheClientIncubating(SimpleCacheClient):
             request_timeout_ms: An optional timeout in milliseconds to allow for Get and Set operations to complete.
                 Defaults to None, in which case 5 seconds is used. The request will be terminated if it takes longer
                 than this value and will result in TimeoutError.
+            endpoint_override: Connect to this endpoint instead of the one in the auth token. A loopback
+                `host:port`, such as a `momento.testing.fake_server`, is used for both the control and the data plane.
+            insecure: Connect over a plaintext channel. Only meant for local test servers.
+            local_credentials: Connect with gRPC local credentials instead of TLS, as a `momento.testing.fake_server`
+                listens with by default. Only meant for local test servers.
+            decoded_dictionary_cache_max_bytes: Keep recently decoded dictionaries in memory, up to about this many
+                bytes, so that reading or updating a dictionary that has not changed since it was last seen does not
+                decode it again. Defaults to None, which disables the cache.
+            dictionary_write_window_ms: How long to wait for more updates of a dictionary or sorted set before
+                writing it. Concurrent `dictionary_set`, `dictionary_set_multi` and `zadd_many` calls on the same item
+                are combined into a single read-modify-write; updates that arrive while one is in flight are combined
+                into the next. Defaults to 0, in which case only updates issued together are combined.
+            dictionary_compression_threshold_bytes: Compress encoded dictionaries of at least this many bytes with
+                zlib. Looking up fields of a compressed dictionary decompresses all of it. Defaults to None, which
+                disables compression.
+            serialization_executor: Encode and decode dictionaries, and decode values in `decode_value`, of at least
+                `serialization_offload_threshold_bytes` in this executor instead of on the event loop, so that they do
+                not stall other requests. A `ProcessPoolExecutor` also lets `dictionary_get_all_many` decode several
+                dictionaries in parallel. Defaults to None, in which case everything runs on the event loop.
+            serialization_offload_threshold_bytes: Size from which payloads are handed to the
+                `serialization_executor`. Defaults to 256 KiB; smaller payloads are not worth the hand-off.
+            compression: Compress values of at least the configured size before storing them, and decompress
+                compressed values when reading them. Defaults to None.
+            serializer: Converts values to bytes in `set_object` and back in `get_object`. Defaults to None, in
+                which case values are stored as JSON.
+            hooks: Called when data requests, such as gets and sets, start and end. See `momento.hooks`.
+            metrics: Record latencies, outcomes and sizes of data requests, for `metrics_snapshot()`.
+            tracing: Creates OpenTelemetry spans for data requests. See `momento.tracing`.
+            hot_keys: Count gets and sets by key, to report the busiest keys. See `momento.hot_keys`.
+            near_cache: Serve gets of frequently read keys from memory for a short while. See `momento.near_cache`.
+            slow_requests: Report data requests that take longer than a threshold. See `momento.slow_requests`.
         Raises:
             IllegalArgumentError: If method arguments fail validations
         """
         warnings.warn(INCUBATING_WARNING_MSG)
-        super().__init__(auth_token, default_ttl_seconds, request_timeout_ms)
+        super().__init__(
+            auth_token,
+            default_ttl_seconds,
+            request_timeout_ms,
+            endpoint_override,
+            insecure,
+            local_credentials,
+            compression,
+            serializer,
+            hooks,
+            metrics,
+            tracing,
+            hot_keys,
+            near_cache,
+            slow_requests,
+        )
+        self._decoded_dictionary_cache: Optional[_DecodedDictionaryCache] = None
+        if decoded_dictionary_cache_max_bytes is not None:
+            self._decoded_dictionary_cache = _DecodedDictionaryCache(decoded_dictionary_cache_max_bytes)
+        if not isinstance(serialization_offload_threshold_bytes, int) or serialization_offload_threshold_bytes < 0:
+            raise errors.InvalidArgumentError("Serialization offload threshold must be a non-negative integer")
+        if dictionary_compression_threshold_bytes is not None and (
+            not isinstance(dictionary_compression_threshold_bytes, int) or dictionary_compression_threshold_bytes < 0
+        ):
+            raise errors.InvalidArgumentError("Dictionary compression threshold must be a non-negative integer")
+        # A partial of a module-level function, so that it can be sent to a process pool.
+        self._serialize_dictionary = functools.partial(
+            serialize_dictionary, compression_threshold_bytes=dictionary_compression_threshold_bytes
+        )
+        self._serialization_executor = serialization_executor
+        self._serialization_offload_threshold_bytes = serialization_offload_threshold_bytes
+        self._item_locks = _ItemLocks()
+        self._dictionary_write_combiner = _DictionaryWriteCombiner[bytes](
+            self._update_dictionary, dictionary_write_window_ms / 1000.0, self._item_locks
+        )
+        self._sorted_set_write_combiner = _DictionaryWriteCombiner[float](
+            self._update_sorted_set, dictionary_write_window_ms / 1000.0, self._item_locks
+        )
+
+    def decoded_dictionary_cache_stats(self) -> Optional[DecodedDictionaryCacheStats]:
+        """Hit, miss, eviction and decode time counters of the decoded-dictionary cache.
+
+        Returns:
+            Optional[DecodedDictionaryCacheStats]: The counters, or None if the cache is disabled.
+        """
+        if self._decoded_dictionary_cache is None:
+            return None
+        return self._decoded_dictionary_cache.stats()
 
     async def dictionary_set(
         self,
         cache_name: str,
         dictionary_name: str,
         key: DictionaryKey,
-        value: DictionaryValue,
+        value: Union[DictionaryValue, bytearray, memoryview],
         ttl_seconds: Optional[int] = None,
         *,
         refresh_ttl: bool,
@@ -66,7 +225,8 @@ class SimpleCacheClientIncubating(SimpleCacheClient):
             cache_name (str): Name of the cache to store the dictionary in.
             dictionary_name (str): The name of the dictionary in the cache.
             key (DictionaryKey): The key to set.
-            value (DictionaryValue): The value to store.
+            value (DictionaryValue): The value to store. Bytearrays and memoryviews are accepted too, and copied,
+                since dictionaries keep their values.
             ttl_seconds (Optional[int], optional): Time to live in seconds for the dictionary
                 as a whole.
             refresh_ttl (bool): If, when performing an update, to refresh the ttl.
@@ -74,16 +234,9 @@ class SimpleCacheClientIncubating(SimpleCacheClient):
         Returns:
             CacheDictionarySetUnaryResponse: data stored in the cache
         """
-        dictionary_get_response = await self.get(cache_name, dictionary_name)
-        cached_dictionary: BytesDictionary = {}
-        if dictionary_get_response.status() == CacheGetStatus.HIT:
-            cached_dictionary = deserialize_dictionary(cast(bytes, dictionary_get_response.value_as_bytes()))
-
         bytes_key = _as_bytes(key)
         bytes_value = _as_bytes(value)
-        cached_dictionary[bytes_key] = bytes_value
-
-        await self.set(cache_name, dictionary_name, serialize_dictionary(cached_dictionary))
+        await self._dictionary_write_combiner.update(cache_name, dictionary_name, {bytes_key: bytes_value})
         return CacheDictionarySetUnaryResponse(dictionary_name=dictionary_name, key=bytes_key, value=bytes_value)
 
     async def dictionary_set_multi(
@@ -111,15 +264,8 @@ class SimpleCacheClientIncubating(SimpleCacheClient):
         Returns:
             CacheDictionarySetMultiResponse: data stored in the cache
         """
-        dictionary_get_response = await self.get(cache_name, dictionary_name)
-        cached_dictionary: BytesDictionary = {}
-        if dictionary_get_response.status() == CacheGetStatus.HIT:
-            cached_dictionary = deserialize_dictionary(cast(bytes, dictionary_get_response.value_as_bytes()))
-
         bytes_dictionary = convert_dict_items_to_bytes(dictionary)
-        cached_dictionary.update(bytes_dictionary)
-
-        await self.set(cache_name, dictionary_name, serialize_dictionary(cached_dictionary))
+        await self._dictionary_write_combiner.update(cache_name, dictionary_name, bytes_dictionary)
         return CacheDictionarySetMultiResponse(dictionary_name=dictionary_name, dictionary=bytes_dictionary)
 
     async def dictionary_get(
@@ -139,15 +285,14 @@ class SimpleCacheClientIncubating(SimpleCacheClient):
             CacheDictionaryGetUnaryResponse: A wrapper for the value (if present)
                 and status (HIT or MISS).
         """
-        dictionary_get_response = await self.get(cache_name, dictionary_name)
-        if dictionary_get_response.status() == CacheGetStatus.MISS:
+        blob = await self._get_blob(cache_name, dictionary_name)
+        if blob is None:
             return CacheDictionaryGetUnaryResponse(value=None, status=CacheGetStatus.MISS)
 
-        dictionary: BytesDictionary = deserialize_dictionary(cast(bytes, dictionary_get_response.value_as_bytes()))
-
-        try:
-            value = dictionary[_as_bytes(key, "Unsupported type for key: ")]
-        except KeyError:
+        (value,) = await self._lookup_fields(
+            cache_name, dictionary_name, blob, [_as_bytes(key, "Unsupported type for key: ")]
+        )
+        if value is None:
             return CacheDictionaryGetUnaryResponse(value=None, status=CacheGetStatus.MISS)
 
         return CacheDictionaryGetUnaryResponse(value=value, status=CacheGetStatus.HIT)
@@ -172,25 +317,19 @@ class SimpleCacheClientIncubating(SimpleCacheClient):
         if len(keys) == 0:
             raise ValueError("Argument keys must be non-empty")
 
-        dictionary_get_response = await self.get(cache_name, dictionary_name)
-        if dictionary_get_response.status() == CacheGetStatus.MISS:
+        blob = await self._get_blob(cache_name, dictionary_name)
+        if blob is None:
             return CacheDictionaryGetMultiResponse(
                 values=[None for _ in range(len(keys))],
                 status=[CacheGetStatus.MISS for _ in range(len(keys))],
             )
 
-        dictionary: BytesDictionary = deserialize_dictionary(cast(bytes, dictionary_get_response.value_as_bytes()))
-
-        values: List[Optional[DictionaryValue]] = []
-        results: List[CacheGetStatus] = []
-        for key in keys:
-            try:
-                value = dictionary[_as_bytes(key, "Unsupported type for key: ")]
-                values.append(value)
-                results.append(CacheGetStatus.HIT)
-            except KeyError:
-                values.append(None)
-                results.append(CacheGetStatus.MISS)
+        values: List[Optional[DictionaryValue]] = list(
+            await self._lookup_fields(
+                cache_name, dictionary_name, blob, [_as_bytes(key, "Unsupported type for key: ") for key in keys]
+            )
+        )
+        results = [CacheGetStatus.MISS if value is None else CacheGetStatus.HIT for value in values]
 
         return CacheDictionaryGetMultiResponse(values=values, status=results)
 
@@ -204,13 +343,107 @@ class SimpleCacheClientIncubating(SimpleCacheClient):
         Returns:
             CacheDictionaryGetAllResponse: Value (the mapping, if present) and status (HIT or MISS).
         """
-        get_response = await self.get(cache_name, dictionary_name)
-        if get_response.status() == CacheGetStatus.MISS:
+        blob = await self._get_blob(cache_name, dictionary_name)
+        if blob is None:
             return CacheDictionaryGetAllResponse(value=None, status=CacheGetStatus.MISS)
 
-        value = deserialize_dictionary(cast(bytes, get_response.value_as_bytes()))
+        manifest = _ShardManifest.decode(blob)
+        if manifest is None:
+            value = await self._decode_dictionary(cache_name, dictionary_name, blob)
+        else:
+            value = await self._get_all_shards(cache_name, dictionary_name, manifest)
         return CacheDictionaryGetAllResponse(value=value, status=CacheGetStatus.HIT)
 
+    async def dictionary_get_all_many(
+        self, cache_name: str, *dictionary_names: str
+    ) -> CacheDictionaryGetAllManyResponse:
+        """Retrieve several entire dictionaries from the cache.
+
+        The dictionaries are fetched concurrently. Large ones are decoded in the `serialization_executor`,
+        in parallel if it is a process pool.
+
+        Args:
+            cache_name (str): Name of the cache to get the dictionaries from.
+            dictionary_names (str): Names of the dictionaries to retrieve.
+
+        Returns:
+            CacheDictionaryGetAllManyResponse: A response per dictionary, in the order of `dictionary_names`.
+        """
+        responses = await gather_all(
+            self.dictionary_get_all(cache_name, dictionary_name) for dictionary_name in dictionary_names
+        )
+        return CacheDictionaryGetAllManyResponse(responses)
+
+    async def decode_value(self, response: CacheGetResponse) -> Optional[str]:
+        """Decode the value of a get response as UTF-8, like `response.value()`.
+
+        Values of at least `serialization_offload_threshold_bytes` are decoded in the `serialization_executor`,
+        so that decoding a multi-megabyte value does not stall other requests. The response keeps the decoded
+        value, so calling `response.value()` afterwards does not decode it again.
+
+        Args:
+            response (CacheGetResponse): A response returned by `get`.
+
+        Returns:
+            Optional[str]: The value if the get was a hit, else None.
+        """
+        value = response.value_as_bytes()
+        if value is None:
+            return None
+        decoded = await self._offload(len(value), _bytes_to_string, value)
+        response._set_decoded_value(decoded)
+        return decoded
+
+    async def dictionary_reshard(
+        self, cache_name: str, dictionary_name: str, shard_count: int
+    ) -> CacheDictionaryReshardResponse:
+        """Spread a dictionary over `shard_count` cache items.
+
+        The fields of a sharded dictionary are split across several cache items plus a small manifest,
+        so that getting or setting a field only transfers the shard it is in, and `dictionary_get_all`
+        fetches the shards concurrently. A dictionary that does not exist yet is created empty, so
+        that it is sharded from its first `dictionary_set` on.
+
+        The dictionary stays readable while it is resharded: the new shards are written before the
+        manifest is switched over to them, and the previous shards are deleted afterwards. Updates
+        made through this client wait for resharding to finish.
+
+        Args:
+            cache_name (str): Name of the cache the dictionary is in.
+            dictionary_name (str): Name of the dictionary to reshard.
+            shard_count (int): Number of shards, between 1 and 1024.
+
+        Returns:
+            CacheDictionaryReshardResponse: The dictionary name and its new shard count.
+
+        Raises:
+            InvalidArgumentError: If the shard count is out of range.
+        """
+        _validate_shard_count(shard_count)
+        async with self._item_locks.lock(cache_name, dictionary_name):
+            blob = await self._get_blob(cache_name, dictionary_name)
+            previous: Optional[_ShardManifest] = None
+            dictionary: BytesDictionary = {}
+            if blob is not None:
+                previous = _ShardManifest.decode(blob)
+                if previous is None:
+                    dictionary = await self._decode_dictionary(cache_name, dictionary_name, blob)
+                else:
+                    dictionary = await self._get_all_shards(cache_name, dictionary_name, previous)
+
+            manifest = _ShardManifest(shard_count) if previous is None else previous.next(shard_count)
+            await gather_all(
+                self._write_dictionary(cache_name, manifest.shard_key(dictionary_name, shard), shard_dictionary)
+                for shard, shard_dictionary in enumerate(manifest.split(dictionary))
+            )
+            await self._write_manifest(cache_name, dictionary_name, manifest)
+            if previous is not None:
+                await gather_all(
+                    self.delete(cache_name, previous.shard_key(dictionary_name, shard))
+                    for shard in range(previous.shard_count)
+                )
+        return CacheDictionaryReshardResponse(dictionary_name=dictionary_name, shard_count=shard_count)
+
     async def exists(self, cache_name: str, *keys: Union[str, bytes]) -> CacheExistsResponse:
         """Test if `keys` exist in the cache.
 
@@ -242,3 +475,516 @@ class SimpleCacheClientIncubating(SimpleCacheClient):
         get_multi_response = await self.get_multi(cache_name, *keys)
         mask = [status == CacheGetStatus.HIT for status in get_multi_response.status()]
         return CacheExistsResponse(keys, mask)
+
+    async def exists_all(
+        self, cache_name: str, *keys: Union[str, bytes], max_concurrency: int = DEFAULT_EXISTS_MAX_CONCURRENCY
+    ) -> bool:
+        """Test if all `keys` exist in the cache, stopping at the first missing key.
+
+        Unlike `exists(...).all()`, this returns as soon as a key is found to be missing and
+        cancels the lookups still in flight, and it never holds more than `max_concurrency`
+        lookups or results at a time, however many keys are tested.
+
+        Examples:
+        >>> if not client.exists_all("my-cache", *keys):
+        ...     log.info("Some key(s) are missing.")
+
+        Args:
+            cache_name (str): Name of the cache to query for the keys.
+            keys (Union[str, bytes]): Key(s) to test for existence. Keys are looked up in order.
+            max_concurrency (int): Maximum number of lookups in flight at once. Defaults to 100.
+
+        Returns:
+            bool: True if all the keys exist, which includes when there are none. False if at least one does not.
+
+        Raises:
+            InvalidArgumentError: If `max_concurrency` is not a positive integer.
+        """
+        return not await self._find_key(cache_name, keys, CacheGetStatus.MISS, max_concurrency)
+
+    async def exists_any(
+        self, cache_name: str, *keys: Union[str, bytes], max_concurrency: int = DEFAULT_EXISTS_MAX_CONCURRENCY
+    ) -> bool:
+        """Test if any of `keys` exists in the cache, stopping at the first existing key.
+
+        Unlike `exists(...).num_exists() > 0`, this returns as soon as a key is found and cancels
+        the lookups still in flight, and it never holds more than `max_concurrency` lookups or
+        results at a time, however many keys are tested.
+
+        Args:
+            cache_name (str): Name of the cache to query for the keys.
+            keys (Union[str, bytes]): Key(s) to test for existence. Keys are looked up in order.
+            max_concurrency (int): Maximum number of lookups in flight at once. Defaults to 100.
+
+        Returns:
+            bool: True if at least one key exists. False if none does, which includes when there are none.
+
+        Raises:
+            InvalidArgumentError: If `max_concurrency` is not a positive integer.
+        """
+        return await self._find_key(cache_name, keys, CacheGetStatus.HIT, max_concurrency)
+
+    async def bloom_add_many(
+        self,
+        cache_name: str,
+        filter_name: str,
+        *keys: Union[str, bytes],
+        expected_items: int = DEFAULT_BLOOM_EXPECTED_ITEMS,
+        false_positive_rate: float = DEFAULT_BLOOM_FALSE_POSITIVE_RATE,
+        ttl_seconds: Optional[int] = None,
+    ) -> CacheBloomAddManyResponse:
+        """Add `keys` to a Bloom filter.
+
+        A Bloom filter answers whether keys were added to it in a single cache item of about
+        1.2 bytes per expected item at a 1% false positive rate, however large the keys are.
+        It never forgets a key, but may claim to contain keys that were never added.
+
+        The filter is created on first use, sized so that it has about `false_positive_rate`
+        false positives once `expected_items` keys were added; the sizing of an existing filter
+        does not change. Concurrent additions to a filter through this client are serialized.
+
+        Args:
+            cache_name (str): Name of the cache to store the filter in.
+            filter_name (str): Name of the filter.
+            keys (Union[str, bytes]): Key(s) to add.
+            expected_items (int): Number of keys the filter is sized for when it is created.
+                Defaults to 100,000.
+            false_positive_rate (float): False positive rate of a new filter once it holds
+                `expected_items` keys. Defaults to 0.01.
+            ttl_seconds (Optional[int]): Time to live in seconds for the filter. Defaults to the
+                client's default TTL.
+
+        Returns:
+            CacheBloomAddManyResponse: The number of keys that were definitely new.
+
+        Raises:
+            InvalidArgumentError: If the filter sizing is invalid.
+        """
+        _validate_sizing(expected_items, false_positive_rate)
+        bytes_keys = [_as_bytes(key, "Unsupported type for key: ") for key in keys]
+        async with self._item_locks.lock(cache_name, filter_name):
+            blob = await self._get_blob(cache_name, filter_name)
+            if blob is None:
+                bloom_filter = _BloomFilter.sized_for(expected_items, false_positive_rate)
+            else:
+                bloom_filter = _BloomFilter.decode(blob)
+            were_present = bloom_filter.add_many(bytes_keys)
+            await self.set(cache_name, filter_name, bloom_filter.encode(), ttl_seconds)
+        return CacheBloomAddManyResponse(filter_name=filter_name, num_added=were_present.count(False))
+
+    async def bloom_might_contain_many(
+        self, cache_name: str, filter_name: str, *keys: Union[str, bytes]
+    ) -> CacheBloomMightContainManyResponse:
+        """Test if `keys` might have been added to a Bloom filter.
+
+        Unlike `exists`, which fetches every key, this fetches only the filter, once, however many
+        keys are tested. A missing filter contains no keys.
+
+        Examples:
+        >>> response = client.bloom_might_contain_many("my-cache", "seen-ids", *ids)
+        ... new_ids = response.absent_keys()
+
+        Args:
+            cache_name (str): Name of the cache the filter is in.
+            filter_name (str): Name of the filter.
+            keys (Union[str, bytes]): Key(s) to test.
+
+        Returns:
+            CacheBloomMightContainManyResponse: For each key, False if it definitely was not added,
+                else True.
+        """
+        bytes_keys = [_as_bytes(key, "Unsupported type for key: ") for key in keys]
+        blob = await self._get_blob(cache_name, filter_name)
+        if blob is None:
+            return CacheBloomMightContainManyResponse(keys, [False] * len(keys))
+        return CacheBloomMightContainManyResponse(keys, _BloomFilter.decode(blob).might_contain_many(bytes_keys))
+
+    async def hll_add_many(
+        self,
+        cache_name: str,
+        hll_name: str,
+        *keys: Union[str, bytes],
+        precision: int = DEFAULT_HLL_PRECISION,
+        ttl_seconds: Optional[int] = None,
+    ) -> CacheHllAddManyResponse:
+        """Add `keys` to a HyperLogLog, which estimates the number of distinct keys added to it.
+
+        A HyperLogLog is a single cache item of `2 ** precision` bytes, however many keys are added,
+        so adding a batch of keys costs one read-modify-write. At the default precision of 14 it is
+        16 KiB and its count is typically within 1% of the true count.
+
+        The HyperLogLog is created on first use with `precision`; the precision of an existing one
+        does not change. Concurrent additions to a HyperLogLog through this client are serialized.
+
+        Args:
+            cache_name (str): Name of the cache to store the HyperLogLog in.
+            hll_name (str): Name of the HyperLogLog.
+            keys (Union[str, bytes]): Key(s) to add.
+            precision (int): Number of bits that select a register of a new HyperLogLog, between 4
+                and 16. Every extra bit doubles the size and divides the error by about 1.4.
+                Defaults to 14.
+            ttl_seconds (Optional[int]): Time to live in seconds for the HyperLogLog. Defaults to the
+                client's default TTL.
+
+        Returns:
+            CacheHllAddManyResponse: Whether the HyperLogLog changed.
+
+        Raises:
+            InvalidArgumentError: If the precision is out of range.
+        """
+        _validate_precision(precision)
+        bytes_keys = [_as_bytes(key, "Unsupported type for key: ") for key in keys]
+        async with self._item_locks.lock(cache_name, hll_name):
+            blob = await self._get_blob(cache_name, hll_name)
+            sketch = _HyperLogLog.empty(precision) if blob is None else _HyperLogLog.decode(blob)
+            changed = sketch.add_many(bytes_keys) > 0
+            if changed or blob is None:
+                await self.set(cache_name, hll_name, sketch.encode(), ttl_seconds)
+        return CacheHllAddManyResponse(hll_name=hll_name, changed=changed)
+
+    async def hll_count(self, cache_name: str, *hll_names: str) -> CacheHllCountResponse:
+        """Estimate the number of distinct keys added to any of the HyperLogLogs `hll_names`.
+
+        Examples:
+        >>> client.hll_count("my-cache", "visitors:2022-10-01", "visitors:2022-10-02").count()
+
+        Args:
+            cache_name (str): Name of the cache the HyperLogLogs are in.
+            hll_names (str): Name(s) of the HyperLogLogs to count the union of. Missing ones are empty.
+
+        Returns:
+            CacheHllCountResponse: The estimated count.
+
+        Raises:
+            InvalidArgumentError: If the HyperLogLogs have different precisions.
+        """
+        sketches = await self._get_hlls(cache_name, hll_names)
+        return CacheHllCountResponse(count=_merge_all(sketches).count() if sketches else 0)
+
+    async def hll_merge(
+        self, cache_name: str, destination_name: str, *source_names: str, ttl_seconds: Optional[int] = None
+    ) -> CacheHllMergeResponse:
+        """Merge the HyperLogLogs `source_names` into `destination_name`.
+
+        Afterwards the destination counts every key added to it or to any of the sources, as if
+        they had all been added to it. The sources are not changed.
+
+        Args:
+            cache_name (str): Name of the cache the HyperLogLogs are in.
+            destination_name (str): Name of the HyperLogLog to merge into. It is created if missing.
+            source_names (str): Name(s) of the HyperLogLogs to merge. Missing ones are empty.
+            ttl_seconds (Optional[int]): Time to live in seconds for the destination. Defaults to the
+                client's default TTL.
+
+        Returns:
+            CacheHllMergeResponse: The name of the destination.
+
+        Raises:
+            InvalidArgumentError: If the HyperLogLogs have different precisions.
+        """
+        async with self._item_locks.lock(cache_name, destination_name):
+            sketches = await self._get_hlls(cache_name, (destination_name, *source_names))
+            merged = _merge_all(sketches) if sketches else _HyperLogLog.empty(DEFAULT_HLL_PRECISION)
+            await self.set(cache_name, destination_name, merged.encode(), ttl_seconds)
+        return CacheHllMergeResponse(hll_name=destination_name)
+
+    async def zadd_many(
+        self, cache_name: str, sorted_set_name: str, scores: Mapping[Union[str, bytes], float]
+    ) -> CacheSortedSetAddManyResponse:
+        """Add members to a sorted set, or update their scores.
+
+        A sorted set keeps its members ordered by score, ties ordered by member, in a single cache
+        item with a fixed-width index, so that ranks and ranges are found by binary search and only
+        the members returned are decoded. Every update rewrites the whole item; concurrent calls on
+        the same sorted set are combined into a single rewrite, like dictionary updates.
+
+        Examples:
+        >>> client.zadd_many("my-cache", "leaderboard", {"alice": 1200, "bob": 950})
+
+        Args:
+            cache_name (str): Name of the cache to store the sorted set in.
+            sorted_set_name (str): Name of the sorted set. It is created if missing.
+            scores (Mapping[Union[str, bytes], float]): The score of each member to add or update.
+
+        Returns:
+            CacheSortedSetAddManyResponse: The scores that were set.
+
+        Raises:
+            InvalidArgumentError: If a score is not a number, or is NaN.
+        """
+        bytes_scores = {_as_bytes(member, "Unsupported type for member: "): score for member, score in scores.items()}
+        _validate_scores(bytes_scores)
+        await self._sorted_set_write_combiner.update(cache_name, sorted_set_name, bytes_scores)
+        return CacheSortedSetAddManyResponse(sorted_set_name=sorted_set_name, scores=bytes_scores)
+
+    async def zrank(
+        self, cache_name: str, sorted_set_name: str, member: Union[str, bytes], *, descending: bool = False
+    ) -> CacheSortedSetRankResponse:
+        """Get the rank and score of a member of a sorted set.
+
+        Args:
+            cache_name (str): Name of the cache the sorted set is in.
+            sorted_set_name (str): Name of the sorted set.
+            member (Union[str, bytes]): The member to rank.
+            descending (bool): Rank from the highest score instead of the lowest. Defaults to False.
+
+        Returns:
+            CacheSortedSetRankResponse: The rank, counting from 0, and score of the member if it is in
+                the sorted set, else a MISS.
+        """
+        bytes_member = _as_bytes(member, "Unsupported type for member: ")
+        view = await self._get_sorted_set(cache_name, sorted_set_name)
+        rank = None if view is None else view.rank(bytes_member)
+        if view is None or rank is None:
+            return CacheSortedSetRankResponse(rank=None, score=None)
+        score = view.score(rank)
+        return CacheSortedSetRankResponse(rank=len(view) - 1 - rank if descending else rank, score=score)
+
+    async def zrange_by_score(
+        self,
+        cache_name: str,
+        sorted_set_name: str,
+        min_score: float = -math.inf,
+        max_score: float = math.inf,
+        *,
+        offset: int = 0,
+        count: Optional[int] = None,
+        descending: bool = False,
+    ) -> CacheSortedSetRangeResponse:
+        """Get the members of a sorted set with scores between `min_score` and `max_score`, inclusive.
+
+        Examples:
+        >>> client.zrange_by_score("my-cache", "leaderboard", 1000, offset=20, count=10).items()
+
+        Args:
+            cache_name (str): Name of the cache the sorted set is in.
+            sorted_set_name (str): Name of the sorted set.
+            min_score (float): The lowest score to include. Defaults to no lower bound.
+            max_score (float): The highest score to include. Defaults to no upper bound.
+            offset (int): Number of members in the range to skip. Defaults to 0.
+            count (Optional[int]): Maximum number of members to return. Defaults to None, which
+                returns the rest of the range.
+            descending (bool): Order the members from the highest score instead of the lowest,
+                which also applies to `offset` and `count`. Defaults to False.
+
+        Returns:
+            CacheSortedSetRangeResponse: The members and their scores; empty if the sorted set is missing.
+
+        Raises:
+            InvalidArgumentError: If `offset` or `count` is negative.
+        """
+        if not isinstance(offset, int) or offset < 0 or count is not None and (not isinstance(count, int) or count < 0):
+            raise errors.InvalidArgumentError("Offset and count must be non-negative integers")
+        view = await self._get_sorted_set(cache_name, sorted_set_name)
+        if view is None:
+            return CacheSortedSetRangeResponse([])
+        start, stop = view.ranks_by_score(min_score, max_score)
+        if descending:
+            stop = max(start, stop - offset)
+            if count is not None:
+                start = max(start, stop - count)
+            return CacheSortedSetRangeResponse(view.items(start, stop)[::-1])
+        start = min(stop, start + offset)
+        if count is not None:
+            stop = min(stop, start + count)
+        return CacheSortedSetRangeResponse(view.items(start, stop))
+
+    async def ztop(self, cache_name: str, sorted_set_name: str, count: int) -> CacheSortedSetRangeResponse:
+        """Get the `count` members of a sorted set with the highest scores, highest first.
+
+        Examples:
+        >>> for member, score in client.ztop("my-cache", "leaderboard", 10).items():
+        ...     print(f"{member}: {score}")
+
+        Args:
+            cache_name (str): Name of the cache the sorted set is in.
+            sorted_set_name (str): Name of the sorted set.
+            count (int): Number of members to return.
+
+        Returns:
+            CacheSortedSetRangeResponse: The members and their scores; empty if the sorted set is missing.
+
+        Raises:
+            InvalidArgumentError: If `count` is negative.
+        """
+        return await self.zrange_by_score(cache_name, sorted_set_name, count=count, descending=True)
+
+    async def _find_key(
+        self, cache_name: str, keys: Sequence[Union[str, bytes]], status: CacheGetStatus, max_concurrency: int
+    ) -> bool:
+        """Whether a get of any of `keys` has `status`, stopping at the first one that does."""
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            raise errors.InvalidArgumentError("Max concurrency must be a positive integer")
+        remaining = iter(keys)
+
+        # Workers share the iterator, so at most `max_concurrency` gets are in flight at a time.
+        async def find() -> bool:
+            for key in remaining:
+                if (await self.get(cache_name, cast(str, key))).status() == status:
+                    return True
+            return False
+
+        pending = {asyncio.ensure_future(find()) for _ in range(min(max_concurrency, len(keys)))}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any([task.result() for task in done]):
+                    return True
+            return False
+        finally:
+            # Cancelling a worker cancels its get in flight as well.
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.wait(pending)
+
+    async def _offload(self, size_bytes: int, function: Callable[[_TArg], _TResult], argument: _TArg) -> _TResult:
+        """Run `function` in the serialization executor if the payload is large enough, else right here."""
+        if self._serialization_executor is None or size_bytes < self._serialization_offload_threshold_bytes:
+            return function(argument)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._serialization_executor, function, argument)
+
+    async def _decode_dictionary(self, cache_name: str, dictionary_name: str, blob: bytes) -> BytesDictionary:
+        if self._decoded_dictionary_cache is None:
+            return await self._offload(len(blob), deserialize_dictionary, blob)
+        return await self._decoded_dictionary_cache.get_or_decode(
+            cache_name, dictionary_name, blob, lambda blob: self._offload(len(blob), deserialize_dictionary, blob)
+        )
+
+    async def _get_blob(self, cache_name: str, key: str) -> Optional[bytes]:
+        get_response = await self.get(cache_name, key)
+        if get_response.status() != CacheGetStatus.HIT:
+            return None
+        return cast(bytes, get_response.value_as_bytes())
+
+    async def _get_hlls(self, cache_name: str, hll_names: Sequence[str]) -> List[_HyperLogLog]:
+        """The HyperLogLogs that exist among `hll_names`."""
+        blobs = await gather_all([self._get_blob(cache_name, hll_name) for hll_name in hll_names])
+        return [_HyperLogLog.decode(blob) for blob in blobs if blob is not None]
+
+    async def _get_sorted_set(self, cache_name: str, sorted_set_name: str) -> Optional[_SortedSetView]:
+        blob = await self._get_blob(cache_name, sorted_set_name)
+        return None if blob is None else _SortedSetView(blob)
+
+    async def _lookup_fields(
+        self, cache_name: str, dictionary_name: str, blob: bytes, fields: Sequence[bytes]
+    ) -> List[Optional[bytes]]:
+        manifest = _ShardManifest.decode(blob)
+        if manifest is None:
+            return deserialize_dictionary_fields(blob, fields)
+
+        values: List[Optional[bytes]] = [None] * len(fields)
+        groups: Dict[int, List[int]] = {}
+        shard_blobs: Dict[int, Optional[bytes]] = {}
+        while True:
+            groups = manifest.group_fields(fields)
+            shard_blobs = await self._get_shards(cache_name, dictionary_name, manifest, groups)
+            resharded = await self._resharded_manifest(cache_name, dictionary_name, manifest, shard_blobs)
+            if resharded is None:
+                break
+            manifest = resharded
+
+        for shard, positions in groups.items():
+            shard_blob = shard_blobs[shard]
+            if shard_blob is None:
+                continue
+            shard_values = deserialize_dictionary_fields(shard_blob, [fields[position] for position in positions])
+            for position, value in zip(positions, shard_values):
+                values[position] = value
+        return values
+
+    async def _get_all_shards(self, cache_name: str, dictionary_name: str, manifest: _ShardManifest) -> BytesDictionary:
+        shard_blobs: Dict[int, Optional[bytes]] = {}
+        while True:
+            shard_blobs = await self._get_shards(cache_name, dictionary_name, manifest, range(manifest.shard_count))
+            resharded = await self._resharded_manifest(cache_name, dictionary_name, manifest, shard_blobs)
+            if resharded is None:
+                break
+            manifest = resharded
+
+        shard_dictionaries = await gather_all(
+            self._decode_dictionary(cache_name, manifest.shard_key(dictionary_name, shard), shard_blob)
+            for shard, shard_blob in shard_blobs.items()
+            if shard_blob is not None
+        )
+        dictionary: BytesDictionary = {}
+        for shard_dictionary in shard_dictionaries:
+            dictionary.update(shard_dictionary)
+        return dictionary
+
+    async def _get_shards(
+        self, cache_name: str, dictionary_name: str, manifest: _ShardManifest, shards: Iterable[int]
+    ) -> Dict[int, Optional[bytes]]:
+        shards = list(shards)
+        shard_blobs = await gather_all(
+            self._get_blob(cache_name, manifest.shard_key(dictionary_name, shard)) for shard in shards
+        )
+        return dict(zip(shards, shard_blobs))
+
+    async def _resharded_manifest(
+        self,
+        cache_name: str,
+        dictionary_name: str,
+        manifest: _ShardManifest,
+        shard_blobs: Dict[int, Optional[bytes]],
+    ) -> Optional[_ShardManifest]:
+        """Returns the new manifest if shards are missing because the dictionary was resharded while reading them.
+
+        Shards can also be missing because they expired; they are then treated as empty.
+        """
+        if all(shard_blob is not None for shard_blob in shard_blobs.values()):
+            return None
+        blob = await self._get_blob(cache_name, dictionary_name)
+        current = None if blob is None else _ShardManifest.decode(blob)
+        if current is None or current.generation == manifest.generation:
+            return None
+        return current
+
+    async def _update_dictionary(self, cache_name: str, dictionary_name: str, updates: BytesDictionary) -> None:
+        """Read, update and write back a dictionary. Called by the write combiner with all pending updates."""
+        blob = await self._get_blob(cache_name, dictionary_name)
+        manifest = None if blob is None else _ShardManifest.decode(blob)
+        if manifest is None:
+            await self._update_item(cache_name, dictionary_name, blob, updates)
+            return
+
+        # Only the shards with updated fields are rewritten. The manifest is rewritten as well so that
+        # it does not expire before the shards.
+        groups: Dict[int, BytesDictionary] = {}
+        for field, value in updates.items():
+            groups.setdefault(manifest.shard_of(field), {})[field] = value
+        shard_keys = [manifest.shard_key(dictionary_name, shard) for shard in groups]
+        shard_blobs = await gather_all([self._get_blob(cache_name, shard_key) for shard_key in shard_keys])
+        shard_writes = [
+            self._update_item(cache_name, shard_key, shard_blob, shard_updates)
+            for shard_key, shard_blob, shard_updates in zip(shard_keys, shard_blobs, groups.values())
+        ]
+        await gather_all([*shard_writes, self._write_manifest(cache_name, dictionary_name, manifest)])
+
+    async def _update_item(self, cache_name: str, key: str, blob: Optional[bytes], updates: BytesDictionary) -> None:
+        """Apply `updates` to the dictionary stored under `key`, whose current value is `blob`."""
+        dictionary: BytesDictionary = {} if blob is None else await self._decode_dictionary(cache_name, key, blob)
+        dictionary.update(updates)
+        await self._write_dictionary(cache_name, key, dictionary)
+
+    async def _write_manifest(self, cache_name: str, dictionary_name: str, manifest: _ShardManifest) -> None:
+        await self.set(cache_name, dictionary_name, manifest.encode())
+
+    async def _write_dictionary(self, cache_name: str, key: str, dictionary: BytesDictionary) -> None:
+        """Store `dictionary`, which is handed over to the decoded-dictionary cache and must not be modified."""
+        size_bytes = 0
+        if self._serialization_executor is not None:
+            size_bytes = sum(map(len, dictionary)) + sum(map(len, dictionary.values()))
+        blob = await self._offload(size_bytes, self._serialize_dictionary, dictionary)
+        await self.set(cache_name, key, blob)
+        if self._decoded_dictionary_cache is not None:
+            self._decoded_dictionary_cache.put(cache_name, key, blob, dictionary)
+
+    async def _update_sorted_set(self, cache_name: str, sorted_set_name: str, updates: Dict[bytes, float]) -> None:
+        """Read, update and write back a sorted set. Called by the write combiner with all pending updates."""
+        blob = await self._get_blob(cache_name, sorted_set_name)
+        scores = {} if blob is None else await self._offload(len(blob), decode_sorted_set, blob)
+        scores.update(updates)
+        encoded = await self._offload(0 if blob is None else len(blob), encode_sorted_set, scores)
+        await self.set(cache_name, sorted_set_name, encoded)
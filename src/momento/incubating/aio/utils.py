@@ -1,9 +1,16 @@
-import pickle
-from typing import cast
+import asyncio
+from typing import Awaitable, Iterable, List, Optional, Sequence, TypeVar
 
 from ..._utilities._data_validation import _as_bytes
+from .._utilities._dictionary_encoding import (
+    decode_dictionary,
+    encode_dictionary,
+    lookup_dictionary_fields,
+)
 from ..cache_operation_types import BytesDictionary, Dictionary
 
+_T = TypeVar("_T")
+
 
 def convert_dict_items_to_bytes(dictionary: Dictionary) -> BytesDictionary:
     return {
@@ -12,9 +19,27 @@ def convert_dict_items_to_bytes(dictionary: Dictionary) -> BytesDictionary:
     }
 
 
-def deserialize_dictionary(pickled_dictionary: bytes) -> BytesDictionary:
-    return cast(BytesDictionary, pickle.loads(pickled_dictionary))
+def deserialize_dictionary(serialized_dictionary: bytes) -> BytesDictionary:
+    return decode_dictionary(serialized_dictionary)
+
+
+def deserialize_dictionary_fields(serialized_dictionary: bytes, keys: Sequence[bytes]) -> List[Optional[bytes]]:
+    return lookup_dictionary_fields(serialized_dictionary, keys)
+
+
+def serialize_dictionary(dictionary: BytesDictionary, compression_threshold_bytes: Optional[int] = None) -> bytes:
+    return encode_dictionary(dictionary, compression_threshold_bytes)
+
 
+async def gather_all(awaitables: Iterable[Awaitable[_T]]) -> List[_T]:
+    """Run `awaitables` concurrently and return their results in order.
 
-def serialize_dictionary(dictionary: BytesDictionary) -> bytes:
-    return pickle.dumps(dictionary)
+    Unlike `asyncio.gather`, the remaining awaitables are cancelled as soon as one of them fails.
+    """
+    futures = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+    try:
+        return [await future for future in futures]
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
@@ -12,6 +12,8 @@ Dictionary = Union[StringDictionary, BytesDictionary]
 
 
 class CacheDictionaryGetUnaryResponse:
+    __slots__ = ("_value", "_status")
+
     def __init__(self, value: Optional[DictionaryValue], status: CacheGetStatus):
         self._value = value
         self._status = status
@@ -44,6 +46,8 @@ class CacheDictionaryGetUnaryResponse:
 
 
 class CacheDictionaryGetMultiResponse:
+    __slots__ = ("_values", "_status")
+
     def __init__(self, values: List[Optional[DictionaryValue]], status: List[CacheGetStatus]):
         self._values = values
         self._status = status
@@ -74,6 +78,8 @@ class CacheDictionaryGetMultiResponse:
 
 
 class CacheDictionarySetUnaryResponse:
+    __slots__ = ("_dictionary_name", "_key", "_value")
+
     def __init__(self, dictionary_name: str, key: bytes, value: bytes):
         self._dictionary_name = dictionary_name
         self._key = key
@@ -105,6 +111,8 @@ class CacheDictionarySetUnaryResponse:
 
 
 class CacheDictionarySetMultiResponse:
+    __slots__ = ("_dictionary_name", "_dictionary")
+
     def __init__(self, dictionary_name: str, dictionary: BytesDictionary):
         self._dictionary_name = dictionary_name
         self._dictionary = dictionary
@@ -128,7 +136,32 @@ class CacheDictionarySetMultiResponse:
         )
 
 
+class CacheDictionaryReshardResponse:
+    __slots__ = ("_dictionary_name", "_shard_count")
+
+    def __init__(self, dictionary_name: str, shard_count: int):
+        self._dictionary_name = dictionary_name
+        self._shard_count = shard_count
+
+    def dictionary_name(self) -> str:
+        return self._dictionary_name
+
+    def shard_count(self) -> int:
+        return self._shard_count
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheDictionaryReshardResponse(dictionary_name={self._dictionary_name!r}, "
+            f"shard_count={self._shard_count!r})"
+        )
+
+
 class CacheDictionaryGetAllResponse:
+    __slots__ = ("_value", "_status")
+
     def __init__(self, value: Optional[BytesDictionary], status: CacheGetStatus):
         self._value = value
         self._status = status
@@ -165,7 +198,36 @@ class CacheDictionaryGetAllResponse:
         return f"CacheDictionaryGetAllResponse(value={self._value!r}, status={self._status!r})"
 
 
+class CacheDictionaryGetAllManyResponse:
+    __slots__ = ("_responses",)
+
+    def __init__(self, responses: List[CacheDictionaryGetAllResponse]):
+        self._responses = responses
+
+    def status(self) -> List[CacheGetStatus]:
+        return [response.status() for response in self._responses]
+
+    def values(self) -> List[Optional[StringDictionary]]:
+        """Returns each dictionary with its items decoded as UTF-8 if it was a hit, else None."""
+        return [response.value() for response in self._responses]
+
+    def values_as_bytes(self) -> List[Optional[BytesDictionary]]:
+        """Returns each dictionary if it was a hit, else None."""
+        return [response.value_as_bytes() for response in self._responses]
+
+    def to_list(self) -> List[CacheDictionaryGetAllResponse]:
+        return self._responses
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return f"CacheDictionaryGetAllManyResponse(responses={self._responses!r})"
+
+
 class CacheExistsResponse:
+    __slots__ = ("_keys", "_results")
+
     def __init__(self, keys: Tuple[Union[str, bytes], ...], results: List[bool]):
         self._keys = keys
         self._results = results
@@ -264,3 +326,238 @@ class CacheExistsResponse:
 
     def __repr__(self) -> str:
         return f"CacheExistsResponse(keys={self._keys!r}, results={self._results!r})"
+
+
+class CacheBloomAddManyResponse:
+    __slots__ = ("_filter_name", "_num_added")
+
+    def __init__(self, filter_name: str, num_added: int):
+        self._filter_name = filter_name
+        self._num_added = num_added
+
+    def filter_name(self) -> str:
+        return self._filter_name
+
+    def num_added(self) -> int:
+        """Count the keys that were definitely not in the filter before they were added.
+
+        Keys that were added before, and keys that collide with other keys, are not counted,
+        so this is a lower bound on the number of new keys.
+
+        Returns:
+            int: The number of new keys.
+        """
+        return self._num_added
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return f"CacheBloomAddManyResponse(filter_name={self._filter_name!r}, num_added={self._num_added!r})"
+
+
+class CacheBloomMightContainManyResponse:
+    __slots__ = ("_keys", "_results")
+
+    def __init__(self, keys: Tuple[Union[str, bytes], ...], results: List[bool]):
+        self._keys = keys
+        self._results = results
+
+    def all(self) -> bool:
+        """Test if all the keys might have been added to the filter.
+
+        Returns:
+            bool: True if all the keys might have been added. False if at least one definitely was not.
+        """
+        return all(self._results)
+
+    def any(self) -> bool:
+        """Test if any of the keys might have been added to the filter.
+
+        Returns:
+            bool: True if at least one key might have been added. False if none of them was.
+        """
+        return any(self._results)
+
+    def results(self) -> List[bool]:
+        """Get a boolean array where each element indicates if the corresponding input key might
+        have been added to the filter. False means the key definitely was not added; True means it
+        was added, or collides with keys that were.
+
+        Returns:
+            List[bool]: The membership mask.
+        """
+        return self._results
+
+    def absent_keys(self) -> List[Union[str, bytes]]:
+        """List the keys that definitely were not added to the filter.
+
+        Returns:
+            List[Union[str, bytes]]: List of queried keys that were not added.
+        """
+        return [key for key, might_contain in zip(self._keys, self._results) if not might_contain]
+
+    def zip_keys_and_results(self) -> Iterable[Tuple[Union[str, bytes], bool]]:
+        """Zip the keys and membership mask.
+
+        Returns:
+            Iterable[Tuple[Union[str, bytes], bool]]: An iterator of tuples `(key, might_contain)`.
+        """
+        return zip(self._keys, self._results)
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return f"CacheBloomMightContainManyResponse(keys={self._keys!r}, results={self._results!r})"
+
+
+class CacheHllAddManyResponse:
+    __slots__ = ("_hll_name", "_changed")
+
+    def __init__(self, hll_name: str, changed: bool):
+        self._hll_name = hll_name
+        self._changed = changed
+
+    def hll_name(self) -> str:
+        return self._hll_name
+
+    def changed(self) -> bool:
+        """Test if adding the keys changed the estimated count.
+
+        Returns:
+            bool: False if the sketch is unchanged, which means every key was probably counted before.
+        """
+        return self._changed
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return f"CacheHllAddManyResponse(hll_name={self._hll_name!r}, changed={self._changed!r})"
+
+
+class CacheHllCountResponse:
+    __slots__ = ("_count",)
+
+    def __init__(self, count: int):
+        self._count = count
+
+    def count(self) -> int:
+        """Get the estimated number of distinct keys.
+
+        Returns:
+            int: The estimate, within about 1% of the true count at the default precision.
+        """
+        return self._count
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return f"CacheHllCountResponse(count={self._count!r})"
+
+
+class CacheHllMergeResponse:
+    __slots__ = ("_hll_name",)
+
+    def __init__(self, hll_name: str):
+        self._hll_name = hll_name
+
+    def hll_name(self) -> str:
+        return self._hll_name
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return f"CacheHllMergeResponse(hll_name={self._hll_name!r})"
+
+
+class CacheSortedSetAddManyResponse:
+    __slots__ = ("_sorted_set_name", "_scores")
+
+    def __init__(self, sorted_set_name: str, scores: Dict[bytes, float]):
+        self._sorted_set_name = sorted_set_name
+        self._scores = scores
+
+    def sorted_set_name(self) -> str:
+        return self._sorted_set_name
+
+    def scores(self) -> Dict[str, float]:
+        return {_bytes_to_string(member): score for member, score in self._scores.items()}
+
+    def scores_as_bytes(self) -> Dict[bytes, float]:
+        return self._scores
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return f"CacheSortedSetAddManyResponse(sorted_set_name={self._sorted_set_name!r}, scores={self._scores!r})"
+
+
+class CacheSortedSetRankResponse:
+    __slots__ = ("_rank", "_score")
+
+    def __init__(self, rank: Optional[int], score: Optional[float]):
+        self._rank = rank
+        self._score = score
+
+    def rank(self) -> Optional[int]:
+        """Get the rank of the member, counting from 0.
+
+        Returns:
+            Optional[int]: The rank if the member is in the sorted set, else None.
+        """
+        return self._rank
+
+    def score(self) -> Optional[float]:
+        """Get the score of the member.
+
+        Returns:
+            Optional[float]: The score if the member is in the sorted set, else None.
+        """
+        return self._score
+
+    def status(self) -> CacheGetStatus:
+        return CacheGetStatus.MISS if self._rank is None else CacheGetStatus.HIT
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return f"CacheSortedSetRankResponse(rank={self._rank!r}, score={self._score!r})"
+
+
+class CacheSortedSetRangeResponse:
+    __slots__ = ("_items",)
+
+    def __init__(self, items: List[Tuple[bytes, float]]):
+        self._items = items
+
+    def items(self) -> List[Tuple[str, float]]:
+        """Get the members in the range with their scores, in rank order.
+
+        Returns:
+            List[Tuple[str, float]]: The `(member, score)` pairs.
+        """
+        return [(_bytes_to_string(member), score) for member, score in self._items]
+
+    def items_as_bytes(self) -> List[Tuple[bytes, float]]:
+        return self._items
+
+    def members(self) -> List[str]:
+        return [_bytes_to_string(member) for member, _ in self._items]
+
+    def members_as_bytes(self) -> List[bytes]:
+        return [member for member, _ in self._items]
+
+    def scores(self) -> List[float]:
+        return [score for _, score in self._items]
+
+    def __str__(self) -> str:
+        return self.__repr__()
+
+    def __repr__(self) -> str:
+        return f"CacheSortedSetRangeResponse(items={self._items!r})"
@@ -1,23 +1,47 @@
+import math
 import warnings
-from typing import Optional, Union
+from concurrent.futures import Executor
+from typing import TYPE_CHECKING, Mapping, Optional, Sequence, Union
 
 from .._async_utils import wait_for_coroutine
 from .._utilities._data_validation import _validate_request_timeout
+from ..cache_operation_types import CacheGetResponse
+from ..compression import Compression
+from ..hooks import RequestHook
+from ..hot_keys import HotKeyTracking
+from ..near_cache import NearCaching
+from ..serialization import Serializer
 from ..simple_cache_client import SimpleCacheClient
+from ..slow_requests import SlowRequestLogging
 from . import INCUBATING_WARNING_MSG
+from ._utilities._decoded_dictionary_cache import DecodedDictionaryCacheStats
 from .aio import simple_cache_client as aio
 from .cache_operation_types import (
+    CacheBloomAddManyResponse,
+    CacheBloomMightContainManyResponse,
+    CacheDictionaryGetAllManyResponse,
     CacheDictionaryGetAllResponse,
     CacheDictionaryGetMultiResponse,
     CacheDictionaryGetUnaryResponse,
+    CacheDictionaryReshardResponse,
     CacheDictionarySetMultiResponse,
     CacheDictionarySetUnaryResponse,
     CacheExistsResponse,
+    CacheHllAddManyResponse,
+    CacheHllCountResponse,
+    CacheHllMergeResponse,
+    CacheSortedSetAddManyResponse,
+    CacheSortedSetRangeResponse,
+    CacheSortedSetRankResponse,
     Dictionary,
     DictionaryKey,
     DictionaryValue,
 )
 
+if TYPE_CHECKING:
+    # Only for type checking, as it needs OpenTelemetry.
+    from ..tracing import TracingInterceptor
+
 
 class SimpleCacheClientIncubating(SimpleCacheClient):
     def __init__(
@@ -25,6 +49,22 @@ class SimpleCacheClientIncubating(SimpleCacheClient):
         auth_token: str,
         default_ttl_seconds: int,
         request_timeout_ms: Optional[int] = None,
+        endpoint_override: Optional[str] = None,
+        insecure: bool = False,
+        local_credentials: bool = False,
+        decoded_dictionary_cache_max_bytes: Optional[int] = None,
+        dictionary_write_window_ms: int = 0,
+        dictionary_compression_threshold_bytes: Optional[int] = None,
+        serialization_executor: Optional[Executor] = None,
+        serialization_offload_threshold_bytes: int = aio.DEFAULT_SERIALIZATION_OFFLOAD_THRESHOLD_BYTES,
+        compression: Optional[Compression] = None,
+        serializer: Optional[Serializer[object]] = None,
+        hooks: Sequence[RequestHook] = (),
+        metrics: bool = False,
+        tracing: Optional["TracingInterceptor"] = None,
+        hot_keys: Optional[HotKeyTracking] = None,
+        near_cache: Optional[NearCaching] = None,
+        slow_requests: Optional[SlowRequestLogging] = None,
     ):
         """Creates a SimpleCacheClientIncubating.
         !! Includes non-final, experimental features and APIs subject to change  !!
@@ -36,6 +76,37 @@ class SimpleCacheClientIncubating(SimpleCacheClient):
             request_timeout_ms: An optional timeout in milliseconds to allow for Get and Set operations to complete.
                 Defaults to None, in which case 5 seconds is used. The request will be terminated if it takes longer
                 than this value and will result in TimeoutError.
+            endpoint_override: Connect to this endpoint instead of the one in the auth token. A loopback
+                `host:port`, such as a `momento.testing.fake_server`, is used for both the control and the data plane.
+            insecure: Connect over a plaintext channel. Only meant for local test servers.
+            local_credentials: Connect with gRPC local credentials instead of TLS, as a `momento.testing.fake_server`
+                listens with by default. Only meant for local test servers.
+            decoded_dictionary_cache_max_bytes: Keep recently decoded dictionaries in memory, up to about this many
+                bytes, so that reading or updating a dictionary that has not changed since it was last seen does not
+                decode it again. Defaults to None, which disables the cache.
+            dictionary_write_window_ms: How long to wait for more updates of a dictionary or sorted set before
+                writing it. Concurrent `dictionary_set`, `dictionary_set_multi` and `zadd_many` calls on the same item
+                are combined into a single read-modify-write; updates that arrive while one is in flight are combined
+                into the next. Defaults to 0, in which case only updates issued together are combined.
+            dictionary_compression_threshold_bytes: Compress encoded dictionaries of at least this many bytes with
+                zlib. Looking up fields of a compressed dictionary decompresses all of it. Defaults to None, which
+                disables compression.
+            serialization_executor: Encode and decode dictionaries, and decode values in `decode_value`, of at least
+                `serialization_offload_threshold_bytes` in this executor. With the synchronous client this mostly
+                matters to `dictionary_get_all_many`, which decodes dictionaries in parallel in a
+                `ProcessPoolExecutor`. Defaults to None, in which case everything runs on the calling thread.
+            serialization_offload_threshold_bytes: Size from which payloads are handed to the
+                `serialization_executor`. Defaults to 256 KiB.
+            compression: Compress values of at least the configured size before storing them, and decompress
+                compressed values when reading them. Defaults to None.
+            serializer: Converts values to bytes in `set_object` and back in `get_object`. Defaults to None, in
+                which case values are stored as JSON.
+            hooks: Called when data requests, such as gets and sets, start and end. See `momento.hooks`.
+            metrics: Record latencies, outcomes and sizes of data requests, for `metrics_snapshot()`.
+            tracing: Creates OpenTelemetry spans for data requests. See `momento.tracing`.
+            hot_keys: Count gets and sets by key, to report the busiest keys. See `momento.hot_keys`.
+            near_cache: Serve gets of frequently read keys from memory for a short while. See `momento.near_cache`.
+            slow_requests: Report data requests that take longer than a threshold. See `momento.slow_requests`.
         Raises:
             IllegalArgumentError: If method arguments fail validations
         """
@@ -46,14 +117,38 @@ class SimpleCacheClientIncubating(SimpleCacheClient):
             auth_token=auth_token,
             default_ttl_seconds=default_ttl_seconds,
             request_timeout_ms=request_timeout_ms,
+            endpoint_override=endpoint_override,
+            insecure=insecure,
+            local_credentials=local_credentials,
+            decoded_dictionary_cache_max_bytes=decoded_dictionary_cache_max_bytes,
+            dictionary_write_window_ms=dictionary_write_window_ms,
+            dictionary_compression_threshold_bytes=dictionary_compression_threshold_bytes,
+            serialization_executor=serialization_executor,
+            serialization_offload_threshold_bytes=serialization_offload_threshold_bytes,
+            compression=compression,
+            serializer=serializer,
+            hooks=hooks,
+            metrics=metrics,
+            tracing=tracing,
+            hot_keys=hot_keys,
+            near_cache=near_cache,
+            slow_requests=slow_requests,
         )
 
+    def decoded_dictionary_cache_stats(self) -> Optional[DecodedDictionaryCacheStats]:
+        """Hit, miss, eviction and decode time counters of the decoded-dictionary cache.
+
+        Returns:
+            Optional[DecodedDictionaryCacheStats]: The counters, or None if the cache is disabled.
+        """
+        return self._momento_async_client.decoded_dictionary_cache_stats()
+
     def dictionary_set(
         self,
         cache_name: str,
         dictionary_name: str,
         key: DictionaryKey,
-        value: DictionaryValue,
+        value: Union[DictionaryValue, bytearray, memoryview],
         ttl_seconds: Optional[int] = None,
         *,
         refresh_ttl: bool,
@@ -67,7 +162,8 @@ class SimpleCacheClientIncubating(SimpleCacheClient):
             cache_name (str): Name of the cache to store the dictionary in.
             dictionary_name (str): The name of the dictionary in the cache.
             key (DictionaryKey): The key to set.
-            value (DictionaryValue): The value to store.
+            value (DictionaryValue): The value to store. Bytearrays and memoryviews are accepted too, and copied,
+                since dictionaries keep their values.
             ttl_seconds (Optional[int], optional): Time to live in seconds for the dictionary
                 as a whole.
             refresh_ttl (bool): If, when performing an update, to refresh the ttl.
@@ -172,6 +268,64 @@ class SimpleCacheClientIncubating(SimpleCacheClient):
         coroutine = self._momento_async_client.dictionary_get_all(cache_name, dictionary_name)
         return wait_for_coroutine(self._loop, coroutine)
 
+    def dictionary_get_all_many(self, cache_name: str, *dictionary_names: str) -> CacheDictionaryGetAllManyResponse:
+        """Retrieve several entire dictionaries from the cache.
+
+        The dictionaries are fetched concurrently. Large ones are decoded in the `serialization_executor`,
+        in parallel if it is a process pool.
+
+        Args:
+            cache_name (str): Name of the cache to get the dictionaries from.
+            dictionary_names (str): Names of the dictionaries to retrieve.
+
+        Returns:
+            CacheDictionaryGetAllManyResponse: A response per dictionary, in the order of `dictionary_names`.
+        """
+        coroutine = self._momento_async_client.dictionary_get_all_many(cache_name, *dictionary_names)
+        return wait_for_coroutine(self._loop, coroutine)
+
+    def decode_value(self, response: CacheGetResponse) -> Optional[str]:
+        """Decode the value of a get response as UTF-8, like `response.value()`.
+
+        Values of at least `serialization_offload_threshold_bytes` are decoded in the `serialization_executor`.
+        The response keeps the decoded value, so calling `response.value()` afterwards does not decode it again.
+
+        Args:
+            response (CacheGetResponse): A response returned by `get`.
+
+        Returns:
+            Optional[str]: The value if the get was a hit, else None.
+        """
+        coroutine = self._momento_async_client.decode_value(response)
+        return wait_for_coroutine(self._loop, coroutine)
+
+    def dictionary_reshard(
+        self, cache_name: str, dictionary_name: str, shard_count: int
+    ) -> CacheDictionaryReshardResponse:
+        """Spread a dictionary over `shard_count` cache items.
+
+        The fields of a sharded dictionary are split across several cache items plus a small manifest,
+        so that getting or setting a field only transfers the shard it is in, and `dictionary_get_all`
+        fetches the shards concurrently. A dictionary that does not exist yet is created empty, so
+        that it is sharded from its first `dictionary_set` on.
+
+        The dictionary stays readable while it is resharded: the new shards are written before the
+        manifest is switched over to them, and the previous shards are deleted afterwards.
+
+        Args:
+            cache_name (str): Name of the cache the dictionary is in.
+            dictionary_name (str): Name of the dictionary to reshard.
+            shard_count (int): Number of shards, between 1 and 1024.
+
+        Returns:
+            CacheDictionaryReshardResponse: The dictionary name and its new shard count.
+
+        Raises:
+            InvalidArgumentError: If the shard count is out of range.
+        """
+        coroutine = self._momento_async_client.dictionary_reshard(cache_name, dictionary_name, shard_count)
+        return wait_for_coroutine(self._loop, coroutine)
+
     def exists(self, cache_name: str, *keys: Union[str, bytes]) -> CacheExistsResponse:
         """Test if `keys` exist in the cache.
 
@@ -199,11 +353,321 @@ class SimpleCacheClientIncubating(SimpleCacheClient):
         coroutine = self._momento_async_client.exists(cache_name, *keys)
         return wait_for_coroutine(self._loop, coroutine)
 
+    def exists_all(
+        self, cache_name: str, *keys: Union[str, bytes], max_concurrency: int = aio.DEFAULT_EXISTS_MAX_CONCURRENCY
+    ) -> bool:
+        """Test if all `keys` exist in the cache, stopping at the first missing key.
+
+        Unlike `exists(...).all()`, this returns as soon as a key is found to be missing and
+        cancels the lookups still in flight, and it never holds more than `max_concurrency`
+        lookups or results at a time, however many keys are tested.
+
+        Args:
+            cache_name (str): Name of the cache to query for the keys.
+            keys (Union[str, bytes]): Key(s) to test for existence. Keys are looked up in order.
+            max_concurrency (int): Maximum number of lookups in flight at once. Defaults to 100.
+
+        Returns:
+            bool: True if all the keys exist, which includes when there are none. False if at least one does not.
+
+        Raises:
+            InvalidArgumentError: If `max_concurrency` is not a positive integer.
+        """
+        coroutine = self._momento_async_client.exists_all(cache_name, *keys, max_concurrency=max_concurrency)
+        return wait_for_coroutine(self._loop, coroutine)
+
+    def exists_any(
+        self, cache_name: str, *keys: Union[str, bytes], max_concurrency: int = aio.DEFAULT_EXISTS_MAX_CONCURRENCY
+    ) -> bool:
+        """Test if any of `keys` exists in the cache, stopping at the first existing key.
+
+        Unlike `exists(...).num_exists() > 0`, this returns as soon as a key is found and cancels
+        the lookups still in flight, and it never holds more than `max_concurrency` lookups or
+        results at a time, however many keys are tested.
+
+        Args:
+            cache_name (str): Name of the cache to query for the keys.
+            keys (Union[str, bytes]): Key(s) to test for existence. Keys are looked up in order.
+            max_concurrency (int): Maximum number of lookups in flight at once. Defaults to 100.
+
+        Returns:
+            bool: True if at least one key exists. False if none does, which includes when there are none.
+
+        Raises:
+            InvalidArgumentError: If `max_concurrency` is not a positive integer.
+        """
+        coroutine = self._momento_async_client.exists_any(cache_name, *keys, max_concurrency=max_concurrency)
+        return wait_for_coroutine(self._loop, coroutine)
+
+    def bloom_add_many(
+        self,
+        cache_name: str,
+        filter_name: str,
+        *keys: Union[str, bytes],
+        expected_items: int = aio.DEFAULT_BLOOM_EXPECTED_ITEMS,
+        false_positive_rate: float = aio.DEFAULT_BLOOM_FALSE_POSITIVE_RATE,
+        ttl_seconds: Optional[int] = None,
+    ) -> CacheBloomAddManyResponse:
+        """Add `keys` to a Bloom filter.
+
+        A Bloom filter answers whether keys were added to it in a single cache item of about
+        1.2 bytes per expected item at a 1% false positive rate, however large the keys are.
+        It never forgets a key, but may claim to contain keys that were never added.
+
+        The filter is created on first use, sized so that it has about `false_positive_rate`
+        false positives once `expected_items` keys were added; the sizing of an existing filter
+        does not change.
+
+        Args:
+            cache_name (str): Name of the cache to store the filter in.
+            filter_name (str): Name of the filter.
+            keys (Union[str, bytes]): Key(s) to add.
+            expected_items (int): Number of keys the filter is sized for when it is created.
+                Defaults to 100,000.
+            false_positive_rate (float): False positive rate of a new filter once it holds
+                `expected_items` keys. Defaults to 0.01.
+            ttl_seconds (Optional[int]): Time to live in seconds for the filter. Defaults to the
+                client's default TTL.
+
+        Returns:
+            CacheBloomAddManyResponse: The number of keys that were definitely new.
+
+        Raises:
+            InvalidArgumentError: If the filter sizing is invalid.
+        """
+        coroutine = self._momento_async_client.bloom_add_many(
+            cache_name,
+            filter_name,
+            *keys,
+            expected_items=expected_items,
+            false_positive_rate=false_positive_rate,
+            ttl_seconds=ttl_seconds,
+        )
+        return wait_for_coroutine(self._loop, coroutine)
+
+    def bloom_might_contain_many(
+        self, cache_name: str, filter_name: str, *keys: Union[str, bytes]
+    ) -> CacheBloomMightContainManyResponse:
+        """Test if `keys` might have been added to a Bloom filter.
+
+        Unlike `exists`, which fetches every key, this fetches only the filter, once, however many
+        keys are tested. A missing filter contains no keys.
+
+        Args:
+            cache_name (str): Name of the cache the filter is in.
+            filter_name (str): Name of the filter.
+            keys (Union[str, bytes]): Key(s) to test.
+
+        Returns:
+            CacheBloomMightContainManyResponse: For each key, False if it definitely was not added,
+                else True.
+        """
+        coroutine = self._momento_async_client.bloom_might_contain_many(cache_name, filter_name, *keys)
+        return wait_for_coroutine(self._loop, coroutine)
+
+    def hll_add_many(
+        self,
+        cache_name: str,
+        hll_name: str,
+        *keys: Union[str, bytes],
+        precision: int = aio.DEFAULT_HLL_PRECISION,
+        ttl_seconds: Optional[int] = None,
+    ) -> CacheHllAddManyResponse:
+        """Add `keys` to a HyperLogLog, which estimates the number of distinct keys added to it.
+
+        A HyperLogLog is a single cache item of `2 ** precision` bytes, however many keys are added,
+        so adding a batch of keys costs one read-modify-write. At the default precision of 14 it is
+        16 KiB and its count is typically within 1% of the true count.
+
+        The HyperLogLog is created on first use with `precision`; the precision of an existing one
+        does not change.
+
+        Args:
+            cache_name (str): Name of the cache to store the HyperLogLog in.
+            hll_name (str): Name of the HyperLogLog.
+            keys (Union[str, bytes]): Key(s) to add.
+            precision (int): Number of bits that select a register of a new HyperLogLog, between 4
+                and 16. Every extra bit doubles the size and divides the error by about 1.4.
+                Defaults to 14.
+            ttl_seconds (Optional[int]): Time to live in seconds for the HyperLogLog. Defaults to the
+                client's default TTL.
+
+        Returns:
+            CacheHllAddManyResponse: Whether the HyperLogLog changed.
+
+        Raises:
+            InvalidArgumentError: If the precision is out of range.
+        """
+        coroutine = self._momento_async_client.hll_add_many(
+            cache_name, hll_name, *keys, precision=precision, ttl_seconds=ttl_seconds
+        )
+        return wait_for_coroutine(self._loop, coroutine)
+
+    def hll_count(self, cache_name: str, *hll_names: str) -> CacheHllCountResponse:
+        """Estimate the number of distinct keys added to any of the HyperLogLogs `hll_names`.
+
+        Args:
+            cache_name (str): Name of the cache the HyperLogLogs are in.
+            hll_names (str): Name(s) of the HyperLogLogs to count the union of. Missing ones are empty.
+
+        Returns:
+            CacheHllCountResponse: The estimated count.
+
+        Raises:
+            InvalidArgumentError: If the HyperLogLogs have different precisions.
+        """
+        coroutine = self._momento_async_client.hll_count(cache_name, *hll_names)
+        return wait_for_coroutine(self._loop, coroutine)
+
+    def hll_merge(
+        self, cache_name: str, destination_name: str, *source_names: str, ttl_seconds: Optional[int] = None
+    ) -> CacheHllMergeResponse:
+        """Merge the HyperLogLogs `source_names` into `destination_name`.
+
+        Afterwards the destination counts every key added to it or to any of the sources, as if
+        they had all been added to it. The sources are not changed.
+
+        Args:
+            cache_name (str): Name of the cache the HyperLogLogs are in.
+            destination_name (str): Name of the HyperLogLog to merge into. It is created if missing.
+            source_names (str): Name(s) of the HyperLogLogs to merge. Missing ones are empty.
+            ttl_seconds (Optional[int]): Time to live in seconds for the destination. Defaults to the
+                client's default TTL.
+
+        Returns:
+            CacheHllMergeResponse: The name of the destination.
+
+        Raises:
+            InvalidArgumentError: If the HyperLogLogs have different precisions.
+        """
+        coroutine = self._momento_async_client.hll_merge(
+            cache_name, destination_name, *source_names, ttl_seconds=ttl_seconds
+        )
+        return wait_for_coroutine(self._loop, coroutine)
+
+    def zadd_many(
+        self, cache_name: str, sorted_set_name: str, scores: Mapping[Union[str, bytes], float]
+    ) -> CacheSortedSetAddManyResponse:
+        """Add members to a sorted set, or update their scores.
+
+        A sorted set keeps its members ordered by score, ties ordered by member, in a single cache
+        item with a fixed-width index, so that ranks and ranges are found by binary search and only
+        the members returned are decoded. Every update rewrites the whole item.
+
+        Examples:
+        >>> client.zadd_many("my-cache", "leaderboard", {"alice": 1200, "bob": 950})
+
+        Args:
+            cache_name (str): Name of the cache to store the sorted set in.
+            sorted_set_name (str): Name of the sorted set. It is created if missing.
+            scores (Mapping[Union[str, bytes], float]): The score of each member to add or update.
+
+        Returns:
+            CacheSortedSetAddManyResponse: The scores that were set.
+
+        Raises:
+            InvalidArgumentError: If a score is not a number, or is NaN.
+        """
+        coroutine = self._momento_async_client.zadd_many(cache_name, sorted_set_name, scores)
+        return wait_for_coroutine(self._loop, coroutine)
+
+    def zrank(
+        self, cache_name: str, sorted_set_name: str, member: Union[str, bytes], *, descending: bool = False
+    ) -> CacheSortedSetRankResponse:
+        """Get the rank and score of a member of a sorted set.
+
+        Args:
+            cache_name (str): Name of the cache the sorted set is in.
+            sorted_set_name (str): Name of the sorted set.
+            member (Union[str, bytes]): The member to rank.
+            descending (bool): Rank from the highest score instead of the lowest. Defaults to False.
+
+        Returns:
+            CacheSortedSetRankResponse: The rank, counting from 0, and score of the member if it is in
+                the sorted set, else a MISS.
+        """
+        coroutine = self._momento_async_client.zrank(cache_name, sorted_set_name, member, descending=descending)
+        return wait_for_coroutine(self._loop, coroutine)
+
+    def zrange_by_score(
+        self,
+        cache_name: str,
+        sorted_set_name: str,
+        min_score: float = -math.inf,
+        max_score: float = math.inf,
+        *,
+        offset: int = 0,
+        count: Optional[int] = None,
+        descending: bool = False,
+    ) -> CacheSortedSetRangeResponse:
+        """Get the members of a sorted set with scores between `min_score` and `max_score`, inclusive.
+
+        Args:
+            cache_name (str): Name of the cache the sorted set is in.
+            sorted_set_name (str): Name of the sorted set.
+            min_score (float): The lowest score to include. Defaults to no lower bound.
+            max_score (float): The highest score to include. Defaults to no upper bound.
+            offset (int): Number of members in the range to skip. Defaults to 0.
+            count (Optional[int]): Maximum number of members to return. Defaults to None, which
+                returns the rest of the range.
+            descending (bool): Order the members from the highest score instead of the lowest,
+                which also applies to `offset` and `count`. Defaults to False.
+
+        Returns:
+            CacheSortedSetRangeResponse: The members and their scores; empty if the sorted set is missing.
+
+        Raises:
+            InvalidArgumentError: If `offset` or `count` is negative.
+        """
+        coroutine = self._momento_async_client.zrange_by_score(
+            cache_name,
+            sorted_set_name,
+            min_score,
+            max_score,
+            offset=offset,
+            count=count,
+            descending=descending,
+        )
+        return wait_for_coroutine(self._loop, coroutine)
+
+    def ztop(self, cache_name: str, sorted_set_name: str, count: int) -> CacheSortedSetRangeResponse:
+        """Get the `count` members of a sorted set with the highest scores, highest first.
+
+        Args:
+            cache_name (str): Name of the cache the sorted set is in.
+            sorted_set_name (str): Name of the sorted set.
+            count (int): Number of members to return.
+
+        Returns:
+            CacheSortedSetRangeResponse: The members and their scores; empty if the sorted set is missing.
+
+        Raises:
+            InvalidArgumentError: If `count` is negative.
+        """
+        coroutine = self._momento_async_client.ztop(cache_name, sorted_set_name, count)
+        return wait_for_coroutine(self._loop, coroutine)
+
 
 def init(
     auth_token: str,
     item_default_ttl_seconds: int,
     request_timeout_ms: Optional[int] = None,
+    endpoint_override: Optional[str] = None,
+    insecure: bool = False,
+    local_credentials: bool = False,
+    decoded_dictionary_cache_max_bytes: Optional[int] = None,
+    dictionary_write_window_ms: int = 0,
+    dictionary_compression_threshold_bytes: Optional[int] = None,
+    serialization_executor: Optional[Executor] = None,
+    serialization_offload_threshold_bytes: int = aio.DEFAULT_SERIALIZATION_OFFLOAD_THRESHOLD_BYTES,
+    compression: Optional[Compression] = None,
+    serializer: Optional[Serializer[object]] = None,
+    hooks: Sequence[RequestHook] = (),
+    metrics: bool = False,
+    tracing: Optional["TracingInterceptor"] = None,
+    hot_keys: Optional[HotKeyTracking] = None,
+    near_cache: Optional[NearCaching] = None,
+    slow_requests: Optional[SlowRequestLogging] = None,
 ) -> SimpleCacheClientIncubating:
     """Creates a SimpleCacheClientIncubating.
     !! Includes non-final, experimental features and APIs subject to change  !!
@@ -215,10 +679,50 @@ def init(
         request_timeout_ms: An optional timeout in milliseconds to allow for Get and Set operations to complete.
             Defaults to 5 seconds. The request will be terminated if it takes longer than this value and will result
             in TimeoutError.
+        endpoint_override: Connect to this endpoint instead of the one in the auth token.
+        insecure: Connect over a plaintext channel. Only meant for local test servers.
+        local_credentials: Connect with gRPC local credentials instead of TLS. Only meant for local test servers.
+        decoded_dictionary_cache_max_bytes: Cache up to about this many bytes of decoded dictionaries in memory.
+            Defaults to None, which disables the cache.
+        dictionary_write_window_ms: How long to wait for more updates of a dictionary or sorted set before writing it;
+            concurrent updates of an item are combined into a single read-modify-write. Defaults to 0.
+        dictionary_compression_threshold_bytes: Compress encoded dictionaries of at least this many bytes.
+            Defaults to None, which disables compression.
+        serialization_executor: Encode and decode large payloads in this executor. Defaults to None.
+        serialization_offload_threshold_bytes: Size from which payloads are handed to the `serialization_executor`.
+            Defaults to 256 KiB.
+        compression: Compress values of at least the configured size before storing them. Defaults to None.
+        serializer: Converts values to bytes in `set_object` and back in `get_object`. Defaults to JSON.
+        hooks: Called when data requests start and end. See `momento.hooks`.
+        metrics: Record latencies, outcomes and sizes of data requests. Defaults to False.
+        tracing: Creates OpenTelemetry spans for data requests. See `momento.tracing`.
+        hot_keys: Count gets and sets by key, to report the busiest keys. See `momento.hot_keys`.
+        near_cache: Serve gets of frequently read keys from memory for a short while. See `momento.near_cache`.
+        slow_requests: Report data requests that take longer than a threshold. See `momento.slow_requests`.
     Returns:
         SimpleCacheClientIncubating
     Raises:
         IllegalArgumentError: If method arguments fail validations
     """
     _validate_request_timeout(request_timeout_ms)
-    return SimpleCacheClientIncubating(auth_token, item_default_ttl_seconds, request_timeout_ms)
+    return SimpleCacheClientIncubating(
+        auth_token,
+        item_default_ttl_seconds,
+        request_timeout_ms,
+        endpoint_override,
+        insecure,
+        local_credentials,
+        decoded_dictionary_cache_max_bytes,
+        dictionary_write_window_ms,
+        dictionary_compression_threshold_bytes,
+        serialization_executor,
+        serialization_offload_threshold_bytes,
+        compression,
+        serializer,
+        hooks,
+        metrics,
+        tracing,
+        hot_keys,
+        near_cache,
+        slow_requests,
+    )
@@ -0,0 +1,327 @@
+"""Metrics of the requests a client makes, and exporters for them.
+
+A client created with `metrics=True` records, for every operation and cache, a latency histogram,
+counts of successes, hits, misses and errors by error type, and the bytes sent and received. It
+also counts retries per operation and requests in flight per gRPC channel. `metrics_snapshot()`
+returns a copy of all of them, which the functions of this module turn into the Prometheus text
+format or StatsD lines:
+
+    snapshot = client.metrics_snapshot()
+    print(snapshot.operation("get", "my-cache").latency.percentile(99))
+    body = prometheus_text(snapshot)
+
+Latencies are recorded in buckets that are within 1/16 of the durations in them, as with
+HdrHistogram at one significant digit, so percentiles are accurate to about 6%.
+"""
+import re
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .compression import CompressionStats
+from .hot_keys import HotKey
+from .near_cache import NearCacheStats
+
+# Upper bounds, in seconds, of the buckets of exported histograms.
+DEFAULT_EXPORT_BUCKETS: Sequence[float] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class HistogramSnapshot:
+    def __init__(
+        self,
+        count: int,
+        sum_seconds: float,
+        min_seconds: float,
+        max_seconds: float,
+        buckets: List[Tuple[float, int]],
+    ):
+        """Durations recorded in a latency histogram.
+
+        Args:
+            count (int): Number of durations recorded.
+            sum_seconds (float): Their sum.
+            min_seconds (float): The shortest of them; 0 if there are none.
+            max_seconds (float): The longest of them; 0 if there are none.
+            buckets (List[Tuple[float, int]]): The number of durations in each bucket that is not empty,
+                by the upper bound of the bucket in seconds, in ascending order.
+        """
+        self.count = count
+        self.sum_seconds = sum_seconds
+        self.min_seconds = min_seconds
+        self.max_seconds = max_seconds
+        self.buckets = buckets
+
+    def percentile(self, percentile: float) -> float:
+        """The duration, in seconds, that `percentile` percent of the durations are at most; 0 if there are none."""
+        target = self.count * percentile / 100
+        seen = 0
+        for upper_bound, count in self.buckets:
+            seen += count
+            if seen >= target:
+                return upper_bound
+        return self.max_seconds
+
+    def cumulative_counts(self, upper_bounds: Sequence[float]) -> List[int]:
+        """The number of durations at most each of `upper_bounds`, which must be in ascending order.
+
+        Durations count towards a bound if their whole bucket is within it.
+        """
+        counts = []
+        seen = 0
+        buckets = iter(self.buckets)
+        pending: Optional[Tuple[float, int]] = next(buckets, None)
+        for upper_bound in upper_bounds:
+            while pending is not None and pending[0] <= upper_bound:
+                seen += pending[1]
+                pending = next(buckets, None)
+            counts.append(seen)
+        return counts
+
+    def __repr__(self) -> str:
+        return (
+            f"HistogramSnapshot(count={self.count!r}, sum_seconds={self.sum_seconds!r}, "
+            f"min_seconds={self.min_seconds!r}, max_seconds={self.max_seconds!r}, buckets={self.buckets!r})"
+        )
+
+
+class OperationMetrics:
+    def __init__(
+        self,
+        operation: str,
+        cache_name: str,
+        latency: HistogramSnapshot,
+        successes: int,
+        hits: int,
+        misses: int,
+        errors: Dict[str, int],
+        request_bytes: int,
+        response_bytes: int,
+    ):
+        """Metrics of the requests of one operation on one cache.
+
+        Args:
+            operation (str): The operation, e.g. "get", "set" or "delete".
+            cache_name (str): Name of the cache.
+            latency (HistogramSnapshot): Durations of the requests, including failed ones.
+            successes (int): Number of requests other than gets that succeeded.
+            hits (int): Number of gets that found their item.
+            misses (int): Number of gets that did not.
+            errors (Dict[str, int]): Number of failed requests, by the type of the error raised, e.g.
+                "TimeoutError".
+            request_bytes (int): Total size of the values sent.
+            response_bytes (int): Total size of the values received.
+        """
+        self.operation = operation
+        self.cache_name = cache_name
+        self.latency = latency
+        self.successes = successes
+        self.hits = hits
+        self.misses = misses
+        self.errors = errors
+        self.request_bytes = request_bytes
+        self.response_bytes = response_bytes
+
+    def __repr__(self) -> str:
+        return (
+            f"OperationMetrics(operation={self.operation!r}, cache_name={self.cache_name!r}, "
+            f"latency={self.latency!r}, successes={self.successes!r}, hits={self.hits!r}, misses={self.misses!r}, "
+            f"errors={self.errors!r}, request_bytes={self.request_bytes!r}, response_bytes={self.response_bytes!r})"
+        )
+
+
+class MetricsSnapshot:
+    def __init__(
+        self,
+        operations: List[OperationMetrics],
+        retries: Dict[str, int],
+        in_flight: List[int],
+        compression: Optional[CompressionStats],
+        hot_keys: Optional[List[HotKey]] = None,
+        near_cache: Optional[NearCacheStats] = None,
+    ):
+        """The metrics of a client at one point in time.
+
+        Args:
+            operations (List[OperationMetrics]): The metrics of each operation and cache that has been used.
+            retries (Dict[str, int]): Number of requests retried, by operation.
+            in_flight (List[int]): Number of requests in flight on each gRPC channel of the client.
+            compression (Optional[CompressionStats]): The counters of value compression, or None if
+                compression is disabled.
+            hot_keys (Optional[List[HotKey]]): The busiest keys of the current interval, or None if
+                the client does not track them. See `momento.hot_keys`.
+            near_cache (Optional[NearCacheStats]): The counters of the near cache, or None if the
+                client has none. See `momento.near_cache`.
+        """
+        self.operations = operations
+        self.retries = retries
+        self.in_flight = in_flight
+        self.compression = compression
+        self.hot_keys = hot_keys
+        self.near_cache = near_cache
+
+    def operation(self, operation: str, cache_name: str) -> Optional[OperationMetrics]:
+        """The metrics of `operation` on `cache_name`, or None if it has not been used."""
+        for metrics in self.operations:
+            if metrics.operation == operation and metrics.cache_name == cache_name:
+                return metrics
+        return None
+
+    def __repr__(self) -> str:
+        return (
+            f"MetricsSnapshot(operations={self.operations!r}, retries={self.retries!r}, "
+            f"in_flight={self.in_flight!r}, compression={self.compression!r}, hot_keys={self.hot_keys!r}, "
+            f"near_cache={self.near_cache!r})"
+        )
+
+
+def prometheus_text(
+    snapshot: MetricsSnapshot, namespace: str = "momento", buckets: Sequence[float] = DEFAULT_EXPORT_BUCKETS
+) -> str:
+    """Formats a snapshot in the Prometheus text exposition format.
+
+    Args:
+        snapshot (MetricsSnapshot): The metrics to format.
+        namespace (str): Prefix of the metric names.
+        buckets (Sequence[float]): Upper bounds, in seconds, of the exported latency buckets.
+
+    Returns:
+        str: The metrics, one sample per line.
+    """
+    lines: List[str] = []
+
+    def family(name: str, metric_type: str, help_text: str) -> str:
+        full_name = f"{namespace}_{name}"
+        lines.append(f"# HELP {full_name} {help_text}")
+        lines.append(f"# TYPE {full_name} {metric_type}")
+        return full_name
+
+    def sample(name: str, labels: Dict[str, str], value: float) -> None:
+        label_text = ",".join(f'{key}="{_escape_label(label)}"' for key, label in labels.items())
+        lines.append(f"{name}{{{label_text}}} {value!r}" if label_text else f"{name} {value!r}")
+
+    name = family("request_duration_seconds", "histogram", "Duration of requests.")
+    for metrics in snapshot.operations:
+        labels = {"operation": metrics.operation, "cache": metrics.cache_name}
+        for upper_bound, count in zip(buckets, metrics.latency.cumulative_counts(buckets)):
+            sample(f"{name}_bucket", {**labels, "le": repr(float(upper_bound))}, count)
+        sample(f"{name}_bucket", {**labels, "le": "+Inf"}, metrics.latency.count)
+        sample(f"{name}_sum", labels, metrics.latency.sum_seconds)
+        sample(f"{name}_count", labels, metrics.latency.count)
+    name = family("requests_total", "counter", "Requests that succeeded, by outcome.")
+    for metrics in snapshot.operations:
+        labels = {"operation": metrics.operation, "cache": metrics.cache_name}
+        for outcome, count in (("success", metrics.successes), ("hit", metrics.hits), ("miss", metrics.misses)):
+            if count:
+                sample(name, {**labels, "outcome": outcome}, count)
+    name = family("request_errors_total", "counter", "Requests that failed, by error.")
+    for metrics in snapshot.operations:
+        for error, count in sorted(metrics.errors.items()):
+            sample(name, {"operation": metrics.operation, "cache": metrics.cache_name, "error": error}, count)
+    name = family("request_bytes_total", "counter", "Bytes of values sent.")
+    for metrics in snapshot.operations:
+        sample(name, {"operation": metrics.operation, "cache": metrics.cache_name}, metrics.request_bytes)
+    name = family("response_bytes_total", "counter", "Bytes of values received.")
+    for metrics in snapshot.operations:
+        sample(name, {"operation": metrics.operation, "cache": metrics.cache_name}, metrics.response_bytes)
+    name = family("retries_total", "counter", "Requests retried.")
+    for operation, count in sorted(snapshot.retries.items()):
+        sample(name, {"operation": operation}, count)
+    name = family("requests_in_flight", "gauge", "Requests in flight.")
+    for channel, count in enumerate(snapshot.in_flight):
+        sample(name, {"channel": str(channel)}, count)
+    compression = snapshot.compression
+    if compression is not None:
+        for field, help_text, value in [
+            ("values_compressed", "Values stored compressed.", compression.values_compressed),
+            ("values_not_compressed", "Values stored uncompressed.", compression.values_not_compressed),
+            (
+                "bytes_before_compression",
+                "Size of compressed values before compression.",
+                compression.bytes_before_compression,
+            ),
+            (
+                "bytes_after_compression",
+                "Size of compressed values after compression.",
+                compression.bytes_after_compression,
+            ),
+            ("values_decompressed", "Compressed values read.", compression.values_decompressed),
+        ]:
+            sample(family(f"compression_{field}_total", "counter", help_text), {}, value)
+    near_cache = snapshot.near_cache
+    if near_cache is not None:
+        for field, help_text, value in [
+            ("hits", "Gets served from the near cache.", near_cache.hits),
+            ("misses", "Gets of promoted keys that went to Momento.", near_cache.misses),
+            ("promotions", "Keys promoted to the near cache.", near_cache.promotions),
+            ("demotions", "Keys demoted from the near cache.", near_cache.demotions),
+            ("invalidations", "Near cache values dropped on writes.", near_cache.invalidations),
+        ]:
+            sample(family(f"near_cache_{field}_total", "counter", help_text), {}, value)
+        sample(family("near_cache_entries", "gauge", "Keys promoted to the near cache."), {}, near_cache.entries)
+    return "".join(f"{line}\n" for line in lines)
+
+
+def statsd_lines(
+    snapshot: MetricsSnapshot, prefix: str = "momento", previous: Optional[MetricsSnapshot] = None
+) -> List[str]:
+    """Formats a snapshot as StatsD metrics, ready to be sent one per line or packet.
+
+    Counts are sent as counters. StatsD expects the increase since the last flush, so pass the
+    snapshot that was last sent as `previous`; without one the totals are sent. Latency
+    percentiles, in milliseconds, and requests in flight are sent as gauges. Metric names are
+    `<prefix>.<cache>.<operation>.<metric>`, with characters other than letters, digits, `-` and
+    `_` in cache names replaced by `_`.
+
+    Args:
+        snapshot (MetricsSnapshot): The metrics to format.
+        prefix (str): Prefix of the metric names.
+        previous (Optional[MetricsSnapshot]): The snapshot sent before, to send the increase since.
+
+    Returns:
+        List[str]: The metrics, e.g. "momento.my-cache.get.hits:12|c".
+    """
+    lines = []
+    for metrics in snapshot.operations:
+        before = None if previous is None else previous.operation(metrics.operation, metrics.cache_name)
+        name = f"{prefix}.{_statsd_name(metrics.cache_name)}.{metrics.operation}"
+        counters = [
+            ("requests", metrics.latency.count, 0 if before is None else before.latency.count),
+            ("successes", metrics.successes, 0 if before is None else before.successes),
+            ("hits", metrics.hits, 0 if before is None else before.hits),
+            ("misses", metrics.misses, 0 if before is None else before.misses),
+            ("request_bytes", metrics.request_bytes, 0 if before is None else before.request_bytes),
+            ("response_bytes", metrics.response_bytes, 0 if before is None else before.response_bytes),
+        ]
+        for error, count in sorted(metrics.errors.items()):
+            counters.append((f"errors.{error}", count, 0 if before is None else before.errors.get(error, 0)))
+        lines += [f"{name}.{counter}:{total - sent}|c" for counter, total, sent in counters if total > sent]
+        for percentile in (50, 90, 99):
+            lines.append(f"{name}.latency.p{percentile}:{metrics.latency.percentile(percentile) * 1000:.3f}|g")
+        lines.append(f"{name}.latency.max:{metrics.latency.max_seconds * 1000:.3f}|g")
+    for operation, count in sorted(snapshot.retries.items()):
+        sent = 0 if previous is None else previous.retries.get(operation, 0)
+        if count > sent:
+            lines.append(f"{prefix}.retries.{operation}:{count - sent}|c")
+    lines += [f"{prefix}.in_flight.channel{channel}:{count}|g" for channel, count in enumerate(snapshot.in_flight)]
+    return lines
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _statsd_name(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_-]", "_", name)
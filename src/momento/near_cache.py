@@ -0,0 +1,93 @@
+"""Near caching of the keys a client reads most often.
+
+A client created with `near_cache=NearCaching()` counts its gets by key. Once a key is read more
+than `min_reads_per_second` times a second, it is promoted: the values `get` returns for it are
+kept in memory for `ttl_seconds` and served from there instead of from Momento. A promoted key is
+demoted again when it is read less than half as often, over a whole interval of `window_seconds`:
+
+    client = SimpleCacheClient(auth_token, default_ttl_seconds, near_cache=NearCaching(min_reads_per_second=200))
+
+Sets and deletes by the client invalidate the value kept for their key, but writes by other
+clients are only seen once it has expired, so a get may return a value up to `ttl_seconds` old.
+Only hits are kept. `near_cache_stats()` and metrics snapshots count promotions, demotions, and the
+gets served from memory. Those gets also count as hits in the metrics of gets, with the time the
+lookup took, and as requests in hot key tracking, but are not seen by hooks.
+"""
+from . import errors
+
+DEFAULT_MIN_READS_PER_SECOND = 100.0
+DEFAULT_TTL_SECONDS = 1.0
+DEFAULT_WINDOW_SECONDS = 1.0
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_TRACKED_KEYS = 1000
+
+
+class NearCaching:
+    def __init__(
+        self,
+        min_reads_per_second: float = DEFAULT_MIN_READS_PER_SECOND,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        tracked_keys: int = DEFAULT_TRACKED_KEYS,
+    ):
+        """When a client keeps values in memory, and for how long.
+
+        Args:
+            min_reads_per_second (float, optional): Read rate from which a key is promoted. Defaults to 100.
+            ttl_seconds (float, optional): How long the value of a promoted key is served from memory.
+                Defaults to 1 second.
+            window_seconds (float, optional): Length of the intervals reads are counted over. Defaults
+                to 1 second.
+            max_entries (int, optional): Most keys to promote at once. Defaults to 1000.
+            tracked_keys (int, optional): Number of keys to count reads of; up to twice as many are
+                kept between evictions. Defaults to 1000.
+
+        Raises:
+            InvalidArgumentError: If an argument is not positive.
+        """
+        if min(min_reads_per_second, ttl_seconds, window_seconds, max_entries, tracked_keys) <= 0:
+            raise errors.InvalidArgumentError("Near caching settings must be positive")
+        self.min_reads_per_second = min_reads_per_second
+        self.ttl_seconds = ttl_seconds
+        self.window_seconds = window_seconds
+        self.max_entries = max_entries
+        self.tracked_keys = tracked_keys
+
+
+class NearCacheStats:
+    def __init__(self, hits: int, misses: int, promotions: int, demotions: int, invalidations: int, entries: int):
+        """Counters of a client's near cache.
+
+        Args:
+            hits (int): Number of gets of promoted keys served from memory.
+            misses (int): Number of gets of promoted keys that went to Momento, because no value was
+                kept, it had expired, or the item was missing.
+            promotions (int): Number of keys promoted.
+            demotions (int): Number of keys demoted.
+            invalidations (int): Number of values dropped because the client wrote their key.
+            entries (int): Number of keys currently promoted.
+        """
+        self.hits = hits
+        self.misses = misses
+        self.promotions = promotions
+        self.demotions = demotions
+        self.invalidations = invalidations
+        self.entries = entries
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, NearCacheStats)
+            and self.hits == other.hits
+            and self.misses == other.misses
+            and self.promotions == other.promotions
+            and self.demotions == other.demotions
+            and self.invalidations == other.invalidations
+            and self.entries == other.entries
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"NearCacheStats(hits={self.hits!r}, misses={self.misses!r}, promotions={self.promotions!r}, "
+            f"demotions={self.demotions!r}, invalidations={self.invalidations!r}, entries={self.entries!r})"
+        )
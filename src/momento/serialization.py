@@ -0,0 +1,65 @@
+"""Serializers that turn objects into cache values and back, for `set_object` and `get_object`.
+
+A serializer writes an object straight to the bytes that are stored, and reads it straight from the
+bytes of the cache item, so values are not taken through an intermediate `str`. Other formats, such
+as msgpack, plug in by subclassing `Serializer`:
+
+    class MsgpackSerializer(Serializer[object]):
+        def serialize(self, value: object) -> bytes:
+            return msgpack.packb(value)
+
+        def deserialize(self, data: bytes) -> object:
+            return msgpack.unpackb(data)
+"""
+import json
+import pickle
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar, cast
+
+_T = TypeVar("_T")
+
+
+class Serializer(ABC, Generic[_T]):
+    """Converts values of type `_T` to and from the bytes stored in the cache."""
+
+    @abstractmethod
+    def serialize(self, value: _T) -> bytes:
+        ...
+
+    @abstractmethod
+    def deserialize(self, data: bytes) -> _T:
+        ...
+
+
+class JsonSerializer(Serializer[object]):
+    """Stores values as compact UTF-8 JSON; the default serializer of the clients."""
+
+    def serialize(self, value: object) -> bytes:
+        # JSON with escaped non-ASCII characters is pure ASCII, which is copied rather than encoded.
+        return json.dumps(value, separators=(",", ":")).encode("ascii")
+
+    def deserialize(self, data: bytes) -> object:
+        # `json.loads` detects the encoding of bytes itself.
+        return cast(object, json.loads(data))
+
+
+class PickleSerializer(Serializer[object]):
+    """Stores values as pickles.
+
+    Unpickling can run arbitrary code, so only use this with caches that only trusted clients write to.
+    """
+
+    def __init__(self, protocol: int = 4):
+        """Creates a pickle serializer.
+
+        Args:
+            protocol (int): The pickle protocol to write. Defaults to 4, which every supported Python
+                version reads.
+        """
+        self._protocol = protocol
+
+    def serialize(self, value: object) -> bytes:
+        return pickle.dumps(value, protocol=self._protocol)
+
+    def deserialize(self, data: bytes) -> object:
+        return cast(object, pickle.loads(data))
@@ -1,6 +1,16 @@
 import asyncio
 from types import TracebackType
-from typing import Mapping, Optional, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
 from ._async_utils import wait_for_coroutine
 from ._utilities._data_validation import _validate_request_timeout
@@ -18,6 +28,19 @@ from .cache_operation_types import (
     ListSigningKeysResponse,
     RevokeSigningKeyResponse,
 )
+from .compression import Compression, CompressionStats
+from .hooks import RequestHook
+from .hot_keys import HotKey, HotKeyTracking
+from .metrics import MetricsSnapshot
+from .near_cache import NearCacheStats, NearCaching
+from .serialization import Serializer
+from .slow_requests import SlowRequestLogging
+
+if TYPE_CHECKING:
+    # Only for type checking, as it needs OpenTelemetry.
+    from .tracing import TracingInterceptor
+
+_T = TypeVar("_T")
 
 
 class SimpleCacheClient:
@@ -26,6 +49,17 @@ class SimpleCacheClient:
         auth_token: str,
         default_ttl_seconds: int,
         request_timeout_ms: Optional[int] = None,
+        endpoint_override: Optional[str] = None,
+        insecure: bool = False,
+        local_credentials: bool = False,
+        compression: Optional[Compression] = None,
+        serializer: Optional[Serializer[object]] = None,
+        hooks: Sequence[RequestHook] = (),
+        metrics: bool = False,
+        tracing: Optional["TracingInterceptor"] = None,
+        hot_keys: Optional[HotKeyTracking] = None,
+        near_cache: Optional[NearCaching] = None,
+        slow_requests: Optional[SlowRequestLogging] = None,
     ):
         """Creates an async SimpleCacheClient
 
@@ -36,6 +70,31 @@ class SimpleCacheClient:
             request_timeout_ms (Optional[int], optional): An optional timeout in milliseconds to allow for Get and Set
                 operations to complete. The request will be terminated if it takes longer than this value and will
                 result in TimeoutError. Defaults to None, in which case a 5 second timeout is used.
+            endpoint_override (Optional[str], optional): Connect to this endpoint instead of the one in the auth
+                token. A loopback `host:port`, such as a `momento.testing.fake_server`, is used for both the control
+                and the data plane.
+            insecure (bool, optional): Connect over a plaintext channel. Only meant for local test servers.
+            local_credentials (bool, optional): Connect with gRPC local credentials instead of TLS, as a
+                `momento.testing.fake_server` listens with by default. Only meant for local test servers.
+            compression (Optional[Compression], optional): Compress values of at least the configured size before
+                storing them, and decompress compressed values when reading them. Defaults to None, in which case
+                values are stored as they are; compressed values written by other clients are still returned
+                compressed.
+            serializer (Optional[Serializer[object]], optional): Converts values to bytes in `set_object` and back
+                in `get_object`, unless another serializer is passed to them. Defaults to None, in which case
+                values are stored as JSON.
+            hooks (Sequence[RequestHook], optional): Called when data requests, such as gets and sets, start and
+                end. See `momento.hooks`. Defaults to none.
+            metrics (bool, optional): Record latencies, outcomes and sizes of data requests, for
+                `metrics_snapshot()`. Defaults to False.
+            tracing (Optional[TracingInterceptor], optional): Creates OpenTelemetry spans for data requests and
+                sends their trace context to the server. See `momento.tracing`. Defaults to None.
+            hot_keys (Optional[HotKeyTracking], optional): Count gets and sets by key, to report the busiest
+                keys. See `momento.hot_keys`. Defaults to None.
+            near_cache (Optional[NearCaching], optional): Serve gets of frequently read keys from memory for a
+                short while. See `momento.near_cache`. Defaults to None.
+            slow_requests (Optional[SlowRequestLogging], optional): Report data requests that take longer than a
+                threshold, with a timeline of their phases. See `momento.slow_requests`. Defaults to None.
         Raises:
             IllegalArgumentError: If method arguments fail validations.
         """
@@ -46,6 +105,17 @@ class SimpleCacheClient:
             auth_token=auth_token,
             default_ttl_seconds=default_ttl_seconds,
             request_timeout_ms=request_timeout_ms,
+            endpoint_override=endpoint_override,
+            insecure=insecure,
+            local_credentials=local_credentials,
+            compression=compression,
+            serializer=serializer,
+            hooks=hooks,
+            metrics=metrics,
+            tracing=tracing,
+            hot_keys=hot_keys,
+            near_cache=near_cache,
+            slow_requests=slow_requests,
         )
 
     def _init_loop(self) -> None:
@@ -77,6 +147,44 @@ class SimpleCacheClient:
             self._momento_async_client.__aexit__(exc_type, exc_value, traceback),
         )
 
+    def metrics_snapshot(self) -> Optional[MetricsSnapshot]:
+        """Latency histograms, outcome counts and sizes of data requests, and the compression counters.
+
+        See `momento.metrics` for exporters.
+
+        Returns:
+            Optional[MetricsSnapshot]: A copy of the metrics, or None if the client does not record them.
+        """
+        return self._momento_async_client.metrics_snapshot()
+
+    def hot_keys(self) -> Optional[List[HotKey]]:
+        """The most requested keys of the current interval so far, busiest first.
+
+        See `momento.hot_keys`.
+
+        Returns:
+            Optional[List[HotKey]]: The keys, or None if the client does not track them.
+        """
+        return self._momento_async_client.hot_keys()
+
+    def near_cache_stats(self) -> Optional[NearCacheStats]:
+        """Hits, promotions and demotions of the near cache.
+
+        See `momento.near_cache`.
+
+        Returns:
+            Optional[NearCacheStats]: The counters, or None if the client has no near cache.
+        """
+        return self._momento_async_client.near_cache_stats()
+
+    def compression_stats(self) -> Optional[CompressionStats]:
+        """Counts, sizes and CPU time of value compression.
+
+        Returns:
+            Optional[CompressionStats]: The counters, or None if compression is disabled.
+        """
+        return self._momento_async_client.compression_stats()
+
     def create_cache(self, cache_name: str) -> CreateCacheResponse:
         """Creates a new cache in your Momento account.
 
@@ -184,7 +292,7 @@ class SimpleCacheClient:
         self,
         cache_name: str,
         key: str,
-        value: Union[str, bytes],
+        value: Union[str, bytes, bytearray, memoryview],
         ttl_seconds: Optional[int] = None,
     ) -> CacheSetResponse:
         """Stores an item in cache
@@ -192,7 +300,8 @@ class SimpleCacheClient:
         Args:
             cache_name: Name of the cache to store the item in.
             key (string or bytes): The key to be used to store item.
-            value (string or bytes): The value to be stored.
+            value (string or bytes): The value to be stored. May also be a bytearray, memoryview or other object
+                supporting the buffer protocol, such as an mmap, which is not copied before it is sent.
             ttl_seconds (Optional): Time to live in cache in seconds. If not provided, then default TTL for the cache
                 client instance is used.
 
@@ -212,14 +321,15 @@ class SimpleCacheClient:
     def set_multi(
         self,
         cache_name: str,
-        items: Union[Mapping[str, str], Mapping[bytes, bytes]],
+        items: Union[Mapping[str, str], Mapping[bytes, Union[bytes, bytearray, memoryview]]],
         ttl_seconds: Optional[int] = None,
     ) -> CacheSetMultiResponse:
         """Store items in the cache.
 
         Args:
             cache_name: Name of the cache to store the item in.
-            items: (Union[Mapping[str, str], Mapping[bytes, bytes]]): The items to store.
+            items: (Union[Mapping[str, str], Mapping[bytes, bytes]]): The items to store. Values may also be
+                bytearrays, memoryviews or other objects supporting the buffer protocol, which are not copied.
             ttl_seconds: (Optional[int]): The TTL to apply to each item. Defaults to None.
 
         Returns:
@@ -275,6 +385,145 @@ class SimpleCacheClient:
         coroutine = self._momento_async_client.get_multi(cache_name, *keys)
         return wait_for_coroutine(self._loop, coroutine)
 
+    def set_object(
+        self,
+        cache_name: str,
+        key: Union[str, bytes],
+        value: _T,
+        ttl_seconds: Optional[int] = None,
+        serializer: Optional[Serializer[_T]] = None,
+    ) -> CacheSetResponse:
+        """Serializes an object and stores it in the cache.
+
+        Args:
+            cache_name: Name of the cache to store the item in.
+            key (string or bytes): The key to be used to store item.
+            value: The object to be stored.
+            ttl_seconds (Optional): Time to live in cache in seconds. If not provided, then default TTL for the cache
+                client instance is used.
+            serializer (Optional[Serializer]): Converts the object to bytes. If not provided, then the serializer of
+                the cache client instance is used.
+
+        Returns:
+            CacheSetResponse, with the serialized value.
+
+        Raises:
+            InvalidArgumentError: If validation fails for provided method arguments, or the object cannot be
+                serialized.
+            BadRequestError: If the provided inputs are rejected by server because they are invalid
+            NotFoundError: If the cache with the given name doesn't exist.
+            AuthenticationError: If the provided Momento Auth Token is invalid.
+            InternalServerError: If server encountered an unknown error while trying to store the item.
+        """
+        coroutine = self._momento_async_client.set_object(cache_name, key, value, ttl_seconds, serializer)
+        return wait_for_coroutine(self._loop, coroutine)
+
+    @overload
+    def get_object(self, cache_name: str, key: Union[str, bytes]) -> Optional[object]:
+        ...
+
+    @overload
+    def get_object(self, cache_name: str, key: Union[str, bytes], serializer: Serializer[_T]) -> Optional[_T]:
+        ...
+
+    def get_object(
+        self, cache_name: str, key: Union[str, bytes], serializer: Optional[Serializer[_T]] = None
+    ) -> Optional[object]:
+        """Retrieve an item from the cache and deserialize it.
+
+        The object is read straight from the bytes of the item, without decoding them to a string first.
+
+        Args:
+            cache_name: Name of the cache to get the item from
+            key (string or bytes): The key to be used to retrieve the item.
+            serializer (Optional[Serializer]): Converts the bytes back to an object. If not provided, then the
+                serializer of the cache client instance is used.
+
+        Returns:
+            The object if the get was a hit, else None.
+
+        Raises:
+            InvalidArgumentError: If validation fails for provided method arguments.
+            BadRequestError: If the provided inputs are rejected by server because they are invalid
+            NotFoundError: If the cache with the given name doesn't exist.
+            AuthenticationError: If the provided Momento Auth Token is invalid.
+            InternalServerError: If server encountered an unknown error while trying to retrieve the item.
+            ClientSdkError: If the item cannot be deserialized.
+        """
+        if serializer is None:
+            return wait_for_coroutine(self._loop, self._momento_async_client.get_object(cache_name, key))
+        coroutine = self._momento_async_client.get_object(cache_name, key, serializer)
+        return wait_for_coroutine(self._loop, coroutine)
+
+    def set_large(
+        self,
+        cache_name: str,
+        key: Union[str, bytes],
+        value: Union[str, bytes, bytearray, memoryview],
+        ttl_seconds: Optional[int] = None,
+        chunk_size_bytes: int = aio.DEFAULT_LARGE_VALUE_CHUNK_SIZE_BYTES,
+        max_concurrency: int = aio.DEFAULT_LARGE_VALUE_MAX_CONCURRENCY,
+    ) -> CacheSetResponse:
+        """Stores a value of any size, split across several cache items if needed.
+
+        Values larger than `chunk_size_bytes` are split into chunks that are stored concurrently as
+        items of their own, plus a small manifest under `key` that lists them with their checksums.
+        The manifest is written last, so `get_large` never returns a mix of the previous and the new
+        value; the chunks of the previous value are deleted afterwards. Smaller values are stored
+        like `set` does. Large values can only be read with `get_large`.
+
+        Args:
+            cache_name: Name of the cache to store the item in.
+            key (string or bytes): The key to be used to store item.
+            value (string or bytes): The value to be stored. May also be a bytearray, memoryview or other object
+                supporting the buffer protocol, such as an mmap, which is not copied before it is sent.
+            ttl_seconds (Optional): Time to live in cache in seconds. If not provided, then default TTL for the cache
+                client instance is used.
+            chunk_size_bytes (int): Size of the chunks. Defaults to 1 MiB; at most 4 MiB minus 64 KiB.
+            max_concurrency (int): Maximum number of chunks written at a time. Defaults to 16.
+
+        Returns:
+            CacheSetResponse
+
+        Raises:
+            InvalidArgumentError: If validation fails for provided method arguments.
+            BadRequestError: If the provided inputs are rejected by server because they are invalid
+            NotFoundError: If the cache with the given name doesn't exist.
+            AuthenticationError: If the provided Momento Auth Token is invalid.
+            InternalServerError: If server encountered an unknown error while trying to store the item.
+        """
+        coroutine = self._momento_async_client.set_large(
+            cache_name, key, value, ttl_seconds, chunk_size_bytes, max_concurrency
+        )
+        return wait_for_coroutine(self._loop, coroutine)
+
+    def get_large(
+        self, cache_name: str, key: Union[str, bytes], max_concurrency: int = aio.DEFAULT_LARGE_VALUE_MAX_CONCURRENCY
+    ) -> CacheGetResponse:
+        """Retrieve a value stored with `set_large`, or with `set`.
+
+        The chunks of a large value are fetched concurrently and copied into a single buffer of the
+        size listed in the manifest as they arrive, after checking their checksums.
+
+        Args:
+            cache_name: Name of the cache to get the item from
+            key (string or bytes): The key to be used to retrieve the item.
+            max_concurrency (int): Maximum number of chunks fetched at a time. Defaults to 16.
+
+        Returns:
+            CacheGetResponse: A miss if the value does not exist or chunks of it expired.
+
+        Raises:
+            InvalidArgumentError: If validation fails for provided method arguments.
+            BadRequestError: If the provided inputs are rejected by server because they are invalid
+            NotFoundError: If the cache with the given name doesn't exist.
+            AuthenticationError: If the provided Momento Auth Token is invalid.
+            InternalServerError: If server encountered an unknown error while trying to retrieve the item.
+            ClientSdkError: If a chunk does not match its checksum.
+        """
+        coroutine = self._momento_async_client.get_large(cache_name, key, max_concurrency)
+        return wait_for_coroutine(self._loop, coroutine)
+
     def delete(self, cache_name: str, key: str) -> CacheDeleteResponse:
         """Delete an item from the cache.
 
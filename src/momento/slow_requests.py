@@ -0,0 +1,87 @@
+"""Logging of slow data requests, with a timeline of where their time went.
+
+A client created with `slow_requests=SlowRequestLogging()` reports every data request that takes
+longer than `threshold_seconds`, to a callback or as a warning on the `momentosdk` log:
+
+    Slow get of my-cache/b'key' took 152.3 ms: interceptor +0.2 ms, attempt 1 +0.2 ms,
+    attempt 1 UNAVAILABLE +80.4 ms, attempt 2 +80.5 ms, attempt 2 OK +151.9 ms, decoded +152.3 ms
+
+The timeline lists when each phase of the request was reached, relative to its start:
+
+- interceptor: the request entered the client's gRPC interceptors. gRPC runs them in a task of its
+  own, so the time until then is spent waiting for the event loop.
+- attempt N: attempt N was sent, after any earlier attempt failed with a status that is retried.
+- attempt N STATUS: the response to attempt N arrived. Responses to unary requests arrive together
+  with their status, so this is also when their first byte did.
+- decoded, or failed: the response was turned into the result or error the caller receives.
+
+Timelines are only recorded for a sample of requests, given by `sample_ratio`. Slow requests that
+were not sampled are still reported, with an empty timeline.
+"""
+from typing import Callable, List, Optional, Tuple
+
+from . import errors
+from .hooks import RequestInfo
+
+DEFAULT_THRESHOLD_SECONDS = 0.1
+
+
+class SlowRequest:
+    __slots__ = ("request", "duration_seconds", "phases", "error")
+
+    def __init__(
+        self,
+        request: RequestInfo,
+        duration_seconds: float,
+        phases: List[Tuple[str, float]],
+        error: Optional[Exception] = None,
+    ):
+        """A request that took longer than the threshold.
+
+        Args:
+            request (RequestInfo): The request.
+            duration_seconds (float): How long it took.
+            phases (List[Tuple[str, float]]): The phases the request went through, with the seconds
+                from its start to when they were reached. Empty if the request was not sampled.
+            error (Optional[Exception]): The error the request failed with, if it did.
+        """
+        self.request = request
+        self.duration_seconds = duration_seconds
+        self.phases = phases
+        self.error = error
+
+    def __repr__(self) -> str:
+        return (
+            f"SlowRequest(request={self.request!r}, duration_seconds={self.duration_seconds!r}, "
+            f"phases={self.phases!r}, error={self.error!r})"
+        )
+
+
+class SlowRequestLogging:
+    def __init__(
+        self,
+        threshold_seconds: float = DEFAULT_THRESHOLD_SECONDS,
+        sample_ratio: float = 1.0,
+        on_slow_request: Optional[Callable[[SlowRequest], None]] = None,
+    ):
+        """Which requests a client reports as slow, and how.
+
+        Args:
+            threshold_seconds (float, optional): Duration from which a request is slow. Defaults to
+                100 milliseconds.
+            sample_ratio (float, optional): The fraction of requests to record the timeline of.
+                Recording one takes a few microseconds. Defaults to 1.0.
+            on_slow_request (Optional[Callable[[SlowRequest], None]], optional): Called on the event
+                loop of the client with every slow request. Defaults to None, in which case they are
+                logged at the WARNING level.
+
+        Raises:
+            InvalidArgumentError: If an argument is out of range.
+        """
+        if threshold_seconds < 0:
+            raise errors.InvalidArgumentError("threshold_seconds must not be negative")
+        if not 0.0 <= sample_ratio <= 1.0:
+            raise errors.InvalidArgumentError("sample_ratio must be between 0 and 1")
+        self.threshold_seconds = threshold_seconds
+        self.sample_ratio = sample_ratio
+        self.on_slow_request = on_slow_request
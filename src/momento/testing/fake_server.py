@@ -0,0 +1,298 @@
+import asyncio
+import json
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional, Tuple
+
+import grpc
+import jwt
+import momento_wire_types.cacheclient_pb2_grpc as cache_grpc
+import momento_wire_types.controlclient_pb2_grpc as control_grpc
+from momento_wire_types import cacheclient_pb2 as cache_pb
+from momento_wire_types import controlclient_pb2 as control_pb
+
+from .. import logs
+
+_CacheItem = Tuple[bytes, float]
+_TOKEN_SIGNING_SECRET = "fake-momento-server-token-signing-secret"
+
+
+class _FakeStorage:
+    """In-memory caches, items and signing keys shared by both fake services."""
+
+    def __init__(self, clock: Callable[[], float]):
+        self._clock = clock
+        self.caches: Dict[str, Dict[bytes, _CacheItem]] = {}
+        self.signing_keys: Dict[str, int] = {}
+
+    def get(self, cache_name: str, key: bytes) -> Optional[bytes]:
+        cache = self.caches[cache_name]
+        item = cache.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at <= self._clock():
+            del cache[key]
+            return None
+        return value
+
+    def set(self, cache_name: str, key: bytes, value: bytes, ttl_milliseconds: int) -> None:
+        self.caches[cache_name][key] = (value, self._clock() + ttl_milliseconds / 1000.0)
+
+    def delete(self, cache_name: str, key: bytes) -> None:
+        self.caches[cache_name].pop(key, None)
+
+
+class _FakeServicerBase:
+    def __init__(self, server: "FakeMomentoServer"):
+        self._server = server
+        self._storage = server._storage
+
+    async def _begin(self, context: grpc.aio.ServicerContext) -> Dict[str, str]:
+        metadata = {md.key: md.value for md in context.invocation_metadata()}
+        expected_token = self._server.auth_token
+        if metadata.get("authorization") != expected_token:
+            await context.abort(grpc.StatusCode.UNAUTHENTICATED, "Invalid signature")
+        if self._server.latency_seconds > 0:
+            await asyncio.sleep(self._server.latency_seconds)
+        return metadata
+
+
+class _FakeScsServicer(_FakeServicerBase, cache_grpc.ScsServicer):
+    async def _cache_name(self, context: grpc.aio.ServicerContext) -> str:
+        metadata = await self._begin(context)
+        cache_name = metadata.get("cache", "")
+        if cache_name == "":
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Cache header is empty")
+        if cache_name not in self._storage.caches:
+            await context.abort(grpc.StatusCode.NOT_FOUND, f"Cache not found: {cache_name}")
+        return cache_name
+
+    async def Get(self, request: cache_pb._GetRequest, context: grpc.aio.ServicerContext) -> cache_pb._GetResponse:
+        cache_name = await self._cache_name(context)
+        value = self._storage.get(cache_name, request.cache_key)
+        if value is None:
+            return cache_pb._GetResponse(result=cache_pb.Miss)
+        return cache_pb._GetResponse(result=cache_pb.Hit, cache_body=value)
+
+    async def Set(self, request: cache_pb._SetRequest, context: grpc.aio.ServicerContext) -> cache_pb._SetResponse:
+        cache_name = await self._cache_name(context)
+        self._storage.set(cache_name, request.cache_key, request.cache_body, request.ttl_milliseconds)
+        return cache_pb._SetResponse(result=cache_pb.Ok)
+
+    async def Delete(
+        self, request: cache_pb._DeleteRequest, context: grpc.aio.ServicerContext
+    ) -> cache_pb._DeleteResponse:
+        cache_name = await self._cache_name(context)
+        self._storage.delete(cache_name, request.cache_key)
+        return cache_pb._DeleteResponse()
+
+
+class _FakeScsControlServicer(_FakeServicerBase, control_grpc.ScsControlServicer):
+    async def CreateCache(
+        self, request: control_pb._CreateCacheRequest, context: grpc.aio.ServicerContext
+    ) -> control_pb._CreateCacheResponse:
+        await self._begin(context)
+        if request.cache_name == "":
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Cache name must not be empty")
+        if request.cache_name in self._storage.caches:
+            await context.abort(grpc.StatusCode.ALREADY_EXISTS, f"Cache already exists: {request.cache_name}")
+        self._storage.caches[request.cache_name] = {}
+        return control_pb._CreateCacheResponse()
+
+    async def DeleteCache(
+        self, request: control_pb._DeleteCacheRequest, context: grpc.aio.ServicerContext
+    ) -> control_pb._DeleteCacheResponse:
+        await self._begin(context)
+        if request.cache_name == "":
+            await context.abort(grpc.StatusCode.INVALID_ARGUMENT, "Cache name must not be empty")
+        if self._storage.caches.pop(request.cache_name, None) is None:
+            await context.abort(grpc.StatusCode.NOT_FOUND, f"Cache not found: {request.cache_name}")
+        return control_pb._DeleteCacheResponse()
+
+    async def ListCaches(
+        self, request: control_pb._ListCachesRequest, context: grpc.aio.ServicerContext
+    ) -> control_pb._ListCachesResponse:
+        await self._begin(context)
+        caches = [control_pb._Cache(cache_name=name) for name in sorted(self._storage.caches)]
+        return control_pb._ListCachesResponse(cache=caches)
+
+    async def CreateSigningKey(
+        self, request: control_pb._CreateSigningKeyRequest, context: grpc.aio.ServicerContext
+    ) -> control_pb._CreateSigningKeyResponse:
+        await self._begin(context)
+        key_id = str(uuid.uuid4())
+        expires_at = int(time.time()) + request.ttl_minutes * 60
+        self._storage.signing_keys[key_id] = expires_at
+        return control_pb._CreateSigningKeyResponse(key=json.dumps({"kid": key_id}), expires_at=expires_at)
+
+    async def RevokeSigningKey(
+        self, request: control_pb._RevokeSigningKeyRequest, context: grpc.aio.ServicerContext
+    ) -> control_pb._RevokeSigningKeyResponse:
+        await self._begin(context)
+        self._storage.signing_keys.pop(request.key_id, None)
+        return control_pb._RevokeSigningKeyResponse()
+
+    async def ListSigningKeys(
+        self, request: control_pb._ListSigningKeysRequest, context: grpc.aio.ServicerContext
+    ) -> control_pb._ListSigningKeysResponse:
+        await self._begin(context)
+        signing_keys = [
+            control_pb._SigningKey(key_id=key_id, expires_at=expires_at)
+            for key_id, expires_at in self._storage.signing_keys.items()
+        ]
+        return control_pb._ListSigningKeysResponse(signing_key=signing_keys)
+
+
+class FakeMomentoServer:
+    """An in-process stand-in for the Momento control and data plane services.
+
+    Both the `ScsControl` and `Scs` services are served from a single port on a background thread
+    with its own event loop, so the server works with both the async and the synchronous clients.
+    Caches and items live in memory and items expire according to their TTL.
+
+    By default the server listens on localhost using gRPC local credentials, which clients are
+    created with `local_credentials=True` for. `auth_token` is a token whose endpoint claims point at
+    the server, so it can be handed to any client:
+
+    >>> with FakeMomentoServer() as server:
+    ...     with SimpleCacheClient(server.auth_token, 60, local_credentials=True) as client:
+    ...         client.create_cache("my-cache")
+
+    Args:
+        port (int): Port to listen on. Defaults to 0, in which case a free port is picked.
+        latency_seconds (float): Artificial latency added to every request. May be changed while running.
+        insecure (bool): Listen on a plaintext port instead of using local credentials. Clients must then be
+            created with `insecure=True`.
+        server_credentials (Optional[grpc.ServerCredentials]): Credentials to listen with instead of the
+            local credentials, e.g. `grpc.ssl_server_credentials` for a localhost TLS certificate. Clients connect
+            to those with TLS, as to the service, if they trust the certificate.
+        clock (Callable[[], float]): Monotonic clock used to expire items. Defaults to `time.monotonic`.
+    """
+
+    def __init__(
+        self,
+        port: int = 0,
+        latency_seconds: float = 0.0,
+        insecure: bool = False,
+        server_credentials: Optional[grpc.ServerCredentials] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.latency_seconds = latency_seconds
+        self._requested_port = port
+        self._insecure = insecure
+        self._server_credentials = server_credentials
+        self._storage = _FakeStorage(clock)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[grpc.aio.Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self._startup_error: Optional[Exception] = None
+        self._port = 0
+        self.auth_token = ""
+
+    @property
+    def endpoint(self) -> str:
+        """The `host:port` the server is listening on."""
+        return f"localhost:{self._port}"
+
+    def make_auth_token(self, subject: str = "fake-momento-server") -> str:
+        """Creates a token whose endpoint claims point at this server.
+
+        Only `auth_token` is accepted by the server; tokens with other subjects are rejected
+        as unauthenticated, which is useful to exercise authentication failures.
+        """
+        claims = {"sub": subject, "cp": self.endpoint, "c": self.endpoint}
+        return jwt.encode(claims, _TOKEN_SIGNING_SECRET, algorithm="HS256")
+
+    def cache_names(self) -> List[str]:
+        """Returns the names of the caches that currently exist on the server."""
+        return list(self._storage.caches)
+
+    def start(self) -> "FakeMomentoServer":
+        started = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, args=(started,), name="fake-momento-server", daemon=True)
+        self._thread.start()
+        started.wait()
+        if self._startup_error is not None:
+            error, self._startup_error = self._startup_error, None
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+            raise error
+        self.auth_token = self.make_auth_token()
+        logs.debug("Fake Momento server listening on %s", self.endpoint)
+        return self
+
+    def stop(self) -> None:
+        if self._loop is None or self._server is None or self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._server.stop(grace=None), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> "FakeMomentoServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _run(self, started: threading.Event) -> None:
+        loop = self._loop
+        assert loop is not None
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._serve())
+        except Exception as e:
+            # Raised again by `start`, which would otherwise wait forever.
+            self._startup_error = e
+            return
+        finally:
+            started.set()
+        loop.run_forever()
+
+    async def _serve(self) -> None:
+        server = grpc.aio.server()
+        cache_grpc.add_ScsServicer_to_server(_FakeScsServicer(self), server)
+        control_grpc.add_ScsControlServicer_to_server(_FakeScsControlServicer(self), server)
+        address = f"localhost:{self._requested_port}"
+        if self._insecure:
+            self._port = server.add_insecure_port(address)
+        else:
+            credentials = self._server_credentials or grpc.local_server_credentials(grpc.LocalConnectionType.LOCAL_TCP)
+            self._port = server.add_secure_port(address, credentials)
+        await server.start()
+        self._server = server
+
+
+def main() -> None:
+    """Runs a fake server until interrupted and prints a token for it.
+
+    Clients connect to it with the token and `local_credentials=True`, or `insecure=True` with
+    `--insecure`.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="In-process fake Momento server")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--insecure", action="store_true")
+    args = parser.parse_args()
+
+    with FakeMomentoServer(args.port, args.latency_ms / 1000.0, args.insecure) as server:
+        print(f"Listening on {server.endpoint}; auth token:")
+        print(server.auth_token, flush=True)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
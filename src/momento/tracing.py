@@ -0,0 +1,139 @@
+"""Tracing of the data requests of a client with OpenTelemetry.
+
+Requires the `opentelemetry-api` package, which the `tracing` extra installs
+(`pip install momento[tracing]`). Spans go to the tracer provider passed to the interceptor, or to
+the global one:
+
+    client = SimpleCacheClient(auth_token, default_ttl_seconds, tracing=TracingInterceptor(sample_ratio=0.01))
+
+Every attempt of a get, set, delete or other data request gets a client span named after its gRPC
+method, e.g. "cache_client.Scs/Get", with the cache name, the sizes of the key and the value, the
+attempt number and the result: "hit", "miss", "ok" or "error". `get_multi` and `set_multi` get a
+span of their own, with the number of keys, that the spans of their requests are children of. The
+trace context is sent in the metadata of each request, in the format of the global propagator.
+
+Requests made while a span is current follow the sampling decision of its trace; other requests
+are sampled at `sample_ratio`, before the sampler of the tracer provider is consulted. Requests that
+are not sampled go straight to the server: no span is created and no metadata is added.
+"""
+import random
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Union
+
+import grpc
+from momento_wire_types.cacheclient_pb2 import ECacheResult
+from opentelemetry import trace
+from opentelemetry.propagate import inject
+from opentelemetry.trace import SpanKind, Status, StatusCode
+
+from . import errors
+from ._utilities._wire_encoding import encoded_set_request_sizes
+from .aio._add_header_client_interceptor import sanitize_client_call_details
+from .aio._retry_interceptor import ATTEMPT
+
+_RESULTS = {ECacheResult.Hit: "hit", ECacheResult.Miss: "miss"}
+
+
+class TracingInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    def __init__(self, tracer_provider: Optional[trace.TracerProvider] = None, sample_ratio: float = 1.0):
+        """Creates spans for the data requests of the clients it is passed to.
+
+        Args:
+            tracer_provider (Optional[trace.TracerProvider], optional): Provides the tracer to create
+                spans with. Defaults to None, in which case the global tracer provider is used.
+            sample_ratio (float, optional): The fraction of requests outside of a trace to trace.
+                Defaults to 1.0.
+
+        Raises:
+            InvalidArgumentError: If `sample_ratio` is not between 0 and 1.
+        """
+        if not 0.0 <= sample_ratio <= 1.0:
+            raise errors.InvalidArgumentError("sample_ratio must be between 0 and 1")
+        self._tracer = trace.get_tracer(__name__, tracer_provider=tracer_provider)
+        self._sample_ratio = sample_ratio
+
+    async def intercept_unary_unary(
+        self,
+        continuation: Callable[
+            [grpc.aio._interceptor.ClientCallDetails, grpc.aio._typing.RequestType],
+            grpc.aio._call.UnaryUnaryCall,
+        ],
+        client_call_details: grpc.aio._interceptor.ClientCallDetails,
+        request: grpc.aio._typing.RequestType,
+    ) -> Union[grpc.aio._call.UnaryUnaryCall, grpc.aio._typing.ResponseType]:
+        if not self._sampled():
+            return await continuation(client_call_details, request)
+
+        call_details = sanitize_client_call_details(client_call_details)
+        method = call_details.method.decode("utf-8").lstrip("/")
+        service, _, method_name = method.partition("/")
+        attributes: Dict[str, Union[str, int]] = {
+            "rpc.system": "grpc",
+            "rpc.service": service,
+            "rpc.method": method_name,
+            "db.system": "momento",
+            "momento.cache_name": call_details.metadata.get("cache", ""),
+            "momento.attempt": ATTEMPT.get(),
+        }
+        if type(request) is bytes:
+            # A set request encoded by `_utilities._wire_encoding`.
+            attributes["momento.key_size"], attributes["momento.value_size"] = encoded_set_request_sizes(request)
+        else:
+            if hasattr(request, "cache_key"):
+                attributes["momento.key_size"] = len(request.cache_key)
+            if hasattr(request, "cache_body"):
+                attributes["momento.value_size"] = len(request.cache_body)
+
+        with self._tracer.start_as_current_span(method, kind=SpanKind.CLIENT, attributes=attributes) as span:
+            carrier: Dict[str, str] = {}
+            inject(carrier)
+            # Retries pass the same call details again, so the trace context goes into a copy of them.
+            traced_call_details = grpc.aio.ClientCallDetails(
+                method=call_details.method,
+                timeout=call_details.timeout,
+                metadata=grpc.aio.Metadata(*call_details.metadata, *carrier.items()),
+                credentials=call_details.credentials,
+                wait_for_ready=call_details.wait_for_ready,
+            )
+            call = await continuation(traced_call_details, request)
+            code = await call.code()
+            span.set_attribute("rpc.grpc.status_code", code.value[0])
+            if code == grpc.StatusCode.OK:
+                response = await call
+                span.set_attribute("momento.result", _RESULTS.get(getattr(response, "result", None), "ok"))
+                if hasattr(response, "cache_body"):
+                    span.set_attribute("momento.value_size", len(response.cache_body))
+            else:
+                span.set_attribute("momento.result", "error")
+                span.set_status(Status(StatusCode.ERROR, f"{code.name}: {await call.details()}"))
+            return call
+
+    @contextmanager
+    def operation(self, operation: str, cache_name: str, key_count: int) -> Iterator[None]:
+        """Makes a span for a multi-key operation current while it runs, if it is sampled.
+
+        Operations that are not sampled make an unsampled span current instead, so that the
+        requests they make are not sampled on their own.
+        """
+        if not self._sampled():
+            with trace.use_span(trace.NonRecordingSpan(_unsampled_span_context()), end_on_exit=False):
+                yield
+            return
+        attributes = {"db.system": "momento", "momento.cache_name": cache_name, "momento.key_count": key_count}
+        with self._tracer.start_as_current_span(f"momento.{operation}", attributes=attributes):
+            yield
+
+    def _sampled(self) -> bool:
+        parent = trace.get_current_span().get_span_context()
+        if parent.is_valid:
+            return bool(parent.trace_flags.sampled)
+        return self._sample_ratio == 1.0 or random.random() < self._sample_ratio
+
+
+def _unsampled_span_context() -> trace.SpanContext:
+    return trace.SpanContext(
+        trace_id=random.getrandbits(128) or 1,
+        span_id=random.getrandbits(64) or 1,
+        is_remote=False,
+        trace_flags=trace.TraceFlags(trace.TraceFlags.DEFAULT),
+    )
@@ -0,0 +1,37 @@
+import pytest
+
+from momento.errors import InvalidArgumentError
+from momento.incubating.simple_cache_client import SimpleCacheClientIncubating
+from tests.utils import uuid_str
+
+
+def test_bloom_missing_filter_contains_nothing(incubating_client: SimpleCacheClientIncubating, cache_name: str):
+    response = incubating_client.bloom_might_contain_many(cache_name, uuid_str(), "a", b"b")
+    assert response.results() == [False, False]
+    assert not response.any()
+    assert response.absent_keys() == ["a", b"b"]
+
+
+def test_bloom_add_and_might_contain(incubating_client: SimpleCacheClientIncubating, cache_name: str):
+    filter_name = uuid_str()
+    keys = [f"key{i}" for i in range(1000)]
+    add_response = incubating_client.bloom_add_many(cache_name, filter_name, *keys, expected_items=1000)
+    assert add_response.filter_name() == filter_name
+    assert 990 <= add_response.num_added() <= 1000
+
+    add_response = incubating_client.bloom_add_many(cache_name, filter_name, keys[0], b"other")
+    assert add_response.num_added() <= 1
+
+    response = incubating_client.bloom_might_contain_many(cache_name, filter_name, *keys, b"other")
+    assert response.all()
+    assert list(response.zip_keys_and_results()) == [(key, True) for key in [*keys, b"other"]]
+
+    response = incubating_client.bloom_might_contain_many(
+        cache_name, filter_name, *[f"missing{i}" for i in range(1000)]
+    )
+    assert sum(response.results()) < 50
+
+
+def test_bloom_rejects_bad_sizing(incubating_client: SimpleCacheClientIncubating, cache_name: str):
+    with pytest.raises(InvalidArgumentError):
+        incubating_client.bloom_add_many(cache_name, uuid_str(), "a", false_positive_rate=2)
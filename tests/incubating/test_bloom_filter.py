@@ -0,0 +1,55 @@
+import pytest
+
+from momento.errors import ClientSdkError, InvalidArgumentError
+from momento.incubating._utilities._bloom_filter import _BloomFilter
+
+
+def test_sizing():
+    bloom_filter = _BloomFilter.sized_for(1000, 0.01)
+    assert (bloom_filter.bit_count, bloom_filter.hash_count) == (9586, 7)
+    assert len(bloom_filter.bits) == 1199
+    assert _BloomFilter.sized_for(1, 1e-300).hash_count == 16
+
+
+def test_round_trip():
+    bloom_filter = _BloomFilter.sized_for(100, 0.01)
+    bloom_filter.add_many([b"a", b"b"])
+    decoded = _BloomFilter.decode(bloom_filter.encode())
+    assert (decoded.bit_count, decoded.hash_count, decoded.bits) == (
+        bloom_filter.bit_count,
+        bloom_filter.hash_count,
+        bloom_filter.bits,
+    )
+    assert decoded.might_contain_many([b"a", b"b"]) == [True, True]
+
+
+def test_add_many_reports_keys_that_might_be_present():
+    bloom_filter = _BloomFilter.sized_for(100, 0.01)
+    assert bloom_filter.add_many([b"a", b"b", b"a"]) == [False, False, True]
+    assert bloom_filter.add_many([b"b"]) == [True]
+
+
+def test_no_false_negatives_and_false_positive_rate_near_target():
+    bloom_filter = _BloomFilter.sized_for(10_000, 0.01)
+    added = [f"added{i}".encode() for i in range(10_000)]
+    bloom_filter.add_many(added)
+    assert all(bloom_filter.might_contain_many(added))
+
+    false_positives = sum(bloom_filter.might_contain_many([f"other{i}".encode() for i in range(10_000)]))
+    assert 0.005 < false_positives / 10_000 < 0.02
+
+
+@pytest.mark.parametrize(
+    "expected_items, false_positive_rate", [(0, 0.01), (1.5, 0.01), (10, 0), (10, 1), (2**40, 0.01)]
+)
+def test_rejects_bad_sizing(expected_items, false_positive_rate):
+    with pytest.raises(InvalidArgumentError):
+        _BloomFilter.sized_for(expected_items, false_positive_rate)
+
+
+@pytest.mark.parametrize(
+    "blob", [b"", b"MBLM", b"XXXX\x01\x07\x08\x00\x00\x00\x00", b"MBLM\x01\x07\x10\x00\x00\x00\x00"]
+)
+def test_rejects_corrupt_blob(blob):
+    with pytest.raises(ClientSdkError):
+        _BloomFilter.decode(blob)
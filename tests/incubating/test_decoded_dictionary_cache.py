@@ -0,0 +1,95 @@
+import pytest
+
+from momento.errors import InvalidArgumentError
+from momento.incubating._utilities._decoded_dictionary_cache import (
+    _FIELD_OVERHEAD_BYTES,
+    _DecodedDictionaryCache,
+)
+from momento.incubating._utilities._dictionary_encoding import (
+    decode_dictionary,
+    encode_dictionary,
+)
+from momento.incubating.cache_operation_types import BytesDictionary
+from momento.incubating.simple_cache_client import SimpleCacheClientIncubating
+from tests.utils import uuid_str
+
+DICTIONARY = {b"key": b"value"}
+BLOB = encode_dictionary(DICTIONARY)
+ENTRY_SIZE_BYTES = 2 * len(BLOB) + _FIELD_OVERHEAD_BYTES
+
+
+async def decode(blob: bytes) -> BytesDictionary:
+    return decode_dictionary(blob)
+
+
+async def test_hit_requires_the_same_blob():
+    cache = _DecodedDictionaryCache(10_000)
+    assert await cache.get_or_decode("cache", "dictionary", BLOB, decode) == DICTIONARY
+    assert await cache.get_or_decode("cache", "dictionary", bytes(bytearray(BLOB)), decode) == DICTIONARY
+    changed = encode_dictionary({b"key": b"other"})
+    assert await cache.get_or_decode("cache", "dictionary", changed, decode) == {b"key": b"other"}
+    assert await cache.get_or_decode("cache", "other-dictionary", changed, decode) == {b"key": b"other"}
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 3, 2)
+    assert stats.decode_seconds > 0
+
+
+async def test_returns_copies():
+    cache = _DecodedDictionaryCache(10_000)
+    for _ in range(2):
+        dictionary = await cache.get_or_decode("cache", "dictionary", BLOB, decode)
+        dictionary[b"key"] = b"modified"
+    assert await cache.get_or_decode("cache", "dictionary", BLOB, decode) == DICTIONARY
+
+
+async def test_evicts_least_recently_used():
+    cache = _DecodedDictionaryCache(2 * ENTRY_SIZE_BYTES)
+    for name in ["a", "b", "a", "c"]:
+        await cache.get_or_decode("cache", name, BLOB, decode)
+    await cache.get_or_decode("cache", "a", BLOB, decode)
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions) == (2, 3, 1)
+    assert (stats.entries, stats.size_bytes) == (2, 2 * ENTRY_SIZE_BYTES)
+
+
+async def test_does_not_hold_dictionaries_larger_than_the_cache():
+    cache = _DecodedDictionaryCache(ENTRY_SIZE_BYTES - 1)
+    await cache.get_or_decode("cache", "dictionary", BLOB, decode)
+    assert (cache.stats().entries, cache.stats().size_bytes) == (0, 0)
+
+
+def test_rejects_negative_size():
+    with pytest.raises(InvalidArgumentError):
+        _DecodedDictionaryCache(-1)
+
+
+def test_client_reuses_decoded_dictionaries(
+    incubating_client: SimpleCacheClientIncubating,
+    auth_token: str,
+    default_ttl_seconds: int,
+    cache_name: str,
+    local_credentials: bool,
+):
+    # `incubating_client` makes sure the test cache exists.
+    with SimpleCacheClientIncubating(
+        auth_token,
+        default_ttl_seconds,
+        local_credentials=local_credentials,
+        decoded_dictionary_cache_max_bytes=1_000_000,
+    ) as client:
+        dictionary_name = uuid_str()
+        client.dictionary_set_multi(cache_name, dictionary_name, {"a": "1"}, refresh_ttl=False)
+        client.dictionary_set(cache_name, dictionary_name, "b", "2", refresh_ttl=False)
+        assert client.dictionary_get_all(cache_name, dictionary_name).value() == {"a": "1", "b": "2"}
+
+        stats = client.decoded_dictionary_cache_stats()
+        assert stats is not None
+        # Only the first write found nothing to decode; every later read was of the blob the client wrote.
+        assert (stats.hits, stats.misses) == (2, 0)
+
+
+def test_client_cache_is_disabled_by_default(auth_token: str, default_ttl_seconds: int, local_credentials: bool):
+    with SimpleCacheClientIncubating(auth_token, default_ttl_seconds, local_credentials=local_credentials) as client:
+        assert client.decoded_dictionary_cache_stats() is None
@@ -3,6 +3,7 @@ import warnings
 
 import pytest
 
+import momento.errors as errors
 from momento.cache_operation_types import CacheGetStatus
 from momento.incubating.aio.utils import convert_dict_items_to_bytes
 from momento.incubating.cache_operation_types import CacheDictionaryGetUnaryResponse
@@ -13,10 +14,11 @@ from tests.utils import str_to_bytes, uuid_bytes, uuid_str
 def test_incubating_warning(
     auth_token: str,
     default_ttl_seconds: int,
+    local_credentials: bool,
 ):
     with pytest.warns(UserWarning):
         warnings.simplefilter("always")
-        with SimpleCacheClientIncubating(auth_token, default_ttl_seconds):
+        with SimpleCacheClientIncubating(auth_token, default_ttl_seconds, local_credentials=local_credentials):
             pass
 
 
@@ -79,6 +81,16 @@ def test_dictionary_set_unary(incubating_client: SimpleCacheClientIncubating, ca
     assert get_response.value() == value
 
 
+def test_dictionary_set_copies_buffers(incubating_client: SimpleCacheClientIncubating, cache_name: str):
+    dictionary_name, key = uuid_str(), uuid_str()
+    value = bytearray(b"value")
+    incubating_client.dictionary_set(cache_name, dictionary_name, key, value, refresh_ttl=False)
+    value[:] = b"other"
+
+    get_response = incubating_client.dictionary_get(cache_name, dictionary_name, key)
+    assert get_response.value_as_bytes() == b"value"
+
+
 def test_dictionary_set_and_dictionary_get_missing_key(incubating_client: SimpleCacheClientIncubating, cache_name: str):
     dictionary_name = uuid_str()
     incubating_client.dictionary_set(
@@ -186,3 +198,95 @@ def test_dictionary_get_all_hit(incubating_client: SimpleCacheClientIncubating,
 
     expected = dictionary
     assert get_all_response.value() == expected
+
+
+def test_dictionary_reshard(incubating_client: SimpleCacheClientIncubating, cache_name: str):
+    dictionary_name = uuid_str()
+    dictionary = {f"key{i}": f"value{i}" for i in range(50)}
+    incubating_client.dictionary_set_multi(cache_name, dictionary_name, dictionary, refresh_ttl=False)
+
+    for shard_count in [4, 7, 1]:
+        reshard_response = incubating_client.dictionary_reshard(cache_name, dictionary_name, shard_count)
+        assert reshard_response.shard_count() == shard_count
+
+        get_all_response = incubating_client.dictionary_get_all(cache_name, dictionary_name)
+        assert get_all_response.value() == dictionary
+
+
+def test_dictionary_sharded_get_and_set(incubating_client: SimpleCacheClientIncubating, cache_name: str):
+    dictionary_name = uuid_str()
+    incubating_client.dictionary_reshard(cache_name, dictionary_name, 8)
+    get_all_response = incubating_client.dictionary_get_all(cache_name, dictionary_name)
+    assert get_all_response.value() == {}
+
+    dictionary = {f"key{i}": f"value{i}" for i in range(20)}
+    incubating_client.dictionary_set_multi(cache_name, dictionary_name, dictionary, refresh_ttl=False)
+    incubating_client.dictionary_set(cache_name, dictionary_name, "key0", "updated", refresh_ttl=False)
+    dictionary["key0"] = "updated"
+
+    get_response = incubating_client.dictionary_get(cache_name, dictionary_name, "key0")
+    assert get_response.value() == "updated"
+
+    get_multi_response = incubating_client.dictionary_get_multi(cache_name, dictionary_name, "key1", "missing", "key19")
+    assert get_multi_response.values() == ["value1", None, "value19"]
+
+    get_all_response = incubating_client.dictionary_get_all(cache_name, dictionary_name)
+    assert get_all_response.value() == dictionary
+
+
+def test_dictionary_reshard_rejects_bad_shard_count(incubating_client: SimpleCacheClientIncubating, cache_name: str):
+    with pytest.raises(errors.InvalidArgumentError):
+        incubating_client.dictionary_reshard(cache_name, uuid_str(), 0)
+
+
+def test_dictionary_get_all_many(incubating_client: SimpleCacheClientIncubating, cache_name: str):
+    dictionary_names = [uuid_str() for _ in range(3)]
+    dictionaries = [{uuid_str(): uuid_str()} for _ in range(2)]
+    for dictionary_name, dictionary in zip(dictionary_names, dictionaries):
+        incubating_client.dictionary_set_multi(cache_name, dictionary_name, dictionary, refresh_ttl=False)
+
+    get_all_many_response = incubating_client.dictionary_get_all_many(cache_name, *dictionary_names)
+    assert get_all_many_response.status() == [CacheGetStatus.HIT, CacheGetStatus.HIT, CacheGetStatus.MISS]
+    assert get_all_many_response.values() == [*dictionaries, None]
+    assert get_all_many_response.values_as_bytes() == [
+        *[convert_dict_items_to_bytes(dictionary) for dictionary in dictionaries],
+        None,
+    ]
+
+
+def test_dictionary_compression(
+    incubating_client: SimpleCacheClientIncubating,
+    auth_token: str,
+    default_ttl_seconds: int,
+    cache_name: str,
+    local_credentials: bool,
+):
+    dictionary = {f"key{i}": "value" * 100 for i in range(100)}
+    dictionary_name, uncompressed_dictionary_name = uuid_str(), uuid_str()
+    incubating_client.dictionary_set_multi(cache_name, uncompressed_dictionary_name, dictionary, refresh_ttl=False)
+    with SimpleCacheClientIncubating(
+        auth_token,
+        default_ttl_seconds,
+        local_credentials=local_credentials,
+        dictionary_compression_threshold_bytes=1024,
+    ) as client:
+        client.dictionary_set_multi(cache_name, dictionary_name, dictionary, refresh_ttl=False)
+        assert (client.dictionary_get_all(cache_name, dictionary_name)).value() == dictionary
+        assert (client.dictionary_get(cache_name, dictionary_name, "key7")).value() == "value" * 100
+
+    blob = (incubating_client.get(cache_name, dictionary_name)).value_as_bytes()
+    uncompressed_blob = (incubating_client.get(cache_name, uncompressed_dictionary_name)).value_as_bytes()
+    assert len(blob) < len(uncompressed_blob) // 10
+    assert (incubating_client.dictionary_get_all(cache_name, dictionary_name)).value() == dictionary
+
+
+def test_dictionary_compression_rejects_negative_threshold(
+    auth_token: str, default_ttl_seconds: int, local_credentials: bool
+):
+    with pytest.raises(errors.InvalidArgumentError):
+        SimpleCacheClientIncubating(
+            auth_token,
+            default_ttl_seconds,
+            local_credentials=local_credentials,
+            dictionary_compression_threshold_bytes=-1,
+        )
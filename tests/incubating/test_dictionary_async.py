@@ -3,6 +3,7 @@ import warnings
 
 import pytest
 
+import momento.errors as errors
 from momento.cache_operation_types import CacheGetStatus
 from momento.incubating.aio.simple_cache_client import SimpleCacheClientIncubating
 from momento.incubating.aio.utils import convert_dict_items_to_bytes
@@ -13,10 +14,11 @@ from tests.utils import str_to_bytes, uuid_bytes, uuid_str
 async def test_incubating_warning(
     auth_token: str,
     default_ttl_seconds: int,
+    local_credentials: bool,
 ):
     with pytest.warns(UserWarning):
         warnings.simplefilter("always")
-        async with SimpleCacheClientIncubating(auth_token, default_ttl_seconds):
+        async with SimpleCacheClientIncubating(auth_token, default_ttl_seconds, local_credentials=local_credentials):
             pass
 
 
@@ -85,6 +87,16 @@ async def test_dictionary_set_unary(incubating_client_async: SimpleCacheClientIn
     assert get_response.value() == value
 
 
+async def test_dictionary_set_copies_buffers(incubating_client_async: SimpleCacheClientIncubating, cache_name: str):
+    dictionary_name, key = uuid_str(), uuid_str()
+    value = bytearray(b"value")
+    await incubating_client_async.dictionary_set(cache_name, dictionary_name, key, value, refresh_ttl=False)
+    value[:] = b"other"
+
+    get_response = await incubating_client_async.dictionary_get(cache_name, dictionary_name, key)
+    assert get_response.value_as_bytes() == b"value"
+
+
 async def test_dictionary_set_and_dictionary_get_missing_key(
     incubating_client_async: SimpleCacheClientIncubating, cache_name: str
 ):
@@ -198,3 +210,101 @@ async def test_dictionary_get_all_hit(incubating_client_async: SimpleCacheClient
 
     expected = dictionary
     assert get_all_response.value() == expected
+
+
+async def test_dictionary_reshard(incubating_client_async: SimpleCacheClientIncubating, cache_name: str):
+    dictionary_name = uuid_str()
+    dictionary = {f"key{i}": f"value{i}" for i in range(50)}
+    await incubating_client_async.dictionary_set_multi(cache_name, dictionary_name, dictionary, refresh_ttl=False)
+
+    for shard_count in [4, 7, 1]:
+        reshard_response = await incubating_client_async.dictionary_reshard(cache_name, dictionary_name, shard_count)
+        assert reshard_response.shard_count() == shard_count
+
+        get_all_response = await incubating_client_async.dictionary_get_all(cache_name, dictionary_name)
+        assert get_all_response.value() == dictionary
+
+
+async def test_dictionary_sharded_get_and_set(incubating_client_async: SimpleCacheClientIncubating, cache_name: str):
+    dictionary_name = uuid_str()
+    await incubating_client_async.dictionary_reshard(cache_name, dictionary_name, 8)
+    get_all_response = await incubating_client_async.dictionary_get_all(cache_name, dictionary_name)
+    assert get_all_response.value() == {}
+
+    dictionary = {f"key{i}": f"value{i}" for i in range(20)}
+    await incubating_client_async.dictionary_set_multi(cache_name, dictionary_name, dictionary, refresh_ttl=False)
+    await incubating_client_async.dictionary_set(cache_name, dictionary_name, "key0", "updated", refresh_ttl=False)
+    dictionary["key0"] = "updated"
+
+    get_response = await incubating_client_async.dictionary_get(cache_name, dictionary_name, "key0")
+    assert get_response.value() == "updated"
+
+    get_multi_response = await incubating_client_async.dictionary_get_multi(
+        cache_name, dictionary_name, "key1", "missing", "key19"
+    )
+    assert get_multi_response.values() == ["value1", None, "value19"]
+
+    get_all_response = await incubating_client_async.dictionary_get_all(cache_name, dictionary_name)
+    assert get_all_response.value() == dictionary
+
+
+async def test_dictionary_reshard_rejects_bad_shard_count(
+    incubating_client_async: SimpleCacheClientIncubating, cache_name: str
+):
+    with pytest.raises(errors.InvalidArgumentError):
+        await incubating_client_async.dictionary_reshard(cache_name, uuid_str(), 0)
+
+
+async def test_dictionary_get_all_many(incubating_client_async: SimpleCacheClientIncubating, cache_name: str):
+    dictionary_names = [uuid_str() for _ in range(3)]
+    dictionaries = [{uuid_str(): uuid_str()} for _ in range(2)]
+    for dictionary_name, dictionary in zip(dictionary_names, dictionaries):
+        await incubating_client_async.dictionary_set_multi(cache_name, dictionary_name, dictionary, refresh_ttl=False)
+
+    get_all_many_response = await incubating_client_async.dictionary_get_all_many(cache_name, *dictionary_names)
+    assert get_all_many_response.status() == [CacheGetStatus.HIT, CacheGetStatus.HIT, CacheGetStatus.MISS]
+    assert get_all_many_response.values() == [*dictionaries, None]
+    assert get_all_many_response.values_as_bytes() == [
+        *[convert_dict_items_to_bytes(dictionary) for dictionary in dictionaries],
+        None,
+    ]
+
+
+async def test_dictionary_compression(
+    incubating_client_async: SimpleCacheClientIncubating,
+    auth_token: str,
+    default_ttl_seconds: int,
+    cache_name: str,
+    local_credentials: bool,
+):
+    dictionary = {f"key{i}": "value" * 100 for i in range(100)}
+    dictionary_name, uncompressed_dictionary_name = uuid_str(), uuid_str()
+    await incubating_client_async.dictionary_set_multi(
+        cache_name, uncompressed_dictionary_name, dictionary, refresh_ttl=False
+    )
+    async with SimpleCacheClientIncubating(
+        auth_token,
+        default_ttl_seconds,
+        local_credentials=local_credentials,
+        dictionary_compression_threshold_bytes=1024,
+    ) as client:
+        await client.dictionary_set_multi(cache_name, dictionary_name, dictionary, refresh_ttl=False)
+        assert (await client.dictionary_get_all(cache_name, dictionary_name)).value() == dictionary
+        assert (await client.dictionary_get(cache_name, dictionary_name, "key7")).value() == "value" * 100
+
+    blob = (await incubating_client_async.get(cache_name, dictionary_name)).value_as_bytes()
+    uncompressed_blob = (await incubating_client_async.get(cache_name, uncompressed_dictionary_name)).value_as_bytes()
+    assert len(blob) < len(uncompressed_blob) // 10
+    assert (await incubating_client_async.dictionary_get_all(cache_name, dictionary_name)).value() == dictionary
+
+
+async def test_dictionary_compression_rejects_negative_threshold(
+    auth_token: str, default_ttl_seconds: int, local_credentials: bool
+):
+    with pytest.raises(errors.InvalidArgumentError):
+        SimpleCacheClientIncubating(
+            auth_token,
+            default_ttl_seconds,
+            local_credentials=local_credentials,
+            dictionary_compression_threshold_bytes=-1,
+        )
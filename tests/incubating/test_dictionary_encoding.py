@@ -0,0 +1,61 @@
+import pickle
+
+import pytest
+
+from momento.errors import ClientSdkError
+from momento.incubating._utilities._dictionary_encoding import (
+    decode_dictionary,
+    encode_dictionary,
+    lookup_dictionary_fields,
+)
+from tests.utils import uuid_bytes
+
+DICTIONARY = {uuid_bytes(): uuid_bytes() * i for i in range(100)}
+
+
+@pytest.mark.parametrize("compression_threshold_bytes", [None, 0, 10**9])
+def test_encode_decode_round_trip(compression_threshold_bytes):
+    blob = encode_dictionary(DICTIONARY, compression_threshold_bytes)
+    assert decode_dictionary(blob) == DICTIONARY
+
+
+def test_encode_decode_empty():
+    assert decode_dictionary(encode_dictionary({})) == {}
+    assert lookup_dictionary_fields(encode_dictionary({}), [b"key"]) == [None]
+
+
+def test_compression_above_threshold():
+    dictionary = {b"key": b"x" * 10_000}
+    assert len(encode_dictionary(dictionary, compression_threshold_bytes=1024)) < 1024
+    assert len(encode_dictionary(dictionary, compression_threshold_bytes=None)) > 10_000
+    assert decode_dictionary(encode_dictionary(dictionary, compression_threshold_bytes=1024)) == dictionary
+
+
+@pytest.mark.parametrize("compression_threshold_bytes", [None, 0])
+def test_lookup_fields(compression_threshold_bytes):
+    blob = encode_dictionary(DICTIONARY, compression_threshold_bytes)
+    keys = list(DICTIONARY)
+    missing = [b"", b"missing", b"\xff" * 32]
+    assert lookup_dictionary_fields(blob, keys) == list(DICTIONARY.values())
+    assert lookup_dictionary_fields(blob, missing) == [None, None, None]
+
+
+def test_reads_legacy_pickled_dictionaries():
+    blob = pickle.dumps(DICTIONARY)
+    assert decode_dictionary(blob) == DICTIONARY
+    assert lookup_dictionary_fields(blob, [next(iter(DICTIONARY)), b"missing"]) == [
+        next(iter(DICTIONARY.values())),
+        None,
+    ]
+
+
+@pytest.mark.parametrize("blob", [b"", b"MDC", b"not a dictionary", b"MDCT\x02\x00\x00\x00\x00\x00"])
+def test_decode_rejects_unknown_encodings(blob):
+    with pytest.raises(ClientSdkError):
+        decode_dictionary(blob)
+
+
+def test_decode_rejects_truncated_index():
+    blob = encode_dictionary(DICTIONARY, compression_threshold_bytes=None)
+    with pytest.raises(ClientSdkError):
+        decode_dictionary(blob[:100])
@@ -0,0 +1,59 @@
+import pytest
+
+from momento.errors import ClientSdkError, InvalidArgumentError
+from momento.incubating._utilities._dictionary_encoding import encode_dictionary
+from momento.incubating._utilities._dictionary_sharding import (
+    _ShardManifest,
+    _validate_shard_count,
+)
+from momento.incubating.aio.simple_cache_client import SimpleCacheClientIncubating
+from tests.utils import uuid_str
+
+
+def test_manifest_round_trip():
+    manifest = _ShardManifest(16, 3).next(5)
+    decoded = _ShardManifest.decode(manifest.encode())
+    assert decoded is not None
+    assert (decoded.shard_count, decoded.generation) == (5, 4)
+    assert _ShardManifest(1, 2**32 - 1).next(1).generation == 0
+
+
+def test_dictionaries_are_not_manifests():
+    assert _ShardManifest.decode(encode_dictionary({})) is None
+    assert _ShardManifest.decode(b"") is None
+
+
+def test_rejects_corrupt_manifest():
+    with pytest.raises(ClientSdkError):
+        _ShardManifest.decode(_ShardManifest(0).encode())
+
+
+def test_fields_are_assigned_to_shards_stably():
+    manifest = _ShardManifest(8)
+    # CRC-32 based, so the assignment does not depend on the process's hash seed.
+    assert [manifest.shard_of(field) for field in [b"a", b"b", b"c"]] == [3, 1, 7]
+    shards = manifest.split({b"a": b"1", b"b": b"2", b"c": b"3"})
+    assert shards == [{}, {b"b": b"2"}, {}, {b"a": b"1"}, {}, {}, {}, {b"c": b"3"}]
+    assert _ShardManifest(2).group_fields([b"a", b"c", b"b"]) == {1: [0, 1, 2]}
+
+
+@pytest.mark.parametrize("shard_count", [0, -1, 1025, 1.5])
+def test_rejects_bad_shard_count(shard_count):
+    with pytest.raises(InvalidArgumentError):
+        _validate_shard_count(shard_count)
+
+
+async def test_reads_with_a_stale_manifest_follow_resharding(
+    incubating_client_async: SimpleCacheClientIncubating, cache_name: str
+):
+    dictionary_name = uuid_str()
+    dictionary = {f"key{i}".encode(): f"value{i}".encode() for i in range(20)}
+    await incubating_client_async.dictionary_reshard(cache_name, dictionary_name, 4)
+    await incubating_client_async.dictionary_set_multi(cache_name, dictionary_name, dictionary, refresh_ttl=False)
+    stale_manifest = _ShardManifest(4)
+
+    # The shards of the stale manifest are deleted by resharding, as if it happened mid-read.
+    await incubating_client_async.dictionary_reshard(cache_name, dictionary_name, 3)
+    blob = stale_manifest.encode()
+    assert await incubating_client_async._get_all_shards(cache_name, dictionary_name, stale_manifest) == dictionary
+    assert await incubating_client_async._lookup_fields(cache_name, dictionary_name, blob, [b"key7"]) == [b"value7"]
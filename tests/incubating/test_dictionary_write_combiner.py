@@ -0,0 +1,117 @@
+import asyncio
+from typing import List, Tuple
+
+import pytest
+
+from momento.errors import InternalServerError, InvalidArgumentError
+from momento.incubating.aio._dictionary_write_combiner import _DictionaryWriteCombiner
+from momento.incubating.aio.simple_cache_client import SimpleCacheClientIncubating
+from momento.incubating.cache_operation_types import BytesDictionary
+from tests.utils import uuid_str
+
+
+class RecordingWriter:
+    def __init__(self, delay_seconds: float = 0.0, fail: bool = False):
+        self.writes: List[Tuple[str, str, BytesDictionary]] = []
+        self._delay_seconds = delay_seconds
+        self._fail = fail
+
+    async def __call__(self, cache_name: str, dictionary_name: str, updates: BytesDictionary) -> None:
+        self.writes.append((cache_name, dictionary_name, dict(updates)))
+        await asyncio.sleep(self._delay_seconds)
+        if self._fail:
+            raise InternalServerError("write failed")
+
+
+async def test_combines_concurrent_updates():
+    writer = RecordingWriter()
+    combiner = _DictionaryWriteCombiner(writer)
+    await asyncio.gather(
+        combiner.update("cache", "dictionary", {b"a": b"1"}),
+        combiner.update("cache", "dictionary", {b"b": b"2", b"a": b"3"}),
+        combiner.update("cache", "other", {b"c": b"4"}),
+    )
+    assert sorted(writer.writes) == [
+        ("cache", "dictionary", {b"a": b"3", b"b": b"2"}),
+        ("cache", "other", {b"c": b"4"}),
+    ]
+
+
+async def test_combines_updates_that_arrive_while_writing():
+    writer = RecordingWriter(delay_seconds=0.05)
+    combiner = _DictionaryWriteCombiner(writer)
+    first = asyncio.ensure_future(combiner.update("cache", "dictionary", {b"a": b"1"}))
+    await asyncio.sleep(0.01)
+    await asyncio.gather(
+        combiner.update("cache", "dictionary", {b"b": b"2"}),
+        combiner.update("cache", "dictionary", {b"c": b"3"}),
+    )
+    await first
+    assert [updates for _, _, updates in writer.writes] == [{b"a": b"1"}, {b"b": b"2", b"c": b"3"}]
+
+
+async def test_window_combines_updates():
+    writer = RecordingWriter()
+    combiner = _DictionaryWriteCombiner(writer, window_seconds=0.05)
+
+    async def update_later() -> None:
+        await asyncio.sleep(0.01)
+        await combiner.update("cache", "dictionary", {b"b": b"2"})
+
+    await asyncio.gather(combiner.update("cache", "dictionary", {b"a": b"1"}), update_later())
+    assert [updates for _, _, updates in writer.writes] == [{b"a": b"1", b"b": b"2"}]
+
+
+async def test_every_caller_sees_the_error():
+    combiner = _DictionaryWriteCombiner(RecordingWriter(fail=True))
+    results = await asyncio.gather(
+        combiner.update("cache", "dictionary", {b"a": b"1"}),
+        combiner.update("cache", "dictionary", {b"b": b"2"}),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, InternalServerError) for result in results)
+
+
+async def test_cancelled_caller_does_not_cancel_the_write():
+    writer = RecordingWriter(delay_seconds=0.05)
+    combiner = _DictionaryWriteCombiner(writer)
+    cancelled = asyncio.ensure_future(combiner.update("cache", "dictionary", {b"a": b"1"}))
+    other = asyncio.ensure_future(combiner.update("cache", "dictionary", {b"b": b"2"}))
+    await asyncio.sleep(0.01)
+    cancelled.cancel()
+    await other
+    assert [updates for _, _, updates in writer.writes] == [{b"a": b"1", b"b": b"2"}]
+
+
+def test_rejects_negative_window():
+    with pytest.raises(InvalidArgumentError):
+        _DictionaryWriteCombiner(RecordingWriter(), window_seconds=-1)
+
+
+async def test_concurrent_dictionary_sets_are_not_lost(
+    incubating_client_async: SimpleCacheClientIncubating, cache_name: str
+):
+    dictionary_name = uuid_str()
+    responses = await asyncio.gather(
+        *[
+            incubating_client_async.dictionary_set(
+                cache_name, dictionary_name, f"key{i}", f"value{i}", refresh_ttl=False
+            )
+            for i in range(20)
+        ],
+        incubating_client_async.dictionary_set_multi(
+            cache_name, dictionary_name, {"key20": "value20", "key21": "value21"}, refresh_ttl=False
+        ),
+    )
+    assert [response.dictionary_name() for response in responses] == [dictionary_name] * 21
+
+    get_all_response = await incubating_client_async.dictionary_get_all(cache_name, dictionary_name)
+    assert get_all_response.value() == {f"key{i}": f"value{i}" for i in range(22)}
+
+
+async def test_concurrent_zadd_many_are_not_lost(incubating_client_async: SimpleCacheClientIncubating, cache_name: str):
+    sorted_set_name = uuid_str()
+    await asyncio.gather(
+        *[incubating_client_async.zadd_many(cache_name, sorted_set_name, {f"player{i}": i}) for i in range(20)]
+    )
+    assert len((await incubating_client_async.zrange_by_score(cache_name, sorted_set_name)).items()) == 20
@@ -56,3 +56,18 @@ def test_exists_multi(incubating_client: SimpleCacheClientIncubating, cache_name
     assert response.missing_keys() == [missing1, missing2]
     assert response.present_keys() == keys
     assert list(response.zip_keys_and_results()) == list(zip(more_keys, mask))
+
+
+def test_exists_all_and_any(incubating_client: SimpleCacheClientIncubating, cache_name: str):
+    present = [uuid_str() for _ in range(3)]
+    for key in present:
+        incubating_client.set(cache_name, key, uuid_str())
+    missing = uuid_str()
+
+    assert incubating_client.exists_all(cache_name, *present)
+    assert not incubating_client.exists_all(cache_name, *present, missing)
+    assert incubating_client.exists_any(cache_name, missing, *present, max_concurrency=1)
+    assert not incubating_client.exists_any(cache_name, missing, uuid_str())
+
+    assert incubating_client.exists_all(cache_name)
+    assert not incubating_client.exists_any(cache_name)
@@ -0,0 +1,84 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from momento.errors import InternalServerError, InvalidArgumentError
+from momento.incubating.aio.simple_cache_client import SimpleCacheClientIncubating
+from tests.utils import uuid_str
+
+
+class GetRecorder:
+    """Wraps the client's `get` to record the keys looked up and how many are in flight at once."""
+
+    def __init__(self, client: SimpleCacheClientIncubating, fail_on: str = ""):
+        self._get = client.get
+        self._fail_on = fail_on
+        self.keys: List[str] = []
+        self.cancelled = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, cache_name: str, key: str):
+        self.keys.append(key)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if key == self._fail_on:
+                raise InternalServerError("get failed")
+            return await self._get(cache_name, key)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.in_flight -= 1
+
+
+async def test_exists_all_stops_at_first_missing_key(
+    incubating_client_async: SimpleCacheClientIncubating, cache_name: str, monkeypatch: pytest.MonkeyPatch
+):
+    present = uuid_str()
+    await incubating_client_async.set(cache_name, present, "value")
+    recorder = GetRecorder(incubating_client_async)
+    monkeypatch.setattr(incubating_client_async, "get", recorder)
+
+    keys = [present, uuid_str()] + [present] * 1000
+    assert not await incubating_client_async.exists_all(cache_name, *keys, max_concurrency=4)
+    assert len(recorder.keys) < 20
+    assert recorder.max_in_flight <= 4
+    assert recorder.cancelled > 0
+    assert recorder.in_flight == 0
+
+
+async def test_exists_any_stops_at_first_existing_key(
+    incubating_client_async: SimpleCacheClientIncubating, cache_name: str, monkeypatch: pytest.MonkeyPatch
+):
+    present = uuid_str()
+    await incubating_client_async.set(cache_name, present, "value")
+    recorder = GetRecorder(incubating_client_async)
+    monkeypatch.setattr(incubating_client_async, "get", recorder)
+
+    keys = [uuid_str() for _ in range(10)] + [present] + [uuid_str() for _ in range(1000)]
+    assert await incubating_client_async.exists_any(cache_name, *keys, max_concurrency=8)
+    assert len(recorder.keys) < 40
+    assert recorder.max_in_flight <= 8
+
+
+async def test_exists_all_raises_errors_and_cancels_other_lookups(
+    incubating_client_async: SimpleCacheClientIncubating, cache_name: str, monkeypatch: pytest.MonkeyPatch
+):
+    failing = uuid_str()
+    recorder = GetRecorder(incubating_client_async, fail_on=failing)
+    monkeypatch.setattr(incubating_client_async, "get", recorder)
+
+    with pytest.raises(InternalServerError):
+        await incubating_client_async.exists_any(cache_name, uuid_str(), failing, *[uuid_str() for _ in range(100)])
+    assert recorder.in_flight == 0
+
+
+@pytest.mark.parametrize("max_concurrency", [0, 1.5])
+async def test_rejects_bad_max_concurrency(
+    incubating_client_async: SimpleCacheClientIncubating, cache_name: str, max_concurrency
+):
+    with pytest.raises(InvalidArgumentError):
+        await incubating_client_async.exists_all(cache_name, "key", max_concurrency=max_concurrency)
@@ -0,0 +1,45 @@
+import pytest
+
+from momento.errors import InvalidArgumentError
+from momento.incubating.aio.simple_cache_client import SimpleCacheClientIncubating
+from tests.utils import uuid_str
+
+
+async def test_hll_count_missing(incubating_client_async: SimpleCacheClientIncubating, cache_name: str):
+    assert (await incubating_client_async.hll_count(cache_name, uuid_str())).count() == 0
+
+
+async def test_hll_add_many_and_count(incubating_client_async: SimpleCacheClientIncubating, cache_name: str):
+    hll_name = uuid_str()
+    response = await incubating_client_async.hll_add_many(cache_name, hll_name, *[f"id{i}" for i in range(1000)])
+    assert response.hll_name() == hll_name
+    assert response.changed()
+
+    response = await incubating_client_async.hll_add_many(cache_name, hll_name, "id1", b"id2")
+    assert not response.changed()
+    count = (await incubating_client_async.hll_count(cache_name, hll_name)).count()
+    assert abs(count - 1000) <= 30
+
+
+async def test_hll_merge_and_count_union(incubating_client_async: SimpleCacheClientIncubating, cache_name: str):
+    first, second, destination = uuid_str(), uuid_str(), uuid_str()
+    await incubating_client_async.hll_add_many(cache_name, first, *[f"id{i}" for i in range(600)])
+    await incubating_client_async.hll_add_many(cache_name, second, *[f"id{i}" for i in range(400, 1000)])
+
+    count = (await incubating_client_async.hll_count(cache_name, first, second, uuid_str())).count()
+    assert abs(count - 1000) <= 30
+
+    response = await incubating_client_async.hll_merge(cache_name, destination, first, second)
+    assert response.hll_name() == destination
+    assert (await incubating_client_async.hll_count(cache_name, destination)).count() == count
+    assert abs((await incubating_client_async.hll_count(cache_name, first)).count() - 600) <= 20
+
+
+async def test_hll_rejects_mismatched_precisions(incubating_client_async: SimpleCacheClientIncubating, cache_name: str):
+    first, second = uuid_str(), uuid_str()
+    await incubating_client_async.hll_add_many(cache_name, first, "a", precision=10)
+    await incubating_client_async.hll_add_many(cache_name, second, "a", precision=11)
+    with pytest.raises(InvalidArgumentError):
+        await incubating_client_async.hll_count(cache_name, first, second)
+    with pytest.raises(InvalidArgumentError):
+        await incubating_client_async.hll_add_many(cache_name, first, "a", precision=20)
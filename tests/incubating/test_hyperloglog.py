@@ -0,0 +1,52 @@
+import pytest
+
+from momento.errors import ClientSdkError, InvalidArgumentError
+from momento.incubating._utilities._hyperloglog import _HyperLogLog, _merge_all
+
+
+def test_round_trip():
+    sketch = _HyperLogLog.empty(10)
+    sketch.add_many([b"a", b"b"])
+    decoded = _HyperLogLog.decode(sketch.encode())
+    assert (decoded.precision, decoded.registers) == (10, sketch.registers)
+    assert len(sketch.encode()) == 6 + 1024
+
+
+def test_add_many_reports_changed_registers():
+    sketch = _HyperLogLog.empty(14)
+    assert sketch.add_many([b"a", b"b"]) == 2
+    assert sketch.add_many([b"a", b"b"]) == 0
+
+
+@pytest.mark.parametrize("count", [0, 1, 100, 10_000, 100_000])
+def test_count_is_close(count):
+    sketch = _HyperLogLog.empty(14)
+    sketch.add_many(f"id{i}".encode() for i in range(count))
+    sketch.add_many(f"id{i}".encode() for i in range(count // 2))
+    assert abs(sketch.count() - count) <= 0.03 * count
+
+
+def test_merge_counts_the_union():
+    first, second = _HyperLogLog.empty(12), _HyperLogLog.empty(12)
+    first.add_many(f"id{i}".encode() for i in range(6000))
+    second.add_many(f"id{i}".encode() for i in range(4000, 10_000))
+    merged = _merge_all([first, second])
+    assert abs(merged.count() - 10_000) <= 0.05 * 10_000
+    assert abs(first.count() - 6000) <= 0.05 * 6000
+
+
+def test_rejects_merging_different_precisions():
+    with pytest.raises(InvalidArgumentError):
+        _HyperLogLog.empty(12).merge(_HyperLogLog.empty(13))
+
+
+@pytest.mark.parametrize("precision", [3, 17, 14.0])
+def test_rejects_bad_precision(precision):
+    with pytest.raises(InvalidArgumentError):
+        _HyperLogLog.empty(precision)
+
+
+@pytest.mark.parametrize("blob", [b"", b"MHLL\x01", b"XXXX\x01\x04" + bytes(16), b"MHLL\x01\x04" + bytes(15)])
+def test_rejects_corrupt_blob(blob):
+    with pytest.raises(ClientSdkError):
+        _HyperLogLog.decode(blob)
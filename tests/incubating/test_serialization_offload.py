@@ -0,0 +1,94 @@
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterator, TypeVar
+
+import pytest
+
+from momento.errors import InvalidArgumentError
+from momento.incubating.aio.simple_cache_client import SimpleCacheClientIncubating
+from tests.utils import uuid_str
+
+_T = TypeVar("_T")
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=2)
+        self.submitted = 0
+
+    def submit(self, fn: Callable[..., _T], *args: object, **kwargs: object) -> "Future[_T]":
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+@pytest.fixture
+def executor() -> Iterator[CountingExecutor]:
+    with CountingExecutor() as executor:
+        yield executor
+
+
+async def test_offloads_payloads_above_threshold(
+    incubating_client_async: SimpleCacheClientIncubating,
+    executor: CountingExecutor,
+    auth_token: str,
+    default_ttl_seconds: int,
+    cache_name: str,
+    local_credentials: bool,
+):
+    # `incubating_client_async` makes sure the test cache exists.
+    dictionary_name = uuid_str()
+    small = {"key": "value"}
+    large = {f"key{i}": "value" * 100 for i in range(100)}
+    async with SimpleCacheClientIncubating(
+        auth_token,
+        default_ttl_seconds,
+        local_credentials=local_credentials,
+        serialization_executor=executor,
+        serialization_offload_threshold_bytes=10_000,
+    ) as client:
+        await client.dictionary_set_multi(cache_name, dictionary_name, small, refresh_ttl=False)
+        assert executor.submitted == 0
+
+        await client.dictionary_set_multi(cache_name, dictionary_name, large, refresh_ttl=False)
+        assert (await client.dictionary_get_all(cache_name, dictionary_name)).value() == {**small, **large}
+        # Decoding the small dictionary stays on the loop; encoding the merged one and decoding it are offloaded.
+        assert executor.submitted == 2
+
+        await client.set(cache_name, dictionary_name, "é" * 10_000)
+        get_response = await client.get(cache_name, dictionary_name)
+        assert await client.decode_value(get_response) == "é" * 10_000
+        assert executor.submitted == 3
+        assert get_response.value() is get_response.value()
+
+
+async def test_decodes_in_process_pool(
+    incubating_client_async: SimpleCacheClientIncubating,
+    auth_token: str,
+    default_ttl_seconds: int,
+    cache_name: str,
+    local_credentials: bool,
+):
+    dictionary_names = [uuid_str() for _ in range(4)]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        async with SimpleCacheClientIncubating(
+            auth_token,
+            default_ttl_seconds,
+            local_credentials=local_credentials,
+            serialization_executor=executor,
+            serialization_offload_threshold_bytes=0,
+        ) as client:
+            for dictionary_name in dictionary_names:
+                await client.dictionary_set(cache_name, dictionary_name, "name", dictionary_name, refresh_ttl=False)
+            get_all_many_response = await client.dictionary_get_all_many(cache_name, *dictionary_names)
+            assert get_all_many_response.values() == [{"name": dictionary_name} for dictionary_name in dictionary_names]
+            get_response = await client.get(cache_name, dictionary_names[0])
+            assert await client.decode_value(get_response) == get_response.value_as_bytes().decode("utf-8")
+
+
+def test_rejects_negative_threshold(auth_token: str, default_ttl_seconds: int, local_credentials: bool):
+    with pytest.raises(InvalidArgumentError):
+        SimpleCacheClientIncubating(
+            auth_token,
+            default_ttl_seconds,
+            local_credentials=local_credentials,
+            serialization_offload_threshold_bytes=-1,
+        )
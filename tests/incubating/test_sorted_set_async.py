@@ -0,0 +1,62 @@
+import pytest
+
+from momento.cache_operation_types import CacheGetStatus
+from momento.errors import InvalidArgumentError
+from momento.incubating.aio.simple_cache_client import SimpleCacheClientIncubating
+from tests.utils import uuid_str
+
+
+async def test_sorted_set_missing(incubating_client_async: SimpleCacheClientIncubating, cache_name: str):
+    sorted_set_name = uuid_str()
+    rank_response = await incubating_client_async.zrank(cache_name, sorted_set_name, "alice")
+    assert rank_response.status() == CacheGetStatus.MISS
+    assert rank_response.rank() is None
+    assert (await incubating_client_async.zrange_by_score(cache_name, sorted_set_name)).items() == []
+    assert (await incubating_client_async.ztop(cache_name, sorted_set_name, 3)).items() == []
+
+
+async def test_zadd_many_and_zrank(incubating_client_async: SimpleCacheClientIncubating, cache_name: str):
+    sorted_set_name = uuid_str()
+    response = await incubating_client_async.zadd_many(cache_name, sorted_set_name, {"alice": 10, b"bob": 20.5})
+    assert response.sorted_set_name() == sorted_set_name
+    assert response.scores() == {"alice": 10, "bob": 20.5}
+    await incubating_client_async.zadd_many(cache_name, sorted_set_name, {"carol": 15, "alice": 30})
+
+    rank_response = await incubating_client_async.zrank(cache_name, sorted_set_name, "alice")
+    assert rank_response.status() == CacheGetStatus.HIT
+    assert (rank_response.rank(), rank_response.score()) == (2, 30)
+    rank_response = await incubating_client_async.zrank(cache_name, sorted_set_name, b"carol", descending=True)
+    assert (rank_response.rank(), rank_response.score()) == (2, 15)
+    assert (await incubating_client_async.zrank(cache_name, sorted_set_name, "dave")).rank() is None
+
+
+async def test_zrange_by_score(incubating_client_async: SimpleCacheClientIncubating, cache_name: str):
+    sorted_set_name = uuid_str()
+    await incubating_client_async.zadd_many(cache_name, sorted_set_name, {f"player{i}": i for i in range(10)})
+
+    response = await incubating_client_async.zrange_by_score(cache_name, sorted_set_name, 2, 5)
+    assert response.items() == [("player2", 2), ("player3", 3), ("player4", 4), ("player5", 5)]
+    assert response.members_as_bytes() == [b"player2", b"player3", b"player4", b"player5"]
+    assert response.scores() == [2, 3, 4, 5]
+
+    response = await incubating_client_async.zrange_by_score(cache_name, sorted_set_name, 2, 5, offset=1, count=2)
+    assert response.members() == ["player3", "player4"]
+    response = await incubating_client_async.zrange_by_score(
+        cache_name, sorted_set_name, 2, 5, offset=1, count=2, descending=True
+    )
+    assert response.members() == ["player4", "player3"]
+    response = await incubating_client_async.zrange_by_score(cache_name, sorted_set_name, 8, offset=5)
+    assert response.items() == []
+
+    response = await incubating_client_async.ztop(cache_name, sorted_set_name, 3)
+    assert response.items() == [("player9", 9), ("player8", 8), ("player7", 7)]
+    assert (await incubating_client_async.ztop(cache_name, sorted_set_name, 20)).scores() == list(range(9, -1, -1))
+
+
+async def test_sorted_set_rejects_bad_arguments(incubating_client_async: SimpleCacheClientIncubating, cache_name: str):
+    with pytest.raises(InvalidArgumentError):
+        await incubating_client_async.zadd_many(cache_name, uuid_str(), {"alice": float("nan")})
+    with pytest.raises(InvalidArgumentError):
+        await incubating_client_async.zrange_by_score(cache_name, uuid_str(), offset=-1)
+    with pytest.raises(InvalidArgumentError):
+        await incubating_client_async.ztop(cache_name, uuid_str(), -1)
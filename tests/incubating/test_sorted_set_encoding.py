@@ -0,0 +1,66 @@
+import math
+import random
+
+import pytest
+
+from momento.errors import ClientSdkError, InvalidArgumentError
+from momento.incubating._utilities._sorted_set_encoding import (
+    _SortedSetView,
+    _validate_scores,
+    decode_sorted_set,
+    encode_sorted_set,
+)
+
+SCORES = {b"carol": 3.0, b"alice": 1.0, b"dave": 3.0, b"": -math.inf, b"bob": 2.5}
+RANKED = [(b"", -math.inf), (b"alice", 1.0), (b"bob", 2.5), (b"carol", 3.0), (b"dave", 3.0)]
+
+
+def test_round_trip():
+    assert decode_sorted_set(encode_sorted_set(SCORES)) == SCORES
+    assert decode_sorted_set(encode_sorted_set({})) == {}
+
+
+def test_members_are_ranked_by_score_then_member():
+    view = _SortedSetView(encode_sorted_set(SCORES))
+    assert view.items(0, len(view)) == RANKED
+    assert [view.rank(member) for member, _ in RANKED] == [0, 1, 2, 3, 4]
+    assert view.rank(b"erin") is None
+    assert view.rank(b"b") is None
+
+
+def test_slices():
+    view = _SortedSetView(encode_sorted_set(SCORES))
+    assert view.items(1, 3) == RANKED[1:3]
+    assert view.items(3, 5) == RANKED[3:5]
+    assert view.items(2, 2) == []
+    assert [view.member(rank) for rank in range(5)] == [member for member, _ in RANKED]
+
+
+@pytest.mark.parametrize(
+    "min_score, max_score, expected",
+    [(-math.inf, math.inf, (0, 5)), (2.5, 3.0, (2, 5)), (1.5, 2.0, (2, 2)), (4, 5, (5, 5)), (3, 1, (3, 3))],
+)
+def test_ranks_by_score(min_score, max_score, expected):
+    assert _SortedSetView(encode_sorted_set(SCORES)).ranks_by_score(min_score, max_score) == expected
+
+
+def test_large_sorted_set():
+    random.seed(7)
+    scores = {f"member{i}".encode(): float(random.randint(0, 100)) for i in range(5000)}
+    ranked = sorted(scores.items(), key=lambda item: (item[1], item[0]))
+    view = _SortedSetView(encode_sorted_set(scores))
+    assert all(view.rank(member) == rank for rank, (member, _) in enumerate(ranked))
+    start, stop = view.ranks_by_score(10, 20)
+    assert view.items(start, stop) == [item for item in ranked if 10 <= item[1] <= 20]
+
+
+@pytest.mark.parametrize("blob", [b"", b"XXXX\x01\x00\x00\x00\x00", encode_sorted_set(SCORES)[:-1]])
+def test_rejects_corrupt_blob(blob):
+    with pytest.raises(ClientSdkError):
+        _SortedSetView(blob)
+
+
+@pytest.mark.parametrize("score", [math.nan, "1"])
+def test_rejects_bad_scores(score):
+    with pytest.raises(InvalidArgumentError):
+        _validate_scores({b"a": score})
@@ -4,7 +4,12 @@ import grpc.aio
 import pytest
 
 from momento.errors import AuthenticationError, InvalidArgumentError
-from src.momento.aio._add_header_client_interceptor import sanitize_client_call_details
+from src.momento.aio._add_header_client_interceptor import (
+    AddHeaderClientInterceptor,
+    Header,
+    StaticHeaders,
+    sanitize_client_call_details,
+)
 
 
 def test_sanitize_client_grpc_request():
@@ -76,3 +81,17 @@ def test_sanitize_client_grpc_request():
                 sanitize_client_call_details(test.client_input)
         else:
             assert sanitize_client_call_details(test.client_input).metadata == test.expected_output.metadata
+
+
+def test_static_headers(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(AddHeaderClientInterceptor, "are_only_once_headers_sent", False)
+    headers = StaticHeaders([Header("authorization", "token"), Header("agent", "python:test")])
+
+    assert list(headers.metadata("cache-1")) == [
+        ("cache", "cache-1"),
+        ("authorization", "token"),
+        ("agent", "python:test"),
+    ]
+    assert list(headers.metadata("cache-2")) == [("cache", "cache-2"), ("authorization", "token")]
+    # The agent header has been sent, so the interceptor of the control plane does not send it again.
+    assert AddHeaderClientInterceptor.are_only_once_headers_sent
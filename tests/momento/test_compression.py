@@ -0,0 +1,134 @@
+import json
+import zlib
+
+import pytest
+
+from momento._utilities._value_compression import _ValueCompressor
+from momento.aio.simple_cache_client import SimpleCacheClient
+from momento.compression import (
+    MAX_BUILT_IN_CODEC_ID,
+    Codec,
+    Compression,
+    CompressionStats,
+    GzipCodec,
+    ZlibCodec,
+)
+from momento.errors import ClientSdkError, InvalidArgumentError
+from tests.utils import uuid_str
+
+JSON_VALUE = json.dumps([{"id": i, "name": f"user-{i}", "active": True} for i in range(500)]).encode()
+
+
+class ReversingCodec(Codec):
+    codec_id = 200
+
+    def compress(self, data: bytes) -> bytes:
+        return zlib.compress(data)[::-1]
+
+    def decompress(self, data: bytes) -> bytes:
+        return zlib.decompress(data[::-1])
+
+
+@pytest.mark.parametrize("codec", [ZlibCodec(), GzipCodec(level=9), ReversingCodec()])
+def test_round_trip(codec: Codec):
+    compressor = _ValueCompressor(Compression(codec))
+    compressed = compressor.compress(JSON_VALUE)
+    assert compressed[:4] == b"\xffMZ" + bytes([codec.codec_id])
+    assert len(compressed) < len(JSON_VALUE) / 4
+    assert compressor.decompress(compressed) == JSON_VALUE
+
+
+def test_reads_values_of_any_known_codec():
+    written = _ValueCompressor(Compression(GzipCodec())).compress(JSON_VALUE)
+    assert _ValueCompressor(Compression(ZlibCodec())).decompress(written) == JSON_VALUE
+
+    written = _ValueCompressor(Compression(ReversingCodec())).compress(JSON_VALUE)
+    with pytest.raises(ClientSdkError):
+        _ValueCompressor(Compression()).decompress(written)
+    assert _ValueCompressor(Compression(extra_codecs=[ReversingCodec()])).decompress(written) == JSON_VALUE
+
+
+def test_small_and_incompressible_values_are_stored_as_they_are():
+    compressor = _ValueCompressor(Compression(threshold_bytes=100))
+    assert compressor.compress(b"x" * 99) == b"x" * 99
+    incompressible = bytes(range(256))
+    assert compressor.compress(incompressible) == incompressible
+    assert compressor.decompress(b"plain") == b"plain"
+    assert compressor.decompress(b"\xffM") == b"\xffM"
+
+
+@pytest.mark.parametrize("value", [b"\xffMZ", b"\xffMZ\x01not zlib", b"\xffMZ\x00"])
+def test_uncompressed_values_that_look_compressed_are_escaped(value: bytes):
+    compressor = _ValueCompressor(Compression(threshold_bytes=1000))
+    stored = compressor.compress(value)
+    assert stored != value
+    assert compressor.decompress(stored) == value
+
+
+def test_rejects_corrupt_value():
+    with pytest.raises(ClientSdkError):
+        _ValueCompressor(Compression()).decompress(b"\xffMZ\x01not zlib")
+
+
+def test_stats():
+    compressor = _ValueCompressor(Compression(threshold_bytes=100))
+    assert compressor.stats() == CompressionStats(0, 0, 0, 0, 0.0, 0, 0.0)
+    assert compressor.stats().compression_ratio() == 1.0
+
+    compressed = compressor.compress(JSON_VALUE)
+    compressor.compress(b"small")
+    compressor.decompress(compressed)
+    stats = compressor.stats()
+    assert (stats.values_compressed, stats.values_not_compressed, stats.values_decompressed) == (1, 1, 1)
+    assert (stats.bytes_before_compression, stats.bytes_after_compression) == (len(JSON_VALUE), len(compressed))
+    assert stats.compression_ratio() == len(JSON_VALUE) / len(compressed)
+    assert stats.compress_cpu_seconds >= 0 and stats.decompress_cpu_seconds >= 0
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"threshold_bytes": -1},
+        {"codec": ReversingCodec(), "extra_codecs": [type("Clash", (ReversingCodec,), {})()]},
+        {"extra_codecs": [type("Clash", (ReversingCodec,), {"codec_id": 1})()]},
+        {"codec": type("Invalid", (ReversingCodec,), {"codec_id": 256})()},
+    ],
+)
+def test_rejects_bad_settings(kwargs):
+    with pytest.raises(InvalidArgumentError):
+        Compression(**kwargs)
+
+
+@pytest.mark.parametrize("codec_id", [3, MAX_BUILT_IN_CODEC_ID])
+def test_rejects_reserved_codec_ids(codec_id):
+    with pytest.raises(InvalidArgumentError, match="reserved"):
+        Compression(type("Reserved", (ReversingCodec,), {"codec_id": codec_id})())
+    with pytest.raises(InvalidArgumentError, match="reserved"):
+        Compression(extra_codecs=[type("Reserved", (ReversingCodec,), {"codec_id": codec_id})()])
+
+
+async def test_client_compresses_values(
+    client_async: SimpleCacheClient, auth_token: str, cache_name: str, default_ttl_seconds: int, local_credentials: bool
+):
+    key = uuid_str()
+    async with SimpleCacheClient(
+        auth_token,
+        default_ttl_seconds,
+        local_credentials=local_credentials,
+        compression=Compression(threshold_bytes=1024),
+    ) as compressing_client:
+        set_response = await compressing_client.set(cache_name, key, JSON_VALUE)
+        assert set_response.value_as_bytes() == JSON_VALUE
+        assert (await compressing_client.get(cache_name, key)).value_as_bytes() == JSON_VALUE
+
+        # Clients without compression see the stored value.
+        stored = (await client_async.get(cache_name, key)).value_as_bytes()
+        assert stored is not None and stored.startswith(b"\xffMZ\x01") and len(stored) < len(JSON_VALUE)
+
+        # Values stored without compression are read as they are.
+        await client_async.set(cache_name, key, "plain")
+        assert (await compressing_client.get(cache_name, key)).value() == "plain"
+
+        stats = compressing_client.compression_stats()
+        assert stats is not None and (stats.values_compressed, stats.values_decompressed) == (1, 1)
+    assert client_async.compression_stats() is None
@@ -0,0 +1,90 @@
+import asyncio
+from typing import Iterator, List, Optional, Tuple
+
+import grpc
+import pytest
+
+from momento import errors
+from momento._utilities._deadlines import bounded_timeout
+from momento.aio._retry_interceptor import RetryInterceptor
+from momento.deadlines import deadline, remaining_seconds
+
+
+class _Call:
+    def __init__(self, code: grpc.StatusCode):
+        self._code = code
+
+    async def code(self) -> grpc.StatusCode:
+        return self._code
+
+    def __await__(self) -> Iterator[None]:
+        return
+        yield
+
+
+def test_nested_deadlines_cannot_outlast_outer_ones():
+    assert remaining_seconds() is None
+    with deadline(1):
+        with deadline(10):
+            remaining = remaining_seconds()
+            assert remaining is not None and 0.9 < remaining <= 1
+        with deadline(0.5):
+            remaining = remaining_seconds()
+            assert remaining is not None and remaining <= 0.5
+    assert remaining_seconds() is None
+
+
+def test_bounded_timeout():
+    assert bounded_timeout(5.0) == 5.0
+    assert bounded_timeout(None) is None
+    with deadline(1):
+        assert bounded_timeout(5.0) <= 1
+        assert bounded_timeout(0.1) == 0.1
+        timeout = bounded_timeout(None)
+        assert timeout is not None and timeout <= 1
+    with deadline(0):
+        with pytest.raises(errors.TimeoutError):
+            bounded_timeout(5.0)
+
+
+def test_negative_deadline():
+    with pytest.raises(errors.InvalidArgumentError):
+        with deadline(-1):
+            pass
+
+
+async def _intercept(
+    server_delay_seconds: float, codes: List[grpc.StatusCode]
+) -> Tuple[grpc.StatusCode, List[Optional[float]]]:
+    """Makes a request through the retry interceptor, and returns its status and the timeout of every attempt."""
+    timeouts: List[Optional[float]] = []
+
+    async def server(call_details: grpc.aio.ClientCallDetails, request: bytes) -> _Call:
+        timeouts.append(call_details.timeout)
+        await asyncio.sleep(server_delay_seconds)
+        return _Call(codes.pop(0))
+
+    call_details = grpc.aio.ClientCallDetails(b"/cache_client.Scs/Get", 5.0, grpc.aio.Metadata(), None, None)
+    call = await RetryInterceptor().intercept_unary_unary(server, call_details, b"")
+    return await call.code(), timeouts
+
+
+async def test_retries_get_the_remaining_budget():
+    with deadline(1):
+        code, timeouts = await _intercept(0.0, [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.OK])
+
+    assert code == grpc.StatusCode.OK
+    first, second = timeouts
+    assert first is not None and second is not None
+    assert second < first <= 1
+
+
+async def test_no_retries_once_the_budget_is_used_up():
+    with deadline(0.01):
+        code, timeouts = await _intercept(0.02, [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.OK])
+
+    assert (code, len(timeouts)) == (grpc.StatusCode.UNAVAILABLE, 1)
+
+
+async def test_attempts_keep_their_timeout_without_a_budget():
+    assert await _intercept(0.0, [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.OK]) == (grpc.StatusCode.OK, [5.0, 5.0])
@@ -0,0 +1,48 @@
+import pytest
+
+from momento.cache_operation_types import (
+    CacheGetMultiResponse,
+    CacheGetResponse,
+    CacheGetStatus,
+)
+
+
+def _response() -> CacheGetMultiResponse:
+    return CacheGetMultiResponse._from_columns([b"a", b"b", "ü".encode("utf-8")], [b"1", None, "ñ".encode("utf-8")])
+
+
+def test_columns():
+    response = _response()
+    assert response.status() == [CacheGetStatus.HIT, CacheGetStatus.MISS, CacheGetStatus.HIT]
+    assert response.values_as_bytes() == [b"1", None, "ñ".encode("utf-8")]
+    assert response.values() == ["1", None, "ñ"]
+    assert [r.value() for r in response.to_list()] == ["1", None, "ñ"]
+
+
+def test_by_key():
+    response = _response()
+    assert response.by_key("ü").value() == "ñ"
+    assert response.by_key(b"a").value_as_bytes() == b"1"
+    assert response.by_key("b").status() == CacheGetStatus.MISS
+    with pytest.raises(KeyError):
+        response.by_key("c")
+
+
+def test_values_are_decoded_lazily():
+    response = CacheGetMultiResponse._from_columns([b"a", b"b"], [b"1", b"\xff"])
+    assert response.by_key("a").value() == "1"
+    with pytest.raises(UnicodeDecodeError):
+        response.values()
+
+
+def test_from_responses():
+    responses = [CacheGetResponse(b"1", CacheGetStatus.HIT), CacheGetResponse(b"", CacheGetStatus.MISS)]
+    response = CacheGetMultiResponse(responses, [b"a", b"b"])
+    assert response.values() == ["1", None]
+    assert response.by_key("b").value() is None
+
+
+def test_responses_have_no_instance_dict():
+    with pytest.raises(AttributeError):
+        CacheGetResponse(b"1", CacheGetStatus.HIT).extra = 1  # type: ignore[attr-defined]
+    assert not hasattr(_response(), "__dict__")
@@ -0,0 +1,43 @@
+import logging
+
+import pytest
+
+from momento import logs
+from momento._utilities._request_hooks import _RequestHooks
+from momento.hooks import RequestHook
+
+
+def test_no_hooks_without_trace_logging():
+    assert _RequestHooks([]).start("get", "cache", b"key") is None
+
+
+def test_trace_logging_hook(caplog: pytest.LogCaptureFixture):
+    # Clients created before TRACE logging is enabled log their requests too.
+    hooks = _RequestHooks([])
+    with caplog.at_level(logs.TRACE, logger=logs.logger.name):
+        get_request = hooks.start("get", "cache", b"key")
+        assert get_request is not None
+        get_request.succeeded(3)
+        set_request = hooks.start("set", "cache", b"key", 3)
+        assert set_request is not None
+        set_request.failed(ValueError("boom"))
+    assert hooks.start("get", "cache", b"key") is None
+
+    assert [record.getMessage().split(" in ")[0] for record in caplog.records] == [
+        "Issuing a get request with key b'key'",
+        "get succeeded for key b'key'",
+        "Issuing a set request with key b'key'",
+        "set failed for b'key' with response: boom",
+    ]
+
+
+def test_failing_hooks_are_logged(caplog: pytest.LogCaptureFixture):
+    class FailingHook(RequestHook):
+        def on_success(self, request: object, duration_seconds: float, response_bytes: int) -> None:
+            raise ValueError("boom")
+
+    request = _RequestHooks([FailingHook()]).start("get", "cache", b"key")
+    assert request is not None
+    with caplog.at_level(logging.WARNING, logger=logs.logger.name):
+        request.succeeded()
+    assert "boom" in caplog.text
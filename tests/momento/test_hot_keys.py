@@ -0,0 +1,83 @@
+import random
+from collections import Counter
+from typing import List
+
+import pytest
+
+from momento import errors
+from momento._utilities._hot_keys import _HotKeyTracker, _SpaceSaving
+from momento.hooks import RequestInfo
+from momento.hot_keys import HotKey, HotKeyTracking
+
+
+def test_space_saving_finds_heavy_hitters():
+    rng = random.Random(7)
+    stream = [f"hot-{i}" for i in range(5) for _ in range(2000)] + [
+        f"cold-{rng.randrange(50_000)}" for _ in range(40_000)
+    ]
+    rng.shuffle(stream)
+    sketch: _SpaceSaving[str] = _SpaceSaving(100)
+    for key in stream:
+        sketch.add(key)
+
+    assert len(sketch) <= 200
+    top = sketch.top(5)
+    assert sorted(key for key, _, _ in top) == [f"hot-{i}" for i in range(5)]
+    actual = Counter(stream)
+    for key, count, error in top:
+        assert count - error <= actual[key] <= count
+
+
+def _request(operation: str, key: bytes, start_time: float) -> RequestInfo:
+    return RequestInfo(operation, "cache", key, 0, start_time)
+
+
+def test_tracker_reports_every_interval():
+    reports: List[List[HotKey]] = []
+    tracker = _HotKeyTracker(HotKeyTracking(top_k=2, report_interval_seconds=10, on_report=reports.append))
+    for i in range(30):
+        tracker.on_start(_request("get", b"hot", i * 0.1))
+        tracker.on_start(_request("set" if i % 3 else "delete", b"warm", i * 0.1))
+    tracker.on_start(_request("get", b"cold", 1.0))
+
+    assert [(key.key, key.requests) for key in tracker.hot_keys(now=2.0)] == [(b"hot", 30), (b"warm", 20)]
+    assert tracker.hot_keys(now=2.0)[0].requests_per_second == 15.0
+    assert reports == []
+
+    tracker.on_start(_request("get", b"next", 12.0))
+
+    (report,) = reports
+    assert [(key.cache_name, key.key, key.requests, key.max_error) for key in report] == [
+        ("cache", b"hot", 30, 0),
+        ("cache", b"warm", 20, 0),
+    ]
+    assert report[0].requests_per_second == 2.5
+    assert [key.key for key in tracker.hot_keys(now=13.0)] == [b"next"]
+
+
+def test_tracker_logs_reports(caplog: pytest.LogCaptureFixture):
+    tracker = _HotKeyTracker(HotKeyTracking(report_interval_seconds=1))
+    tracker.on_start(_request("get", b"key", 0.0))
+    with caplog.at_level("INFO", logger="momentosdk"):
+        tracker.on_start(_request("get", b"key", 2.0))
+
+    assert [record.getMessage() for record in caplog.records] == ["Hot keys: cache/b'key' 0.5/s"]
+
+
+def test_sampled_counts_are_scaled():
+    tracker = _HotKeyTracker(HotKeyTracking(sample_ratio=0.5))
+    random.seed(1)
+    for _ in range(10_000):
+        tracker.on_start(_request("get", b"key", 0.0))
+
+    (hot_key,) = tracker.hot_keys(now=1.0)
+    assert hot_key.requests == pytest.approx(10_000, rel=0.05)
+
+
+@pytest.mark.parametrize(
+    "arguments",
+    [{"top_k": 0}, {"top_k": 10, "capacity": 5}, {"sample_ratio": 0.0}, {"report_interval_seconds": 0}],
+)
+def test_invalid_tracking(arguments: dict):
+    with pytest.raises(errors.InvalidArgumentError):
+        HotKeyTracking(**arguments)
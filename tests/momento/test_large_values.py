@@ -0,0 +1,96 @@
+import asyncio
+import zlib
+
+import pytest
+
+from momento._utilities._large_values import _LargeValueManifest
+from momento.aio.simple_cache_client import SimpleCacheClient
+from momento.cache_operation_types import CacheGetStatus
+from momento.errors import ClientSdkError
+from tests.utils import uuid_str
+
+VALUE = bytes(range(256)) * 40
+
+
+def test_manifest_round_trip():
+    manifest = _LargeValueManifest.for_value(VALUE, 4000)
+    assert manifest.chunk_count == 3
+    chunks = [VALUE[:4000], VALUE[4000:8000], VALUE[8000:]]
+    assert list(manifest.checksums) == [zlib.crc32(chunk) for chunk in chunks]
+
+    decoded = _LargeValueManifest.decode(manifest.encode())
+    assert decoded is not None
+    assert (decoded.generation, decoded.chunk_size, decoded.value_size) == (manifest.generation, 4000, len(VALUE))
+    assert decoded.checksums == manifest.checksums
+    assert decoded.chunk_bounds(2) == (8000, len(VALUE))
+    assert _LargeValueManifest.decode(b"plain value") is None
+
+
+def test_manifest_generations_differ():
+    assert (
+        _LargeValueManifest.for_value(VALUE, 4000).generation != _LargeValueManifest.for_value(VALUE, 4000).generation
+    )
+
+
+def test_rejects_corrupt_manifest_and_chunks():
+    manifest = _LargeValueManifest.for_value(VALUE, 4000)
+    with pytest.raises(ClientSdkError):
+        _LargeValueManifest.decode(manifest.encode()[:-4])
+    with pytest.raises(ClientSdkError):
+        manifest.verify_chunk(0, VALUE[1:4001])
+    with pytest.raises(ClientSdkError):
+        manifest.verify_chunk(2, VALUE[8000:-1])
+
+
+async def _manifest(client: SimpleCacheClient, cache_name: str, key: str) -> _LargeValueManifest:
+    blob = (await client.get(cache_name, key)).value_as_bytes()
+    assert blob is not None
+    manifest = _LargeValueManifest.decode(blob)
+    assert manifest is not None
+    return manifest
+
+
+async def test_deletes_previous_chunks(client_async: SimpleCacheClient, cache_name: str):
+    key = uuid_str()
+    await client_async.set_large(cache_name, key, VALUE, chunk_size_bytes=4000)
+    previous = await _manifest(client_async, cache_name, key)
+    await client_async.set_large(cache_name, key, VALUE, chunk_size_bytes=4000)
+
+    for index in range(previous.chunk_count):
+        chunk_response = await client_async.get(cache_name, previous.chunk_key(key.encode(), index))
+        assert chunk_response.status() == CacheGetStatus.MISS
+    assert (await client_async.get_large(cache_name, key)).value_as_bytes() == VALUE
+
+
+async def test_missing_chunk_is_a_miss(client_async: SimpleCacheClient, cache_name: str):
+    key = uuid_str()
+    await client_async.set_large(cache_name, key, VALUE, chunk_size_bytes=4000)
+    manifest = await _manifest(client_async, cache_name, key)
+    await client_async.delete(cache_name, manifest.chunk_key(key.encode(), 1))
+    assert (await client_async.get_large(cache_name, key)).status() == CacheGetStatus.MISS
+
+
+async def test_corrupt_chunk_raises(client_async: SimpleCacheClient, cache_name: str):
+    key = uuid_str()
+    await client_async.set_large(cache_name, key, VALUE, chunk_size_bytes=4000)
+    manifest = await _manifest(client_async, cache_name, key)
+    await client_async.set(cache_name, manifest.chunk_key(key.encode(), 1), bytes(4000))
+    with pytest.raises(ClientSdkError):
+        await client_async.get_large(cache_name, key)
+
+
+async def test_readers_never_see_a_torn_value(client_async: SimpleCacheClient, cache_name: str):
+    key = uuid_str()
+    values = [bytes([i]) * 10_000 for i in range(4)]
+    await client_async.set_large(cache_name, key, values[0], chunk_size_bytes=1000)
+
+    async def write() -> None:
+        for value in values[1:]:
+            await client_async.set_large(cache_name, key, value, chunk_size_bytes=1000, max_concurrency=2)
+
+    async def read() -> None:
+        for _ in range(10):
+            value = (await client_async.get_large(cache_name, key, max_concurrency=2)).value_as_bytes()
+            assert value in values
+
+    await asyncio.gather(write(), read(), read())
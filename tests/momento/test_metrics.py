@@ -0,0 +1,112 @@
+import pytest
+
+from momento import errors
+from momento._utilities._client_metrics import (
+    _bucket_index,
+    _bucket_upper_bound,
+    _ClientMetrics,
+    _LatencyHistogram,
+)
+from momento.compression import CompressionStats
+from momento.hooks import RequestInfo
+from momento.metrics import (
+    HistogramSnapshot,
+    MetricsSnapshot,
+    OperationMetrics,
+    prometheus_text,
+    statsd_lines,
+)
+
+
+def test_buckets_are_contiguous_and_precise():
+    for micros in list(range(5000)) + [2**20 + 12345, 2**29 + 1]:
+        index = _bucket_index(micros)
+        assert micros <= _bucket_upper_bound(index)
+        assert index == 0 or _bucket_upper_bound(index - 1) < micros
+        assert _bucket_upper_bound(index) - micros <= micros / 16
+
+
+def test_histogram_percentiles():
+    histogram = _LatencyHistogram()
+    for millis in range(1, 101):
+        histogram.record(millis / 1000)
+    snapshot = histogram.snapshot()
+
+    assert snapshot.count == 100
+    assert snapshot.sum_seconds == pytest.approx(5.05)
+    assert (snapshot.min_seconds, snapshot.max_seconds) == (0.001, 0.1)
+    assert snapshot.percentile(50) == pytest.approx(0.050, rel=1 / 16)
+    assert snapshot.percentile(99) == pytest.approx(0.099, rel=1 / 16)
+    assert snapshot.percentile(100) == 0.1
+    assert snapshot.cumulative_counts([0.0005, 0.0095, 1.0]) == [0, 9, 100]
+
+
+def test_client_metrics():
+    metrics = _ClientMetrics(2, lambda: None)
+    get = RequestInfo("get", "cache", b"key", 0, 0.0, channel=1)
+    set_request = RequestInfo("set", "cache", b"key", 10, 0.0)
+    metrics.on_start(get)
+    metrics.on_start(set_request)
+    assert metrics.snapshot().in_flight == [1, 1]
+
+    get.hit = True
+    metrics.on_success(get, 0.002, 5)
+    metrics.on_success(set_request, 0.001, 0)
+    get.hit = False
+    metrics.on_start(get)
+    metrics.on_success(get, 0.003, 0)
+    metrics.on_start(get)
+    metrics.on_error(get, 0.5, errors.TimeoutError("timed out"))
+    metrics.record_retry("/cache_client.Scs/Get")
+    snapshot = metrics.snapshot()
+
+    assert snapshot.in_flight == [0, 0]
+    assert snapshot.retries == {"get": 1}
+    gets = snapshot.operation("get", "cache")
+    assert gets is not None
+    assert (gets.hits, gets.misses, gets.successes, gets.errors) == (1, 1, 0, {"TimeoutError": 1})
+    assert (gets.latency.count, gets.response_bytes) == (3, 5)
+    sets = snapshot.operation("set", "cache")
+    assert sets is not None
+    assert (sets.successes, sets.request_bytes) == (1, 10)
+    assert snapshot.operation("delete", "cache") is None
+
+
+def _snapshot(hits: int, errors: int) -> MetricsSnapshot:
+    latency = HistogramSnapshot(hits + errors, 0.5, 0.001, 0.2, [(0.001, hits), (0.2, errors)])
+    gets = OperationMetrics("get", 'my "cache"', latency, 0, hits, 0, {"TimeoutError": errors}, 0, 10)
+    compression = CompressionStats(1, 2, 300, 100, 0.0, 4, 0.0)
+    return MetricsSnapshot([gets], {"get": 1}, [3], compression)
+
+
+def test_prometheus_text():
+    text = prometheus_text(_snapshot(hits=4, errors=1), buckets=[0.01, 1.0])
+
+    assert "# TYPE momento_request_duration_seconds histogram\n" in text
+    labels = 'operation="get",cache="my \\"cache\\""'
+    for line in [
+        f'momento_request_duration_seconds_bucket{{{labels},le="0.01"}} 4',
+        f'momento_request_duration_seconds_bucket{{{labels},le="1.0"}} 5',
+        f'momento_request_duration_seconds_bucket{{{labels},le="+Inf"}} 5',
+        f"momento_request_duration_seconds_sum{{{labels}}} 0.5",
+        f'momento_requests_total{{{labels},outcome="hit"}} 4',
+        f'momento_request_errors_total{{{labels},error="TimeoutError"}} 1',
+        f"momento_response_bytes_total{{{labels}}} 10",
+        'momento_retries_total{operation="get"} 1',
+        'momento_requests_in_flight{channel="0"} 3',
+        "momento_compression_values_compressed_total 1",
+    ]:
+        assert f"{line}\n" in text
+
+
+def test_statsd_lines():
+    lines = statsd_lines(_snapshot(hits=4, errors=1), previous=_snapshot(hits=1, errors=1))
+
+    assert "momento.my__cache_.get.hits:3|c" in lines
+    assert "momento.my__cache_.get.requests:3|c" in lines
+    assert "momento.my__cache_.get.response_bytes:10|c" not in lines
+    assert not any(".errors." in line for line in lines)
+    assert "momento.my__cache_.get.latency.p50:1.000|g" in lines
+    assert "momento.my__cache_.get.latency.max:200.000|g" in lines
+    assert "momento.in_flight.channel0:3|g" in lines
+    assert "momento.retries.get:1|c" in statsd_lines(_snapshot(hits=4, errors=1))
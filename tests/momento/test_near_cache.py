@@ -0,0 +1,209 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from momento import errors
+from momento._utilities._near_cache import _NearCache
+from momento.aio.simple_cache_client import SimpleCacheClient
+from momento.cache_operation_types import CacheGetResponse, CacheGetStatus
+from momento.hooks import RequestInfo
+from momento.metrics import MetricsSnapshot, prometheus_text
+from momento.near_cache import NearCacheStats, NearCaching
+from momento.testing.fake_server import FakeMomentoServer
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+_HIT = CacheGetResponse(b"value", CacheGetStatus.HIT)
+_MISS = CacheGetResponse(b"", CacheGetStatus.MISS)
+
+
+def _near_cache(clock: _Clock, **settings: float) -> _NearCache:
+    return _NearCache(NearCaching(**{"min_reads_per_second": 3, "ttl_seconds": 0.5, **settings}), clock)
+
+
+def _read(near_cache: _NearCache, key: bytes = b"key", response: CacheGetResponse = _HIT) -> bool:
+    """Reads `key` through the near cache, and returns whether it was served from memory."""
+    cached, version = near_cache.get("cache", key)
+    if cached is not None:
+        return True
+    near_cache.put("cache", key, response, version)
+    return False
+
+
+def test_promotes_keys_read_often():
+    clock = _Clock()
+    near_cache = _near_cache(clock)
+
+    assert [_read(near_cache) for _ in range(5)] == [False, False, False, True, True]
+    assert not _read(near_cache, b"other-key")
+    assert near_cache.stats() == NearCacheStats(hits=2, misses=0, promotions=1, demotions=0, invalidations=0, entries=1)
+
+
+def test_keys_stay_promoted_under_steady_load():
+    clock = _Clock()
+    near_cache = _near_cache(clock, ttl_seconds=60)
+    served_from_memory = []
+    for read in range(50):
+        clock.now = read * 0.2
+        served_from_memory.append(_read(near_cache))
+
+    assert served_from_memory == [False] * 3 + [True] * 47
+    stats = near_cache.stats()
+    assert (stats.promotions, stats.demotions) == (1, 0)
+
+
+def test_values_expire():
+    clock = _Clock()
+    near_cache = _near_cache(clock)
+    for _ in range(4):
+        _read(near_cache)
+
+    clock.now = 0.6
+    assert [_read(near_cache) for _ in range(2)] == [False, True]
+    assert near_cache.stats().misses == 1
+
+
+def test_misses_are_not_kept():
+    near_cache = _near_cache(_Clock())
+
+    assert not any(_read(near_cache, response=_MISS) for _ in range(5))
+    assert near_cache.stats().entries == 1
+
+
+def test_demotes_keys_read_less_often():
+    clock = _Clock()
+    near_cache = _near_cache(clock, min_reads_per_second=4)
+    for _ in range(4):
+        _read(near_cache)
+
+    # Two reads a second are enough to stay promoted, but a single one is not.
+    clock.now = 1.0
+    for _ in range(2):
+        _read(near_cache)
+    clock.now = 2.0
+    _read(near_cache)
+    assert near_cache.stats().demotions == 0
+    clock.now = 3.0
+    _read(near_cache)
+    assert near_cache.stats() == NearCacheStats(hits=1, misses=2, promotions=1, demotions=1, invalidations=0, entries=0)
+
+
+def test_idle_windows_demote_keys():
+    clock = _Clock()
+    near_cache = _near_cache(clock)
+    for _ in range(10):
+        _read(near_cache)
+
+    clock.now = 10.0
+    assert not _read(near_cache)
+    assert near_cache.stats().demotions == 1
+
+
+def test_keeps_at_most_max_entries():
+    near_cache = _near_cache(_Clock(), max_entries=1)
+    for key in (b"first", b"second"):
+        for _ in range(4):
+            _read(near_cache, key)
+
+    assert near_cache.stats().entries == 1
+    assert _read(near_cache, b"first")
+    assert not _read(near_cache, b"second")
+
+
+@pytest.mark.parametrize("operation", ["set", "delete"])
+def test_writes_invalidate_their_key(operation: str):
+    near_cache = _near_cache(_Clock())
+    for key in (b"key", b"other-key"):
+        for _ in range(4):
+            _read(near_cache, key)
+
+    near_cache.on_start(RequestInfo(operation, "cache", b"key", 0, 0.0))
+    near_cache.on_start(RequestInfo("get", "cache", b"other-key", 0, 0.0))
+
+    assert not _read(near_cache)
+    assert _read(near_cache)
+    assert _read(near_cache, b"other-key")
+    assert near_cache.stats().invalidations == 1
+
+
+def test_gets_in_flight_during_writes_are_not_kept():
+    near_cache = _near_cache(_Clock())
+    for _ in range(3):
+        _read(near_cache)
+
+    _, version = near_cache.get("cache", b"key")
+    near_cache.invalidate("cache", b"key")
+    near_cache.put("cache", b"key", _HIT, version)
+
+    assert not _read(near_cache)
+    assert _read(near_cache)
+
+
+def test_gets_started_during_writes_are_not_kept():
+    near_cache = _near_cache(_Clock())
+    for _ in range(4):
+        _read(near_cache)
+    write = RequestInfo("set", "cache", b"key", 5, 0.0)
+
+    near_cache.on_start(write)
+    _, version = near_cache.get("cache", b"key")
+    near_cache.on_success(write, 0.1, 0)
+    # The get read the item from before the write.
+    near_cache.put("cache", b"key", _HIT, version)
+
+    assert not _read(near_cache)
+    assert near_cache.stats().invalidations == 1
+
+
+async def test_reads_own_writes_with_overlapping_get():
+    with FakeMomentoServer() as server:
+        near_cache = NearCaching(min_reads_per_second=1, ttl_seconds=60)
+        async with SimpleCacheClient(server.auth_token, 60, local_credentials=True, near_cache=near_cache) as client:
+            await client.create_cache("cache")
+            await client.set("cache", "key", "before")
+            assert (await client.get("cache", "key")).value() == "before"
+
+            # The set waits on the server, while the get that starts after it is served at once.
+            server.latency_seconds = 0.2
+            write = asyncio.ensure_future(client.set("cache", "key", "after"))
+            await asyncio.sleep(0.05)
+            server.latency_seconds = 0.0
+            assert (await client.get("cache", "key")).value() == "before"
+            await write
+
+            assert (await client.get("cache", "key")).value() == "after"
+
+
+def test_invalidate_cache():
+    near_cache = _near_cache(_Clock())
+    for _ in range(4):
+        _read(near_cache)
+
+    near_cache.invalidate_cache("other-cache")
+    assert _read(near_cache)
+    near_cache.invalidate_cache("cache")
+    assert not _read(near_cache)
+
+
+@pytest.mark.parametrize("setting", ["min_reads_per_second", "ttl_seconds", "window_seconds", "max_entries"])
+def test_invalid_settings(setting: str):
+    with pytest.raises(errors.InvalidArgumentError):
+        NearCaching(**{setting: 0})
+
+
+def test_prometheus_text_includes_near_cache():
+    stats = NearCacheStats(hits=5, misses=2, promotions=1, demotions=0, invalidations=3, entries=1)
+    lines: List[str] = prometheus_text(MetricsSnapshot([], {}, [], None, near_cache=stats)).splitlines()
+
+    assert "momento_near_cache_hits_total 5" in lines
+    assert "momento_near_cache_invalidations_total 3" in lines
+    assert "# TYPE momento_near_cache_entries gauge" in lines
+    assert "momento_near_cache_entries 1" in lines
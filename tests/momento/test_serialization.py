@@ -0,0 +1,38 @@
+import pickle
+from datetime import date
+
+import pytest
+
+from momento.serialization import JsonSerializer, PickleSerializer, Serializer
+
+
+class DateSerializer(Serializer[date]):
+    def serialize(self, value: date) -> bytes:
+        return value.isoformat().encode("ascii")
+
+    def deserialize(self, data: bytes) -> date:
+        return date.fromisoformat(data.decode("ascii"))
+
+
+@pytest.mark.parametrize("value", [{"a": [1, 2.5, None, True]}, "ünïcode ✓", [], 0])
+def test_json_round_trip(value: object):
+    serializer = JsonSerializer()
+    data = serializer.serialize(value)
+    assert isinstance(data, bytes)
+    assert serializer.deserialize(data) == value
+
+
+def test_json_reads_any_utf_encoding():
+    assert JsonSerializer().deserialize('{"name": "café"}'.encode("utf-16")) == {"name": "café"}
+
+
+def test_pickle_writes_the_configured_protocol():
+    assert PickleSerializer().serialize({"a"})[1] == 4
+    data = PickleSerializer(protocol=pickle.HIGHEST_PROTOCOL).serialize({"a"})
+    assert data[1] == pickle.HIGHEST_PROTOCOL
+    assert PickleSerializer().deserialize(data) == {"a"}
+
+
+def test_custom_serializer():
+    serializer = DateSerializer()
+    assert serializer.deserialize(serializer.serialize(date(2022, 10, 1))) == date(2022, 10, 1)
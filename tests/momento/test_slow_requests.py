@@ -0,0 +1,97 @@
+from typing import Dict, Iterator, List
+
+import grpc
+import pytest
+
+from momento import errors
+from momento._utilities._slow_requests import REQUEST_TIMELINE, _SlowRequestLog
+from momento.aio._retry_interceptor import RetryInterceptor
+from momento.hooks import RequestInfo
+from momento.slow_requests import SlowRequest, SlowRequestLogging
+
+
+class _Call:
+    def __init__(self, code: grpc.StatusCode):
+        self._code = code
+
+    async def code(self) -> grpc.StatusCode:
+        return self._code
+
+    def __await__(self) -> Iterator[None]:
+        return
+        yield
+
+
+def _request() -> RequestInfo:
+    return RequestInfo("get", "cache", b"key", 0, 0.0)
+
+
+async def test_timeline_of_retried_request():
+    slow_requests: List[SlowRequest] = []
+    log = _SlowRequestLog(SlowRequestLogging(threshold_seconds=0.1, on_slow_request=slow_requests.append))
+    codes = [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.OK]
+
+    async def server(call_details: grpc.aio.ClientCallDetails, request: bytes) -> _Call:
+        return _Call(codes.pop(0))
+
+    request = _request()
+    log.on_start(request)
+    call_details = grpc.aio.ClientCallDetails(b"/cache_client.Scs/Get", 1.0, grpc.aio.Metadata(), None, None)
+    await RetryInterceptor().intercept_unary_unary(server, call_details, b"")
+    log.on_success(request, 0.5, 0)
+
+    (slow_request,) = slow_requests
+    assert slow_request.request is request
+    assert slow_request.duration_seconds == 0.5
+    assert [phase for phase, _ in slow_request.phases] == [
+        "interceptor",
+        "attempt 1",
+        "attempt 1 UNAVAILABLE",
+        "attempt 2",
+        "attempt 2 OK",
+        "decoded",
+    ]
+    assert slow_request.phases[-1] == ("decoded", 0.5)
+    assert REQUEST_TIMELINE.get() is None
+
+
+def test_fast_requests_are_not_reported():
+    slow_requests: List[SlowRequest] = []
+    log = _SlowRequestLog(SlowRequestLogging(threshold_seconds=0.1, on_slow_request=slow_requests.append))
+    request = _request()
+    log.on_start(request)
+    log.on_success(request, 0.05, 0)
+
+    assert slow_requests == []
+    assert REQUEST_TIMELINE.get() is None
+
+
+def test_unsampled_requests_are_reported_without_timeline():
+    slow_requests: List[SlowRequest] = []
+    log = _SlowRequestLog(SlowRequestLogging(sample_ratio=0.0, on_slow_request=slow_requests.append))
+    request = _request()
+    log.on_start(request)
+    assert REQUEST_TIMELINE.get() is None
+    error = errors.TimeoutError("timed out")
+    log.on_error(request, 0.2, error)
+
+    (slow_request,) = slow_requests
+    assert (slow_request.phases, slow_request.error) == ([], error)
+
+
+def test_slow_requests_are_logged(caplog: pytest.LogCaptureFixture):
+    log = _SlowRequestLog(SlowRequestLogging())
+    request = _request()
+    log.on_start(request)
+    with caplog.at_level("WARNING", logger="momentosdk"):
+        log.on_error(request, 0.25, errors.TimeoutError("timed out"))
+
+    assert [record.getMessage() for record in caplog.records] == [
+        "Slow get of cache/b'key' failed after 250.0 ms with TimeoutError: failed +250.0 ms"
+    ]
+
+
+@pytest.mark.parametrize("settings", [{"threshold_seconds": -1}, {"sample_ratio": 1.5}])
+def test_invalid_settings(settings: Dict[str, float]):
+    with pytest.raises(errors.InvalidArgumentError):
+        SlowRequestLogging(**settings)
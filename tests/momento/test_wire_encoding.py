@@ -0,0 +1,31 @@
+import pytest
+from momento_wire_types.cacheclient_pb2 import _SetRequest
+
+from momento._utilities._wire_encoding import (
+    encode_set_request,
+    encoded_set_request_size,
+    encoded_set_request_sizes,
+    encoded_set_request_value,
+)
+
+
+@pytest.mark.parametrize(
+    "cache_key, cache_body, ttl_milliseconds",
+    [
+        (b"", b"", 0),
+        (b"key", b"", 0),
+        (b"", b"value", 1),
+        (b"k" * 127, b"v" * 128, 127),
+        (b"k" * 300, b"v" * 100_000, 60_000),
+        (b"key", b"value", 2**64 - 1),
+    ],
+)
+def test_matches_protobuf(cache_key: bytes, cache_body: bytes, ttl_milliseconds: int):
+    expected = _SetRequest(
+        cache_key=cache_key, cache_body=cache_body, ttl_milliseconds=ttl_milliseconds
+    ).SerializeToString()
+    assert encode_set_request(cache_key, cache_body, ttl_milliseconds) == expected
+    assert encode_set_request(cache_key, memoryview(bytearray(cache_body)), ttl_milliseconds) == expected
+    assert encoded_set_request_size(cache_key, cache_body, ttl_milliseconds) == len(expected)
+    assert encoded_set_request_sizes(expected) == (len(cache_key), len(cache_body))
+    assert encoded_set_request_value(expected) == cache_body
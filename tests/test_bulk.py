@@ -0,0 +1,164 @@
+import base64
+import json
+import os
+import struct
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import momento.errors as errors
+from momento.aio.simple_cache_client import SimpleCacheClient
+from momento.bulk import export_items, import_items, main
+from tests.utils import uuid_str
+
+
+def _jsonl(*items: object) -> str:
+    return "".join(json.dumps(item) + "\n" for item in items)
+
+
+async def test_import_jsonl(client_async: SimpleCacheClient, cache_name: str, tmp_path: Path):
+    keys = [uuid_str() for _ in range(3)]
+    path = tmp_path / "items.jsonl"
+    path.write_text(
+        _jsonl(
+            {"key": keys[0], "value": "value0"},
+            {"key": keys[1], "value_base64": base64.b64encode(b"\xff\x00").decode(), "ttl_seconds": 1},
+        )
+        + "\n"
+        + _jsonl({"key_base64": base64.b64encode(keys[2].encode()).decode(), "value": "value2"})
+    )
+
+    stats = await import_items(client_async, cache_name, str(path), batch_size=2)
+
+    assert (stats.items, stats.value_bytes, stats.missing_keys) == (3, 14, 0)
+    values = await client_async.get_multi(cache_name, *keys)
+    assert values.values_as_bytes() == [b"value0", b"\xff\x00", b"value2"]
+
+
+async def test_import_csv_with_quoted_line_breaks(client_async: SimpleCacheClient, cache_name: str, tmp_path: Path):
+    keys = [uuid_str() for _ in range(2)]
+    path = tmp_path / "items.csv"
+    path.write_text(f'{keys[0]},"two\nlines"\n{keys[1]},"with, comma",60\n')
+
+    await import_items(client_async, cache_name, str(path))
+
+    values = await client_async.get_multi(cache_name, *keys)
+    assert values.values() == ["two\nlines", "with, comma"]
+
+
+async def test_import_invalid_record(client_async: SimpleCacheClient, cache_name: str, tmp_path: Path):
+    path = tmp_path / "items.jsonl"
+    path.write_text(_jsonl({"key": uuid_str(), "value": "v"}, {"key": uuid_str(), "ttl_seconds": 0}))
+
+    with pytest.raises(errors.InvalidArgumentError, match="Could not read jsonl record at byte"):
+        await import_items(client_async, cache_name, str(path))
+
+
+async def test_export_and_import_binary(client_async: SimpleCacheClient, cache_name: str, tmp_path: Path):
+    keys = [uuid_str() for _ in range(5)]
+    await client_async.set_multi(cache_name, {key.encode(): key.encode() + b"\xff" for key in keys[:4]})
+    keys_path = tmp_path / "keys.txt"
+    keys_path.write_text("\r\n".join(keys) + "\n")
+    output_path = tmp_path / "items.bin"
+
+    stats = await export_items(client_async, cache_name, str(keys_path), str(output_path), batch_size=2)
+
+    assert (stats.items, stats.missing_keys) == (4, 1)
+    for key in keys[:4]:
+        await client_async.delete(cache_name, key)
+    await import_items(client_async, cache_name, str(output_path))
+    values = await client_async.get_multi(cache_name, *keys)
+    assert values.values_as_bytes() == [key.encode() + b"\xff" for key in keys[:4]] + [None]
+
+
+async def test_export_jsonl_and_csv(client_async: SimpleCacheClient, cache_name: str, tmp_path: Path):
+    key = uuid_str()
+    await client_async.set(cache_name, key, "a,b")
+    keys_path = tmp_path / "keys.txt"
+    keys_path.write_text(key)
+
+    await export_items(client_async, cache_name, str(keys_path), str(tmp_path / "items.jsonl"))
+    await export_items(client_async, cache_name, str(keys_path), str(tmp_path / "items.csv"))
+
+    assert json.loads((tmp_path / "items.jsonl").read_text()) == {"key": key, "value": "a,b"}
+    assert (tmp_path / "items.csv").read_text() == f'{key},"a,b"\n'
+
+
+async def test_import_resumes_from_checkpoint(client_async: SimpleCacheClient, cache_name: str, tmp_path: Path):
+    keys = [uuid_str() for _ in range(4)]
+    path = tmp_path / "items.csv"
+    lines = [f"{key},value\n" for key in keys]
+    path.write_text("".join(lines))
+    checkpoint_path = tmp_path / "checkpoint.json"
+    # As saved by a run that was interrupted after the first two items.
+    checkpoint = {"input": str(path), "offset": len("".join(lines[:2])), "output_size": 0}
+    checkpoint_path.write_text(json.dumps({**checkpoint, "items": 2, "value_bytes": 10, "missing_keys": 0}))
+
+    stats = await import_items(client_async, cache_name, str(path), checkpoint_path=str(checkpoint_path))
+
+    assert (stats.items, stats.value_bytes) == (4, 20)
+    values = await client_async.get_multi(cache_name, *keys)
+    assert values.values() == [None, None, "value", "value"]
+    assert json.loads(checkpoint_path.read_text())["offset"] == os.path.getsize(path)
+    # A completed run does nothing when it is run again.
+    await client_async.delete(cache_name, keys[3])
+    await import_items(client_async, cache_name, str(path), checkpoint_path=str(checkpoint_path))
+    assert (await client_async.get(cache_name, keys[3])).value() is None
+
+
+async def test_export_resumes_from_checkpoint(client_async: SimpleCacheClient, cache_name: str, tmp_path: Path):
+    keys = [uuid_str() for _ in range(3)]
+    await client_async.set_multi(cache_name, {key: key for key in keys})
+    keys_path = tmp_path / "keys.txt"
+    keys_path.write_text("".join(f"{key}\n" for key in keys))
+    output_path = tmp_path / "items.jsonl"
+    first_item = _jsonl({"key": keys[0], "value": keys[0]})
+    # The last checkpoint came after the first item; a partial write of the second one followed it.
+    output_path.write_text(first_item + '{"key": "')
+    checkpoint = {"input": str(keys_path), "offset": len(keys[0]) + 1, "output_size": len(first_item)}
+    checkpoint_path = tmp_path / "checkpoint.json"
+    checkpoint_path.write_text(json.dumps({**checkpoint, "items": 1, "value_bytes": 36, "missing_keys": 0}))
+
+    stats = await export_items(
+        client_async, cache_name, str(keys_path), str(output_path), checkpoint_path=str(checkpoint_path)
+    )
+
+    assert stats.items == 3
+    lines: List[object] = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert lines == [{"key": key, "value": key} for key in keys]
+
+
+async def test_checkpoint_of_another_input(client_async: SimpleCacheClient, cache_name: str, tmp_path: Path):
+    path = tmp_path / "items.jsonl"
+    path.write_text("")
+    checkpoint_path = tmp_path / "checkpoint.json"
+    checkpoint_path.write_text(json.dumps({"input": str(tmp_path / "other.jsonl"), "offset": 0}))
+
+    with pytest.raises(errors.InvalidArgumentError, match="Checkpoint"):
+        await import_items(client_async, cache_name, str(path), checkpoint_path=str(checkpoint_path))
+
+
+async def test_unknown_format(client_async: SimpleCacheClient, cache_name: str, tmp_path: Path):
+    with pytest.raises(errors.InvalidArgumentError, match="Cannot tell the format"):
+        await import_items(client_async, cache_name, str(tmp_path / "items.txt"))
+
+
+def test_command_line(
+    auth_token: str, local_credentials: bool, cache_name: str, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+):
+    key = uuid_str()
+    path = tmp_path / "items"
+    path.write_bytes(struct.pack("<III", len(key), 5, 60) + key.encode() + b"value")
+    keys_path = tmp_path / "keys.txt"
+    keys_path.write_text(key)
+    output_path = tmp_path / "items.csv"
+
+    options = ["--auth-token", auth_token, *(["--local-credentials"] if local_credentials else [])]
+    main([*options, "--format", "binary", "import", cache_name, str(path)])
+    main([*options, "export", cache_name, str(keys_path), str(output_path)])
+
+    assert output_path.read_text() == f"{key},value\n"
+    report = capsys.readouterr().err
+    assert "Imported 1 items" in report
+    assert "Exported 1 items" in report
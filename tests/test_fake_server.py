@@ -0,0 +1,157 @@
+import datetime
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Tuple
+
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+import momento.errors as errors
+from momento.aio.simple_cache_client import SimpleCacheClient
+from momento.cache_operation_types import CacheGetStatus
+from momento.testing.fake_server import FakeMomentoServer
+from tests.utils import uuid_str
+
+
+class _ManualClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+# Serves a cache over TLS and reads an item back with a client that is created as for the service.
+_TLS_CLIENT_SCRIPT = """
+import asyncio
+import sys
+
+import grpc
+
+from momento.aio.simple_cache_client import SimpleCacheClient
+from momento.testing.fake_server import FakeMomentoServer
+
+
+async def main() -> None:
+    with open(sys.argv[1], "rb") as key_file, open(sys.argv[2], "rb") as certificate_file:
+        credentials = grpc.ssl_server_credentials([(key_file.read(), certificate_file.read())])
+    with FakeMomentoServer(server_credentials=credentials) as server:
+        async with SimpleCacheClient(server.auth_token, 60) as client:
+            await client.create_cache("my-cache")
+            await client.set("my-cache", "key", "value")
+            print((await client.get("my-cache", "key")).value())
+
+
+asyncio.run(main())
+"""
+
+
+def _localhost_certificate() -> Tuple[bytes, bytes]:
+    """A self-signed certificate for localhost, and its private key, in PEM."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.utcnow()
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    key_pem = key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+    )
+    return certificate.public_bytes(serialization.Encoding.PEM), key_pem
+
+
+async def test_fake_server_expires_items_using_its_clock():
+    clock = _ManualClock()
+    with FakeMomentoServer(clock=clock) as server:
+        async with SimpleCacheClient(server.auth_token, 60, local_credentials=True) as client:
+            cache_name, key = uuid_str(), uuid_str()
+            await client.create_cache(cache_name)
+            await client.set(cache_name, key, "value", 10)
+
+            clock.now = 9.9
+            assert (await client.get(cache_name, key)).status() == CacheGetStatus.HIT
+
+            clock.now = 10.0
+            assert (await client.get(cache_name, key)).status() == CacheGetStatus.MISS
+
+
+async def test_fake_server_insecure_with_endpoint_override():
+    with FakeMomentoServer(insecure=True) as server:
+        async with SimpleCacheClient("not-a-jwt", 60, endpoint_override=server.endpoint, insecure=True) as client:
+            with pytest.raises(errors.AuthenticationError):
+                await client.list_caches()
+
+        async with SimpleCacheClient(server.auth_token, 60, endpoint_override=server.endpoint, insecure=True) as client:
+            await client.create_cache("my-cache")
+            assert server.cache_names() == ["my-cache"]
+
+
+async def test_fake_server_latency():
+    with FakeMomentoServer(latency_seconds=0.2) as server:
+        async with SimpleCacheClient(server.auth_token, 60, request_timeout_ms=50, local_credentials=True) as client:
+            await client.create_cache("my-cache")
+            with pytest.raises(errors.TimeoutError):
+                await client.get("my-cache", "key")
+
+            server.latency_seconds = 0
+            assert (await client.get("my-cache", "key")).status() == CacheGetStatus.MISS
+
+
+def test_fake_server_start_raises_startup_errors(monkeypatch: pytest.MonkeyPatch):
+    async def fail_to_serve() -> None:
+        raise RuntimeError("Failed to bind")
+
+    server = FakeMomentoServer()
+    monkeypatch.setattr(server, "_serve", fail_to_serve)
+    with pytest.raises(RuntimeError, match="Failed to bind"):
+        server.start()
+
+    # Once the error is fixed, the server can be started again.
+    monkeypatch.undo()
+    with server:
+        assert server.auth_token
+
+
+def test_fake_server_over_localhost_tls(tmp_path: Path):
+    certificate, key = _localhost_certificate()
+    certificate_path, key_path = tmp_path / "localhost.crt", tmp_path / "localhost.key"
+    certificate_path.write_bytes(certificate)
+    key_path.write_bytes(key)
+
+    # gRPC loads the root certificates once per process, so the client runs in a fresh interpreter
+    # that trusts the certificate instead of the system's root certificates.
+    result = subprocess.run(
+        [sys.executable, "-c", _TLS_CLIENT_SCRIPT, str(key_path), str(certificate_path)],
+        env={**os.environ, "GRPC_DEFAULT_SSL_ROOTS_FILE_PATH": str(certificate_path)},
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "value\n"
+
+
+async def test_clients_use_tls_for_loopback_endpoints_by_default():
+    with FakeMomentoServer() as server:
+        async with SimpleCacheClient(server.auth_token, 60) as client:
+            with pytest.raises(errors.SdkError):
+                await client.list_caches()
+
+
+def test_local_credentials_cannot_be_used_over_insecure_channels():
+    with pytest.raises(errors.InvalidArgumentError):
+        SimpleCacheClient("not-a-jwt", 60, endpoint_override="localhost:1", insecure=True, local_credentials=True)
@@ -1,10 +1,19 @@
+import mmap
 import time
+from array import array
+from typing import List, Tuple
 
 import pytest
 
 import momento.errors as errors
 from momento.cache_operation_types import CacheGetStatus
+from momento.deadlines import deadline
+from momento.hooks import RequestHook, RequestInfo
+from momento.hot_keys import HotKeyTracking
+from momento.near_cache import NearCacheStats, NearCaching
+from momento.serialization import PickleSerializer
 from momento.simple_cache_client import SimpleCacheClient
+from momento.slow_requests import SlowRequest, SlowRequestLogging
 from tests.utils import str_to_bytes, uuid_bytes, uuid_str
 
 
@@ -84,8 +93,10 @@ def test_create_cache_with_bad_cache_name_throws_exception(
         assert cm.exception == "Cache name must be a non-empty string"
 
 
-def test_create_cache_throws_authentication_exception_for_bad_token(bad_auth_token: str, default_ttl_seconds: int):
-    with SimpleCacheClient(bad_auth_token, default_ttl_seconds) as client:
+def test_create_cache_throws_authentication_exception_for_bad_token(
+    bad_auth_token: str, default_ttl_seconds: int, local_credentials: bool
+):
+    with SimpleCacheClient(bad_auth_token, default_ttl_seconds, local_credentials=local_credentials) as client:
         with pytest.raises(errors.AuthenticationError):
             client.create_cache(uuid_str())
 
@@ -129,8 +140,10 @@ def test_delete_with_bad_cache_name_throws_exception(client: SimpleCacheClient,
         assert cm.exception == "Cache name must be a non-empty string"
 
 
-def test_delete_cache_throws_authentication_exception_for_bad_token(bad_auth_token: str, default_ttl_seconds: int):
-    with SimpleCacheClient(bad_auth_token, default_ttl_seconds) as client:
+def test_delete_cache_throws_authentication_exception_for_bad_token(
+    bad_auth_token: str, default_ttl_seconds: int, local_credentials: bool
+):
+    with SimpleCacheClient(bad_auth_token, default_ttl_seconds, local_credentials=local_credentials) as client:
         with pytest.raises(errors.AuthenticationError):
             client.delete_cache(uuid_str())
 
@@ -155,8 +168,10 @@ def test_list_caches_succeeds(client: SimpleCacheClient, cache_name: str):
         client.delete_cache(cache_name)
 
 
-def test_list_caches_throws_authentication_exception_for_bad_token(bad_auth_token: str, default_ttl_seconds: int):
-    with SimpleCacheClient(bad_auth_token, default_ttl_seconds) as client:
+def test_list_caches_throws_authentication_exception_for_bad_token(
+    bad_auth_token: str, default_ttl_seconds: int, local_credentials: bool
+):
+    with SimpleCacheClient(bad_auth_token, default_ttl_seconds, local_credentials=local_credentials) as client:
         with pytest.raises(errors.AuthenticationError):
             client.list_caches()
 
@@ -309,15 +324,19 @@ def test_set_with_bad_value_throws_exception(client: SimpleCacheClient, cache_na
 
 
 def test_set_throws_authentication_exception_for_bad_token(
-    bad_auth_token: str, cache_name: str, default_ttl_seconds: int
+    bad_auth_token: str, cache_name: str, default_ttl_seconds: int, local_credentials: bool
 ):
-    with SimpleCacheClient(bad_auth_token, default_ttl_seconds) as client:
+    with SimpleCacheClient(bad_auth_token, default_ttl_seconds, local_credentials=local_credentials) as client:
         with pytest.raises(errors.AuthenticationError):
             client.set(cache_name, "foo", "bar")
 
 
-def test_set_throws_timeout_error_for_short_request_timeout(auth_token: str, cache_name: str, default_ttl_seconds: int):
-    with SimpleCacheClient(auth_token, default_ttl_seconds, request_timeout_ms=1) as client:
+def test_set_throws_timeout_error_for_short_request_timeout(
+    auth_token: str, cache_name: str, default_ttl_seconds: int, local_credentials: bool
+):
+    with SimpleCacheClient(
+        auth_token, default_ttl_seconds, local_credentials=local_credentials, request_timeout_ms=1
+    ) as client:
         with pytest.raises(errors.TimeoutError):
             client.set(cache_name, "foo", "bar")
 
@@ -367,15 +386,19 @@ def test_get_with_bad_key_throws_exception(client: SimpleCacheClient, cache_name
 
 
 def test_get_throws_authentication_exception_for_bad_token(
-    bad_auth_token: str, cache_name: str, default_ttl_seconds: int
+    bad_auth_token: str, cache_name: str, default_ttl_seconds: int, local_credentials: bool
 ):
-    with SimpleCacheClient(bad_auth_token, default_ttl_seconds) as client:
+    with SimpleCacheClient(bad_auth_token, default_ttl_seconds, local_credentials=local_credentials) as client:
         with pytest.raises(errors.AuthenticationError):
             client.get(cache_name, "foo")
 
 
-def test_get_throws_timeout_error_for_short_request_timeout(auth_token: str, cache_name: str, default_ttl_seconds: int):
-    with SimpleCacheClient(auth_token, default_ttl_seconds, request_timeout_ms=1) as client:
+def test_get_throws_timeout_error_for_short_request_timeout(
+    auth_token: str, cache_name: str, default_ttl_seconds: int, local_credentials: bool
+):
+    with SimpleCacheClient(
+        auth_token, default_ttl_seconds, local_credentials=local_credentials, request_timeout_ms=1
+    ) as client:
         with pytest.raises(errors.TimeoutError):
             client.get(cache_name, "foo")
 
@@ -394,9 +417,24 @@ def test_get_multi_and_set(client: SimpleCacheClient, cache_name: str):
     assert items[2][1] == values[3]
 
 
-def test_get_multi_failure(auth_token: str, cache_name: str, default_ttl_seconds: int):
+def test_get_multi_by_key(client: SimpleCacheClient, cache_name: str):
+    key, value, missing_key = uuid_str(), uuid_str(), uuid_str()
+    client.set(cache_name, key, value)
+
+    get_resp = client.get_multi(cache_name, key, missing_key.encode("utf-8"))
+    assert get_resp.status() == [CacheGetStatus.HIT, CacheGetStatus.MISS]
+    assert get_resp.by_key(key).value() == value
+    assert get_resp.by_key(key.encode("utf-8")).value_as_bytes() == value.encode("utf-8")
+    assert get_resp.by_key(missing_key).status() == CacheGetStatus.MISS
+    with pytest.raises(KeyError):
+        get_resp.by_key(uuid_str())
+
+
+def test_get_multi_failure(auth_token: str, cache_name: str, default_ttl_seconds: int, local_credentials: bool):
     # Start with a cache client with impossibly small request timeout to force failures
-    with SimpleCacheClient(auth_token, default_ttl_seconds, request_timeout_ms=1) as client:
+    with SimpleCacheClient(
+        auth_token, default_ttl_seconds, local_credentials=local_credentials, request_timeout_ms=1
+    ) as client:
         with pytest.raises(errors.TimeoutError):
             client.get_multi(cache_name, "key1", "key2", "key3", "key4", "key5", "key6")
 
@@ -406,9 +444,12 @@ def test_set_multi_failure(
     auth_token: str,
     cache_name: str,
     default_ttl_seconds: int,
+    local_credentials: bool,
 ):
     # Start with a cache client with impossibly small request timeout to force failures
-    with SimpleCacheClient(auth_token, default_ttl_seconds, request_timeout_ms=1) as client:
+    with SimpleCacheClient(
+        auth_token, default_ttl_seconds, local_credentials=local_credentials, request_timeout_ms=1
+    ) as client:
         with pytest.raises(errors.TimeoutError):
             client.set_multi(
                 cache_name=cache_name,
@@ -450,3 +491,374 @@ def test_delete(client: SimpleCacheClient, cache_name: str):
     # Verify deleted
     get_response = client.get(cache_name, key)
     assert get_response.status() == CacheGetStatus.MISS
+
+
+# Test set_object and get_object
+def test_set_object_and_get_object(client: SimpleCacheClient, cache_name: str):
+    key = uuid_str()
+    value = {"name": "café", "tags": ["a", "b"], "count": 3}
+
+    set_response = client.set_object(cache_name, key, value)
+    assert set_response.value_as_bytes() == b'{"name":"caf\\u00e9","tags":["a","b"],"count":3}'
+
+    assert client.get_object(cache_name, key) == value
+    assert (client.get(cache_name, key)).value() == set_response.value()
+
+
+def test_get_object_returns_none_for_miss(client: SimpleCacheClient, cache_name: str):
+    assert client.get_object(cache_name, uuid_str()) is None
+
+
+def test_set_object_and_get_object_with_serializer(client: SimpleCacheClient, cache_name: str):
+    key = uuid_str()
+    value = {"tuple": (1, 2), "set": {b"x"}}
+    client.set_object(cache_name, key, value, serializer=PickleSerializer())
+    assert client.get_object(cache_name, key, PickleSerializer()) == value
+
+
+def test_client_serializer_is_used_by_default(
+    auth_token: str, cache_name: str, default_ttl_seconds: int, local_credentials: bool
+):
+    key = uuid_str()
+    with SimpleCacheClient(
+        auth_token, default_ttl_seconds, local_credentials=local_credentials, serializer=PickleSerializer()
+    ) as pickling_client:
+        pickling_client.set_object(cache_name, key, (1, 2))
+        assert pickling_client.get_object(cache_name, key) == (1, 2)
+
+
+def test_set_object_with_unserializable_value_throws_exception(client: SimpleCacheClient, cache_name: str):
+    with pytest.raises(errors.InvalidArgumentError):
+        client.set_object(cache_name, uuid_str(), {"set"})
+
+
+def test_get_object_with_undeserializable_value_throws_exception(client: SimpleCacheClient, cache_name: str):
+    key = uuid_str()
+    client.set(cache_name, key, "not json")
+    with pytest.raises(errors.ClientSdkError):
+        client.get_object(cache_name, key)
+
+
+# Test set_large and get_large
+def test_set_large_and_get_large(client: SimpleCacheClient, cache_name: str):
+    key = uuid_str()
+    value = bytes(range(256)) * 14
+
+    set_response = client.set_large(cache_name, key, value, chunk_size_bytes=1000)
+    assert set_response.value_as_bytes() == value
+
+    get_response = client.get_large(cache_name, key, max_concurrency=2)
+    assert get_response.status() == CacheGetStatus.HIT
+    assert get_response.value_as_bytes() == value
+    assert type(get_response.value_as_bytes()) is bytes
+
+
+def test_set_large_stores_small_values_like_set(client: SimpleCacheClient, cache_name: str):
+    key = uuid_str()
+    client.set_large(cache_name, key, "small", chunk_size_bytes=1000)
+    assert (client.get(cache_name, key)).value() == "small"
+    assert (client.get_large(cache_name, key)).value() == "small"
+
+
+def test_set_large_replaces_values(client: SimpleCacheClient, cache_name: str):
+    key = uuid_str()
+    client.set_large(cache_name, key, "a" * 3000, chunk_size_bytes=1000)
+    client.set_large(cache_name, key, "b" * 2500, chunk_size_bytes=1000)
+    assert (client.get_large(cache_name, key)).value() == "b" * 2500
+
+    client.set_large(cache_name, key, "c", chunk_size_bytes=1000)
+    assert (client.get_large(cache_name, key)).value() == "c"
+
+
+def test_set_large_stores_values_that_look_like_a_manifest(client: SimpleCacheClient, cache_name: str):
+    key = uuid_str()
+    value = b"\xffMLV" + bytes(64)
+    client.set_large(cache_name, key, value)
+    assert (client.get_large(cache_name, key)).value_as_bytes() == value
+
+
+def test_get_large_returns_miss(client: SimpleCacheClient, cache_name: str):
+    assert (client.get_large(cache_name, uuid_str())).status() == CacheGetStatus.MISS
+
+
+def test_set_large_with_bad_chunk_size_throws_exception(client: SimpleCacheClient, cache_name: str):
+    for chunk_size_bytes in [0, 4 * 1024 * 1024]:
+        with pytest.raises(errors.InvalidArgumentError):
+            client.set_large(cache_name, uuid_str(), "value", chunk_size_bytes=chunk_size_bytes)
+
+
+def test_set_with_too_large_value_throws_exception(client: SimpleCacheClient, cache_name: str):
+    with pytest.raises(errors.InvalidArgumentError, match="set_large"):
+        client.set(cache_name, uuid_str(), bytes(4 * 1024 * 1024))
+
+
+# Test buffer values
+def test_set_with_buffer_values(client: SimpleCacheClient, cache_name: str):
+    numbers = array("I", range(100))
+    mapped = mmap.mmap(-1, 4096)
+    mapped.write(b"mapped value")
+    for value, expected in [
+        (bytearray(b"bytearray value"), b"bytearray value"),
+        (memoryview(b"...memoryview value...")[3:-3], b"memoryview value"),
+        (memoryview(numbers), numbers.tobytes()),
+        (memoryview(mapped)[:12], b"mapped value"),
+    ]:
+        key = uuid_str()
+        set_response = client.set(cache_name, key, value)
+        assert set_response.value_as_bytes() == expected
+        assert (client.get(cache_name, key)).value_as_bytes() == expected
+
+
+def test_set_multi_and_set_large_with_buffer_values(client: SimpleCacheClient, cache_name: str):
+    items = {uuid_bytes(): bytearray(b"value-1"), uuid_bytes(): memoryview(b"value-2")}
+    set_multi_response = client.set_multi(cache_name, items)
+    assert list(set_multi_response.items_as_bytes().values()) == [b"value-1", b"value-2"]
+
+    key = uuid_str()
+    value = bytearray(range(256)) * 10
+    client.set_large(cache_name, key, memoryview(value), chunk_size_bytes=1000)
+    assert (client.get_large(cache_name, key)).value_as_bytes() == value
+
+
+def test_set_responses_do_not_keep_buffer_values(client: SimpleCacheClient, cache_name: str):
+    value = bytearray(b"value")
+    mapped = mmap.mmap(-1, 4096)
+    mapped.write(b"mapped value")
+    large_value = bytearray(range(256)) * 10
+    set_responses = [
+        client.set(cache_name, uuid_str(), value),
+        client.set(cache_name, uuid_str(), memoryview(mapped)[:12]),
+        client.set_large(cache_name, uuid_str(), value),
+        client.set_large(cache_name, uuid_str(), large_value, chunk_size_bytes=1000),
+    ]
+    # Neither resizing nor closing a buffer is allowed while a view of it is kept.
+    value[:] = b"changed value"
+    large_value.clear()
+    mapped.close()
+
+    assert [set_response.value_as_bytes() for set_response in set_responses] == [
+        b"value",
+        b"mapped value",
+        b"value",
+        bytes(range(256)) * 10,
+    ]
+
+
+def test_set_with_non_contiguous_buffer_throws_exception(client: SimpleCacheClient, cache_name: str):
+    with pytest.raises(errors.InvalidArgumentError):
+        client.set(cache_name, uuid_str(), memoryview(b"abcdef")[::2])
+
+
+# Hook tests
+class RecordingHook(RequestHook):
+    def __init__(self) -> None:
+        self.events: List[Tuple[str, str, bytes, int]] = []
+        self.errors: List[Exception] = []
+
+    def on_start(self, request: RequestInfo) -> None:
+        self.events.append(("start", request.operation, request.key, request.request_bytes))
+
+    def on_success(self, request: RequestInfo, duration_seconds: float, response_bytes: int) -> None:
+        assert duration_seconds >= 0
+        self.events.append(("success", request.operation, request.key, response_bytes))
+
+    def on_error(self, request: RequestInfo, duration_seconds: float, error: Exception) -> None:
+        self.events.append(("error", request.operation, request.key, 0))
+        self.errors.append(error)
+
+
+class FailingHook(RequestHook):
+    def on_start(self, request: RequestInfo) -> None:
+        raise ValueError("hook failed")
+
+
+def test_hooks_observe_requests(
+    client: SimpleCacheClient, auth_token: str, cache_name: str, default_ttl_seconds: int, local_credentials: bool
+):
+    hook = RecordingHook()
+    key = uuid_str()
+    with SimpleCacheClient(
+        auth_token, default_ttl_seconds, local_credentials=local_credentials, hooks=[FailingHook(), hook]
+    ) as hooked_client:
+        hooked_client.set(cache_name, key, "value")
+        hooked_client.get(cache_name, key)
+        hooked_client.delete(cache_name, key)
+        hooked_client.get(cache_name, key)
+
+    key_bytes = key.encode("utf-8")
+    assert hook.events == [
+        ("start", "set", key_bytes, 5),
+        ("success", "set", key_bytes, 0),
+        ("start", "get", key_bytes, 0),
+        ("success", "get", key_bytes, 5),
+        ("start", "delete", key_bytes, 0),
+        ("success", "delete", key_bytes, 0),
+        ("start", "get", key_bytes, 0),
+        ("success", "get", key_bytes, 0),
+    ]
+
+
+def test_hooks_observe_errors(auth_token: str, cache_name: str, default_ttl_seconds: int, local_credentials: bool):
+    hook = RecordingHook()
+    with SimpleCacheClient(
+        auth_token, default_ttl_seconds, local_credentials=local_credentials, request_timeout_ms=1, hooks=[hook]
+    ) as client:
+        with pytest.raises(errors.TimeoutError):
+            client.get(cache_name, "key")
+
+    assert [event[0] for event in hook.events] == ["start", "error"]
+    assert isinstance(hook.errors[0], errors.TimeoutError)
+
+
+# Metrics tests
+def test_metrics(
+    client: SimpleCacheClient, auth_token: str, cache_name: str, default_ttl_seconds: int, local_credentials: bool
+):
+    assert client.metrics_snapshot() is None
+    key = uuid_str()
+    with SimpleCacheClient(
+        auth_token, default_ttl_seconds, local_credentials=local_credentials, metrics=True
+    ) as metered_client:
+        metered_client.set(cache_name, key, "value")
+        metered_client.get(cache_name, key)
+        metered_client.get(cache_name, uuid_str())
+        snapshot = metered_client.metrics_snapshot()
+
+    assert snapshot is not None
+    assert snapshot.in_flight == [0]
+    sets = snapshot.operation("set", cache_name)
+    gets = snapshot.operation("get", cache_name)
+    assert sets is not None and gets is not None
+    assert (sets.successes, sets.request_bytes) == (1, 5)
+    assert (gets.hits, gets.misses, gets.response_bytes, gets.latency.count) == (1, 1, 5, 2)
+    assert gets.latency.percentile(50) > 0
+
+
+def test_metrics_count_errors(auth_token: str, cache_name: str, default_ttl_seconds: int, local_credentials: bool):
+    with SimpleCacheClient(
+        auth_token, default_ttl_seconds, local_credentials=local_credentials, request_timeout_ms=1, metrics=True
+    ) as metered_client:
+        with pytest.raises(errors.TimeoutError):
+            metered_client.get(cache_name, "key")
+        snapshot = metered_client.metrics_snapshot()
+
+    assert snapshot is not None
+    gets = snapshot.operation("get", cache_name)
+    assert gets is not None
+    assert gets.errors == {"TimeoutError": 1}
+
+
+# Hot key tests
+def test_hot_keys(
+    client: SimpleCacheClient, auth_token: str, cache_name: str, default_ttl_seconds: int, local_credentials: bool
+):
+    assert client.hot_keys() is None
+    hot_key, cold_key = uuid_str(), uuid_str()
+    with SimpleCacheClient(
+        auth_token,
+        default_ttl_seconds,
+        local_credentials=local_credentials,
+        metrics=True,
+        hot_keys=HotKeyTracking(top_k=2),
+    ) as tracking_client:
+        tracking_client.set(cache_name, hot_key, "value")
+        for _ in range(3):
+            tracking_client.get(cache_name, hot_key)
+        tracking_client.get(cache_name, cold_key)
+        tracking_client.delete(cache_name, hot_key)
+        hot_keys = tracking_client.hot_keys()
+        snapshot = tracking_client.metrics_snapshot()
+
+    assert hot_keys is not None
+    assert [(key.cache_name, key.key, key.requests) for key in hot_keys] == [
+        (cache_name, hot_key.encode(), 4),
+        (cache_name, cold_key.encode(), 1),
+    ]
+    assert snapshot is not None and snapshot.hot_keys is not None
+    assert snapshot.hot_keys[0].key == hot_key.encode()
+
+
+def test_near_cache(
+    client: SimpleCacheClient, auth_token: str, cache_name: str, default_ttl_seconds: int, local_credentials: bool
+):
+    assert client.near_cache_stats() is None
+    key = uuid_str()
+    near_cache = NearCaching(min_reads_per_second=2, ttl_seconds=60)
+    with SimpleCacheClient(
+        auth_token,
+        default_ttl_seconds,
+        local_credentials=local_credentials,
+        metrics=True,
+        hot_keys=HotKeyTracking(),
+        near_cache=near_cache,
+    ) as near_client:
+        near_client.set(cache_name, key, "value")
+        for _ in range(3):
+            assert (near_client.get(cache_name, key)).value() == "value"
+        client.set(cache_name, key, "changed")
+        # Writes of other clients are not seen until the value expires.
+        assert (near_client.get(cache_name, key)).value() == "value"
+
+        near_client.set(cache_name, key, "changed again")
+        assert (near_client.get(cache_name, key)).value() == "changed again"
+        assert (near_client.get(cache_name, key)).value() == "changed again"
+        stats = near_client.near_cache_stats()
+        snapshot = near_client.metrics_snapshot()
+        hot_keys = near_client.hot_keys()
+
+    assert stats == NearCacheStats(hits=3, misses=1, promotions=1, demotions=0, invalidations=1, entries=1)
+    assert snapshot is not None and snapshot.near_cache == stats
+    # Gets served from the near cache count too.
+    get_metrics = snapshot.operation("get", cache_name)
+    assert get_metrics is not None and get_metrics.hits == get_metrics.latency.count == 6
+    assert hot_keys is not None and [(hot_key.key, hot_key.requests) for hot_key in hot_keys] == [(key.encode(), 8)]
+
+
+def test_slow_requests(
+    client: SimpleCacheClient, auth_token: str, cache_name: str, default_ttl_seconds: int, local_credentials: bool
+):
+    slow_requests: List[SlowRequest] = []
+    logging = SlowRequestLogging(threshold_seconds=0, on_slow_request=slow_requests.append)
+    with SimpleCacheClient(
+        auth_token, default_ttl_seconds, local_credentials=local_credentials, slow_requests=logging
+    ) as logging_client:
+        logging_client.set(cache_name, "key", "value")
+        logging_client.get_multi(cache_name, "key", "other-key")
+    with SimpleCacheClient(
+        auth_token,
+        default_ttl_seconds,
+        local_credentials=local_credentials,
+        request_timeout_ms=1,
+        slow_requests=logging,
+    ) as timing_out_client:
+        with pytest.raises(errors.TimeoutError):
+            timing_out_client.get(cache_name, "key")
+
+    assert [(request.request.operation, request.request.key) for request in slow_requests] == [
+        ("set", b"key"),
+        ("get", b"key"),
+        ("get", b"other-key"),
+        ("get", b"key"),
+    ]
+    for slow_request in slow_requests[:3]:
+        assert [phase for phase, _ in slow_request.phases] == ["interceptor", "attempt 1", "attempt 1 OK", "decoded"]
+        offsets = [offset for _, offset in slow_request.phases]
+        assert offsets == sorted(offsets)
+        assert offsets[-1] == slow_request.duration_seconds
+    timed_out = slow_requests[3]
+    assert isinstance(timed_out.error, errors.TimeoutError)
+    assert [phase for phase, _ in timed_out.phases][-2:] == ["attempt 1 DEADLINE_EXCEEDED", "failed"]
+
+
+def test_deadline_budget(client: SimpleCacheClient, cache_name: str):
+    key = uuid_str()
+    with deadline(60):
+        client.set(cache_name, key, "value")
+        assert (client.get(cache_name, key)).value() == "value"
+    with deadline(0):
+        with pytest.raises(errors.TimeoutError):
+            client.delete(cache_name, key)
+        with pytest.raises(errors.TimeoutError):
+            client.get_multi(cache_name, key, uuid_str())
+    # The delete was not sent.
+    assert (client.get(cache_name, key)).value() == "value"
@@ -0,0 +1,206 @@
+from typing import Iterator, List, Tuple
+
+import grpc
+import pytest
+
+import momento.errors as errors
+from momento.aio._retry_interceptor import RetryInterceptor
+from momento.aio.simple_cache_client import SimpleCacheClient
+from tests.utils import uuid_str
+
+pytest.importorskip("opentelemetry.sdk")
+
+from opentelemetry import trace  # noqa: E402
+from opentelemetry.sdk.trace import ReadableSpan, TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+
+from momento.tracing import TracingInterceptor  # noqa: E402
+
+
+@pytest.fixture
+def exporter() -> InMemorySpanExporter:
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer_provider(exporter: InMemorySpanExporter) -> Iterator[TracerProvider]:
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    yield provider
+    provider.shutdown()
+
+
+def _spans(exporter: InMemorySpanExporter) -> List[ReadableSpan]:
+    return sorted(exporter.get_finished_spans(), key=lambda span: span.start_time)
+
+
+async def test_spans_of_requests(
+    client_async: SimpleCacheClient,
+    auth_token: str,
+    cache_name: str,
+    default_ttl_seconds: int,
+    tracer_provider: TracerProvider,
+    exporter: InMemorySpanExporter,
+    local_credentials: bool,
+):
+    key = uuid_str()
+    tracing = TracingInterceptor(tracer_provider)
+    async with SimpleCacheClient(
+        auth_token, default_ttl_seconds, local_credentials=local_credentials, tracing=tracing
+    ) as traced_client:
+        await traced_client.set(cache_name, key, "value")
+        await traced_client.get(cache_name, key)
+        await traced_client.get(cache_name, uuid_str())
+        await traced_client.delete(cache_name, key)
+
+    spans = _spans(exporter)
+    assert [span.name for span in spans] == [
+        "cache_client.Scs/Set",
+        "cache_client.Scs/Get",
+        "cache_client.Scs/Get",
+        "cache_client.Scs/Delete",
+    ]
+    assert all(span.kind == trace.SpanKind.CLIENT for span in spans)
+    assert dict(spans[0].attributes) == {
+        "rpc.system": "grpc",
+        "rpc.service": "cache_client.Scs",
+        "rpc.method": "Set",
+        "db.system": "momento",
+        "momento.cache_name": cache_name,
+        "momento.attempt": 1,
+        "momento.key_size": len(key),
+        "momento.value_size": 5,
+        "rpc.grpc.status_code": 0,
+        "momento.result": "ok",
+    }
+    assert [(span.attributes["momento.result"], span.attributes["momento.value_size"]) for span in spans[1:3]] == [
+        ("hit", 5),
+        ("miss", 0),
+    ]
+    assert spans[3].attributes["momento.result"] == "ok"
+
+
+async def test_multi_operation_span(
+    client_async: SimpleCacheClient,
+    auth_token: str,
+    cache_name: str,
+    default_ttl_seconds: int,
+    tracer_provider: TracerProvider,
+    exporter: InMemorySpanExporter,
+    local_credentials: bool,
+):
+    keys = [uuid_str() for _ in range(3)]
+    tracing = TracingInterceptor(tracer_provider)
+    async with SimpleCacheClient(
+        auth_token, default_ttl_seconds, local_credentials=local_credentials, tracing=tracing
+    ) as traced_client:
+        await traced_client.get_multi(cache_name, *keys)
+
+    spans = _spans(exporter)
+    operation = spans[0]
+    assert operation.name == "momento.get_multi"
+    assert operation.attributes["momento.key_count"] == 3
+    assert [span.name for span in spans[1:]] == ["cache_client.Scs/Get"] * 3
+    assert all(span.parent is not None and span.parent.span_id == operation.context.span_id for span in spans[1:])
+
+
+async def test_failed_request_span(
+    client_async: SimpleCacheClient,
+    auth_token: str,
+    cache_name: str,
+    default_ttl_seconds: int,
+    tracer_provider: TracerProvider,
+    exporter: InMemorySpanExporter,
+    local_credentials: bool,
+):
+    tracing = TracingInterceptor(tracer_provider)
+    async with SimpleCacheClient(
+        auth_token, default_ttl_seconds, local_credentials=local_credentials, request_timeout_ms=1, tracing=tracing
+    ) as client:
+        with pytest.raises(errors.TimeoutError):
+            await client.get(cache_name, "key")
+
+    (span,) = _spans(exporter)
+    assert span.attributes["momento.result"] == "error"
+    assert span.attributes["rpc.grpc.status_code"] == grpc.StatusCode.DEADLINE_EXCEEDED.value[0]
+    assert span.status.status_code == trace.StatusCode.ERROR
+
+
+async def test_sampling(
+    client_async: SimpleCacheClient,
+    auth_token: str,
+    cache_name: str,
+    default_ttl_seconds: int,
+    tracer_provider: TracerProvider,
+    exporter: InMemorySpanExporter,
+    local_credentials: bool,
+):
+    tracing = TracingInterceptor(tracer_provider, sample_ratio=0.0)
+    tracer = tracer_provider.get_tracer(__name__)
+    async with SimpleCacheClient(
+        auth_token, default_ttl_seconds, local_credentials=local_credentials, tracing=tracing
+    ) as traced_client:
+        await traced_client.get(cache_name, "key")
+        await traced_client.get_multi(cache_name, "key", "other-key")
+        assert exporter.get_finished_spans() == ()
+
+        # Requests in a sampled trace are traced regardless of the ratio.
+        with tracer.start_as_current_span("parent") as parent:
+            await traced_client.get(cache_name, "key")
+
+    parent_span, request = _spans(exporter)
+    assert request.parent is not None
+    assert request.parent.span_id == parent.get_span_context().span_id
+    assert request.context.trace_id == parent_span.context.trace_id
+
+
+def test_invalid_sample_ratio():
+    with pytest.raises(errors.InvalidArgumentError):
+        TracingInterceptor(sample_ratio=1.5)
+
+
+class _Call:
+    def __init__(self, code: grpc.StatusCode):
+        self._code = code
+
+    async def code(self) -> grpc.StatusCode:
+        return self._code
+
+    async def details(self) -> str:
+        return "unavailable"
+
+    def __await__(self) -> Iterator[None]:
+        return
+        yield
+
+
+async def test_trace_context_and_attempts(tracer_provider: TracerProvider, exporter: InMemorySpanExporter):
+    codes = [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.OK]
+    sent_metadata: List[List[Tuple[str, str]]] = []
+
+    async def server(call_details: grpc.aio.ClientCallDetails, request: bytes) -> _Call:
+        sent_metadata.append(list(call_details.metadata))
+        return _Call(codes.pop(0))
+
+    async def traced(call_details: grpc.aio.ClientCallDetails, request: bytes) -> _Call:
+        return await TracingInterceptor(tracer_provider).intercept_unary_unary(server, call_details, request)
+
+    call_details = grpc.aio.ClientCallDetails(
+        b"/cache_client.Scs/Set", 1.0, grpc.aio.Metadata(("cache", "my-cache")), None, None
+    )
+    await RetryInterceptor().intercept_unary_unary(traced, call_details, b"\x0a\x03key\x12\x05value")
+
+    spans = _spans(exporter)
+    assert [(span.attributes["momento.attempt"], span.attributes["momento.result"]) for span in spans] == [
+        (1, "error"),
+        (2, "ok"),
+    ]
+    assert (spans[0].attributes["momento.key_size"], spans[0].attributes["momento.value_size"]) == (3, 5)
+    for span, metadata in zip(spans, sent_metadata):
+        context = span.get_span_context()
+        traceparent = f"00-{context.trace_id:032x}-{context.span_id:016x}-{context.trace_flags:02x}"
+        assert metadata == [("cache", "my-cache"), ("traceparent", traceparent)]
+    assert list(call_details.metadata) == [("cache", "my-cache")]